@@ -0,0 +1,45 @@
+-- Migration: Indexes for keyset pagination and filtered job listings
+-- Purpose: Support cursor pagination on (posted_date, id) used by
+--          POST /jobs/query (apify-job-worker) and GET /jobs (job-worker)
+--          without OFFSET scans, and cover the common listing filters.
+--
+-- This migration:
+-- 1. Enables pg_trgm for substring (ILIKE '%...%') location/country filters
+-- 2. Adds the base (posted_date, id) ordering index
+-- 3. Adds partial composite indexes for active jobs per common filter
+--    (job-worker's GET /jobs uses them with active_only=true)
+-- 4. Adds a GIN index on site_tags for containment filters
+--
+-- Plain CREATE INDEX is used because run_migration.py executes each file as a
+-- single multi-statement batch (CONCURRENTLY cannot run inside it).
+
+-- Step 1: Trigram support for location ILIKE filters
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Step 2: Keyset ordering index
+CREATE INDEX IF NOT EXISTS idx_jobs_posted_date_id
+  ON jobs (posted_date DESC NULLS LAST, id DESC);
+
+-- Step 3: Composite indexes for active listings, ordered for keyset scans
+CREATE INDEX IF NOT EXISTS idx_jobs_active_board_posted
+  ON jobs (board_id, posted_date DESC NULLS LAST, id DESC)
+  WHERE is_active = true;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_active_employment_posted
+  ON jobs (employment_type, posted_date DESC NULLS LAST, id DESC)
+  WHERE is_active = true;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_active_fractional_posted
+  ON jobs (is_fractional, posted_date DESC NULLS LAST, id DESC)
+  WHERE is_active = true;
+
+-- Country filters are substring matches on location
+CREATE INDEX IF NOT EXISTS idx_jobs_location_trgm
+  ON jobs USING GIN (location gin_trgm_ops);
+
+-- Step 4: site_tags containment (site_tags @> ARRAY['...'])
+CREATE INDEX IF NOT EXISTS idx_jobs_site_tags
+  ON jobs USING GIN (site_tags);
+
+-- Keep planner row estimates (used for listing totals) fresh
+ANALYZE jobs;
@@ -0,0 +1,51 @@
+-- Migration: Cross-board near-duplicate detection (MinHash + LSH)
+-- Purpose: Link the same role scraped from different boards (LinkedIn via
+--          Apify, Greenhouse/Lever/Ashby) to one canonical job.
+--
+-- This migration:
+-- 1. Adds jobs.canonical_job_id (NULL = the job is canonical)
+-- 2. Creates job_minhash holding each job's packed 128 x uint32 signature
+-- 3. Creates job_lsh_buckets holding 16 (band, bucket) keys per job
+--
+-- Used by near_duplicates.link_near_duplicate() in both job workers.
+-- Column types follow jobs.id so this works whatever key type jobs uses.
+
+-- Steps 1-3: Columns and tables typed after jobs.id
+DO $$
+DECLARE
+  id_type text;
+BEGIN
+  SELECT format_type(a.atttypid, a.atttypmod) INTO id_type
+  FROM pg_attribute a
+  WHERE a.attrelid = 'jobs'::regclass AND a.attname = 'id';
+
+  EXECUTE format(
+    'ALTER TABLE jobs ADD COLUMN IF NOT EXISTS canonical_job_id %s REFERENCES jobs(id) ON DELETE SET NULL',
+    id_type
+  );
+
+  EXECUTE format(
+    'CREATE TABLE IF NOT EXISTS job_minhash (
+       job_id %s PRIMARY KEY REFERENCES jobs(id) ON DELETE CASCADE,
+       signature bytea NOT NULL,
+       created_at timestamptz NOT NULL DEFAULT NOW()
+     )',
+    id_type
+  );
+
+  EXECUTE format(
+    'CREATE TABLE IF NOT EXISTS job_lsh_buckets (
+       band smallint NOT NULL,
+       bucket bigint NOT NULL,
+       job_id %s NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
+       PRIMARY KEY (band, bucket, job_id)
+     )',
+    id_type
+  );
+END $$;
+
+-- Lookups by job (re-indexing, cascades) and canonical grouping
+CREATE INDEX IF NOT EXISTS idx_job_lsh_buckets_job_id ON job_lsh_buckets (job_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_canonical_job_id
+  ON jobs (canonical_job_id)
+  WHERE canonical_job_id IS NOT NULL;
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Index jobs saved before near-duplicate detection existed.
+
+Run once after migrations/004_job_near_duplicates.sql, and again any time;
+jobs that already have a signature are skipped.
+
+Usage:
+    python scripts/backfill_near_duplicates.py
+    python scripts/backfill_near_duplicates.py --limit 1000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import asyncpg
+from dotenv import load_dotenv
+
+from shared.near_duplicates import backfill_near_duplicates
+
+
+async def main(limit: int, batch_size: int) -> int:
+    load_dotenv(Path(__file__).parent.parent / ".env")
+
+    db_url = os.getenv("DATABASE_URL")
+    if not db_url:
+        print("❌ DATABASE_URL not set")
+        return 1
+
+    conn = await asyncpg.connect(db_url)
+    try:
+        stats = await backfill_near_duplicates(conn, batch_size=batch_size, limit=limit or None)
+    finally:
+        await conn.close()
+
+    print(f"✅ Indexed {stats['indexed']} jobs, linked {stats['linked']} near duplicates")
+    if stats["errors"]:
+        print(f"⚠️  {stats['errors']} jobs failed to index")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=0, help="Index at most this many jobs (0 = all)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.limit, args.batch_size)))
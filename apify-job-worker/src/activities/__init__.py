@@ -1,6 +1,7 @@
 """Activities for LinkedIn Apify Scraper workflow."""
 
-from .apify_scraper import scrape_linkedin_via_apify
+from .apify_scraper import scrape_linkedin_via_apify, start_linkedin_apify_run
+from .dataset_ingest import ingest_apify_dataset
 from .pydantic_classification import classify_jobs_with_pydantic_ai
 from .duplicate_checker import (
     check_duplicates_in_neon,
@@ -8,6 +9,7 @@ from .duplicate_checker import (
     merge_duplicate_results,
 )
 from .zep_sync import sync_jobs_to_zep, update_zep_job_timestamps
+from shared.near_duplicates import link_near_duplicate
 from temporalio import activity
 import asyncpg
 from typing import List, Dict
@@ -61,14 +63,16 @@ async def save_jobs_to_database(data: Dict) -> Dict:
 
         # Save jobs
         added = 0
+        updated = 0
         failed = 0
+        duplicates_linked = 0
 
         for job in jobs:
             try:
                 # Generate external_id from job_id or URL
                 external_id = job.get("job_id") or job.get("external_id") or job.get("url", "").split("/")[-1]
 
-                await conn.execute(
+                row = await conn.fetchrow(
                     """INSERT INTO jobs (
                         board_id, external_id, title, company_name, location, full_description, url,
                         employment_type, seniority_level, is_fractional, is_remote,
@@ -79,7 +83,8 @@ async def save_jobs_to_database(data: Dict) -> Dict:
                         last_seen_at = NOW(),
                         is_fractional = EXCLUDED.is_fractional,
                         classification_confidence = EXCLUDED.classification_confidence,
-                        classification_reasoning = EXCLUDED.classification_reasoning""",
+                        classification_reasoning = EXCLUDED.classification_reasoning
+                    RETURNING id, (xmax = 0) AS inserted""",
                     board_id,
                     external_id,
                     job.get("title"),
@@ -96,15 +101,33 @@ async def save_jobs_to_database(data: Dict) -> Dict:
                     job.get("classification_reasoning"),
                     job.get("site_tags", ["fractional-jobs"])
                 )
-                added += 1
+                if row["inserted"]:
+                    added += 1
+                    # Link to the same role already saved from a company ATS board
+                    try:
+                        if await link_near_duplicate(conn, row["id"], job):
+                            duplicates_linked += 1
+                    except Exception as e:
+                        # Dedup is best-effort; the job itself is already saved
+                        activity.logger.warning(f"Near-duplicate check failed for {row['id']}: {e}")
+                else:
+                    updated += 1
             except Exception as e:
                 activity.logger.warning(f"Failed to save job {job.get('url', 'unknown')}: {e}")
                 failed += 1
 
         await conn.close()
 
-        activity.logger.info(f"Saved {added} jobs, {failed} failed")
-        return {"added": added, "updated": 0, "failed": failed}
+        activity.logger.info(
+            f"Saved {added} new, {updated} updated, {failed} failed, "
+            f"{duplicates_linked} linked as cross-board duplicates"
+        )
+        return {
+            "added": added,
+            "updated": updated,
+            "failed": failed,
+            "duplicates_linked": duplicates_linked,
+        }
 
     except Exception as e:
         activity.logger.error(f"Database error: {e}")
@@ -112,6 +135,8 @@ async def save_jobs_to_database(data: Dict) -> Dict:
 
 __all__ = [
     "scrape_linkedin_via_apify",
+    "start_linkedin_apify_run",
+    "ingest_apify_dataset",
     "classify_jobs_with_gemini",
     "extract_job_skills",
     "save_jobs_to_database",
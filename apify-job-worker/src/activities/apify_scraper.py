@@ -2,7 +2,7 @@
 
 import asyncio
 import httpx
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from temporalio import activity
 from urllib.parse import quote
 import logging
@@ -13,35 +13,19 @@ from ..models.apify import ApifyRunInput, ApifyRunResponse, ApifyRunStatus, Apif
 logger = logging.getLogger(__name__)
 
 
-@activity.defn
-async def scrape_linkedin_via_apify(config: dict = None) -> List[dict]:
-    """
-    Scrape UK fractional jobs from LinkedIn using Apify.
+# Dataset items fetched per request when streaming a finished run
+DATASET_PAGE_SIZE = 100
 
-    Pipeline:
-    1. Start Apify actor run with configured filters
-    2. Poll for completion (with timeout)
-    3. Retrieve results from dataset
-    4. Normalize to internal job format
-
-    Args:
-        config: Optional overrides for location, keywords, maxResults
-            - location: Default "United Kingdom"
-            - keywords: Default "fractional OR part-time OR contract OR interim"
-            - max_results: Default 100
+# Polling: 60 polls * 10 seconds = 10 minutes
+MAX_POLLS = 60
+POLL_INTERVAL_SECONDS = 10
 
-    Returns:
-        List of normalized job dictionaries
+# A run that ended in one of these is not worth resuming on retry
+_FAILED_STATUSES = {ApifyRunStatus.FAILED, ApifyRunStatus.TIMED_OUT, ApifyRunStatus.ABORTED}
 
-    Raises:
-        RuntimeError: If Apify run fails
-        TimeoutError: If polling exceeds 10 minutes
-    """
-    settings = get_settings()
-    config = config or {}
 
-    # Build run input
-    run_input = ApifyRunInput(
+def _build_run_input(config: dict) -> ApifyRunInput:
+    return ApifyRunInput(
         job_title=config.get("job_title", "Fractional"),
         location=config.get("location", "United Kingdom"),
         searchKeywords=config.get("keywords", "fractional OR part-time OR contract OR interim"),
@@ -51,124 +35,246 @@ async def scrape_linkedin_via_apify(config: dict = None) -> List[dict]:
         job_post_time=config.get("job_post_time"),  # Filter by post time
     )
 
-    activity.logger.info(f"Starting Apify scrape with config: {run_input.dict()}")
 
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        # Step 1: Start actor run
-        activity.logger.info("Posting run request to Apify API...")
+async def _start_run(client: httpx.AsyncClient, run_input: ApifyRunInput) -> ApifyRunResponse:
+    """Start the configured actor task and return the run (id + default dataset)."""
+    settings = get_settings()
+    activity.logger.info("Posting run request to Apify API...")
+    try:
+        # URL encode task_id since it contains slashes
+        encoded_task_id = quote(settings.apify_task_id, safe='')
+        response = await client.post(
+            f"{settings.apify_base_url}/actor-tasks/{encoded_task_id}/runs",
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {settings.apify_api_key}",
+            },
+            json=run_input.dict(),
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        activity.logger.error(f"Failed to start Apify run: {e}")
+        raise RuntimeError(f"Apify API error: {e}")
+
+    run_response = ApifyRunResponse(**response.json()["data"])
+    activity.logger.info(
+        f"Apify run started: {run_response.id}, dataset: {run_response.defaultDatasetId}"
+    )
+    return run_response
+
+
+async def _fetch_run(client: httpx.AsyncClient, run_id: str) -> dict:
+    """Current state of an Apify run (the API's "data" object)."""
+    settings = get_settings()
+    response = await client.get(
+        f"{settings.apify_base_url}/actor-runs/{run_id}",
+        headers={"Authorization": f"Bearer {settings.apify_api_key}"},
+    )
+    response.raise_for_status()
+    return response.json()["data"]
+
+
+async def _start_or_resume_run(client: httpx.AsyncClient, run_input: ApifyRunInput) -> str:
+    """
+    Return the ID of the run to wait on: the one a previous attempt started, or a new one.
+
+    Apify runs are paid, so the run ID is heartbeated as soon as the run
+    starts and a retried attempt polls that run instead of starting a
+    second one (as ingest_apify_dataset resumes at its last offset). A run
+    that already failed is replaced.
+    """
+    details = activity.info().heartbeat_details
+    if details:
+        run_id = details[0]["run_id"]
         try:
-            # URL encode task_id since it contains slashes
-            encoded_task_id = quote(settings.apify_task_id, safe='')
-            response = await client.post(
-                f"{settings.apify_base_url}/actor-tasks/{encoded_task_id}/runs",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {settings.apify_api_key}",
-                },
-                json=run_input.dict(),
-            )
-            response.raise_for_status()
+            run = await _fetch_run(client, run_id)
+        except httpx.HTTPError as e:
+            activity.logger.warning(f"Could not check Apify run {run_id}: {e}, polling it anyway")
+            return run_id
+        if run["status"] not in _FAILED_STATUSES:
+            activity.logger.info(f"Resuming Apify run {run_id} ({run['status']})")
+            return run_id
+        activity.logger.warning(f"Previous Apify run {run_id} ended {run['status']}, starting a new run")
+
+    run_response = await _start_run(client, run_input)
+    activity.heartbeat({"run_id": run_response.id})
+    return run_response.id
+
+
+async def _wait_for_run(client: httpx.AsyncClient, run_id: str) -> str:
+    """
+    Poll an Apify run until it finishes (max 10 minutes).
+
+    Returns:
+        The run's default dataset ID
+
+    Raises:
+        RuntimeError: If the run failed, timed out or was aborted
+        TimeoutError: If polling exceeds 10 minutes
+    """
+    for poll_count in range(1, MAX_POLLS + 1):
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        # The run ID is the resume point for a retried attempt
+        activity.heartbeat({"run_id": run_id, "poll": poll_count})
+
+        try:
+            run = await _fetch_run(client, run_id)
         except httpx.HTTPError as e:
-            activity.logger.error(f"Failed to start Apify run: {e}")
-            raise RuntimeError(f"Apify API error: {e}")
+            activity.logger.warning(f"Status check failed: {e}, retrying...")
+            continue
 
-        run_data = response.json()
-        run_response = ApifyRunResponse(**run_data["data"])
-        run_id = run_response.id
-        dataset_id = run_response.defaultDatasetId
+        status = run["status"]
 
         activity.logger.info(
-            f"Apify run started: {run_id}, dataset: {dataset_id}"
+            f"Apify run status: {status} (poll {poll_count}/{MAX_POLLS})"
         )
 
-        # Step 2: Poll for completion (max 10 minutes)
-        max_polls = 60  # 60 polls * 10 seconds = 10 minutes
-        poll_count = 0
+        if status == ApifyRunStatus.SUCCEEDED:
+            dataset_id = run["defaultDatasetId"]
+            activity.logger.info(f"Apify run succeeded! Dataset ID: {dataset_id}")
+            return dataset_id
+        elif status in _FAILED_STATUSES:
+            status_message = run.get("statusMessage", "Unknown error")
+            activity.logger.error(
+                f"Apify run {status}: {status_message}"
+            )
+            raise RuntimeError(
+                f"Apify run {status}: {status_message}"
+            )
 
-        while poll_count < max_polls:
-            await asyncio.sleep(10)  # Wait 10 seconds between polls
-            poll_count += 1
+    activity.logger.error("Apify run polling timeout after 10 minutes")
+    raise TimeoutError(
+        f"Apify run {run_id} did not complete within 10 minutes"
+    )
 
-            try:
-                status_response = await client.get(
-                    f"{settings.apify_base_url}/actor-runs/{run_id}",
-                    headers={"Authorization": f"Bearer {settings.apify_api_key}"},
-                )
-                status_response.raise_for_status()
-            except httpx.HTTPError as e:
-                activity.logger.warning(f"Status check failed: {e}, retrying...")
-                continue
 
-            status_data = status_response.json()
-            status = status_data["data"]["status"]
+async def fetch_dataset_page(
+    client: httpx.AsyncClient,
+    dataset_id: str,
+    offset: int,
+    limit: int = DATASET_PAGE_SIZE,
+) -> List[dict]:
+    """Fetch one page of raw items from an Apify dataset."""
+    settings = get_settings()
+    try:
+        response = await client.get(
+            f"{settings.apify_base_url}/datasets/{dataset_id}/items",
+            headers={"Authorization": f"Bearer {settings.apify_api_key}"},
+            params={"format": "json", "clean": "true", "offset": offset, "limit": limit},
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        activity.logger.error(f"Failed to fetch dataset page at offset {offset}: {e}")
+        raise RuntimeError(f"Failed to fetch Apify dataset: {e}")
 
-            activity.logger.info(
-                f"Apify run status: {status} (poll {poll_count}/{max_polls})"
-            )
+    return response.json()
 
-            if status == ApifyRunStatus.SUCCEEDED:
-                dataset_id = status_data["data"]["defaultDatasetId"]
-                activity.logger.info(f"Apify run succeeded! Dataset ID: {dataset_id}")
-                break
-            elif status in [
-                ApifyRunStatus.FAILED,
-                ApifyRunStatus.TIMED_OUT,
-                ApifyRunStatus.ABORTED,
-            ]:
-                status_message = status_data["data"].get("statusMessage", "Unknown error")
-                activity.logger.error(
-                    f"Apify run {status}: {status_message}"
-                )
-                raise RuntimeError(
-                    f"Apify run {status}: {status_message}"
-                )
 
-        if poll_count >= max_polls:
-            activity.logger.error("Apify run polling timeout after 10 minutes")
-            raise TimeoutError(
-                f"Apify run {run_id} did not complete within 10 minutes"
-            )
+def normalize_dataset_items(raw_items: List, offset: int = 0) -> Tuple[List[dict], int]:
+    """
+    Normalize raw Apify items to the internal job format.
 
-        # Step 3: Retrieve results from dataset
-        activity.logger.info(f"Fetching results from dataset: {dataset_id}")
+    Returns:
+        (normalized jobs, number of items that failed to parse)
+    """
+    normalized_jobs = []
+    failed_parse = 0
 
+    for i, raw_job in enumerate(raw_items, offset):
         try:
-            results_response = await client.get(
-                f"{settings.apify_base_url}/datasets/{dataset_id}/items",
-                headers={"Authorization": f"Bearer {settings.apify_api_key}"},
-                params={"format": "json"},
+            # Handle various response formats
+            if isinstance(raw_job, dict):
+                # Try to parse as ApifyJob model
+                apify_job = ApifyJob(**raw_job)
+                normalized_jobs.append(apify_job.to_internal_job())
+            else:
+                activity.logger.warning(
+                    f"Job {i} is not a dict: {type(raw_job)}"
+                )
+                failed_parse += 1
+        except Exception as e:
+            activity.logger.warning(
+                f"Failed to parse job {i}: {e}, skipping"
             )
-            results_response.raise_for_status()
-        except httpx.HTTPError as e:
-            activity.logger.error(f"Failed to fetch dataset: {e}")
-            raise RuntimeError(f"Failed to fetch Apify dataset: {e}")
+            failed_parse += 1
+            continue
+
+    return normalized_jobs, failed_parse
+
+
+@activity.defn
+async def start_linkedin_apify_run(config: dict = None) -> dict:
+    """
+    Start an Apify LinkedIn scrape and wait for it to finish.
 
-        raw_jobs = results_response.json()
+    Returns a reference to the run's dataset rather than its items, so the
+    workflow history only carries IDs; ingest_apify_dataset streams the items.
+    A retried attempt waits on the run the previous attempt started.
+
+    Args:
+        config: Same overrides as scrape_linkedin_via_apify
+
+    Returns:
+        {"run_id": ..., "dataset_id": ...}
+    """
+    run_input = _build_run_input(config or {})
+    activity.logger.info(f"Starting Apify scrape with config: {run_input.dict()}")
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        run_id = await _start_or_resume_run(client, run_input)
+        dataset_id = await _wait_for_run(client, run_id)
+
+    return {"run_id": run_id, "dataset_id": dataset_id}
 
-        # Step 4: Normalize to internal format
-        activity.logger.info(f"Normalizing {len(raw_jobs)} jobs from Apify response")
+
+@activity.defn
+async def scrape_linkedin_via_apify(config: dict = None) -> List[dict]:
+    """
+    Scrape UK fractional jobs from LinkedIn using Apify.
+
+    Pipeline:
+    1. Start Apify actor run with configured filters
+    2. Poll for completion (with timeout)
+    3. Retrieve results from dataset
+    4. Normalize to internal job format
+
+    Returns the whole dataset in one result; LinkedInApifyScraperWorkflow uses
+    start_linkedin_apify_run + ingest_apify_dataset instead.
+
+    Args:
+        config: Optional overrides for location, keywords, maxResults
+            - location: Default "United Kingdom"
+            - keywords: Default "fractional OR part-time OR contract OR interim"
+            - max_results: Default 100
+
+    Returns:
+        List of normalized job dictionaries
+
+    Raises:
+        RuntimeError: If Apify run fails
+        TimeoutError: If polling exceeds 10 minutes
+    """
+    run_input = _build_run_input(config or {})
+    activity.logger.info(f"Starting Apify scrape with config: {run_input.dict()}")
+
+    async with httpx.AsyncClient(timeout=300.0) as client:
+        run_id = await _start_or_resume_run(client, run_input)
+        dataset_id = await _wait_for_run(client, run_id)
+
+        # Retrieve and normalize results page by page
+        activity.logger.info(f"Fetching results from dataset: {dataset_id}")
 
         normalized_jobs = []
         failed_parse = 0
-
-        for i, raw_job in enumerate(raw_jobs):
-            try:
-                # Handle various response formats
-                if isinstance(raw_job, dict):
-                    # Try to parse as ApifyJob model
-                    apify_job = ApifyJob(**raw_job)
-                    normalized_jobs.append(apify_job.to_internal_job())
-                else:
-                    activity.logger.warning(
-                        f"Job {i} is not a dict: {type(raw_job)}"
-                    )
-                    failed_parse += 1
-            except Exception as e:
-                activity.logger.warning(
-                    f"Failed to parse job {i}: {e}, skipping"
-                )
-                failed_parse += 1
-                continue
+        offset = 0
+        while True:
+            raw_items = await fetch_dataset_page(client, dataset_id, offset)
+            jobs, failed = normalize_dataset_items(raw_items, offset)
+            normalized_jobs.extend(jobs)
+            failed_parse += failed
+            offset += len(raw_items)
+            if len(raw_items) < DATASET_PAGE_SIZE:
+                break
 
         activity.logger.info(
             f"Scraped {len(normalized_jobs)} jobs from LinkedIn via Apify "
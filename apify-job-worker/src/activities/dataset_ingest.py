@@ -0,0 +1,135 @@
+"""Streaming ingestion of a finished Apify run's dataset."""
+
+import copy
+from typing import Dict, List
+from temporalio import activity
+import httpx
+import logging
+
+from .apify_scraper import DATASET_PAGE_SIZE, fetch_dataset_page, normalize_dataset_items
+from .pydantic_classification import classify_jobs_with_pydantic_ai
+from .zep_sync import sync_jobs_to_zep
+
+logger = logging.getLogger(__name__)
+
+# Only the first few errors are kept in the activity result
+MAX_REPORTED_ERRORS = 10
+
+# Jobs classified or synced to ZEP between heartbeats. Each Gemini or ZEP
+# call takes seconds, so a full page in one go outlasts the heartbeat timeout
+HEARTBEAT_BATCH_SIZE = 10
+
+
+def _batches(jobs: List[Dict]) -> List[List[Dict]]:
+    return [jobs[i:i + HEARTBEAT_BATCH_SIZE] for i in range(0, len(jobs), HEARTBEAT_BATCH_SIZE)]
+
+
+def _empty_totals() -> Dict:
+    return {
+        "scraped": 0,
+        "failed_parse": 0,
+        "classified": 0,
+        "added": 0,
+        "updated": 0,
+        "failed": 0,
+        "duplicates_linked": 0,
+        "synced": 0,
+        "errors": [],
+    }
+
+
+@activity.defn
+async def ingest_apify_dataset(data: Dict) -> Dict:
+    """
+    Stream an Apify dataset page by page into Neon (and optionally ZEP).
+
+    Each page of items is normalized, optionally classified, upserted with
+    save_jobs_to_database (which also links cross-board near duplicates) and
+    synced to ZEP before the next page is fetched. The next offset and running
+    totals are heartbeated once a page is saved and synced, so a retried
+    attempt resumes mid-dataset instead of re-saving from the start.
+    Classification and ZEP sync run in batches of HEARTBEAT_BATCH_SIZE jobs
+    with a heartbeat after each.
+
+    Args:
+        data: Dataset reference plus options:
+            - dataset_id: Apify dataset to read (from start_linkedin_apify_run)
+            - page_size: Items per page (default DATASET_PAGE_SIZE)
+            - classify: Run Pydantic AI classification per page (default False)
+            - sync_zep: Sync each saved page to ZEP (default True)
+
+    Returns:
+        Totals: scraped, failed_parse, classified, added, updated, failed,
+        duplicates_linked, synced, errors
+    """
+    # Imported here: save_jobs_to_database lives in the package __init__
+    from . import save_jobs_to_database
+
+    dataset_id = data["dataset_id"]
+    page_size = data.get("page_size", DATASET_PAGE_SIZE)
+    classify = data.get("classify", False)
+    sync_zep = data.get("sync_zep", True)
+
+    # Resume from the last heartbeat of a previous attempt
+    offset = 0
+    totals = _empty_totals()
+    details = activity.info().heartbeat_details
+    if details:
+        offset = details[0]["offset"]
+        totals = details[0]["totals"]
+        activity.logger.info(f"Resuming dataset {dataset_id} at offset {offset}")
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        while True:
+            raw_items = await fetch_dataset_page(client, dataset_id, offset, page_size)
+            if not raw_items:
+                break
+
+            # Heartbeats before this page is fully synced repeat the last
+            # checkpoint, so a retry redoes the whole page and counts it once
+            checkpoint = {"offset": offset, "totals": copy.deepcopy(totals)}
+
+            jobs, failed_parse = normalize_dataset_items(raw_items, offset)
+            totals["scraped"] += len(jobs)
+            totals["failed_parse"] += failed_parse
+
+            if jobs and classify:
+                classified = []
+                for batch in _batches(jobs):
+                    # ZEP indexes the skills, which only the LLM extracts
+                    classified.extend(await classify_jobs_with_pydantic_ai(batch, extract_skills=sync_zep))
+                    activity.heartbeat(checkpoint)
+                jobs = classified
+                totals["classified"] += len(jobs)
+
+            if jobs:
+                # Page upserts are idempotent, so a retry of this page is safe
+                save_result = await save_jobs_to_database({"company": {}, "jobs": jobs})
+                for key in ("added", "updated", "failed", "duplicates_linked"):
+                    totals[key] += save_result.get(key, 0)
+
+            if jobs and sync_zep:
+                activity.heartbeat(checkpoint)
+                for batch in _batches(jobs):
+                    try:
+                        zep_result = await sync_jobs_to_zep(batch)
+                        totals["synced"] += zep_result.get("synced", 0)
+                        totals["errors"].extend(zep_result.get("errors", []))
+                    except Exception as e:
+                        activity.logger.warning(f"ZEP sync failed for page at offset {offset}: {e}")
+                        totals["errors"].append(f"ZEP sync failed at offset {offset}: {e}")
+                    activity.heartbeat(checkpoint)
+                del totals["errors"][MAX_REPORTED_ERRORS:]
+
+            offset += len(raw_items)
+            activity.heartbeat({"offset": offset, "totals": totals})
+            activity.logger.info(
+                f"Ingested dataset {dataset_id} through offset {offset}: "
+                f"{totals['added']} added, {totals['updated']} updated"
+            )
+
+            if len(raw_items) < page_size:
+                break
+
+    activity.logger.info(f"Dataset {dataset_id} ingestion complete: {totals}")
+    return totals
@@ -7,6 +7,8 @@ from temporalio import activity
 import logging
 import os
 
+from shared.provider_limits import provider_slot
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,17 +123,18 @@ async def check_duplicates_in_zep(jobs: List[Dict]) -> Dict[str, any]:
                 job_id = job.get("job_id") or job.get("external_id")
 
                 # Search ZEP graph for this job
-                search_response = await client.post(
-                    f"{zep_base_url}/v2/graphs/job_market/search",
-                    headers={
-                        "Authorization": f"Bearer {zep_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "query": f"Job with URL {job_url} or ID {job_id}",
-                        "limit": 1
-                    }
-                )
+                async with provider_slot("zep"):
+                    search_response = await client.post(
+                        f"{zep_base_url}/v2/graphs/job_market/search",
+                        headers={
+                            "Authorization": f"Bearer {zep_api_key}",
+                            "Content-Type": "application/json"
+                        },
+                        json={
+                            "query": f"Job with URL {job_url} or ID {job_id}",
+                            "limit": 1
+                        }
+                    )
 
                 if search_response.status_code == 200:
                     results = search_response.json()
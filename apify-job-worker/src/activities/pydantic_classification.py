@@ -1,15 +1,131 @@
 """Pydantic AI-powered job classification activity."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from temporalio import activity
 import logging
 from ..models.job_classification import classify_job, JobClassification
+from shared.job_taxonomy import Country, Department, EmploymentType, SeniorityLevel, WorkplaceType
+from shared.provider_limits import provider_slot
+from shared.rule_classification import pre_classify_job, RuleClassification, RULE_CONFIDENCE_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+# Rule-based enums → JobClassification literals
+_EMPLOYMENT_TYPES = {
+    EmploymentType.FRACTIONAL: "fractional",
+    EmploymentType.PART_TIME: "part_time",
+    EmploymentType.CONTRACT: "contract",
+    EmploymentType.INTERIM: "contract",
+    EmploymentType.TEMPORARY: "temporary",
+    EmploymentType.FREELANCE: "freelance",
+    EmploymentType.FULL_TIME: "full_time",
+}
+
+_SENIORITY_LEVELS = {
+    SeniorityLevel.C_SUITE: "c_suite",
+    SeniorityLevel.VP: "vp",
+    SeniorityLevel.DIRECTOR: "director",
+    SeniorityLevel.HEAD: "director",
+    SeniorityLevel.SENIOR_MANAGER: "manager",
+    SeniorityLevel.MANAGER: "manager",
+    SeniorityLevel.SENIOR: "senior",
+    SeniorityLevel.MID: "mid",
+    SeniorityLevel.JUNIOR: "junior",
+    SeniorityLevel.ENTRY: "entry",
+}
+
+_WORKPLACE_TYPES = {
+    WorkplaceType.REMOTE: "remote",
+    WorkplaceType.HYBRID: "hybrid",
+    WorkplaceType.ONSITE: "onsite",
+}
+
+_CATEGORIES = {
+    Department.HUMAN_RESOURCES: "HR",
+    Department.GENERAL_MANAGEMENT: "Executive",
+}
+
+_COUNTRY_NAMES = {
+    Country.UK: "United Kingdom",
+    Country.US: "United States",
+    Country.GERMANY: "Germany",
+    Country.FRANCE: "France",
+    Country.NETHERLANDS: "Netherlands",
+    Country.IRELAND: "Ireland",
+    Country.SPAIN: "Spain",
+    Country.ITALY: "Italy",
+    Country.CANADA: "Canada",
+    Country.AUSTRALIA: "Australia",
+    Country.SINGAPORE: "Singapore",
+    Country.UAE: "United Arab Emirates",
+    Country.REMOTE: "Remote",
+}
+
+
+def _job_description(job: Dict) -> str:
+    return job.get("full_description") or job.get("job_description") or job.get("description", "")
+
+
+def _apply_rule_classification(job: Dict, rules: RuleClassification) -> Dict:
+    """
+    Merge a confident rule-based classification into the job in the LLM output shape.
+
+    Fields only the LLM can extract (skills, salary, company details) are set
+    explicitly empty so rule- and LLM-classified jobs have the same keys.
+    """
+    site_tags = []
+    if rules.is_fractional:
+        site_tags.append("fractional-jobs")
+    if rules.is_remote:
+        site_tags.append("remote-jobs")
+
+    job_classified = job.copy()
+    job_classified.update({
+        "employment_type": _EMPLOYMENT_TYPES[rules.employment_type],
+        "is_fractional": rules.is_fractional,
+        "country": _COUNTRY_NAMES.get(rules.country, "Unknown"),
+        "city": rules.city,
+        "is_remote": rules.is_remote,
+        "workplace_type": _WORKPLACE_TYPES.get(rules.workplace_type),
+        "category": _CATEGORIES.get(rules.department, rules.department.value),
+        "seniority_level": _SENIORITY_LEVELS[rules.seniority_level],
+        "role_title": rules.executive_role.value if rules.executive_role else job.get("title") or job.get("job_title", ""),
+        "company_industry": None,
+        "company_size": None,
+        "required_skills": [],
+        "nice_to_have_skills": [],
+        "years_experience": None,
+        "salary_min": None,
+        "salary_max": None,
+        "salary_currency": None,
+        "classification_confidence": rules.confidence,
+        "classification_reasoning": rules.reasoning,
+        "classification_method": "rules",
+        "site_tags": site_tags,
+    })
+    return job_classified
+
+
+def _rule_classify(job: Dict) -> Optional[Dict]:
+    """Classify a job with rules, or return None if it needs the LLM."""
+    rules = pre_classify_job(
+        title=job.get("title") or job.get("job_title", ""),
+        description=_job_description(job),
+        employment_type=job.get("employment_type"),
+        seniority_level=job.get("seniority_level"),
+        location=job.get("location", ""),
+    )
+    if (
+        rules.confidence < RULE_CONFIDENCE_THRESHOLD
+        or rules.employment_type not in _EMPLOYMENT_TYPES
+        or rules.seniority_level not in _SENIORITY_LEVELS
+    ):
+        return None
+    return _apply_rule_classification(job, rules)
+
 
 @activity.defn
-async def classify_jobs_with_pydantic_ai(jobs: List[Dict]) -> List[Dict]:
+async def classify_jobs_with_pydantic_ai(jobs: List[Dict], extract_skills: bool = False) -> List[Dict]:
     """
     Classify jobs using Pydantic AI with Gemini.
 
@@ -22,8 +138,15 @@ async def classify_jobs_with_pydantic_ai(jobs: List[Dict]) -> List[Dict]:
     - Salary information
     - Site tags for targeting
 
+    Jobs the rule-based pre-classifier is confident about (obvious full-time
+    or "Fractional CFO" postings) skip the LLM; only the rest go to Gemini.
+    Rules can't extract skills, so with extract_skills every job that has a
+    description goes to Gemini. Each job gets a classification_method of
+    "rules", "llm" or "fallback".
+
     Args:
         jobs: List of raw job dictionaries from Apify
+        extract_skills: Callers that use the skills (ZEP sync) need the LLM
 
     Returns:
         List of jobs with comprehensive AI classification
@@ -32,26 +155,35 @@ async def classify_jobs_with_pydantic_ai(jobs: List[Dict]) -> List[Dict]:
 
     classified_jobs = []
     failed = 0
+    resolved_by_rules = 0
 
     for i, job in enumerate(jobs):
+        needs_llm = extract_skills and bool(_job_description(job))
+        job_classified = None if needs_llm else _rule_classify(job)
+        if job_classified:
+            classified_jobs.append(job_classified)
+            resolved_by_rules += 1
+            continue
+
         try:
             # Extract fields for classification
             title = job.get("title") or job.get("job_title", "")
-            description = job.get("full_description") or job.get("job_description") or job.get("description", "")
+            description = _job_description(job)
             company_name = job.get("company_name", "Unknown")
             location = job.get("location", "")
             employment_type = job.get("employment_type")
             seniority_level = job.get("seniority_level")
 
             # Run Pydantic AI classification
-            classification: JobClassification = await classify_job(
-                job_title=title,
-                job_description=description,
-                company_name=company_name,
-                location=location,
-                employment_type=employment_type,
-                seniority_level=seniority_level
-            )
+            async with provider_slot("gemini"):
+                classification: JobClassification = await classify_job(
+                    job_title=title,
+                    job_description=description,
+                    company_name=company_name,
+                    location=location,
+                    employment_type=employment_type,
+                    seniority_level=seniority_level
+                )
 
             # Merge classification back into job dict
             job_classified = job.copy()
@@ -89,6 +221,7 @@ async def classify_jobs_with_pydantic_ai(jobs: List[Dict]) -> List[Dict]:
                 # Metadata
                 "classification_confidence": classification.classification_confidence,
                 "classification_reasoning": classification.reasoning,
+                "classification_method": "llm",
                 "site_tags": classification.site_tags,
             })
 
@@ -108,6 +241,7 @@ async def classify_jobs_with_pydantic_ai(jobs: List[Dict]) -> List[Dict]:
                 "is_fractional": False,
                 "classification_confidence": 0.0,
                 "classification_reasoning": f"AI classification failed: {str(e)}",
+                "classification_method": "fallback",
                 "site_tags": []
             })
             classified_jobs.append(job_fallback)
@@ -115,5 +249,10 @@ async def classify_jobs_with_pydantic_ai(jobs: List[Dict]) -> List[Dict]:
     activity.logger.info(
         f"Classification complete: {len(classified_jobs) - failed} successful, {failed} failed"
     )
+    if jobs:
+        activity.logger.info(
+            f"Rule fast path resolved {resolved_by_rules}/{len(jobs)} jobs "
+            f"({resolved_by_rules / len(jobs):.0%}) without an LLM call"
+        )
 
     return classified_jobs
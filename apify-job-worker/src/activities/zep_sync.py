@@ -6,6 +6,8 @@ from temporalio import activity
 import logging
 from zep_cloud import Zep
 
+from shared.provider_limits import provider_slot
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,11 +99,12 @@ The company {company_name} has posted a position for {job_title}"""
 
             # Add to ZEP graph - ZEP will automatically extract entities and relationships
             # Using "text" type (not "message") for better entity extraction
-            result = client.graph.add(
-                graph_id=graph_id,
-                type="text",  # Changed from "message" to "text" for better entity extraction
-                data=job_text.strip()
-            )
+            async with provider_slot("zep"):
+                result = client.graph.add(
+                    graph_id=graph_id,
+                    type="text",  # Changed from "message" to "text" for better entity extraction
+                    data=job_text.strip()
+                )
 
             synced += 1
             activity.logger.info(f"✅ Synced job to ZEP: {job.get('title')} (uuid: {result.uuid_})")
@@ -9,6 +9,9 @@ import asyncpg
 import os
 
 from temporalio.client import Client
+
+from shared.pagination import count_rows, encode_cursor, keyset_condition
+
 from ..config.settings import get_settings
 
 # Create FastAPI app
@@ -53,8 +56,11 @@ class JobsQueryRequest(BaseModel):
     is_fractional: Optional[bool] = None
     is_remote: Optional[bool] = None
     company: Optional[str] = None
+    site_tag: Optional[str] = None
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None  # next_cursor from a previous page; takes precedence over offset
+    exact_total: bool = False  # Force an exact COUNT(*) instead of the planner estimate
 
 
 # Health check
@@ -141,16 +147,23 @@ async def query_jobs(request: JobsQueryRequest):
     - is_fractional
     - is_remote
     - company
+    - site_tag
 
-    Returns paginated results.
+    Returns paginated results ordered by (posted_date, id). Pass the returned
+    next_cursor back as `cursor` to fetch the following page without OFFSET
+    scanning. `total` is a planner estimate on large result sets unless
+    `exact_total` is set (see total_is_estimate).
     """
     settings = get_settings()
 
     try:
-        conn = await asyncpg.connect(settings.database_url)
-
         # Build dynamic query
-        conditions = ["j.is_active = true", "jb.company_name = 'LinkedIn UK (Apify)'"]
+        # The board is a scalar subquery so it is an index condition on
+        # j.board_id, and idx_jobs_active_board_posted serves the order
+        conditions = [
+            "j.is_active = true",
+            "j.board_id = (SELECT id FROM job_boards WHERE company_name = 'LinkedIn UK (Apify)')",
+        ]
         params = []
         param_count = 1
 
@@ -184,7 +197,27 @@ async def query_jobs(request: JobsQueryRequest):
             conditions.append(f"j.company_name ILIKE ${param_count}")
             param_count += 1
 
+        if request.site_tag:
+            params.append(request.site_tag)
+            conditions.append(f"j.site_tags @> ARRAY[${param_count}]::text[]")
+            param_count += 1
+
         where_clause = " AND ".join(conditions)
+        from_where = f"jobs j WHERE {where_clause}"
+        filter_params = list(params)
+
+        # Keyset pagination: continue after the last row of the previous page
+        if request.cursor:
+            try:
+                conditions.append(keyset_condition(request.cursor, params))
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            param_count = len(params) + 1
+            page_where = " AND ".join(conditions)
+            offset = 0
+        else:
+            page_where = where_clause
+            offset = request.offset
 
         # Execute query
         query = f"""
@@ -210,35 +243,42 @@ async def query_jobs(request: JobsQueryRequest):
                 j.classification_confidence,
                 j.first_seen_at
             FROM jobs j
-            JOIN job_boards jb ON j.board_id = jb.id
-            WHERE {where_clause}
-            ORDER BY j.posted_date DESC NULLS LAST, j.first_seen_at DESC
+            WHERE {page_where}
+            ORDER BY j.posted_date DESC NULLS LAST, j.id DESC
             LIMIT ${param_count} OFFSET ${param_count + 1}
         """
 
-        params.extend([request.limit, request.offset])
+        conn = await asyncpg.connect(settings.database_url)
+
+        # Fetch one extra row to know whether another page exists
+        params.extend([request.limit + 1, offset])
         rows = await conn.fetch(query, *params)
 
-        # Get total count
-        count_query = f"""
-            SELECT COUNT(*) FROM jobs j
-            JOIN job_boards jb ON j.board_id = jb.id
-            WHERE {where_clause}
-        """
-        total = await conn.fetchval(count_query, *params[:-2])
+        # Estimated (or cached exact) total - COUNT(*) on every page is too slow
+        total, total_is_estimate = await count_rows(
+            conn, from_where, filter_params, exact=request.exact_total
+        )
 
         await conn.close()
 
-        jobs = [dict(row) for row in rows]
+        has_more = len(rows) > request.limit
+        jobs = [dict(row) for row in rows[:request.limit]]
+        next_cursor = None
+        if has_more and jobs:
+            next_cursor = encode_cursor(jobs[-1]["posted_date"], jobs[-1]["id"])
 
         return {
             "jobs": jobs,
             "total": total,
+            "total_is_estimate": total_is_estimate,
             "limit": request.limit,
-            "offset": request.offset,
-            "has_more": (request.offset + request.limit) < total
+            "offset": offset,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Query failed: {str(e)}")
 
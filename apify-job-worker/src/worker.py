@@ -10,6 +10,9 @@ from dotenv import load_dotenv
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from shared.provider_limits import configure_provider_limits
+from shared.telemetry import telemetry_interceptors
+
 from .config.settings import get_settings
 
 # Load environment variables from .env
@@ -18,6 +21,8 @@ from .workflows import LinkedInApifyScraperWorkflow
 from .activities import (
     # Core scraping
     scrape_linkedin_via_apify,
+    start_linkedin_apify_run,
+    ingest_apify_dataset,
 
     # Pydantic AI classification
     classify_jobs_with_pydantic_ai,
@@ -113,6 +118,9 @@ async def main():
         )
         logger.info("✅ Connected to Temporal")
 
+        # Gemini/Zep calls share account-wide limits with the other workers
+        configure_provider_limits(database_url=settings.database_url)
+
         # Create and run worker
         worker = Worker(
             client,
@@ -121,6 +129,8 @@ async def main():
             activities=[
                 # Core scraping
                 scrape_linkedin_via_apify,
+                start_linkedin_apify_run,
+                ingest_apify_dataset,
 
                 # Pydantic AI classification
                 classify_jobs_with_pydantic_ai,
@@ -140,6 +150,7 @@ async def main():
                 # Skills extraction
                 extract_job_skills,
             ],
+            interceptors=telemetry_interceptors("apify-job-worker"),
         )
 
         logger.info("=" * 70)
@@ -153,6 +164,8 @@ async def main():
         logger.info("Registered Activities:")
         logger.info("  Scraping:")
         logger.info("    - scrape_linkedin_via_apify")
+        logger.info("    - start_linkedin_apify_run")
+        logger.info("    - ingest_apify_dataset (streamed save + ZEP sync)")
         logger.info("  Classification:")
         logger.info("    - classify_jobs_with_pydantic_ai (Gemini 2.0 Flash)")
         logger.info("  Duplicate Checking:")
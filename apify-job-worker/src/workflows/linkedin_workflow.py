@@ -12,10 +12,11 @@ class LinkedInApifyScraperWorkflow:
     Workflow for scraping jobs from LinkedIn via Apify.
 
     Pipeline (simplified):
-    1. Scrape LinkedIn via Apify API
-    2. Save raw jobs to Neon database
-    3. Sync raw jobs to ZEP knowledge graph
+    1. Start the Apify run and wait for its dataset
+    2. Stream the dataset page by page: save each page to Neon and sync it
+       to the ZEP knowledge graph as it arrives
 
+    Only the dataset reference and totals pass through workflow history.
     Classification and fractional assessment handled downstream.
     Schedule: Daily at 2 AM UTC
     Duration: ~5-10 minutes (depends on Apify scraping time)
@@ -31,10 +32,13 @@ class LinkedInApifyScraperWorkflow:
                 - location: Default "United Kingdom"
                 - keywords: Default "fractional"
                 - jobs_entries: Default 100
+                - page_size: Dataset items per page (default 100)
+                - classify: Classify each page with Pydantic AI (default False)
 
         Returns:
             Dictionary with pipeline execution summary:
                 - source: "linkedin_apify"
+                - dataset_id: Apify dataset that was ingested
                 - jobs_scraped: Number of jobs scraped from Apify
                 - jobs_added_to_neon: Number added to Neon database
                 - jobs_synced_to_zep: Number synced to ZEP knowledge graph
@@ -45,13 +49,15 @@ class LinkedInApifyScraperWorkflow:
         start_time = workflow.now()
         workflow.logger.info(f"Starting LinkedIn Apify Scraper workflow with config: {config}")
 
-        # Step 1: Scrape LinkedIn via Apify
+        # Step 1: Run the Apify scrape; only the dataset reference comes back.
+        # The run ID is heartbeated, so a retry polls the same run.
         workflow.logger.info("Step 1: Scraping LinkedIn via Apify...")
         try:
-            raw_jobs = await workflow.execute_activity(
-                "scrape_linkedin_via_apify",
+            run_ref = await workflow.execute_activity(
+                "start_linkedin_apify_run",
                 config,
                 start_to_close_timeout=timedelta(minutes=15),
+                heartbeat_timeout=timedelta(minutes=2),
                 retry_policy=RetryPolicy(
                     maximum_attempts=2,
                     initial_interval=timedelta(seconds=30),
@@ -68,69 +74,54 @@ class LinkedInApifyScraperWorkflow:
                 "duration_seconds": (workflow.now() - start_time).total_seconds(),
             }
 
-        if not raw_jobs:
-            workflow.logger.warning("No jobs scraped from LinkedIn")
-            return {
-                "source": "linkedin_apify",
-                "jobs_scraped": 0,
-                "jobs_added_to_neon": 0,
-                "jobs_synced_to_zep": 0,
-                "errors": ["No jobs found from Apify scrape"],
-                "duration_seconds": (workflow.now() - start_time).total_seconds(),
-            }
-
-        workflow.logger.info(f"Step 1 complete: Scraped {len(raw_jobs)} raw jobs")
-
-        # Step 2: UPSERT jobs to Neon database (insert new, update existing)
-        workflow.logger.info("Step 2: Upserting jobs to Neon (insert new, update existing)...")
+        workflow.logger.info(f"Step 1 complete: Apify dataset {run_ref['dataset_id']}")
 
-        neon_save_result = {"added": 0, "updated": 0}
+        # Step 2: Stream the dataset into Neon and ZEP page by page.
+        # Progress is heartbeated, so retries resume at the last saved page.
+        workflow.logger.info("Step 2: Streaming dataset into Neon and ZEP...")
         try:
-            neon_save_result = await workflow.execute_activity(
-                "save_jobs_to_database",
-                {"company": {}, "jobs": raw_jobs},  # UPSERT all raw jobs
-                start_to_close_timeout=timedelta(minutes=3),
+            totals = await workflow.execute_activity(
+                "ingest_apify_dataset",
+                {
+                    "dataset_id": run_ref["dataset_id"],
+                    "page_size": config.get("page_size", 100),
+                    "classify": config.get("classify", False),
+                },
+                start_to_close_timeout=timedelta(minutes=30),
+                heartbeat_timeout=timedelta(minutes=5),
+                retry_policy=RetryPolicy(
+                    maximum_attempts=3,
+                    initial_interval=timedelta(seconds=30),
+                ),
             )
         except Exception as e:
-            workflow.logger.error(f"Neon upsert failed: {e}")
+            workflow.logger.error(f"Dataset ingestion failed: {e}")
             return {
                 "source": "linkedin_apify",
-                "jobs_scraped": len(raw_jobs),
+                "dataset_id": run_ref["dataset_id"],
+                "jobs_scraped": 0,
                 "jobs_added_to_neon": 0,
                 "jobs_synced_to_zep": 0,
-                "errors": [f"Neon upsert failed: {str(e)}"],
+                "errors": [f"Dataset ingestion failed: {str(e)}"],
                 "duration_seconds": (workflow.now() - start_time).total_seconds(),
             }
 
-        workflow.logger.info(
-            f"Neon upsert complete: {neon_save_result.get('added', 0)} added, "
-            f"{neon_save_result.get('updated', 0)} updated"
-        )
-
-        # Step 3: UPSERT jobs to ZEP knowledge graph (insert new, update existing)
-        workflow.logger.info("Step 3: Upserting jobs to ZEP (insert new, update existing)...")
-        zep_sync_result = {"synced": 0}
-        try:
-            zep_sync_result = await workflow.execute_activity(
-                "sync_jobs_to_zep",
-                raw_jobs,  # UPSERT all raw jobs
-                start_to_close_timeout=timedelta(minutes=5),
-            )
-        except Exception as e:
-            workflow.logger.warning(f"ZEP upsert failed: {e}, continuing without ZEP sync")
-            zep_sync_result = {"synced": 0, "error": str(e)}
-
-        workflow.logger.info(f"ZEP upsert complete: {zep_sync_result.get('synced', 0)} synced")
+        errors = list(totals.get("errors", []))
+        if not totals.get("scraped"):
+            workflow.logger.warning("No jobs scraped from LinkedIn")
+            errors.append("No jobs found from Apify scrape")
 
         duration = (workflow.now() - start_time).total_seconds()
 
         result = {
             "source": "linkedin_apify",
-            "jobs_scraped": len(raw_jobs),
-            "jobs_added_to_neon": neon_save_result.get("added", 0),
-            "jobs_updated_in_neon": neon_save_result.get("updated", 0),
-            "jobs_synced_to_zep": zep_sync_result.get("synced", 0),
-            "errors": neon_save_result.get("errors", []) + zep_sync_result.get("errors", []),
+            "dataset_id": run_ref["dataset_id"],
+            "jobs_scraped": totals.get("scraped", 0),
+            "jobs_added_to_neon": totals.get("added", 0),
+            "jobs_updated_in_neon": totals.get("updated", 0),
+            "jobs_linked_as_duplicates": totals.get("duplicates_linked", 0),
+            "jobs_synced_to_zep": totals.get("synced", 0),
+            "errors": errors,
             "duration_seconds": duration,
         }
 
@@ -0,0 +1,73 @@
+import asyncio
+import dataclasses
+
+import httpx
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from src.activities import apify_scraper
+
+
+class FakeApify:
+    """Apify API with one run per POST; every run has finished with `status`."""
+
+    def __init__(self, status="SUCCEEDED"):
+        self.status = status
+        self.started = []
+
+    def handler(self, request):
+        if request.method == "POST":
+            run_id = f"run-{len(self.started) + 1}"
+            self.started.append(run_id)
+            return httpx.Response(201, json={"data": {"id": run_id, "actId": "actor", "status": "READY"}})
+        run_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"data": {"status": self.status, "defaultDatasetId": f"{run_id}-data"}})
+
+
+@pytest.fixture
+def apify(monkeypatch):
+    apify = FakeApify()
+    transport = httpx.MockTransport(apify.handler)
+    real_client = httpx.AsyncClient
+
+    monkeypatch.setattr(apify_scraper, "POLL_INTERVAL_SECONDS", 0)
+    monkeypatch.setattr(
+        apify_scraper.httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+    )
+    return apify
+
+
+def _env(heartbeat_details=()):
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(env.info, heartbeat_details=list(heartbeat_details))
+    env.heartbeats = []
+    env.on_heartbeat = lambda *details: env.heartbeats.append(details[0])
+    return env
+
+
+def test_run_id_is_heartbeated_once_started(apify):
+    env = _env()
+
+    result = asyncio.run(env.run(apify_scraper.start_linkedin_apify_run, {}))
+
+    assert result == {"run_id": "run-1", "dataset_id": "run-1-data"}
+    assert env.heartbeats[0] == {"run_id": "run-1"}
+
+
+def test_retry_polls_the_existing_run(apify):
+    env = _env([{"run_id": "run-7"}])
+
+    result = asyncio.run(env.run(apify_scraper.start_linkedin_apify_run, {}))
+
+    assert apify.started == []
+    assert result == {"run_id": "run-7", "dataset_id": "run-7-data"}
+
+
+def test_retry_after_a_failed_run_starts_a_new_one(apify):
+    apify.status = "FAILED"
+    env = _env([{"run_id": "run-7"}])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(env.run(apify_scraper.start_linkedin_apify_run, {}))
+
+    assert apify.started == ["run-1"]
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+import src.activities
+from src.activities import dataset_ingest
+
+
+@pytest.fixture
+def page(monkeypatch):
+    """One dataset page of 25 jobs; records each classify and ZEP batch."""
+    batches = {"classify": [], "zep": []}
+
+    async def fetch_dataset_page(client, dataset_id, offset, page_size):
+        return [{"n": i} for i in range(25)] if offset == 0 else []
+
+    def normalize_dataset_items(raw_items, offset):
+        return [dict(item) for item in raw_items], 0
+
+    async def classify(jobs, extract_skills=False):
+        batches["classify"].append(len(jobs))
+        return jobs
+
+    async def save_jobs_to_database(data):
+        return {"added": len(data["jobs"])}
+
+    async def sync_jobs_to_zep(jobs):
+        batches["zep"].append(len(jobs))
+        return {"synced": len(jobs), "errors": []}
+
+    monkeypatch.setattr(dataset_ingest, "fetch_dataset_page", fetch_dataset_page)
+    monkeypatch.setattr(dataset_ingest, "normalize_dataset_items", normalize_dataset_items)
+    monkeypatch.setattr(dataset_ingest, "classify_jobs_with_pydantic_ai", classify)
+    monkeypatch.setattr(dataset_ingest, "sync_jobs_to_zep", sync_jobs_to_zep)
+    monkeypatch.setattr(src.activities, "save_jobs_to_database", save_jobs_to_database)
+    return batches
+
+
+def test_classify_and_zep_sync_heartbeat_between_batches(page):
+    env = ActivityEnvironment()
+    heartbeats = []
+    env.on_heartbeat = lambda *details: heartbeats.append(details[0])
+
+    totals = asyncio.run(
+        env.run(dataset_ingest.ingest_apify_dataset, {"dataset_id": "d", "classify": True})
+    )
+
+    assert page["classify"] == [10, 10, 5]
+    assert page["zep"] == [10, 10, 5]
+    assert totals["classified"] == totals["added"] == totals["synced"] == 25
+    # Batch heartbeats repeat the page checkpoint until the page is done
+    assert [h["offset"] for h in heartbeats] == [0] * 7 + [25]
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from src.activities import pydantic_classification
+from src.models.job_classification import JobClassification
+
+CFO_JOB = {
+    "title": "Finance Director",
+    "company_name": "Acme",
+    "employment_type": "Full-time",
+    "location": "London, United Kingdom (Hybrid)",
+    "description": "Must have: IFRS reporting.",
+}
+
+LLM_CLASSIFICATION = JobClassification(
+    employment_type="full_time",
+    is_fractional=False,
+    country="United Kingdom",
+    city="London",
+    is_remote=False,
+    workplace_type="hybrid",
+    category="Finance",
+    seniority_level="c_suite",
+    role_title="CFO",
+    company_name="Acme",
+    required_skills=["IFRS"],
+    classification_confidence=0.9,
+    reasoning="llm",
+)
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+
+    async def classify_job(**kwargs):
+        calls.append(kwargs)
+        return LLM_CLASSIFICATION
+
+    monkeypatch.setattr(pydantic_classification, "classify_job", classify_job)
+    return calls
+
+
+def test_rule_classified_jobs_have_every_llm_field(llm_calls):
+    [job] = asyncio.run(pydantic_classification.classify_jobs_with_pydantic_ai([CFO_JOB]))
+
+    assert not llm_calls
+    assert job["classification_method"] == "rules"
+    assert job["workplace_type"] == "hybrid"
+    assert job["required_skills"] == []
+    assert job["nice_to_have_skills"] == []
+    llm_fields = {"company_industry", "company_size", "years_experience", "salary_min", "salary_max", "salary_currency"}
+    assert llm_fields <= job.keys()
+
+
+def test_extract_skills_sends_jobs_with_descriptions_to_the_llm(llm_calls):
+    jobs = [CFO_JOB, {**CFO_JOB, "description": ""}]
+
+    classified = asyncio.run(
+        pydantic_classification.classify_jobs_with_pydantic_ai(jobs, extract_skills=True)
+    )
+
+    assert len(llm_calls) == 1
+    assert [job["classification_method"] for job in classified] == ["llm", "rules"]
+    assert classified[0]["required_skills"] == ["IFRS"]
+
+
+def test_non_executive_part_time_job_goes_to_the_llm(llm_calls):
+    job = {**CFO_JOB, "title": "Part-time Sales Assistant", "employment_type": "Part-time", "seniority_level": "Entry level"}
+
+    [classified] = asyncio.run(pydantic_classification.classify_jobs_with_pydantic_ai([job]))
+
+    assert len(llm_calls) == 1
+    assert classified["classification_method"] == "llm"
@@ -7,6 +7,14 @@ Executes CompanyCreationWorkflow for comprehensive company profiling.
 import asyncio
 import os
 import sys
+import time
+
+STARTED_AT = time.perf_counter()
+
+if __name__ == "__main__" and "--import-profile" in sys.argv:
+    # Report what the worker's imports cost, without connecting to Temporal
+    from src.utils.startup_profile import import_profile_main
+    sys.exit(import_profile_main(sys.argv[1:]))
 
 from temporalio.client import Client
 from temporalio.worker import Worker
@@ -27,223 +35,14 @@ from src.workflows.topic_cluster_workflow import TopicClusterWorkflow
 from src.workflows.video_enrichment_workflow import VideoEnrichmentWorkflow
 # NarrativeArticleCreationWorkflow removed - superseded by 4-act workflow in ArticleCreationWorkflow
 
-# Import all activities
-from src.activities.normalize import (
-    normalize_company_url,
-    check_company_exists,
-)
-
-from src.activities.research.serper import (
-    fetch_company_news,
-    serper_news_search,
-    serper_article_search,
-    fetch_targeted_research,
-    serper_httpx_deep_articles,  # Deep article crawling with httpx
-    serper_scrape_url,  # Single URL scrape via Serper API
-)
-
-from src.activities.research.dataforseo import (
-    dataforseo_news_search,
-    dataforseo_serp_search,
-    dataforseo_keyword_research,
-    dataforseo_keyword_difficulty,
-    dataforseo_related_keywords,  # Keyword cluster discovery (first step in research)
-    research_country_seo_keywords,  # Country guide SEO research
-)
-
-from src.activities.research.news_assessment import (
-    assess_news_batch,
-)
-
-from src.activities.research.crawl import (
-    httpx_crawl,
-    # firecrawl_crawl,  # Disabled - out of credit
-    # firecrawl_httpx_discover,  # Disabled - out of credit
-)
-
-from src.activities.research.crawl4ai_service import (
-    crawl4ai_service_crawl,  # External Railway Crawl4AI microservice (browser automation)
-    crawl4ai_batch_crawl,  # Batch crawl multiple URLs at once
-    prefilter_urls_by_relevancy,  # Pre-filter URLs by topic relevancy before crawling
-)
-
-from src.activities.research.exa import (
-    exa_research_company,
-    exa_research_topic,
-    exa_find_similar_companies,
-)
-
-from src.activities.research.reddit import (
-    reddit_search_expat_content,  # Reddit JSON API for expat voices
-)
-
-from src.activities.research.ambiguity import (
-    check_research_ambiguity,
-    validate_company_match,
-)
-
-from src.activities.validation.link_validator import (
-    playwright_url_cleanse,  # Deprecated
-    playwright_clean_links,
-    playwright_pre_cleanse,  # Phase 4b: Score URLs before article generation
-    playwright_post_cleanse,  # Phase 5b: Validate links after article written
-)
-
-from src.activities.media.logo_extraction import (
-    extract_and_process_logo,
-)
-
-from src.activities.media.replicate_images import (
-    generate_company_featured_image,
-    generate_placeholder_image,
-)
-
-from src.activities.media.flux_api_client import (
-    generate_flux_image,
-)
-
-from src.activities.media.sequential_images import (
-    generate_sequential_article_images,
-    generate_company_contextual_images,
-)
-
-from src.activities.media.prompt_images import (
-    generate_article_images_from_prompts,
-)
-
-from src.activities.media.video_generation import (
-    generate_four_act_video,  # 4-act 12-second video for articles
-    generate_company_video,  # Simple 3s branding video for company profiles
-)
-
-from src.activities.media.mux_client import (
-    upload_video_to_mux,
-    upload_video_file_to_mux,
-    delete_mux_asset,
-    get_mux_asset_info,
-    inject_section_images_activity,
-)
-
-from src.activities.media.mux_catalog import (
-    query_videos_by_country,
-    query_videos_by_mode,
-    query_videos_by_article,
-    get_all_videos_summary,
-)
-
-from src.activities.articles.analyze_sections import (
-    analyze_article_sections,
-)
-
-from src.activities.generation.profile_generation_v2 import (
-    generate_company_profile_v2,
-)
-
-from src.activities.generation.article_generation import (
-    generate_four_act_article,  # 4-act article with four_act_content
-    generate_narrative_article,  # Legacy 3-act narrative-driven article
-    refine_broken_links,  # Phase 5b: Haiku fixes broken links in article
-    generate_four_act_video_prompt,  # Assembles video prompt from briefs (simple, no AI fallback)
-    generate_four_act_video_prompt_brief,  # NEW: Generates briefs from article AFTER save
-)
-
-from src.activities.generation.country_guide_generation import (
-    generate_country_guide_content,  # 8-motivation country guide (now with mode: story/guide/yolo)
-    extract_country_facts,  # Extract facts for countries.facts JSONB
-    generate_country_video_prompt,  # Country-specific 4-act video prompt
-    generate_segment_video_prompt,  # Multi-video: hero/family/finance/daily/yolo prompts
-    generate_topic_cluster_content,  # SEO-targeted topic cluster articles
-)
-
-from src.activities.generation.research_curation import (
-    curate_research_sources,
-)
-
-# generate_four_act_video_prompt moved to article_generation.py
-# generate_image_prompts removed (dead code - thumbnails come from video)
-
-from src.activities.generation.narrative_builder import (
-    build_3_act_narrative,  # Video-first 3-act narrative structure
-)
-
-from src.activities.generation.completeness import (
-    calculate_completeness_score,
-    get_missing_fields,
-    suggest_improvements,
-)
-
-from src.activities.storage.neon_database import (
-    save_company_to_neon,
-    update_company_metadata,
-    get_company_by_id,
-    save_article_to_neon,
-    get_article_by_slug,
-    update_article_four_act_content,  # NEW: Update four_act_content briefs and video_prompt
-    save_spawn_candidate,
-    # Video tags for cluster architecture
-    save_video_tags,
-    get_videos_by_cluster,
-    get_videos_by_country,
-    # NEW: Video inheritance for topic clusters and hubs
-    inherit_parent_video_to_children,
-    get_cluster_videos,
-    get_cluster_story_video,  # NEW: Get story video for video reuse optimization
-    # NEW: Video topic matching for intelligent section placement
-    get_cluster_videos_with_topics,
-    match_video_to_section,
-    # NEW: Video finessing activities for end-of-workflow cleanup
-    finesse_cluster_media,
-    finesse_all_cluster_media,
-)
-
-from src.activities.storage.neon_countries import (
-    save_or_create_country,
-    update_country_facts,
-    update_country_seo_keywords,
-    link_article_to_country,
-    publish_country,
-    get_country_by_code,
-)
-
-from src.activities.storage.neon_articles import (
-    get_recent_articles_from_neon,
-)
-
-from src.activities.storage.neon_country_hubs import (
-    generate_hub_seo_slug,
-    aggregate_cluster_to_hub_payload,
-    save_or_update_country_hub,
-    get_country_hub,
-    get_hub_by_slug,
-    publish_country_hub,
-    generate_hub_content,
-)
-
-from src.activities.storage.zep_integration import (
-    query_zep_for_context,
-    sync_company_to_zep,
-    create_zep_summary,
-    sync_v2_profile_to_zep_graph,
-    sync_article_to_zep,
-)
-
-from src.activities.storage.zep_entity_extraction import (
-    extract_entities_from_v2_profile,
-    extract_entities_from_article,  # New: Extract jobs, skills, locations from articles
-)
-
-from src.activities.storage.zep_graph_visual import (
-    fetch_company_graph_data,
-)
-
-# Articles activities re-enabled
-from src.activities.articles.fetch_related import (
-    fetch_related_articles,
-    link_article_to_company,
-    get_article_timeline,
-)
+# Activities are registered lazily (see src/activities/registry.py)
+from src.activities.registry import LAZY_ACTIVITIES, worker_activities
 
 from src.utils.config import config
+from shared.telemetry import telemetry_interceptors
+from shared.provider_limits import configure_provider_limits, provider_limit_interceptors
+
+IMPORTED_AT = time.perf_counter()
 
 
 async def main():
@@ -307,156 +106,16 @@ async def main():
         print(f"❌ Failed to connect to Temporal: {e}")
         sys.exit(1)
 
+    # Shared provider buckets/leases live in Neon; "llm" activities use the configured model
+    configure_provider_limits(database_url=config.DATABASE_URL, ai_model=config.get_ai_model)
+
     # Create worker with all workflows and activities
     worker = Worker(
         client,
         task_queue=config.TEMPORAL_TASK_QUEUE,
         workflows=[CompanyCreationWorkflow, ArticleCreationWorkflow, NewsCreationWorkflow, CountryGuideCreationWorkflow, SegmentVideoWorkflow, CrawlUrlWorkflow, ClusterArticleWorkflow, TopicClusterWorkflow, VideoEnrichmentWorkflow],
-        activities=[
-            # Normalization
-            normalize_company_url,
-            check_company_exists,
-
-            # Research - Serper
-            fetch_company_news,
-            serper_news_search,  # News search for scheduling/news creation
-            serper_article_search,  # Article search for article creation workflow
-            fetch_targeted_research,
-            serper_httpx_deep_articles,  # Deep article crawling with httpx
-            serper_scrape_url,  # Single URL scrape via Serper API (50/50 with crawl4ai)
-
-            # Research - DataForSEO
-            dataforseo_news_search,
-            dataforseo_serp_search,
-            dataforseo_keyword_research,  # SEO keyword research
-            dataforseo_keyword_difficulty,  # SEO keyword difficulty analysis
-            dataforseo_related_keywords,  # Keyword cluster discovery (first step)
-            research_country_seo_keywords,  # Country guide SEO research
-
-            # News Assessment
-            assess_news_batch,
-
-            # Research - Other
-            httpx_crawl,
-            crawl4ai_service_crawl,  # External Crawl4AI service (browser automation)
-            crawl4ai_batch_crawl,  # Batch crawl multiple URLs
-            prefilter_urls_by_relevancy,  # Pre-filter URLs before crawling
-            # firecrawl_crawl,  # Disabled - out of credit
-            # firecrawl_httpx_discover,  # Disabled - out of credit
-            exa_research_company,
-            exa_research_topic,
-            exa_find_similar_companies,
-
-            # Reddit
-            reddit_search_expat_content,  # Expat voices from Reddit
-
-            # Ambiguity & Validation
-            check_research_ambiguity,
-            validate_company_match,
-            playwright_url_cleanse,  # Deprecated
-            playwright_clean_links,
-            playwright_pre_cleanse,  # Phase 4b: Score URLs before article gen
-            playwright_post_cleanse,  # Phase 5b: Validate links after article
-
-            # Media
-            extract_and_process_logo,
-            generate_company_featured_image,
-            generate_placeholder_image,
-            generate_flux_image,
-            generate_sequential_article_images,
-            generate_company_contextual_images,
-            generate_article_images_from_prompts,
-            analyze_article_sections,
-            # Video
-            generate_four_act_video,  # 4-act 12-second video for articles
-            generate_company_video,  # Simple 3s branding video for company profiles
-            upload_video_to_mux,
-            upload_video_file_to_mux,
-            delete_mux_asset,
-            get_mux_asset_info,
-            inject_section_images_activity,
-            # Mux Asset Catalog (MCP)
-            query_videos_by_country,
-            query_videos_by_mode,
-            query_videos_by_article,
-            get_all_videos_summary,
-
-            # Generation
-            generate_company_profile_v2,
-            generate_four_act_article,  # 4-act article with four_act_content
-            generate_narrative_article,  # Legacy 3-act narrative-driven article
-            refine_broken_links,  # Phase 5b: Haiku fixes broken links
-            generate_four_act_video_prompt,  # Assembles video prompt from briefs (simple)
-            generate_four_act_video_prompt_brief,  # NEW: Generates briefs AFTER article save
-            build_3_act_narrative,   # New: video-first 3-act narrative structure
-            curate_research_sources,
-            calculate_completeness_score,
-            get_missing_fields,
-            suggest_improvements,
-
-            # Database
-            save_company_to_neon,
-            update_company_metadata,
-            get_company_by_id,
-            save_article_to_neon,
-            get_article_by_slug,
-            update_article_four_act_content,  # NEW: Update briefs and video_prompt
-            get_recent_articles_from_neon,
-            save_spawn_candidate,  # Article spawn candidates
-            # Video tags for cluster architecture
-            save_video_tags,
-            get_videos_by_cluster,
-            get_videos_by_country,
-            # Video inheritance for topic clusters and hubs
-            inherit_parent_video_to_children,
-            get_cluster_videos,
-            get_cluster_story_video,
-            # Video topic matching for intelligent section placement
-            get_cluster_videos_with_topics,
-            match_video_to_section,
-
-            # Video finessing for end-of-workflow cleanup
-            finesse_cluster_media,
-            finesse_all_cluster_media,
-
-            # Country Guide Database
-            save_or_create_country,
-            update_country_facts,
-            update_country_seo_keywords,
-            link_article_to_country,
-            publish_country,
-            get_country_by_code,
-
-            # Country Guide Generation
-            generate_country_guide_content,
-            extract_country_facts,
-            generate_country_video_prompt,
-            generate_segment_video_prompt,  # Multi-video: hero/family/finance/daily/yolo
-            generate_topic_cluster_content,  # SEO-targeted topic cluster articles
-
-            # Country Hub (SEO pillar pages)
-            generate_hub_seo_slug,
-            aggregate_cluster_to_hub_payload,
-            save_or_update_country_hub,
-            get_country_hub,
-            get_hub_by_slug,
-            publish_country_hub,
-            generate_hub_content,
-
-            # Zep Integration
-            query_zep_for_context,
-            sync_company_to_zep,
-            create_zep_summary,
-            sync_article_to_zep,
-            fetch_company_graph_data,
-            extract_entities_from_v2_profile,  # Extract deals/people from company profiles
-            extract_entities_from_article,  # Extract jobs/skills/locations from articles
-
-            # Articles (re-enabled)
-            fetch_related_articles,
-            link_article_to_company,
-            get_article_timeline,
-        ],
+        activities=worker_activities(),
+        interceptors=telemetry_interceptors("content-worker") + provider_limit_interceptors(),
     )
 
     print("\n" + "=" * 70)
@@ -514,6 +173,7 @@ async def main():
             "save_company_to_neon",
             "update_company_metadata",
             "get_company_by_id",
+            "neon_find_similar_articles",
         ]),
         ("Zep Integration", [
             "query_zep_for_context",
@@ -534,6 +194,10 @@ async def main():
             print(f"     - {activity}")
 
     print("\n✅ Worker is ready to process company creation workflows")
+    print(
+        f"   ⏱️  Imports {IMPORTED_AT - STARTED_AT:.2f}s, time to polling {time.perf_counter() - STARTED_AT:.2f}s "
+        f"({'lazy' if LAZY_ACTIVITIES else 'eager'} activities)"
+    )
     print("   Press Ctrl+C to stop\n")
 
     # Run worker (blocks until interrupted)
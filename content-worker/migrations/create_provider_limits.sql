@@ -0,0 +1,27 @@
+-- Migration: Create provider rate limit tables
+-- Description: Shared state for shared/provider_limits.py - one token
+--              bucket per external provider (Serper, DataForSEO, Exa,
+--              Gemini, Anthropic, OpenAI, Replicate, Mux, Zep) and the
+--              concurrency leases held by workers calling it.
+--
+-- Every acquire runs in one transaction under
+-- pg_advisory_xact_lock(7301, hashtext(provider)), so buckets need no
+-- row versioning. Leases expire with the activity's start_to_close timeout;
+-- expired rows are deleted on the next acquire for that provider.
+
+CREATE TABLE IF NOT EXISTS provider_rate_buckets (
+    provider VARCHAR(50) PRIMARY KEY,            -- serper, anthropic, replicate, ...
+    tokens DOUBLE PRECISION NOT NULL,            -- Bucket level at refilled_at
+    refilled_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS provider_leases (
+    id BIGSERIAL PRIMARY KEY,
+    provider VARCHAR(50) NOT NULL,
+    priority VARCHAR(20) NOT NULL,               -- interactive, batch
+    holder TEXT NOT NULL,                        -- <service>:<pid>, for debugging stuck leases
+    acquired_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_provider_leases_provider_expires_at ON provider_leases (provider, expires_at);
@@ -0,0 +1,21 @@
+-- Migration: Create url_health table for link validation results
+-- Description: Persistent cache of link check outcomes shared by
+--              playwright_pre_cleanse (Phase 4b), playwright_post_cleanse
+--              (Phase 5b) and company Phase 5.5 validation.
+--
+-- Rows are keyed by normalized URL (see validation/url_health.py).
+-- expires_at is set per outcome: ~30 days for 200s on government domains,
+-- 1 hour for timeouts.
+
+CREATE TABLE IF NOT EXISTS url_health (
+    url TEXT PRIMARY KEY,                        -- Normalized URL
+    status VARCHAR(20) NOT NULL,                 -- validated, broken, paywall, bot_blocked, uncertain, flagged
+    score REAL NOT NULL,                         -- Same scale as scored_urls (0.1 - 1.0)
+    reason VARCHAR(100),                         -- e.g. ok, 404_not_found, paywall:subscribe to read
+    final_url TEXT,                              -- Redirect target, when known
+    checked_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL
+);
+
+-- Periodic cleanup: DELETE FROM url_health WHERE expires_at < NOW()
+CREATE INDEX IF NOT EXISTS idx_url_health_expires_at ON url_health (expires_at);
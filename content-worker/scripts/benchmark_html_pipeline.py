@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark: regex post-processing chain vs single-pass HtmlPipeline.
+
+Runs both over our largest country guides (10k+ words):
+- old: markdown cleanup regexes, inject_section_images (split by H2 and
+  re-join), then one re.sub per broken link
+- new: split_trailing_sections + one HtmlPipeline run with
+  TextCleanupVisitor, UnlinkVisitor and SectionImageVisitor
+
+Both outputs must agree on figure count, link count and visible text.
+
+Usage:
+    cd content-worker && python3 scripts/benchmark_html_pipeline.py
+    python3 scripts/benchmark_html_pipeline.py --neon --limit 5     # real guides
+    python3 scripts/benchmark_html_pipeline.py --fixture guide.html
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import html as lxml_html
+
+from src.utils.html_pipeline import (
+    HtmlPipeline,
+    SectionImageVisitor,
+    TextCleanupVisitor,
+    UnlinkVisitor,
+    split_trailing_sections,
+)
+from src.utils.inject_section_images import inject_section_images
+
+
+PLAYBACK_ID = "benchmarkPlaybackId00000000000000"
+BROKEN_LINKS = 20
+
+WORDS = (
+    "residency visa permit tax income apply application document embassy consulate "
+    "cost month year family spouse children school health insurance property rent "
+    "bank account remote work digital nomad golden program citizen requirement"
+).split()
+
+
+def synthetic_guide(words: int = 12000, seed: int = 7) -> str:
+    """A country guide shaped like our generated ones: ~40 H2 sections, lists, links."""
+    rng = random.Random(seed)
+    parts = ["<p>Intro " + " ".join(rng.choices(WORDS, k=80)) + "</p>\n```html\n"]
+    written = 80
+    section = 0
+    while written < words:
+        section += 1
+        parts.append(f"\n<h2>Section {section}: {rng.choice(WORDS).title()} guide</h2>\n")
+        for _ in range(4):
+            sentence = rng.choices(WORDS, k=70)
+            link_at = rng.randrange(70)
+            url = f"https://example{rng.randrange(60)}.gov/page/{rng.randrange(400)}"
+            sentence[link_at] = f'<a href="{url}" target="_blank">{sentence[link_at]}</a>'
+            parts.append("<p>" + " ".join(sentence) + "</p>\n")
+            written += 70
+        parts.append("<ul>" + "".join(f"<li>{' '.join(rng.choices(WORDS, k=12))}</li>" for _ in range(5)) + "</ul>\n")
+        parts.append("---\n\n\n\n\n")
+        written += 60
+    parts.append("```\n")
+    parts.append("---MEDIA PROMPTS---\nFEATURED: a skyline\nSECTION 1: a street\n")
+    parts.append('---STRUCTURED DATA---\n{"sections": []}\n')
+    return "".join(parts)
+
+
+def broken_urls(html: str, count: int = BROKEN_LINKS) -> list:
+    urls = sorted(set(re.findall(r'href="([^"]+)"', html)))
+    return random.Random(3).sample(urls, min(count, len(urls)))
+
+
+def old_chain(raw: str, broken: list) -> str:
+    """The previous article_generation cleanup + section images + regex unlinking."""
+    content = re.sub(r'---\s*(MEDIA|IMAGE)\s*PROMPTS\s*---\s*.+', '', raw, flags=re.DOTALL | re.IGNORECASE).strip()
+    content = re.sub(r'---\s*STRUCTURED\s*DATA\s*---\s*```json\s*.+?\s*```', '', content, flags=re.DOTALL | re.IGNORECASE).strip()
+    content = re.sub(r'---\s*STRUCTURED\s*DATA\s*---\s*\{.+?\}', '', content, flags=re.DOTALL | re.IGNORECASE).strip()
+    content = re.sub(r'^---\s*$', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\n---\s*\n', '\n\n', content)
+    content = re.sub(r'```\w*\n?', '', content)
+    content = re.sub(r'"Copy like this\.?"', '', content, flags=re.IGNORECASE)
+    content = re.sub(r'(<h2[^>]*>)', r'\n\n\1', content)
+    content = re.sub(r'\n{4,}', '\n\n\n', content)
+    content = content.strip()
+
+    content = inject_section_images(content, PLAYBACK_ID, image_width=1200)
+
+    for url in broken:
+        pattern = rf'<a[^>]*href="{re.escape(url)}"[^>]*>([^<]+)</a>'
+        content = re.sub(pattern, r'\1', content)
+    return content
+
+
+def new_pipeline(raw: str, broken: list) -> str:
+    body, _ = split_trailing_sections(raw)
+    return HtmlPipeline([
+        TextCleanupVisitor(),
+        UnlinkVisitor(broken),
+        SectionImageVisitor(PLAYBACK_ID, image_width=1200),
+    ]).run(body)
+
+
+def summarize(html: str) -> tuple:
+    root = lxml_html.fragment_fromstring(html, create_parent="div")
+    text = " ".join(root.text_content().split())
+    return len(root.findall(".//figure")), len(root.findall(".//a")), text
+
+
+async def load_from_neon(limit: int) -> list:
+    import psycopg
+    from src.utils.config import config
+
+    async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(
+                """
+                SELECT slug, content FROM articles
+                WHERE word_count > 10000 AND content IS NOT NULL
+                ORDER BY word_count DESC
+                LIMIT %s
+                """,
+                (limit,)
+            )
+            return await cur.fetchall()
+
+
+def best_of(fn, raw, broken, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn(raw, broken)
+        timings.append(time.perf_counter() - start)
+    return out, min(timings)
+
+
+def main(args):
+    if args.neon:
+        guides = asyncio.run(load_from_neon(args.limit))
+    elif args.fixture:
+        with open(args.fixture) as f:
+            guides = [(os.path.basename(args.fixture), f.read())]
+    else:
+        guides = [(f"synthetic-{args.words // 1000}k", synthetic_guide(args.words))]
+
+    failed = False
+    for slug, raw in guides:
+        broken = broken_urls(raw)
+        old_out, old_time = best_of(old_chain, raw, broken, args.repeat)
+        new_out, new_time = best_of(new_pipeline, raw, broken, args.repeat)
+
+        old_summary, new_summary = summarize(old_out), summarize(new_out)
+        match = old_summary == new_summary
+        failed |= not match
+
+        print(
+            f"{slug[:40]:<40} {len(raw.split()):>6} words  "
+            f"regex chain {old_time * 1000:7.1f} ms  pipeline {new_time * 1000:7.1f} ms  "
+            f"figures {new_summary[0]:>3}  links {new_summary[1]:>4}  "
+            f"{'match' if match else 'MISMATCH'}"
+        )
+        if not match:
+            print(f"  old: figures={old_summary[0]} links={old_summary[1]}  new: figures={new_summary[0]} links={new_summary[1]}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--neon", action="store_true", help="Benchmark the largest guides in Neon")
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--fixture", help="HTML file to benchmark")
+    parser.add_argument("--words", type=int, default=12000, help="Synthetic guide size")
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-URL aiohttp sessions (old HEAD fallback) vs pooled LinkChecker.
+
+Serves a 200-URL fixture from a local HTTPS test server: 8 "hosts" (ports)
+with a mix of 200s, redirects, 403s and 404s (plus timeouts with --timeouts,
+which then dominate wall time for both paths). The server uses a throwaway
+self-signed certificate, so every new connection pays a real TLS handshake.
+Network round trips of connection setup (DNS + TCP + TLS) are simulated by
+delaying the first request on each new connection by --handshake-ms; every
+request also pays --latency-ms.
+
+Usage:
+    cd content-worker && python3 scripts/benchmark_link_checker.py
+    python3 scripts/benchmark_link_checker.py --handshake-ms 80 --latency-ms 20
+    python3 scripts/benchmark_link_checker.py --plain    # HTTP, no TLS cost
+
+Both paths must classify every URL identically.
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import random
+import ssl
+import sys
+import tempfile
+import time
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.activities.validation.link_checker import LinkChecker, classify_status
+
+
+HOSTS = 8
+BASE_PORT = 18700
+FIXTURE_SIZE = 200
+TIMEOUT = 5.0
+
+# Path kinds and their share of the fixture
+KINDS = [("ok", 0.6), ("redirect", 0.15), ("missing", 0.12), ("forbidden", 0.1), ("slow", 0.03)]
+
+
+def self_signed_contexts() -> tuple:
+    """(server, client) SSL contexts for a throwaway 127.0.0.1 certificate."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert_path, key_path = os.path.join(tmp, "cert.pem"), os.path.join(tmp, "key.pem")
+        with open(cert_path, "wb") as f:
+            f.write(cert.public_bytes(serialization.Encoding.PEM))
+        with open(key_path, "wb") as f:
+            f.write(key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ))
+        server = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server.load_cert_chain(cert_path, key_path)
+        client = ssl.create_default_context(cafile=cert_path)
+    return server, client
+
+
+def build_fixture(size: int = FIXTURE_SIZE, seed: int = 11, timeouts: bool = False, scheme: str = "https") -> list:
+    """Deterministic URL list spread over the test hosts."""
+    rng = random.Random(seed)
+    kinds, weights = zip(*[k for k in KINDS if timeouts or k[0] != "slow"])
+    urls = []
+    for i in range(size):
+        port = BASE_PORT + rng.randrange(HOSTS)
+        kind = rng.choices(kinds, weights)[0]
+        urls.append(f"{scheme}://127.0.0.1:{port}/{kind}/{i}")
+    return urls
+
+
+class TestServer:
+    """aiohttp app on HOSTS ports that counts connections and simulates handshakes."""
+
+    def __init__(self, handshake_ms: float, latency_ms: float, ssl_context: ssl.SSLContext = None):
+        self.ssl_context = ssl_context
+        self.handshake = handshake_ms / 1000
+        self.latency = latency_ms / 1000
+        self.seen_transports = set()
+        self.connections = 0
+        self.runners = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        transport_id = id(request.transport)
+        if transport_id not in self.seen_transports:
+            self.seen_transports.add(transport_id)
+            self.connections += 1
+            await asyncio.sleep(self.handshake)
+        await asyncio.sleep(self.latency)
+
+        kind = request.match_info["kind"]
+        if kind == "ok":
+            return web.Response(status=200, text="ok")
+        if kind == "redirect":
+            raise web.HTTPMovedPermanently(f"/ok/{request.match_info['n']}")
+        if kind == "missing":
+            return web.Response(status=404, text="not found")
+        if kind == "forbidden":
+            return web.Response(status=403, text="forbidden")
+        await asyncio.sleep(TIMEOUT + 1)
+        return web.Response(status=200, text="ok")
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_route("HEAD", "/{kind}/{n}", self.handle)
+        for i in range(HOSTS):
+            runner = web.AppRunner(app)
+            await runner.setup()
+            await web.TCPSite(runner, "127.0.0.1", BASE_PORT + i, ssl_context=self.ssl_context).start()
+            self.runners.append(runner)
+
+    async def stop(self):
+        for runner in self.runners:
+            await runner.cleanup()
+
+    def reset(self):
+        self.seen_transports.clear()
+        self.connections = 0
+
+
+async def check_per_url_sessions(urls: list, ssl_context: ssl.SSLContext = None) -> dict:
+    """The previous HEAD fallback: a fresh ClientSession per URL, all at once."""
+    async def check(url):
+        try:
+            timeout = aiohttp.ClientTimeout(total=TIMEOUT)
+            connector = aiohttp.TCPConnector(ssl=ssl_context or True)
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+                async with session.head(url, allow_redirects=True) as response:
+                    return url, classify_status(response.status)["reason"]
+        except asyncio.TimeoutError:
+            return url, "timeout"
+        except Exception as e:
+            return url, f"error:{type(e).__name__}"
+
+    return dict(await asyncio.gather(*[check(u) for u in urls]))
+
+
+async def check_pooled(urls: list, ssl_context: ssl.SSLContext = None) -> dict:
+    results = {}
+    async with LinkChecker(timeout=TIMEOUT, ssl_context=ssl_context) as checker:
+        async for result in checker.stream(urls):
+            results[result["url"]] = result["reason"]
+    return results
+
+
+async def main(args):
+    server_ssl, client_ssl = (None, None) if args.plain else self_signed_contexts()
+    urls = build_fixture(timeouts=args.timeouts, scheme="http" if args.plain else "https")
+    server = TestServer(args.handshake_ms, args.latency_ms, server_ssl)
+    await server.start()
+
+    try:
+        reference = None
+        for name, fn in (("per-URL sessions", check_per_url_sessions), ("LinkChecker", check_pooled)):
+            timings = []
+            for _ in range(args.repeat):
+                server.reset()
+                start = time.perf_counter()
+                results = await fn(urls, client_ssl)
+                timings.append(time.perf_counter() - start)
+
+            reference = reference or results
+            mismatches = sum(1 for u in urls if results[u] != reference[u])
+            print(
+                f"{name:>17}: best {min(timings) * 1000:8.1f} ms  "
+                f"connections {server.connections:4d}  mismatches {mismatches}"
+            )
+            if mismatches:
+                sys.exit(1)
+    finally:
+        await server.stop()
+
+    print(f"URLs: {len(urls)} over {HOSTS} {'HTTP' if args.plain else 'HTTPS'} hosts, handshake {args.handshake_ms:.0f} ms, latency {args.latency_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--handshake-ms", type=float, default=60.0, help="Simulated new-connection cost")
+    parser.add_argument("--latency-ms", type=float, default=15.0, help="Per-request server latency")
+    parser.add_argument("--timeouts", action="store_true", help="Include URLs that time out")
+    parser.add_argument("--plain", action="store_true", help="Serve plain HTTP (no TLS handshake cost)")
+    parser.add_argument("--repeat", type=int, default=3)
+    asyncio.run(main(parser.parse_args()))
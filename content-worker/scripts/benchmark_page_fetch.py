@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Benchmark: crawler fetch + extraction throughput.
+
+Compares, over the same set of synthetic news/company pages served
+in-process (httpx.MockTransport, no network):
+- bs4:       full body download + BeautifulSoup(html.parser) on the event loop
+             (what the crawlers did)
+- lxml:      byte-capped fetch + extract_page on the event loop
+- lxml-pool: byte-capped fetch + extract_page in the parse process pool
+             (what the crawlers do now)
+
+Reports pages/second with N concurrent fetches and the worst event-loop
+stall seen by a 10 ms ticker task (a stalled loop delays Temporal
+heartbeats and every other activity on the worker).
+
+Usage:
+    cd content-worker && python3 scripts/benchmark_page_fetch.py
+    python3 scripts/benchmark_page_fetch.py --pages 60 --concurrency 8 --paragraphs 400
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from bs4 import BeautifulSoup
+
+from src.utils.page_fetch import extract_page, fetch_html, fetch_page, run_parser
+
+
+WORDS = (
+    "visa residence permit applicants must provide proof of income health insurance "
+    "and a clean criminal record the ministry processes applications within weeks "
+    "fees vary by nationality and family members may join the main applicant"
+).split()
+
+
+def sentence(rng: random.Random, words: int = 18) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + ","
+
+
+def make_page(rng: random.Random, paragraphs: int) -> str:
+    nav = "".join(f'<li><a href="/section/{i}">Section {i}</a></li>' for i in range(60))
+    body = "".join(f"<p>{sentence(rng)} {sentence(rng)}</p>" for _ in range(paragraphs))
+    comments = "".join(
+        f'<div class="comment"><a href="/u/{i}">user{i}</a><p>{sentence(rng, 8)}</p></div>' for i in range(80)
+    )
+    related = "".join(f'<li><a href="/story/{i}">{sentence(rng, 6)}</a></li>' for i in range(40))
+    script = "<script>" + "var x=1;" * 4000 + "</script>"
+    return (
+        f"<html><head><title>Benchmark page</title>{script}<style>body{{}}</style></head><body>"
+        f"<header><nav><ul>{nav}</ul></nav></header>"
+        f'<div class="layout"><article class="post-content"><h1>Headline</h1>{body}</article>'
+        f'<aside class="sidebar"><ul>{related}</ul></aside>'
+        f'<section class="comments">{comments}</section></div>'
+        f"<footer>{sentence(rng)}</footer></body></html>"
+    )
+
+
+def bs4_extract(html: str, max_chars: int) -> dict:
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(["script", "style", "nav", "footer", "header"]):
+        element.decompose()
+    text = soup.get_text(separator=" ", strip=True)
+    return {"title": soup.title.string if soup.title else "", "content": text[:max_chars]}
+
+
+async def loop_lag_monitor(stop: asyncio.Event, samples: list):
+    interval = 0.01
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - start - interval)
+
+
+async def run(mode: str, client: httpx.AsyncClient, urls: list, concurrency: int, max_chars: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    lengths = []
+
+    async def one(url: str):
+        async with semaphore:
+            if mode == "bs4":
+                response = await client.get(url)
+                page = bs4_extract(response.text, max_chars)
+            elif mode == "lxml":
+                fetched = await fetch_html(client, url)
+                page = extract_page(fetched["html"], url, max_chars=max_chars, encoding=fetched["encoding"])
+            else:
+                page = await fetch_page(client, url, max_chars=max_chars)
+            lengths.append(len(page["content"]))
+
+    stop = asyncio.Event()
+    lags = []
+    monitor = asyncio.create_task(loop_lag_monitor(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(one(url) for url in urls))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+    return elapsed, max(lags) if lags else 0.0, sum(lengths) / max(1, len(lengths))
+
+
+async def main(args):
+    rng = random.Random(7)
+    pages = [make_page(rng, args.paragraphs).encode() for _ in range(args.distinct)]
+    print(
+        f"{args.pages} fetches of {args.distinct} distinct pages, "
+        f"avg {sum(map(len, pages)) / len(pages) / 1024:.0f} KB, concurrency {args.concurrency}"
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        index = int(request.url.path.rsplit("/", 1)[-1]) % len(pages)
+        return httpx.Response(200, content=pages[index], headers={"content-type": "text/html; charset=utf-8"})
+
+    urls = [f"https://bench.local/page/{i}" for i in range(args.pages)]
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        # Start the pool outside the timed runs
+        await run_parser(extract_page, pages[0], urls[0])
+
+        for mode in ("bs4", "lxml", "lxml-pool"):
+            elapsed, worst_lag, avg_chars = await run(mode, client, urls, args.concurrency, args.max_chars)
+            print(
+                f"  {mode:<10} {args.pages / elapsed:7.1f} pages/s  "
+                f"worst loop stall {worst_lag * 1000:7.1f} ms  avg content {avg_chars:,.0f} chars"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--distinct", type=int, default=5)
+    parser.add_argument("--paragraphs", type=int, default=250)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--max-chars", type=int, default=10000)
+    asyncio.run(main(parser.parse_args()))
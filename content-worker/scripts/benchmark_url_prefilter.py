@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark: URL pre-filter precision/recall by scorer.
+
+Runs prefilter_urls_by_relevancy over a labeled candidate set (url, title,
+snippet, relevant) with each scorer:
+- keyword (min 1 and min 2 matches - what the workflows used)
+- tfidf (local hashed TF-IDF, no network)
+- embedding (batched embeddings; only if OPENAI_API_KEY or GOOGLE_API_KEY
+  is set, otherwise it falls back to keyword and is reported as such)
+
+Usage:
+    cd content-worker && python3 scripts/benchmark_url_prefilter.py
+    python3 scripts/benchmark_url_prefilter.py --fixture my_candidates.json
+
+Fixture format: [{"topic": "...", "candidates": [{url, title, snippet, relevant}]}]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.activities.research.crawl4ai_service import prefilter_urls_by_relevancy
+
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "url_candidates.json")
+
+RUNS = [
+    ("keyword (min 1)", "keyword", 1),
+    ("keyword (min 2)", "keyword", 2),
+    ("tfidf", "tfidf", 1),
+    ("embedding", "embedding", 1),
+]
+
+
+async def main(args):
+    with open(args.fixture) as f:
+        candidate_sets = json.load(f)
+
+    totals = {name: [0, 0, 0] for name, _, _ in RUNS}  # true positives, kept, relevant
+
+    for candidate_set in candidate_sets:
+        topic = candidate_set["topic"]
+        candidates = candidate_set["candidates"]
+        relevant = {c["url"] for c in candidates if c["relevant"]}
+        print(f"\n{topic}  ({len(candidates)} candidates, {len(relevant)} relevant)")
+
+        for name, scorer, min_matches in RUNS:
+            start = time.perf_counter()
+            result = await prefilter_urls_by_relevancy(candidates, topic, min_matches, args.max_urls, scorer)
+            elapsed = time.perf_counter() - start
+
+            kept = set(result["relevant_urls"])
+            true_positives = len(kept & relevant)
+            precision = true_positives / len(kept) if kept else 0.0
+            recall = true_positives / len(relevant) if relevant else 0.0
+            totals[name][0] += true_positives
+            totals[name][1] += len(kept)
+            totals[name][2] += len(relevant)
+
+            used = result.get("scorer", scorer)
+            label = name if used == scorer else f"{name} -> {used}"
+            print(
+                f"  {label:<22} kept {len(kept):>3}  precision {precision:5.2f}  recall {recall:5.2f}  "
+                f"{elapsed * 1000:7.1f} ms"
+            )
+            if args.verbose:
+                for url in sorted(kept - relevant):
+                    print(f"      false positive: {url}")
+                for url in sorted(relevant - kept):
+                    print(f"      missed:         {url}")
+
+    print("\nOverall")
+    for name, (true_positives, kept, relevant) in totals.items():
+        precision = true_positives / kept if kept else 0.0
+        recall = true_positives / relevant if relevant else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        print(f"  {name:<22} precision {precision:5.2f}  recall {recall:5.2f}  F1 {f1:5.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE)
+    parser.add_argument("--max-urls", type=int, default=30)
+    parser.add_argument("--verbose", action="store_true", help="List false positives and misses")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark: worker cold start, lazy vs eager activity registration.
+
+For each mode, starts --runs fresh interpreters that import worker.py and
+build its activity list (everything before Client.connect) and reports
+median/max time and peak RSS. With --address, also launches
+`python worker.py` against a running Temporal server (e.g.
+`temporal server start-dev`) and reads the time to polling it prints.
+
+Target: the worker should be polling within TIME_TO_POLLING_TARGET_SECONDS
+of process start. Without --address the import + registration time is
+checked against it instead (a lower bound: connect and Worker() are extra).
+
+Usage:
+    cd content-worker && python3 scripts/benchmark_worker_startup.py
+    python3 scripts/benchmark_worker_startup.py --runs 10 --mode lazy
+    python3 scripts/benchmark_worker_startup.py --address localhost:7233
+    python3 worker.py --import-profile     # which imports the time goes to
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+WORKER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TIME_TO_POLLING_TARGET_SECONDS = 2.0
+
+STARTUP = """
+import resource, time
+start = time.perf_counter()
+import worker
+from src.activities.registry import worker_activities
+activities = worker_activities()
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(activities))
+"""
+
+POLLING_LINE = re.compile(r"time to polling ([\d.]+)s")
+
+
+def measure_import(mode: str) -> dict:
+    env = {**os.environ, "LAZY_ACTIVITIES": "true" if mode == "lazy" else "false"}
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", STARTUP], cwd=WORKER_DIR, env=env, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else f"exit {proc.returncode}")
+    seconds, max_rss_kb, activities = proc.stdout.split()[-3:]
+    return {"seconds": float(seconds), "wall": wall, "rss_mb": int(max_rss_kb) / 1024, "activities": int(activities)}
+
+
+def measure_polling(mode: str, address: str, timeout: float = 60.0) -> float:
+    env = {
+        **os.environ,
+        "LAZY_ACTIVITIES": "true" if mode == "lazy" else "false",
+        "TEMPORAL_ADDRESS": address,
+        "TEMPORAL_API_KEY": "",
+        "TELEMETRY_ENABLED": "false",
+    }
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "worker.py"],
+        cwd=WORKER_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    deadline = time.monotonic() + timeout
+    output = []
+    try:
+        for line in proc.stdout:
+            output.append(line)
+            match = POLLING_LINE.search(line)
+            if match:
+                return float(match.group(1))
+            if time.monotonic() > deadline:
+                break
+        raise RuntimeError("worker never reported polling:\n" + "".join(output[-15:]))
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--mode", choices=["lazy", "eager", "both"], default="both")
+    parser.add_argument("--address", help="Temporal server for time-to-polling (e.g. localhost:7233)")
+    parser.add_argument("--target", type=float, default=TIME_TO_POLLING_TARGET_SECONDS)
+    args = parser.parse_args()
+
+    modes = ["lazy", "eager"] if args.mode == "both" else [args.mode]
+    failed = False
+
+    print(f"Worker cold start ({args.runs} runs per mode, target {args.target:.1f}s to polling)\n")
+    print(f"{'mode':<6} {'activities':>10} {'import+register s':>18} {'max s':>7} {'process s':>10} {'RSS MB':>8} {'polling s':>10}")
+
+    for mode in modes:
+        try:
+            runs = [measure_import(mode) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"{mode:<6} failed: {e}")
+            failed = True
+            continue
+
+        polling = None
+        if args.address:
+            try:
+                polling = statistics.median(measure_polling(mode, args.address) for _ in range(args.runs))
+            except RuntimeError as e:
+                print(f"{mode:<6} polling failed: {e}")
+
+        seconds = statistics.median(r["seconds"] for r in runs)
+        print(
+            f"{mode:<6} {runs[0]['activities']:>10} {seconds:>18.2f} "
+            f"{max(r['seconds'] for r in runs):>7.2f} "
+            f"{statistics.median(r['wall'] for r in runs):>10.2f} "
+            f"{statistics.median(r['rss_mb'] for r in runs):>8.0f} "
+            f"{'-' if polling is None else f'{polling:.2f}':>10}"
+        )
+
+        if mode == "lazy":
+            measured = polling if polling is not None else seconds
+            ok = measured <= args.target
+            failed = failed or not ok
+            label = "time to polling" if polling is not None else "import + register (lower bound)"
+            print(f"       {'✅' if ok else '❌'} {label} {measured:.2f}s vs target {args.target:.1f}s")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
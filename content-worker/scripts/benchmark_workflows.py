@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Benchmark: end-to-end content workflows, fully offline.
+
+Runs ArticleCreationWorkflow, CompanyCreationWorkflow and
+CountryGuideCreationWorkflow (with their CrawlUrl / ClusterArticle /
+TopicCluster / SegmentVideo children) in Temporal's time-skipping test
+environment against one in-process worker:
+
+- provider activities (DataForSEO, Serper, Exa, Crawl4AI, Playwright, LLM
+  generation, Zep, Neon, Replicate, Mux) are recorded-fixture stubs from
+  scripts/workflow_stubs.py, sleeping per the [median, p95] latency profiles
+  in scripts/fixtures/workflow_providers.json times --latency-scale
+- CPU-only activities (URL prefilter, page dedupe, completeness score,
+  video prompt assembly, country facts, hub assembly) run for real
+
+Reports per workflow, averaged over --iterations:
+- wall-clock, and per phase (activity type): calls, total and max seconds
+- critical path through the workflow and its children (activity telemetry)
+- worker CPU seconds (process time) and peak RSS
+- history size (events and bytes) of the workflow and its children
+
+Provider credentials and DATABASE_URL are blanked before src is imported,
+so nothing can reach a real service. The server is never downloaded:
+- by default the Temporal CLI dev server from requirements-dev.txt
+  (temporal-bin, pinned) is started from PATH, or from --temporal-cli /
+  TEMPORAL_CLI_PATH. No workflow here uses timers, so real time is fine.
+- --test-server (or TEMPORAL_TEST_SERVER_PATH) uses a pre-fetched
+  temporal-test-server binary in time-skipping mode instead.
+Stub failures are non-retryable, so a stub bug fails the run instead of
+retrying forever. --check needs no server: it lists the activities the
+workflows call that would fall through to the {} fallback (neither
+stubbed nor run locally); tests/test_workflow_stubs.py runs it in pytest.
+
+A recorded run (--json, default latency scale) is kept in
+scripts/fixtures/benchmark_workflows_run.json.
+
+Usage:
+    pip install ./shared -r content-worker/requirements-dev.txt   # from the repo root
+    cd content-worker && python3 scripts/benchmark_workflows.py
+    python3 scripts/benchmark_workflows.py --workflow article --iterations 3
+    python3 scripts/benchmark_workflows.py --latency-scale 0       # orchestration + CPU only
+    python3 scripts/benchmark_workflows.py --recorded recordings/  # <activity>.json overrides
+    python3 scripts/benchmark_workflows.py --json before.json
+    python3 scripts/benchmark_workflows.py --check                 # stub coverage, no server
+"""
+
+import argparse
+import ast
+import asyncio
+import inspect
+import json
+import os
+import resource
+import shutil
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Blank (not unset) so load_dotenv() in src.utils.config can't fill them back in
+OFFLINE_ENV = (
+    "DATABASE_URL", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "GEMINI_API_KEY", "OPENAI_API_KEY",
+    "PYDANTIC_AI_GATEWAY_API_KEY", "DATAFORSEO_LOGIN", "DATAFORSEO_PASSWORD", "SERPER_API_KEY",
+    "EXA_API_KEY", "LINKUP_API_KEY", "FIRECRAWL_API_KEY", "CRAWL4AI_SERVICE_URL",
+    "REPLICATE_API_TOKEN", "CLOUDINARY_URL", "FLUX_API_KEY", "MUX_TOKEN_ID", "MUX_TOKEN_SECRET",
+    "ZEP_API_KEY", "TEMPORAL_API_KEY",
+)
+for key in OFFLINE_ENV:
+    os.environ[key] = ""
+
+from temporalio import activity
+from temporalio.testing import WorkflowEnvironment
+from temporalio.worker import Worker
+
+from src.workflows.article_creation import ArticleCreationWorkflow
+from src.workflows.company_creation import CompanyCreationWorkflow
+from src.workflows.country_guide_creation import CountryGuideCreationWorkflow
+from src.workflows.crawl_url_workflow import CrawlUrlWorkflow
+from src.workflows.cluster_article_workflow import ClusterArticleWorkflow
+from src.workflows.topic_cluster_workflow import TopicClusterWorkflow
+from src.workflows.segment_video_workflow import SegmentVideoWorkflow
+
+# CPU-only activities, run for real
+from src.activities.normalize import normalize_company_url
+from src.activities.generation.completeness import calculate_completeness_score
+from src.activities.research.crawl4ai_service import prefilter_urls_by_relevancy
+from src.activities.research.page_dedup import dedupe_crawled_pages
+from src.activities.generation.article_generation import generate_four_act_video_prompt
+from src.activities.generation.country_guide_generation import (
+    extract_country_facts,
+    generate_segment_video_prompt,
+)
+from src.activities.storage.neon_country_hubs import (
+    generate_hub_seo_slug,
+    aggregate_cluster_to_hub_payload,
+    generate_hub_content,
+)
+from src.activities.media.mux_client import inject_section_images_activity
+from shared.telemetry import ActivityTelemetryInterceptor, LocalExporter, critical_path
+
+from workflow_stubs import FIXTURE, ProviderStubs
+
+
+TASK_QUEUE = "quest-content-queue"  # Child workflows hardcode it
+
+WORKFLOW_CLASSES = [
+    ArticleCreationWorkflow,
+    CompanyCreationWorkflow,
+    CountryGuideCreationWorkflow,
+    CrawlUrlWorkflow,
+    ClusterArticleWorkflow,
+    TopicClusterWorkflow,
+    SegmentVideoWorkflow,
+]
+
+LOCAL_ACTIVITIES = [
+    normalize_company_url,
+    calculate_completeness_score,
+    prefilter_urls_by_relevancy,
+    dedupe_crawled_pages,
+    generate_four_act_video_prompt,
+    extract_country_facts,
+    generate_segment_video_prompt,
+    generate_hub_seo_slug,
+    aggregate_cluster_to_hub_payload,
+    generate_hub_content,
+    inject_section_images_activity,
+]
+
+WORKFLOWS = {
+    "article": (ArticleCreationWorkflow, {
+        "topic": "Portugal digital nomad visa income threshold rises",
+        "article_type": "news",
+        "app": "relocation",
+        "jurisdiction": "UK",
+        "video_quality": "medium",
+    }),
+    "company": (CompanyCreationWorkflow, {
+        "url": "https://www.globalrelocate.co.uk",
+        "category": "relocation_provider",
+        "jurisdiction": "UK",
+        "app": "relocation",
+    }),
+    "country_guide": (CountryGuideCreationWorkflow, {
+        "country_name": "Portugal",
+        "country_code": "PT",
+        "app": "relocation",
+        "video_quality": "medium",
+    }),
+}
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def history_tree(client, workflow_id: str) -> List[Dict[str, Any]]:
+    """History size of a workflow and, recursively, every child it started."""
+    history = await client.get_workflow_handle(workflow_id).fetch_history()
+    events = history.events
+    children = [
+        e.child_workflow_execution_started_event_attributes.workflow_execution.workflow_id
+        for e in events
+        if e.HasField("child_workflow_execution_started_event_attributes")
+    ]
+    tree = [{
+        "workflow_id": workflow_id,
+        "workflow_type": events[0].workflow_execution_started_event_attributes.workflow_type.name,
+        "events": len(events),
+        "bytes": sum(e.ByteSize() for e in events),
+    }]
+    for child_id in children:
+        tree.extend(await history_tree(client, child_id))
+    return tree
+
+
+def summarize_phases(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    phases = defaultdict(lambda: {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "cost": 0.0})
+    for r in records:
+        phase = phases[r["activity_type"]]
+        phase["calls"] += 1
+        phase["total_seconds"] += r["execution_seconds"]
+        phase["max_seconds"] = max(phase["max_seconds"], r["execution_seconds"])
+        phase["cost"] += r.get("cost") or 0.0
+    return sorted(
+        ({"activity_type": name, **phase} for name, phase in phases.items()),
+        key=lambda p: p["total_seconds"],
+        reverse=True
+    )
+
+
+async def run_once(env, name: str, iteration: int, telemetry: ActivityTelemetryInterceptor, exporter: LocalExporter) -> Dict[str, Any]:
+    workflow_cls, workflow_input = WORKFLOWS[name]
+    workflow_id = f"benchmark-{name}-{iteration}-{int(time.time() * 1000)}"
+    exporter.records.clear()
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    result = await env.client.execute_workflow(
+        workflow_cls.run,
+        workflow_input,
+        id=workflow_id,
+        task_queue=TASK_QUEUE,
+    )
+    wall_seconds = time.perf_counter() - wall_start
+    cpu_seconds = time.process_time() - cpu_start
+
+    tree = await history_tree(env.client, workflow_id)
+    telemetry.flush()  # records are exported on the telemetry thread
+    workflow_ids = {w["workflow_id"] for w in tree}
+    records = [r for r in exporter.records if r["workflow_id"] in workflow_ids]
+
+    return {
+        "workflow": name,
+        "iteration": iteration,
+        "status": result.get("status") if isinstance(result, dict) else None,
+        "wall_seconds": wall_seconds,
+        "cpu_seconds": cpu_seconds,
+        "peak_rss_mb": peak_rss_mb(),
+        "activities": len(records),
+        "failed_activities": sum(1 for r in records if r["status"] != "completed"),
+        "cost": sum(r.get("cost") or 0.0 for r in records),
+        "history": {
+            "workflows": len(tree),
+            "events": sum(w["events"] for w in tree),
+            "bytes": sum(w["bytes"] for w in tree),
+            "root_events": tree[0]["events"],
+            "root_bytes": tree[0]["bytes"],
+        },
+        "phases": summarize_phases(records),
+        "critical_path": [
+            {
+                "workflow_type": r["workflow_type"],
+                "activity_type": r["activity_type"],
+                "execution_seconds": r["execution_seconds"],
+                "gap_seconds": r["gap_seconds"],
+            }
+            for r in critical_path([dict(r) for r in records])
+        ],
+    }
+
+
+def called_activities(workflow_cls) -> List[str]:
+    """Activity names a workflow's module passes to execute_activity/start_activity."""
+    tree = ast.parse(inspect.getsource(inspect.getmodule(workflow_cls)))
+    names = set()
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call) and node.args
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("execute_activity", "start_activity")
+        ):
+            names.update(
+                n.value for n in ast.walk(node.args[0])
+                if isinstance(n, ast.Constant) and isinstance(n.value, str)
+            )
+    return sorted(names)
+
+
+def check_coverage(stubs: ProviderStubs) -> int:
+    """Print how each activity the benchmarked workflows call is served; 1 if any aren't."""
+    registered = {}
+    for fn in stubs.activities():
+        defn = activity._Definition.must_from_callable(fn)
+        if defn.name:
+            registered[defn.name] = "stub"
+    for fn in LOCAL_ACTIVITIES:
+        registered[activity._Definition.must_from_callable(fn).name] = "local"
+
+    missing = 0
+    for workflow_cls in WORKFLOW_CLASSES:
+        names = called_activities(workflow_cls)
+        served = [registered.get(name, "FALLBACK") for name in names]
+        missing += served.count("FALLBACK")
+        print(
+            f"\n{workflow_cls.__name__}: {len(names)} activities "
+            f"({served.count('stub')} stub, {served.count('local')} local, {served.count('FALLBACK')} fallback)"
+        )
+        for name, how in zip(names, served):
+            if how == "FALLBACK":
+                print(f"  {name:<48} returns {{}} (no stub)")
+    return 1 if missing else 0
+
+
+def print_run(run: Dict[str, Any], top: int) -> None:
+    history = run["history"]
+    print(f"\n{run['workflow']} #{run['iteration']}: status={run['status']}")
+    print(
+        f"  wall {run['wall_seconds']:.2f}s | worker CPU {run['cpu_seconds']:.2f}s | "
+        f"peak RSS {run['peak_rss_mb']:.0f} MB | {run['activities']} activities "
+        f"({run['failed_activities']} failed) | stub cost ${run['cost']:.3f}"
+    )
+    print(
+        f"  history: {history['workflows']} workflows, {history['events']} events, "
+        f"{history['bytes'] / 1024:.1f} KiB (root {history['root_events']} events, "
+        f"{history['root_bytes'] / 1024:.1f} KiB)"
+    )
+
+    print(f"  {'phase':<40} {'calls':>5} {'total s':>9} {'max s':>8}")
+    for phase in run["phases"][:top]:
+        print(
+            f"  {phase['activity_type']:<40} {phase['calls']:>5} "
+            f"{phase['total_seconds']:>9.3f} {phase['max_seconds']:>8.3f}"
+        )
+
+    print("  critical path:")
+    for step in run["critical_path"]:
+        print(
+            f"    +{step['gap_seconds']:.3f}s  {step['workflow_type']}/{step['activity_type']} "
+            f"{step['execution_seconds']:.3f}s"
+        )
+
+
+def print_summary(runs: List[Dict[str, Any]]) -> None:
+    by_workflow = defaultdict(list)
+    for run in runs:
+        by_workflow[run["workflow"]].append(run)
+
+    print("\n" + "=" * 78)
+    print(f"{'workflow':<16} {'runs':>4} {'wall s':>8} {'cpu s':>8} {'events':>8} {'history KiB':>12} {'RSS MB':>8}")
+    for name, group in by_workflow.items():
+        n = len(group)
+        print(
+            f"{name:<16} {n:>4} "
+            f"{sum(r['wall_seconds'] for r in group) / n:>8.2f} "
+            f"{sum(r['cpu_seconds'] for r in group) / n:>8.2f} "
+            f"{sum(r['history']['events'] for r in group) / n:>8.0f} "
+            f"{sum(r['history']['bytes'] for r in group) / n / 1024:>12.1f} "
+            f"{max(r['peak_rss_mb'] for r in group):>8.0f}"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workflow", choices=sorted(WORKFLOWS) + ["all"], default="all")
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--latency-scale", type=float, default=0.01,
+                        help="Multiplier on fixture latencies (1 = production-like, 0 = no delay)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--recorded", help="Directory of <activity>.json recorded results")
+    parser.add_argument("--temporal-cli", default=os.getenv("TEMPORAL_CLI_PATH") or shutil.which("temporal"),
+                        help="Temporal CLI binary for the dev server (default: temporal on PATH)")
+    parser.add_argument("--test-server", default=os.getenv("TEMPORAL_TEST_SERVER_PATH"),
+                        help="Pre-fetched temporal-test-server binary; runs time-skipping instead")
+    parser.add_argument("--top", type=int, default=12, help="Phases to print per run")
+    parser.add_argument("--json", metavar="PATH",
+                        help="Write runs as JSON to PATH instead of printing tables (the dev server owns stdout)")
+    parser.add_argument("--check", action="store_true",
+                        help="Only check which called activities are stubbed (no test server)")
+    args = parser.parse_args()
+
+    names = sorted(WORKFLOWS) if args.workflow == "all" else [args.workflow]
+    stubs = ProviderStubs.from_fixture(
+        args.fixture,
+        latency_scale=args.latency_scale,
+        seed=args.seed,
+        recorded_dir=args.recorded,
+    )
+    if args.check:
+        return check_coverage(stubs)
+
+    if args.test_server:
+        start_env = WorkflowEnvironment.start_time_skipping(test_server_existing_path=args.test_server)
+    elif args.temporal_cli:
+        start_env = WorkflowEnvironment.start_local(dev_server_existing_path=args.temporal_cli, dev_server_log_level="error")
+    else:
+        print("No Temporal server binary: pip install -r requirements-dev.txt, or pass --temporal-cli", file=sys.stderr)
+        return 2
+
+    exporter = LocalExporter()
+    telemetry = ActivityTelemetryInterceptor("benchmark", [exporter])
+
+    runs = []
+    async with await start_env as env:
+        async with Worker(
+            env.client,
+            task_queue=TASK_QUEUE,
+            workflows=WORKFLOW_CLASSES,
+            activities=stubs.activities() + LOCAL_ACTIVITIES,
+            interceptors=[telemetry],
+        ):
+            for name in names:
+                for i in range(args.iterations):
+                    run = await run_once(env, name, i, telemetry, exporter)
+                    runs.append(run)
+                    if not args.json:
+                        print_run(run, args.top)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"runs": runs, "unstubbed": dict(stubs.unstubbed)}, f, indent=2)
+        print(f"Wrote {len(runs)} runs to {args.json}")
+        return
+
+    print_summary(runs)
+    if stubs.unstubbed:
+        print(f"\nUnstubbed activities (returned {{}}): {dict(stubs.unstubbed)}")
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Calibrate: article index duplicate/related thresholds per scorer.
+
+Scores labeled headline pairs (story, article, label "duplicate" /
+"related" / "new") with each available scorer and sweeps the thresholds,
+applying the same title entity checks as classify():
+- duplicate: precision/recall of a "duplicate" verdict
+- related: precision/recall of any match ("duplicate" or "developing")
+
+hashed always runs; openai/google only if their API key is set.
+
+Usage:
+    cd content-worker && python3 scripts/calibrate_article_thresholds.py
+    python3 scripts/calibrate_article_thresholds.py --fixture my_pairs.json
+
+Fixture format: [{"story": "...", "article": "...", "label": "duplicate"}]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.article_index import (
+    INDEX_HASH_DIMENSIONS,
+    THRESHOLDS,
+    article_text,
+    related_matches,
+    same_story,
+)
+from src.utils.embeddings import embed_texts, embedding_provider, hashed_features
+
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "headline_pairs.json")
+
+SWEEP = [round(float(t), 2) for t in np.arange(0.2, 0.96, 0.05)]
+
+
+async def similarities(scorer, pairs):
+    texts = [article_text(p[side]) for p in pairs for side in ("story", "article")]
+    vectors = hashed_features(texts, INDEX_HASH_DIMENSIONS) if scorer == "hashed" else await embed_texts(texts)
+    if vectors is None:
+        return None
+    return [float(vectors[2 * i] @ vectors[2 * i + 1]) for i in range(len(pairs))]
+
+
+def verdicts(pairs, scores, scorer, duplicate, related):
+    thresholds = {"duplicate": duplicate, "related": related}
+    saved, THRESHOLDS[scorer] = THRESHOLDS[scorer], thresholds
+    try:
+        out = []
+        for pair, score in zip(pairs, scores):
+            match = {"title": pair["article"], "similarity": score}
+            matched = related_matches(pair["story"], [match], scorer)
+            if matched and score >= duplicate and same_story(pair["story"], match):
+                out.append("duplicate")
+            else:
+                out.append("developing" if matched else "new")
+        return out
+    finally:
+        THRESHOLDS[scorer] = saved
+
+
+def precision_recall(predicted, actual):
+    true_positives = sum(p and a for p, a in zip(predicted, actual))
+    kept, wanted = sum(predicted), sum(actual)
+    return (true_positives / kept if kept else 1.0), (true_positives / wanted if wanted else 1.0)
+
+
+def f1(precision, recall):
+    return 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+
+async def main(args):
+    with open(args.fixture) as f:
+        pairs = json.load(f)
+    labels = [p["label"] for p in pairs]
+    print(f"{len(pairs)} pairs: {labels.count('duplicate')} duplicate, "
+          f"{labels.count('related')} related, {labels.count('new')} new")
+
+    for scorer in ["hashed"] + ([embedding_provider()] if embedding_provider() else []):
+        scores = await similarities(scorer, pairs)
+        if scores is None:
+            print(f"\n{scorer}: embedding call failed, skipped")
+            continue
+
+        print(f"\n{scorer} (current {THRESHOLDS[scorer]})")
+        print(f"  {'threshold':>9}  {'dup P':>6} {'dup R':>6} {'dup F1':>6}   {'rel P':>6} {'rel R':>6} {'rel F1':>6}")
+        best = {}
+        for threshold in SWEEP:
+            duplicate = verdicts(pairs, scores, scorer, threshold, min(threshold, THRESHOLDS[scorer]["related"]))
+            related = verdicts(pairs, scores, scorer, 1.01, threshold)
+            dup = precision_recall([v == "duplicate" for v in duplicate], [l == "duplicate" for l in labels])
+            rel = precision_recall([v != "new" for v in related], [l != "new" for l in labels])
+            print(f"  {threshold:>9.2f}  {dup[0]:>6.2f} {dup[1]:>6.2f} {f1(*dup):>6.2f}   "
+                  f"{rel[0]:>6.2f} {rel[1]:>6.2f} {f1(*rel):>6.2f}")
+            for kind, pr in (("duplicate", dup), ("related", rel)):
+                if f1(*pr) > best.get(kind, (0, 0))[1]:
+                    best[kind] = (threshold, f1(*pr))
+        print(f"  best F1: duplicate {best.get('duplicate')}, related {best.get('related')}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE)
+    asyncio.run(main(parser.parse_args()))
@@ -9,10 +9,16 @@ import asyncio
 import os
 from datetime import timedelta, datetime
 from temporalio.client import Client, Schedule, ScheduleActionStartWorkflow, ScheduleSpec, ScheduleIntervalSpec, ScheduleState
+from temporalio.common import Priority
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Scheduled runs are batch work: provider rate limits keep a reserve for
+# dashboard requests (shared/provider_limits.py BATCH_PRIORITY_KEY).
+# Child article workflows inherit the priority.
+BATCH_PRIORITY = Priority(priority_key=4)
+
 # App configurations for scheduling
 APP_CONFIGS = {
     "placement": {
@@ -74,6 +80,7 @@ async def create_news_creation_schedule(app: str, config: dict):
                     workflow_input,
                     id=f"4act-news-{app}-{date_str}",
                     task_queue=task_queue,
+                    priority=BATCH_PRIORITY,
                 ),
                 spec=ScheduleSpec(
                     intervals=[
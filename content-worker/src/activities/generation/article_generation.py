@@ -14,8 +14,11 @@ Falls back to Anthropic Claude if Gemini unavailable.
 from temporalio import activity
 from typing import Dict, Any, List, Optional
 from slugify import slugify
+import asyncio
+import os
 import re
 import json
+import time
 
 # AI SDKs - Gemini primary, Anthropic fallback
 import google.generativeai as genai
@@ -25,7 +28,22 @@ import anthropic
 from pydantic import BaseModel, Field, field_validator
 
 from src.utils.config import config
-from src.config.app_config import get_app_config, APP_CONFIGS, CharacterStyle, CHARACTER_STYLE_PROMPTS
+from src.utils.context_packer import (
+    DEFAULT_CONTEXT_BUDGET, budget_for, estimate_tokens, format_packing_stats, pack_sources
+)
+from src.utils.html_pipeline import HtmlPipeline, TextCleanupVisitor, UnlinkVisitor, split_trailing_sections
+from src.utils.article_stream import ArticleStreamParser, find_json_object
+from shared.app_config import (
+    get_app_config, APP_CONFIGS, CharacterStyle, CHARACTER_STYLE_PROMPT_SETS,
+    VideoActTemplate, VideoConfig, format_act_structure,
+)
+
+# Cast wording injected into this worker's video prompts
+CHARACTER_STYLE_PROMPTS = CHARACTER_STYLE_PROMPT_SETS["content-worker"]
+
+
+# Minimum seconds between progress heartbeats while an article streams in
+HEARTBEAT_INTERVAL_SECONDS = 2.0
 
 
 # ===== PYDANTIC MODELS FOR 4-ACT VALIDATION =====
@@ -98,16 +116,9 @@ def extract_media_prompts(content: str) -> tuple:
     return content, featured_prompt, section_prompts
 
 
-def extract_structured_data(response_text: str) -> Dict[str, Any]:
-    """
-    Extract structured JSON data from article response.
-
-    Looks for ---STRUCTURED DATA--- section with 4-act sections, callouts, FAQ, etc.
-
-    Returns:
-        Dict with sections, callouts, faq, comparison, timeline, stat_highlight, guide_mode
-    """
-    structured_data = {
+def _default_structured_data() -> Dict[str, Any]:
+    """Empty STRUCTURED DATA skeleton; parsed JSON is merged over it."""
+    return {
         "sections": [],
         "callouts": [],
         "faq": [],
@@ -139,59 +150,69 @@ def extract_structured_data(response_text: str) -> Dict[str, Any]:
         }
     }
 
-    # Find structured data section
-    # First try: with ```json code fence
-    match = re.search(r'---\s*STRUCTURED\s*DATA\s*---\s*```json\s*(.+?)\s*```', response_text, re.DOTALL | re.IGNORECASE)
 
-    if not match:
-        # Second try: find the JSON by locating opening brace and finding balanced closing brace
-        header_match = re.search(r'---\s*STRUCTURED\s*DATA\s*---\s*', response_text, re.IGNORECASE)
-        if header_match:
-            start_pos = header_match.end()
-            # Find the first { after the header
-            brace_pos = response_text.find('{', start_pos)
-            if brace_pos != -1:
-                # Find balanced closing brace
-                depth = 0
-                end_pos = brace_pos
-                for i, char in enumerate(response_text[brace_pos:], start=brace_pos):
-                    if char == '{':
-                        depth += 1
-                    elif char == '}':
-                        depth -= 1
-                        if depth == 0:
-                            end_pos = i + 1
-                            break
-                if depth == 0:
-                    json_str = response_text[brace_pos:end_pos]
-                    match = type('Match', (), {'group': lambda self, n: json_str})()  # Fake match object
+def parse_structured_json(json_str: str) -> Dict[str, Any]:
+    """
+    Parse a STRUCTURED DATA JSON object over the default structure.
 
-    if match:
-        json_str = match.group(1).strip()
+    Tolerates trailing commas; on parse failure the defaults are returned.
+    """
+    structured_data = _default_structured_data()
+    json_str = json_str.strip()
+    try:
+        data = json.loads(json_str)
+        structured_data.update(data)
+        print(f"✅ STRUCTURED DATA extracted: {len(data.get('sections', []))} sections")
+    except json.JSONDecodeError as e:
+        print(f"⚠️ JSON parse error (attempting fix): {str(e)[:100]}")
+        # Try to fix common JSON issues
+        json_str = re.sub(r',\s*([}\]])', r'\1', json_str)  # Remove trailing commas
         try:
             data = json.loads(json_str)
             structured_data.update(data)
-            print(f"✅ STRUCTURED DATA extracted: {len(data.get('sections', []))} sections")
-        except json.JSONDecodeError as e:
-            print(f"⚠️ JSON parse error (attempting fix): {str(e)[:100]}")
-            # Try to fix common JSON issues
-            json_str = re.sub(r',\s*([}\]])', r'\1', json_str)  # Remove trailing commas
-            try:
-                data = json.loads(json_str)
-                structured_data.update(data)
-                print(f"✅ STRUCTURED DATA extracted after fix: {len(data.get('sections', []))} sections")
-            except json.JSONDecodeError as e2:
-                print(f"❌ STRUCTURED DATA JSON PARSE FAILED: {str(e2)[:200]}")
-                print(f"❌ JSON string (first 500 chars): {json_str[:500]}")
-    else:
-        print(f"❌ NO STRUCTURED DATA SECTION FOUND in response")
-        # Log what we're looking for to help debug
-        if '---' in response_text and 'STRUCTURED' in response_text.upper():
-            print(f"⚠️ Found partial match - header may be malformed")
+            print(f"✅ STRUCTURED DATA extracted after fix: {len(data.get('sections', []))} sections")
+        except json.JSONDecodeError as e2:
+            print(f"❌ STRUCTURED DATA JSON PARSE FAILED: {str(e2)[:200]}")
+            print(f"❌ JSON string (first 500 chars): {json_str[:500]}")
 
     return structured_data
 
 
+def extract_structured_data(response_text: str) -> Dict[str, Any]:
+    """
+    Extract structured JSON data from article response.
+
+    Looks for ---STRUCTURED DATA--- section with 4-act sections, callouts, FAQ, etc.
+    Streamed generation gets the JSON from ArticleStreamParser instead and
+    calls parse_structured_json directly.
+
+    Returns:
+        Dict with sections, callouts, faq, comparison, timeline, stat_highlight, guide_mode
+    """
+    json_str = None
+
+    # Find structured data section
+    # First try: with ```json code fence
+    match = re.search(r'---\s*STRUCTURED\s*DATA\s*---\s*```json\s*(.+?)\s*```', response_text, re.DOTALL | re.IGNORECASE)
+    if match:
+        json_str = match.group(1)
+    else:
+        # Second try: the first balanced JSON object after the header
+        header_match = re.search(r'---\s*STRUCTURED\s*DATA\s*---\s*', response_text, re.IGNORECASE)
+        if header_match:
+            json_str = find_json_object(response_text, header_match.end())
+
+    if json_str:
+        return parse_structured_json(json_str)
+
+    print(f"❌ NO STRUCTURED DATA SECTION FOUND in response")
+    # Log what we're looking for to help debug
+    if '---' in response_text and 'STRUCTURED' in response_text.upper():
+        print(f"⚠️ Found partial match - header may be malformed")
+
+    return _default_structured_data()
+
+
 def generate_video_narrative_from_sections(sections: List[Dict], playback_id: str = None) -> Dict[str, Any]:
     """
     Generate video_narrative JSON from article sections.
@@ -271,9 +292,6 @@ async def generate_four_act_article(
         activity.logger.info(f"Using custom slug: {custom_slug}")
 
     try:
-        # Build prompt with research context
-        prompt = build_prompt(topic, research_context)
-
         # AI provider is configurable via ARTICLE_AI_PROVIDER env var
         # Determine which provider to use: Gateway > Anthropic > Gemini
         gateway_key = os.environ.get("PYDANTIC_AI_GATEWAY_API_KEY") or getattr(config, "PYDANTIC_AI_GATEWAY_API_KEY", None)
@@ -292,7 +310,7 @@ async def generate_four_act_article(
             provider = "anthropic"
             model_name = "claude-sonnet-4-20250514"
             activity.logger.info(f"Using AI: {provider}:{model_name}")
-            anthropic_client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
+            anthropic_client = anthropic.AsyncAnthropic(api_key=config.ANTHROPIC_API_KEY)
         elif config.GOOGLE_API_KEY:
             # Last resort: Gemini
             use_gemini = True
@@ -304,6 +322,9 @@ async def generate_four_act_article(
         else:
             raise ValueError("No AI API key configured (need PYDANTIC_AI_GATEWAY_API_KEY, ANTHROPIC_API_KEY, or GOOGLE_API_KEY)")
 
+        # Build prompt with research context, packed to the model's budget
+        prompt = build_prompt(topic, research_context, budget_tokens=budget_for(model_name))
+
         # Get app config for rich context
         app_config = APP_CONFIGS.get(app)
 
@@ -948,95 +969,123 @@ HOLISTIC VIDEO QUALITY (AI video models struggle with these - follow strictly):
 Source links are MANDATORY - articles without <a href> tags will be rejected.
 The STRUCTURED DATA section is MANDATORY - without it, no video can be generated."""
 
-        # Generate article using Gateway (primary), Anthropic (secondary), or Gemini (fallback)
-        if use_gateway:
-            # Use Gateway with GPT-4o
-            from src.utils.ai_gateway import get_completion_async
-            full_prompt = f"{system_prompt}\n\n{prompt}"
-            article_text = await get_completion_async(
-                full_prompt,
-                model="quality",  # gpt-4o via gateway
-                max_tokens=16384,
-                temperature=0.7
-            )
-            activity.logger.info(f"Gateway response received: {len(article_text)} chars")
-        elif use_gemini:
-            # Gemini 2.5 Pro (stable)
-            model = genai.GenerativeModel(
-                model_name='gemini-2.5-pro',
-                system_instruction=system_prompt
-            )
-            response = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=16384,
+        # Generate article using Gateway (primary), Anthropic (secondary), or Gemini (fallback).
+        # The response is streamed: metadata, body and STRUCTURED DATA are parsed as
+        # they arrive, and every few seconds of output heartbeats progress so a
+        # stalled stream trips the workflow's heartbeat_timeout instead of the
+        # whole start_to_close_timeout. Until the first delta a ticker
+        # heartbeats instead, so a slow first token doesn't kill the attempt.
+        usage = {}
+
+        async def stream_article():
+            if use_gateway:
+                # Use Gateway with GPT-4o
+                from src.utils.ai_gateway import stream_completion_async
+                full_prompt = f"{system_prompt}\n\n{prompt}"
+                async for delta in stream_completion_async(
+                    full_prompt,
+                    model="quality",  # gpt-4o via gateway
+                    max_tokens=16384,
                     temperature=0.7
+                ):
+                    yield delta
+            elif use_gemini:
+                # Gemini 2.5 Pro (stable)
+                model = genai.GenerativeModel(
+                    model_name='gemini-2.5-pro',
+                    system_instruction=system_prompt
                 )
-            )
-            article_text = response.text
-            activity.logger.info(f"Gemini response received: {len(article_text)} chars")
-        else:
-            # Anthropic Claude fallback
-            message = anthropic_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=16384,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            article_text = message.content[0].text
-            activity.logger.info(f"Anthropic response received: {len(article_text)} chars")
-
-        # Parse SEO metadata from structured output
-        lines = article_text.strip().split('\n')
-
-        # Extract TITLE:, META:, SLUG: from first lines
-        title = topic  # fallback
-        meta_description = None
-        ai_suggested_slug = None
-        content_start_idx = 0
-
-        for idx, line in enumerate(lines[:10]):  # Check first 10 lines for metadata
-            line_stripped = line.strip()
-            if line_stripped.startswith('TITLE:'):
-                title = line_stripped[6:].strip()
-                # Soft limit 90 chars - only truncate if way over, and only at natural breaks
-                if len(title) > 90:
-                    activity.logger.warning(f"Title too long ({len(title)} chars), truncating to ~90")
-                    # Try to truncate at colon (natural headline break)
-                    colon_pos = title[:90].rfind(':')
-                    if colon_pos > 40:
-                        # Keep the part before colon + colon itself
-                        title = title[:colon_pos + 1].strip()
-                    else:
-                        # No colon, try dash or em-dash
-                        dash_pos = max(title[:90].rfind(' - '), title[:90].rfind(' – '))
-                        if dash_pos > 40:
-                            title = title[:dash_pos].strip()
-                        else:
-                            # Last resort: just keep under 90 at word boundary
-                            truncated = title[:90]
-                            last_space = truncated.rfind(' ')
-                            if last_space > 60:
-                                title = truncated[:last_space].rstrip(':,-–')
-                content_start_idx = idx + 1
-            elif line_stripped.startswith('META:'):
-                meta_description = line_stripped[5:].strip()
-                content_start_idx = idx + 1
-            elif line_stripped.startswith('SLUG:'):
-                ai_suggested_slug = line_stripped[5:].strip().lower().replace(' ', '-')
-                content_start_idx = idx + 1
-            elif line_stripped.startswith('<'):
-                # HTML content started
-                break
+                response = await model.generate_content_async(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        max_output_tokens=16384,
+                        temperature=0.7
+                    ),
+                    stream=True
+                )
+                async for chunk in response:
+                    try:
+                        yield chunk.text
+                    except ValueError:
+                        # Chunk without text parts (e.g. final finish_reason chunk)
+                        continue
+            else:
+                # Anthropic Claude fallback
+                async with anthropic_client.messages.stream(
+                    model="claude-sonnet-4-20250514",
+                    max_tokens=16384,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                ) as stream:
+                    async for delta in stream.text_stream:
+                        yield delta
+                    message = await stream.get_final_message()
+                    usage["input_tokens"] = message.usage.input_tokens
+                    usage["output_tokens"] = message.usage.output_tokens
+
+        parser = ArticleStreamParser()
+
+        async def heartbeat_until_first_delta():
+            # Opening the stream (provider slot, long prompt) can take longer
+            # than heartbeat_timeout before the first token arrives
+            while True:
+                activity.heartbeat(parser.progress())
+                await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+
+        ticker = asyncio.create_task(heartbeat_until_first_delta())
+        last_heartbeat = time.monotonic()
+        try:
+            async for delta in stream_article():
+                if not ticker.done():
+                    # From here on a stalled stream stops heartbeating
+                    ticker.cancel()
+                parser.feed(delta)
+                now = time.monotonic()
+                if now - last_heartbeat >= HEARTBEAT_INTERVAL_SECONDS:
+                    activity.heartbeat(parser.progress())
+                    last_heartbeat = now
+        finally:
+            ticker.cancel()
+        parser.finish()
+
+        article_text = parser.text
+        activity.logger.info(f"{provider} stream complete: {len(article_text)} chars")
+
+        # SEO metadata (TITLE:, META:, SLUG:) was picked out of the first lines while streaming
+        title = parser.title or topic  # fallback
+        meta_description = parser.meta_description
+        ai_suggested_slug = parser.slug
+        body, trailing, structured_json = parser.body, parser.trailing, parser.structured_json
+
+        # Soft limit 90 chars - only truncate if way over, and only at natural breaks
+        if parser.title and len(title) > 90:
+            activity.logger.warning(f"Title too long ({len(title)} chars), truncating to ~90")
+            # Try to truncate at colon (natural headline break)
+            colon_pos = title[:90].rfind(':')
+            if colon_pos > 40:
+                # Keep the part before colon + colon itself
+                title = title[:colon_pos + 1].strip()
+            else:
+                # No colon, try dash or em-dash
+                dash_pos = max(title[:90].rfind(' - '), title[:90].rfind(' – '))
+                if dash_pos > 40:
+                    title = title[:dash_pos].strip()
+                else:
+                    # Last resort: just keep under 90 at word boundary
+                    truncated = title[:90]
+                    last_space = truncated.rfind(' ')
+                    if last_space > 60:
+                        title = truncated[:last_space].rstrip(':,-–')
 
         # Fallback: if no structured metadata, use first line as title
-        if title == topic and lines:
-            title = lines[0].strip().lstrip('#').strip()
-            content_start_idx = 1
-
-        raw_content = '\n'.join(lines[content_start_idx:]).strip()
+        if title == topic and parser.first_line:
+            title = parser.first_line.lstrip('#').strip()
+            lines = article_text.strip().split('\n', 1)
+            raw_content = lines[1].strip() if len(lines) > 1 else ''
+            body, trailing = split_trailing_sections(raw_content)
+            structured_json = None
 
         # Log extracted metadata
         activity.logger.info(f"SEO Metadata - Title ({len(title)} chars): {title[:70]}")
@@ -1045,33 +1094,19 @@ The STRUCTURED DATA section is MANDATORY - without it, no video can be generated
         if ai_suggested_slug:
             activity.logger.info(f"SEO Metadata - AI Slug: {ai_suggested_slug}")
 
-        # Extract structured data (sections, callouts, FAQ, etc.) for 4-act video
-        structured_data = extract_structured_data(raw_content)
+        # Extract structured data (sections, callouts, FAQ, etc.) for 4-act video.
+        # Use the JSON object the stream parser matched; rescan the tail only if it didn't.
+        if structured_json:
+            structured_data = parse_structured_json(structured_json)
+        else:
+            structured_data = extract_structured_data(trailing)
 
         # Also extract legacy media prompts for backwards compatibility
-        content, featured_prompt, section_prompts = extract_media_prompts(raw_content)
-
-        # Remove structured data section from content (it's metadata, not display content)
-        content = re.sub(r'---\s*STRUCTURED\s*DATA\s*---\s*```json\s*.+?\s*```', '', content, flags=re.DOTALL | re.IGNORECASE).strip()
-        content = re.sub(r'---\s*STRUCTURED\s*DATA\s*---\s*\{.+?\}', '', content, flags=re.DOTALL | re.IGNORECASE).strip()
-
-        # Clean markdown artifacts and formatting issues
-        # Remove triple dashes (markdown separators) - they're not valid HTML
-        content = re.sub(r'^---\s*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'\n---\s*\n', '\n\n', content)
-
-        # Remove code blocks (```html, ```markdown, etc.)
-        content = re.sub(r'```\w*\n?', '', content)
+        _, featured_prompt, section_prompts = extract_media_prompts(trailing)
 
-        # Remove "Copy like this" annotations
-        content = re.sub(r'"Copy like this\.?"', '', content, flags=re.IGNORECASE)
-
-        # Fix spacing: Ensure double line breaks before H2 headers for mobile readability
-        content = re.sub(r'(<h2[^>]*>)', r'\n\n\1', content)
-
-        # Clean up excessive whitespace
-        content = re.sub(r'\n{4,}', '\n\n\n', content)  # Max 3 newlines (2 blank lines)
-        content = content.strip()
+        # Clean markdown artifacts (--- rules, code fences, "Copy like this"),
+        # space out H2s and collapse blank lines in one parsed pass
+        content = HtmlPipeline([TextCleanupVisitor()]).run(body)
 
         # Log structured data extraction
         sections = structured_data.get("sections", [])
@@ -1158,9 +1193,9 @@ The STRUCTURED DATA section is MANDATORY - without it, no video can be generated
             output_tokens = len(article_text) // 4
             cost = (input_tokens * 0.00025 + output_tokens * 0.001) / 1000  # Gemini pricing
         else:
-            # Anthropic Claude - has usage info
-            input_tokens = message.usage.input_tokens
-            output_tokens = message.usage.output_tokens
+            # Anthropic Claude - usage from the final stream message
+            input_tokens = usage.get("input_tokens", len(prompt) // 4)
+            output_tokens = usage.get("output_tokens", len(article_text) // 4)
             cost = (input_tokens * 0.003 + output_tokens * 0.015) / 1000
 
         return {
@@ -1249,8 +1284,17 @@ The STRUCTURED DATA section is MANDATORY - without it, no video can be generated
         }
 
 
-def build_prompt(topic: str, research_context: Dict[str, Any]) -> str:
-    """Build prompt with rich curated research from Gemini Pro analysis."""
+def build_prompt(
+    topic: str,
+    research_context: Dict[str, Any],
+    budget_tokens: int = DEFAULT_CONTEXT_BUDGET
+) -> str:
+    """
+    Build prompt with rich curated research from Gemini Pro analysis.
+
+    Source page text is packed (deduped, ranked by relevance) into whatever
+    is left of budget_tokens after the facts, URLs and knowledge-graph context.
+    """
     parts = [f"Write an article about: {topic}\n"]
 
     # Check for curated sources (new two-stage approach with Gemini Pro)
@@ -1404,16 +1448,33 @@ def build_prompt(topic: str, research_context: Dict[str, Any]) -> str:
 
             parts.append("")  # Empty line after Zep context
 
+        # === PREVIOUS COVERAGE - earlier articles on this story (news duplicate check) ===
+        previous_coverage = research_context.get("previous_coverage", [])
+        if previous_coverage:
+            parts.append("\n=== PREVIOUS COVERAGE (this is a developing story - link to our earlier articles) ===")
+            for article in previous_coverage[:5]:
+                parts.append(f"• {article.get('title', 'Article')}: /{article.get('slug', '')}")
+            parts.append("Mention what has changed since, and link the earlier coverage using the relative URLs above.")
+
         # === CURATED SOURCES with full content ===
+        # Full text only for relevant sources, packed into the remaining budget
+        shown = curated[:30]
+        with_content = [s for s in shown if s.get('full_content') and s.get('relevance_score', 0) >= 5]
+        packed, packing = pack_sources(
+            with_content, topic, budget_tokens - estimate_tokens('\n'.join(parts)), text_key="full_content"
+        )
+        packed_content = {id(s): p["full_content"] for s, p in zip(with_content, packed)}
+        activity.logger.info(f"Research context packed: {format_packing_stats(packing)}")
+
         parts.append("\n=== CURATED SOURCES (ranked by relevance - use for inline citations) ===")
-        for source in curated[:30]:
+        for source in shown:
             parts.append(f"\n--- Source (relevance: {source.get('relevance_score', '?')}/10) ---")
             parts.append(f"Title: {source.get('title', '')}")
             parts.append(f"URL: {source.get('url', '')}")
             if source.get('unique_value'):
                 parts.append(f"Unique Value: {source['unique_value']}")
-            if source.get('full_content') and source.get('relevance_score', 0) >= 5:
-                parts.append(f"Full Content:\n{source['full_content'][:6000]}")
+            if packed_content.get(id(source)):
+                parts.append(f"Full Content:\n{packed_content[id(source)]}")
 
     else:
         # Fallback to old approach (uncurated sources)
@@ -1426,23 +1487,29 @@ def build_prompt(topic: str, research_context: Dict[str, Any]) -> str:
                 if a.get('snippet'):
                     parts.append(a['snippet'])
 
-        crawled = research_context.get("crawled_pages", [])
+        # Crawled pages and Exa results share the remaining budget
+        crawled = research_context.get("crawled_pages", [])[:20]
+        exa = [
+            {**r, "content": r.get('content', '') or r.get('text', '')}
+            for r in research_context.get("exa_results", [])[:10]
+        ]
+        packed, packing = pack_sources(crawled + exa, topic, budget_tokens - estimate_tokens('\n'.join(parts)))
+        crawled, exa = packed[:len(crawled)], packed[len(crawled):]
+        activity.logger.info(f"Research context packed: {format_packing_stats(packing)}")
+
         if crawled:
             parts.append("\n=== SOURCES ===")
-            for p in crawled[:20]:
+            for p in crawled:
                 parts.append(f"\n{p.get('title', '')}")
-                content = p.get('content', '')[:6000]
-                if content:
-                    parts.append(content)
+                if p['content']:
+                    parts.append(p['content'])
 
-        exa = research_context.get("exa_results", [])
         if exa:
             parts.append("\n=== RESEARCH ===")
-            for r in exa[:10]:
+            for r in exa:
                 parts.append(f"\n{r.get('title', '')}")
-                content = r.get('content', '') or r.get('text', '')
-                if content:
-                    parts.append(content[:6000])
+                if r['content']:
+                    parts.append(r['content'])
 
     return '\n'.join(parts)
 
@@ -1589,8 +1656,12 @@ SLUG: [suggested-slug-here]
 - Be specific with facts from research
 - Each section should match its act's key_points exactly"""
 
-    # Build research prompt
-    research_prompt = build_prompt(narrative.get("topic", ""), research_context)
+    provider, model_name = config.get_ai_model()
+
+    # Build research prompt, packed to the model's budget
+    research_prompt = build_prompt(
+        narrative.get("topic", ""), research_context, budget_tokens=budget_for(model_name)
+    )
 
     user_prompt = f"""Write the 3-act narrative article.
 
@@ -1609,7 +1680,6 @@ Write the article now:"""
 
     try:
         client = anthropic.Anthropic(api_key=config.ANTHROPIC_API_KEY)
-        provider, model_name = config.get_ai_model()
 
         message = client.messages.create(
             model=model_name,
@@ -1816,11 +1886,9 @@ IMPORTANT:
         if not json_match:
             activity.logger.warning("Could not parse Gemini response, falling back to link removal")
             # Fallback: just remove links
-            refined_content = article_content
-            for ctx in broken_contexts:
-                url = ctx["url"]
-                pattern = rf'<a[^>]*href="{re.escape(url)}"[^>]*>([^<]+)</a>'
-                refined_content = re.sub(pattern, r'\1', refined_content)
+            refined_content = HtmlPipeline([
+                UnlinkVisitor(ctx["url"] for ctx in broken_contexts)
+            ]).run(article_content)
             return {
                 "success": True,
                 "refined_content": refined_content,
@@ -1831,6 +1899,7 @@ IMPORTANT:
         fixes = json.loads(json_match.group(1))
         changes_made = []
         refined_content = article_content
+        unlink_urls = []
 
         for fix in fixes:
             url = fix.get("url", "")
@@ -1842,11 +1911,13 @@ IMPORTANT:
                 refined_content = refined_content.replace(original, fixed)
                 changes_made.append({"url": url, "action": action})
             elif url:
-                # Fallback: remove link wrapper
-                pattern = rf'<a[^>]*href="{re.escape(url)}"[^>]*>([^<]+)</a>'
-                refined_content = re.sub(pattern, r'\1', refined_content)
+                # Fallback: remove link wrapper (all together, below)
+                unlink_urls.append(url)
                 changes_made.append({"url": url, "action": "remove_link_fallback"})
 
+        if unlink_urls:
+            refined_content = HtmlPipeline([UnlinkVisitor(unlink_urls)]).run(refined_content)
+
         activity.logger.info(f"Refined {len(changes_made)} broken links (cost: ${cost:.4f})")
 
         return {
@@ -2017,6 +2088,16 @@ ARTICLE_TYPE_TO_TEMPLATE = {
     "analysis": "market_analysis",
 }
 
+# Used when the app has no video templates (act block formatted once, like app templates)
+GENERIC_VIDEO_ACT_TEMPLATE = VideoActTemplate(
+    name="generic",
+    act_1_role="THE SETUP - Problem/challenge", act_1_mood="Tension, stakes",
+    act_2_role="THE OPPORTUNITY - Discovery/hope", act_2_mood="Hope, revelation",
+    act_3_role="THE JOURNEY - Process/action", act_3_mood="Progress, momentum",
+    act_4_role="THE RESOLUTION - Outcome/future", act_4_mood="Achievement, possibility",
+)
+GENERIC_ACT_STRUCTURE = format_act_structure(GENERIC_VIDEO_ACT_TEMPLATE, VideoConfig())
+
 
 @activity.defn
 async def generate_four_act_video_prompt_brief(
@@ -2084,23 +2165,15 @@ async def generate_four_act_video_prompt_brief(
             selected_template = video_prompt_template.get_template()
 
     if selected_template:
-        act_1_role = selected_template.act_1_role
-        act_1_mood = selected_template.act_1_mood
-        act_2_role = selected_template.act_2_role
-        act_2_mood = selected_template.act_2_mood
-        act_3_role = selected_template.act_3_role
-        act_3_mood = selected_template.act_3_mood
-        act_4_role = selected_template.act_4_role
-        act_4_mood = selected_template.act_4_mood
-        template_used = selected_template.name
-        activity.logger.info(f"Using template '{template_used}' for article_type '{article_type}'")
+        # Precomputed at config load with the app's act timestamps
+        act_structure = app_config.article_theme.act_structure_prompts[selected_template.name]
+        activity.logger.info(f"Using template '{selected_template.name}' for article_type '{article_type}'")
     else:
-        act_1_role, act_1_mood = "THE SETUP - Problem/challenge", "Tension, stakes"
-        act_2_role, act_2_mood = "THE OPPORTUNITY - Discovery/hope", "Hope, revelation"
-        act_3_role, act_3_mood = "THE JOURNEY - Process/action", "Progress, momentum"
-        act_4_role, act_4_mood = "THE RESOLUTION - Outcome/future", "Achievement, possibility"
-        template_used = "generic"
+        selected_template = GENERIC_VIDEO_ACT_TEMPLATE
+        act_structure = GENERIC_ACT_STRUCTURE
         activity.logger.warning(f"No template found for article_type '{article_type}', using generic")
+    template_used = selected_template.name
+    act_1_mood, act_2_mood, act_3_mood, act_4_mood = (mood for _, mood in selected_template.acts)
 
     # Build AI prompt - request JSON for Pydantic validation
     ai_prompt = f"""Generate 4-act video content briefs for this article. Return ONLY valid JSON.
@@ -2111,17 +2184,7 @@ ARTICLE CONTENT:
 {content}
 
 ===== 4-ACT STRUCTURE (from app template: {template_used}) =====
-ACT 1 (0-3s): {act_1_role}
-  Mood: {act_1_mood}
-
-ACT 2 (3-6s): {act_2_role}
-  Mood: {act_2_mood}
-
-ACT 3 (6-9s): {act_3_role}
-  Mood: {act_3_mood}
-
-ACT 4 (9-12s): {act_4_role}
-  Mood: {act_4_mood}
+{act_structure}
 
 ===== VISUAL STYLE =====
 {technical_notes}
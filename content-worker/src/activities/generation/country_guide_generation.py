@@ -20,9 +20,15 @@ import google.generativeai as genai
 import anthropic
 
 from src.utils.config import config
+from src.utils.context_packer import (
+    CHARS_PER_TOKEN, budget_for, format_packing_stats, pack_research_context
+)
 from src.utils.currency import get_currency_display_guidance, get_country_currency, get_currency_symbol
 
 
+# Research JSON sent to guide generation (same size as the old 50k-char cut)
+GUIDE_RESEARCH_TOKENS = 50000 // CHARS_PER_TOKEN
+
 # 8 motivations with display info
 MOTIVATIONS = {
     "corporate": {
@@ -1030,11 +1036,20 @@ After all content, include this JSON block:
 ```
 """
 
+    # Pack page text so the whole research JSON fits the guide budget, instead
+    # of cutting the dump off mid-way (which dropped key_facts and voices)
+    packed_context, packing = pack_research_context(
+        research_context,
+        f"{country_name} relocation visa tax cost of living",
+        min(GUIDE_RESEARCH_TOKENS, budget_for("gemini-2.5-pro"))
+    )
+    activity.logger.info(f"Guide research context packed: {format_packing_stats(packing)}")
+
     # Build research prompt
     research_prompt = f"""Write a comprehensive relocation guide for {country_name}.
 
 RESEARCH DATA:
-{json.dumps(research_context, indent=2, default=str)[:50000]}
+{json.dumps(packed_context, indent=2, default=str)}
 
 Use ALL of this research. Be specific. Include real numbers, dates, and requirements.
 Every claim needs a source link. This guide should be the definitive resource for anyone considering {country_name}."""
@@ -37,7 +37,7 @@ import anthropic
 import json
 
 from src.utils.config import config
-from src.config.app_config import APP_CONFIGS
+from shared.app_config import APP_CONFIGS
 
 
 # ============================================================================
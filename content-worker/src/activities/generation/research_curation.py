@@ -17,6 +17,7 @@ from temporalio import activity
 from typing import Dict, Any, List
 
 from src.utils.ai_gateway import get_completion_async
+from src.utils.context_packer import budget_for, format_packing_stats, pack_sources
 
 
 def is_relevant_to_topic(title: str, content: str, topic: str) -> bool:
@@ -221,9 +222,14 @@ async def curate_research_sources(
 
     activity.logger.info(f"Processing {len(all_sources)} relevant sources for curation")
 
+    # Pack source content into the curation model's token budget: boilerplate
+    # and near-duplicate paragraphs go first, then the least topic-relevant ones
+    packed_sources, packing = pack_sources(all_sources, topic, budget_for("quality"))
+    activity.logger.info(f"Curation context packed: {format_packing_stats(packing)}")
+
     # Build curation prompt - simplified structure to reduce JSON errors
     sources_text = ""
-    for s in all_sources:
+    for s in packed_sources:
         sources_text += f"\n\n--- SOURCE [{s['id']}] ---\n"
         sources_text += f"Title: {s['title']}\n"
         sources_text += f"URL: {s['url']}\n"
@@ -455,6 +461,7 @@ OUTPUT (JSON only):"""
                 "article_outline": [],
                 "total_input": len(all_sources),
                 "total_output": max_sources,
+                "context_packing": packing,
                 "error": "JSON parsing failed"
             }
 
@@ -538,6 +545,7 @@ OUTPUT (JSON only):"""
             "total_input": len(all_sources),
             "total_output": len(curated_with_content),
             "filtered_count": filtered_count,
+            "context_packing": packing,
             "model": "gemini-2.5-pro"
         }
 
@@ -560,5 +568,6 @@ OUTPUT (JSON only):"""
             "spawn_opportunities": [],
             "total_input": len(all_sources),
             "total_output": min(len(all_sources), max_sources),
+            "context_packing": packing,
             "error": str(e)
         }
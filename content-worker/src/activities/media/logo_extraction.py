@@ -12,12 +12,12 @@ import cloudinary
 import cloudinary.uploader
 from temporalio import activity
 from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from PIL import Image
 from io import BytesIO
 
 from src.utils.config import config
+from src.utils.page_fetch import fetch_html, parse_html, run_parser
 
 
 @activity.defn
@@ -132,14 +132,58 @@ async def extract_and_process_logo(
         }
 
 
-async def find_logo_urls(url: str) -> list[str]:
+def logo_candidates(html: bytes, url: str, encoding: Optional[str] = None) -> list[str]:
     """
-    Find logo image URLs from website.
+    Candidate logo URLs from a page's HTML (runs in the parse pool).
 
     Strategies:
     1. Look for <img> with "logo" in class/id/alt
     2. Look for <img> in header/nav
     3. Look for <link rel="icon">
+    """
+    candidates = []
+    doc = parse_html(html, encoding)
+    if doc is None:
+        return candidates
+
+    def add(src: Optional[str]) -> None:
+        if src:
+            full_url = urljoin(url, src)
+            if full_url not in candidates:
+                candidates.append(full_url)
+
+    # Strategy 1: Find images with "logo" in attributes
+    images = list(doc.iter('img'))
+    for attribute in ('class', 'id', 'alt'):
+        for img in images:
+            if 'logo' in (img.get(attribute) or '').lower():
+                add(img.get('src') or img.get('data-src'))
+
+    # Strategy 2: Find images in header/nav
+    header = doc.find('.//header')
+    if header is None:
+        header = doc.find('.//nav')
+    if header is not None:
+        for img in list(header.iter('img'))[:3]:  # First 3 images
+            add(img.get('src') or img.get('data-src'))
+
+    # Strategy 3: Favicon
+    for link in doc.iter('link'):
+        if 'icon' in (link.get('rel') or '').lower().split():
+            href = link.get('href')
+            if href:
+                candidates.append(urljoin(url, href))
+            break
+
+    return candidates
+
+
+async def find_logo_urls(url: str) -> list[str]:
+    """
+    Find logo image URLs from website.
+
+    Fetches the page byte-capped and parses it off the event loop
+    (see logo_candidates for the strategies).
 
     Args:
         url: Website URL
@@ -151,54 +195,12 @@ async def find_logo_urls(url: str) -> list[str]:
 
     try:
         async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; QuestBot/1.0)"
-                }
-            )
+            fetched = await fetch_html(client, url)
 
-            if response.status_code != 200:
+            if fetched["html"] is None:
                 return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Strategy 1: Find images with "logo" in attributes
-            logo_imgs = soup.find_all('img', {
-                'class': lambda x: x and 'logo' in x.lower(),
-            })
-            logo_imgs += soup.find_all('img', {
-                'id': lambda x: x and 'logo' in x.lower(),
-            })
-            logo_imgs += soup.find_all('img', {
-                'alt': lambda x: x and 'logo' in x.lower(),
-            })
-
-            for img in logo_imgs:
-                src = img.get('src') or img.get('data-src')
-                if src:
-                    full_url = urljoin(url, src)
-                    if full_url not in candidates:
-                        candidates.append(full_url)
-
-            # Strategy 2: Find images in header/nav
-            header = soup.find('header') or soup.find('nav')
-            if header:
-                header_imgs = header.find_all('img')
-                for img in header_imgs[:3]:  # First 3 images
-                    src = img.get('src') or img.get('data-src')
-                    if src:
-                        full_url = urljoin(url, src)
-                        if full_url not in candidates:
-                            candidates.append(full_url)
-
-            # Strategy 3: Favicon
-            icon_link = soup.find('link', rel='icon') or soup.find('link', rel='shortcut icon')
-            if icon_link:
-                href = icon_link.get('href')
-                if href:
-                    full_url = urljoin(url, href)
-                    candidates.append(full_url)
+            candidates = await run_parser(logo_candidates, fetched["html"], url, fetched["encoding"])
 
     except Exception as e:
         activity.logger.error(f"Failed to parse website for logos: {e}")
@@ -335,16 +335,19 @@ async def inject_section_images_activity(
     """
     activity.logger.info(f"Injecting section images for video {video_playback_id}")
 
+    if not video_playback_id or not content:
+        return content
+
     # Import here (inside activity) to avoid Temporal workflow sandbox restrictions
-    from src.utils.inject_section_images import inject_section_images
+    from src.utils.html_pipeline import HtmlPipeline, SectionImageVisitor
 
-    result = inject_section_images(
-        content,
+    images = SectionImageVisitor(
         video_playback_id,
         image_width=image_width,
         max_sections=max_sections,
         four_act_content=four_act_content
     )
+    result = HtmlPipeline([images]).run(content)
 
-    activity.logger.info("Section images injected successfully")
+    activity.logger.info(f"Section images injected successfully: {images.injected}")
     return result
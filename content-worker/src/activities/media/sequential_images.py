@@ -21,7 +21,7 @@ from temporalio import activity
 
 from src.activities.articles.analyze_sections import analyze_article_sections
 from src.activities.media.flux_api_client import generate_flux_image
-from src.config.app_config import get_app_config, APP_CONFIGS
+from shared.app_config import get_app_config, APP_CONFIGS
 
 
 def build_sequential_prompt(
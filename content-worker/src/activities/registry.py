@@ -0,0 +1,235 @@
+"""
+Lazy Activity Registry
+
+Every activity the content worker serves, as activity name ->
+"module:function". The activity modules pull in the heavy SDKs at import
+(google.generativeai, anthropic, openai, pydantic_ai, replicate,
+mux_python, zep_cloud, exa_py, cloudinary, bs4, app_config's Pydantic
+models), which made cold starts slow and every replica pay for all of
+them.
+
+lazy_activities() registers a proxy per name instead: the proxy imports
+its module on first call (in a thread, so a slow import doesn't stall
+heartbeats of activities already running) and then calls the real
+function. Activities are all async and take JSON-native arguments, so the
+untyped proxy decodes them exactly as the real signature would.
+
+LAZY_ACTIVITIES=false imports everything up front (eager_activities()),
+which surfaces import errors at startup. check_registry() imports every
+target and reports names that don't match their @activity.defn, so the
+table can't silently drift from the code.
+"""
+
+import asyncio
+import importlib
+import os
+from typing import Any, Callable, Dict, List
+
+from temporalio import activity
+
+
+LAZY_ACTIVITIES = os.getenv("LAZY_ACTIVITIES", "true").lower() == "true"
+
+
+ACTIVITIES: Dict[str, str] = {
+    # Normalization
+    "normalize_company_url": "src.activities.normalize:normalize_company_url",
+    "check_company_exists": "src.activities.normalize:check_company_exists",
+
+    # Research - Serper
+    "serper_company_search": "src.activities.research.serper:fetch_company_news",
+    "serper_news_search": "src.activities.research.serper:serper_news_search",  # News search for scheduling/news creation
+    "serper_article_search": "src.activities.research.serper:serper_article_search",  # Article search for article creation workflow
+    "serper_targeted_search": "src.activities.research.serper:fetch_targeted_research",
+    "serper_crawl4ai_deep_articles": "src.activities.research.serper:serper_httpx_deep_articles",  # Deep article crawling with httpx
+    "serper_scrape": "src.activities.research.serper:serper_scrape_url",  # Single URL scrape via Serper API (50/50 with crawl4ai)
+
+    # Research - DataForSEO
+    "dataforseo_news_search": "src.activities.research.dataforseo:dataforseo_news_search",
+    "dataforseo_serp_search": "src.activities.research.dataforseo:dataforseo_serp_search",
+    "dataforseo_keyword_research": "src.activities.research.dataforseo:dataforseo_keyword_research",  # SEO keyword research
+    "dataforseo_keyword_difficulty": "src.activities.research.dataforseo:dataforseo_keyword_difficulty",  # SEO keyword difficulty analysis
+    "dataforseo_related_keywords": "src.activities.research.dataforseo:dataforseo_related_keywords",  # Keyword cluster discovery (first step)
+    "research_country_seo_keywords": "src.activities.research.dataforseo:research_country_seo_keywords",  # Country guide SEO research
+
+    # News Assessment
+    "assess_news_relevancy": "src.activities.research.news_assessment:assess_news_batch",
+
+    # Research - Other
+    "httpx_crawl": "src.activities.research.crawl:httpx_crawl",
+    "crawl4ai_crawl": "src.activities.research.crawl4ai_service:crawl4ai_service_crawl",  # External Crawl4AI service (browser automation)
+    "crawl4ai_batch": "src.activities.research.crawl4ai_service:crawl4ai_batch_crawl",  # Batch crawl multiple URLs
+    "prefilter_urls_by_relevancy": "src.activities.research.crawl4ai_service:prefilter_urls_by_relevancy",  # Pre-filter URLs before crawling
+    "dedupe_crawled_pages": "src.activities.research.page_dedup:dedupe_crawled_pages",  # Drop near-duplicate crawled pages
+    "exa_research_company": "src.activities.research.exa:exa_research_company",
+    "exa_research_topic": "src.activities.research.exa:exa_research_topic",
+    "exa_find_similar_companies": "src.activities.research.exa:exa_find_similar_companies",
+
+    # Reddit
+    "reddit_search_expat_content": "src.activities.research.reddit:reddit_search_expat_content",  # Expat voices from Reddit
+
+    # Ambiguity & Validation
+    "check_research_ambiguity": "src.activities.research.ambiguity:check_research_ambiguity",
+    "validate_company_match": "src.activities.research.ambiguity:validate_company_match",
+    "playwright_url_cleanse": "src.activities.validation.link_validator:playwright_url_cleanse",  # Deprecated
+    "playwright_clean_links": "src.activities.validation.link_validator:playwright_clean_links",
+    "playwright_pre_cleanse": "src.activities.validation.link_validator:playwright_pre_cleanse",  # Phase 4b: Score URLs before article gen
+    "playwright_post_cleanse": "src.activities.validation.link_validator:playwright_post_cleanse",  # Phase 5b: Validate links after article
+
+    # Media
+    "extract_and_process_logo": "src.activities.media.logo_extraction:extract_and_process_logo",
+    "generate_company_featured_image": "src.activities.media.replicate_images:generate_company_featured_image",
+    "generate_placeholder_image": "src.activities.media.replicate_images:generate_placeholder_image",
+    "generate_flux_image": "src.activities.media.flux_api_client:generate_flux_image",
+    "generate_sequential_article_images": "src.activities.media.sequential_images:generate_sequential_article_images",
+    "generate_company_contextual_images": "src.activities.media.sequential_images:generate_company_contextual_images",
+    "generate_article_images_from_prompts": "src.activities.media.prompt_images:generate_article_images_from_prompts",
+    "analyze_article_sections": "src.activities.articles.analyze_sections:analyze_article_sections",
+    # Video
+    "generate_four_act_video": "src.activities.media.video_generation:generate_four_act_video",  # 4-act 12-second video for articles
+    "generate_company_video": "src.activities.media.video_generation:generate_company_video",  # Simple 3s branding video for company profiles
+    "upload_video_to_mux": "src.activities.media.mux_client:upload_video_to_mux",
+    "upload_video_file_to_mux": "src.activities.media.mux_client:upload_video_file_to_mux",
+    "delete_mux_asset": "src.activities.media.mux_client:delete_mux_asset",
+    "get_mux_asset_info": "src.activities.media.mux_client:get_mux_asset_info",
+    "inject_section_images": "src.activities.media.mux_client:inject_section_images_activity",
+    # Mux Asset Catalog (MCP)
+    "query_videos_by_country": "src.activities.media.mux_catalog:query_videos_by_country",
+    "query_videos_by_mode": "src.activities.media.mux_catalog:query_videos_by_mode",
+    "query_videos_by_article": "src.activities.media.mux_catalog:query_videos_by_article",
+    "get_all_videos_summary": "src.activities.media.mux_catalog:get_all_videos_summary",
+
+    # Generation
+    "generate_company_profile_v2": "src.activities.generation.profile_generation_v2:generate_company_profile_v2",
+    "generate_four_act_article": "src.activities.generation.article_generation:generate_four_act_article",  # 4-act article with four_act_content
+    "generate_narrative_article": "src.activities.generation.article_generation:generate_narrative_article",  # Legacy 3-act narrative-driven article
+    "refine_broken_links": "src.activities.generation.article_generation:refine_broken_links",  # Phase 5b: Haiku fixes broken links
+    "generate_four_act_video_prompt": "src.activities.generation.article_generation:generate_four_act_video_prompt",  # Assembles video prompt from briefs (simple)
+    "generate_four_act_video_prompt_brief": "src.activities.generation.article_generation:generate_four_act_video_prompt_brief",  # NEW: Generates briefs AFTER article save
+    "build_3_act_narrative": "src.activities.generation.narrative_builder:build_3_act_narrative",   # New: video-first 3-act narrative structure
+    "curate_research_sources": "src.activities.generation.research_curation:curate_research_sources",
+    "calculate_completeness_score": "src.activities.generation.completeness:calculate_completeness_score",
+    "get_missing_fields": "src.activities.generation.completeness:get_missing_fields",
+    "suggest_improvements": "src.activities.generation.completeness:suggest_improvements",
+
+    # Database
+    "save_company_to_neon": "src.activities.storage.neon_database:save_company_to_neon",
+    "update_company_metadata": "src.activities.storage.neon_database:update_company_metadata",
+    "get_company_by_id": "src.activities.storage.neon_database:get_company_by_id",
+    "save_article_to_neon": "src.activities.storage.neon_database:save_article_to_neon",
+    "get_article_by_slug": "src.activities.storage.neon_database:get_article_by_slug",
+    "update_article_four_act_content": "src.activities.storage.neon_database:update_article_four_act_content",  # NEW: Update briefs and video_prompt
+    "neon_get_recent_articles": "src.activities.storage.neon_articles:get_recent_articles_from_neon",
+    "neon_find_similar_articles": "src.activities.storage.neon_articles:find_similar_articles",  # In-worker vector index for news duplicate detection
+    "save_spawn_candidate": "src.activities.storage.neon_database:save_spawn_candidate",  # Article spawn candidates
+    # Video tags for cluster architecture
+    "save_video_tags": "src.activities.storage.neon_database:save_video_tags",
+    "get_videos_by_cluster": "src.activities.storage.neon_database:get_videos_by_cluster",
+    "get_videos_by_country": "src.activities.storage.neon_database:get_videos_by_country",
+    # Video inheritance for topic clusters and hubs
+    "inherit_parent_video_to_children": "src.activities.storage.neon_database:inherit_parent_video_to_children",
+    "get_cluster_videos": "src.activities.storage.neon_database:get_cluster_videos",
+    "get_cluster_story_video": "src.activities.storage.neon_database:get_cluster_story_video",
+    # Video topic matching for intelligent section placement
+    "get_cluster_videos_with_topics": "src.activities.storage.neon_database:get_cluster_videos_with_topics",
+    "match_video_to_section": "src.activities.storage.neon_database:match_video_to_section",
+
+    # Video finessing for end-of-workflow cleanup
+    "finesse_cluster_media": "src.activities.storage.neon_database:finesse_cluster_media",
+    "finesse_all_cluster_media": "src.activities.storage.neon_database:finesse_all_cluster_media",
+
+    # Country Guide Database
+    "save_or_create_country": "src.activities.storage.neon_countries:save_or_create_country",
+    "update_country_facts": "src.activities.storage.neon_countries:update_country_facts",
+    "update_country_seo_keywords": "src.activities.storage.neon_countries:update_country_seo_keywords",
+    "link_article_to_country": "src.activities.storage.neon_countries:link_article_to_country",
+    "publish_country": "src.activities.storage.neon_countries:publish_country",
+    "get_country_by_code": "src.activities.storage.neon_countries:get_country_by_code",
+
+    # Country Guide Generation
+    "generate_country_guide_content": "src.activities.generation.country_guide_generation:generate_country_guide_content",
+    "extract_country_facts": "src.activities.generation.country_guide_generation:extract_country_facts",
+    "generate_country_video_prompt": "src.activities.generation.country_guide_generation:generate_country_video_prompt",
+    "generate_segment_video_prompt": "src.activities.generation.country_guide_generation:generate_segment_video_prompt",  # Multi-video: hero/family/finance/daily/yolo
+    "generate_topic_cluster_content": "src.activities.generation.country_guide_generation:generate_topic_cluster_content",  # SEO-targeted topic cluster articles
+
+    # Country Hub (SEO pillar pages)
+    "generate_hub_seo_slug": "src.activities.storage.neon_country_hubs:generate_hub_seo_slug",
+    "aggregate_cluster_to_hub_payload": "src.activities.storage.neon_country_hubs:aggregate_cluster_to_hub_payload",
+    "save_or_update_country_hub": "src.activities.storage.neon_country_hubs:save_or_update_country_hub",
+    "get_country_hub": "src.activities.storage.neon_country_hubs:get_country_hub",
+    "get_hub_by_slug": "src.activities.storage.neon_country_hubs:get_hub_by_slug",
+    "publish_country_hub": "src.activities.storage.neon_country_hubs:publish_country_hub",
+    "generate_hub_content": "src.activities.storage.neon_country_hubs:generate_hub_content",
+
+    # Zep Integration
+    "query_zep_for_context": "src.activities.storage.zep_integration:query_zep_for_context",
+    "sync_company_to_zep": "src.activities.storage.zep_integration:sync_company_to_zep",
+    "create_zep_summary": "src.activities.storage.zep_integration:create_zep_summary",
+    "sync_v2_profile_to_zep_graph": "src.activities.storage.zep_integration:sync_v2_profile_to_zep_graph",  # Sync V2 profile to Zep knowledge graph
+    "sync_article_to_zep": "src.activities.storage.zep_integration:sync_article_to_zep",
+    "fetch_company_graph_data": "src.activities.storage.zep_graph_visual:fetch_company_graph_data",
+    "extract_entities_from_v2_profile": "src.activities.storage.zep_entity_extraction:extract_entities_from_v2_profile",  # Extract deals/people from company profiles
+    "extract_entities_from_article": "src.activities.storage.zep_entity_extraction:extract_entities_from_article",  # Extract jobs/skills/locations from articles
+
+    # Articles (re-enabled)
+    "fetch_related_articles": "src.activities.articles.fetch_related:fetch_related_articles",
+    "link_article_to_company": "src.activities.articles.fetch_related:link_article_to_company",
+    "get_article_timeline": "src.activities.articles.fetch_related:get_article_timeline",
+}
+
+
+def _resolve(target: str) -> Callable[..., Any]:
+    module_name, attr = target.split(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _lazy(name: str, target: str):
+    resolved: List[Callable[..., Any]] = []
+
+    async def proxy(*args):
+        if not resolved:
+            resolved.append(await asyncio.to_thread(_resolve, target))
+        return await resolved[0](*args)
+
+    proxy.__name__ = proxy.__qualname__ = target.split(":")[1]
+    return activity.defn(name=name)(proxy)
+
+
+def lazy_activities() -> List[Callable[..., Any]]:
+    """Proxies for every registered activity; modules import on first call."""
+    return [_lazy(name, target) for name, target in ACTIVITIES.items()]
+
+
+def eager_activities() -> List[Callable[..., Any]]:
+    """The real activity functions (imports every activity module now)."""
+    return [_resolve(target) for target in ACTIVITIES.values()]
+
+
+def worker_activities() -> List[Callable[..., Any]]:
+    """Activities for Worker(activities=...), lazy unless LAZY_ACTIVITIES=false."""
+    return lazy_activities() if LAZY_ACTIVITIES else eager_activities()
+
+
+def check_registry() -> List[str]:
+    """
+    Import every target and compare with its @activity.defn.
+
+    Returns:
+        Problems found (empty if the registry matches the code)
+    """
+    problems = []
+    for name, target in ACTIVITIES.items():
+        try:
+            fn = _resolve(target)
+        except Exception as e:
+            problems.append(f"{name}: cannot import {target} ({type(e).__name__}: {e})")
+            continue
+        definition = getattr(fn, "__temporal_activity_definition", None)
+        if definition is None:
+            problems.append(f"{name}: {target} is not an @activity.defn")
+        elif definition.name != name:
+            problems.append(f"{name}: {target} is registered as {definition.name!r}")
+        elif not asyncio.iscoroutinefunction(fn):
+            problems.append(f"{name}: {target} is sync; the lazy proxy only wraps async activities")
+    return problems
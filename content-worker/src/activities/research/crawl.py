@@ -11,12 +11,13 @@ from typing import Dict, Any, List
 from urllib.parse import urljoin, urlparse
 
 from src.utils.config import config
+from src.utils.page_fetch import fetch_page
 
 
 @activity.defn
 async def httpx_crawl(url: str) -> Dict[str, Any]:
     """
-    Crawl company website using httpx + BeautifulSoup (free, fast).
+    Crawl company website using httpx + lxml (free, fast).
 
     Args:
         url: Company website URL
@@ -169,10 +170,10 @@ async def crawl_company_website(url: str) -> Dict[str, Any]:
 
 async def crawl_with_httpx(base_url: str) -> Dict[str, Any]:
     """
-    Crawl with httpx + BeautifulSoup (free, local).
+    Crawl with httpx + lxml (free, local).
 
-    Uses httpx for HTTP requests and BeautifulSoup for HTML parsing.
-    No browser automation - pure HTTP scraping.
+    Uses the shared byte-capped fetch and main-content extraction
+    (src/utils/page_fetch.py). No browser automation - pure HTTP scraping.
 
     Args:
         base_url: Base URL to crawl
@@ -243,33 +244,14 @@ async def crawl_with_httpx(base_url: str) -> Dict[str, Any]:
             url = urljoin(base_url, path)
 
             try:
-                response = await client.get(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; QuestBot/1.0)"
-                    }
-                )
-
-                if response.status_code == 200:
-                    # Extract text content (simplified - in production use BeautifulSoup)
-                    from bs4 import BeautifulSoup
-
-                    soup = BeautifulSoup(response.text, 'html.parser')
-
-                    # Remove script and style elements
-                    for script in soup(["script", "style"]):
-                        script.decompose()
-
-                    # Get text
-                    text = soup.get_text(separator=' ', strip=True)
-
-                    # Limit to 5000 chars per page
-                    text = text[:5000]
+                # Byte-capped fetch, extraction off the event loop; 5000 chars per page
+                page = await fetch_page(client, url, max_chars=5000)
 
+                if page["success"]:
                     pages.append({
                         "url": url,
-                        "title": soup.title.string if soup.title else "",
-                        "content": text,
+                        "title": page["title"],
+                        "content": page["content"],
                         "path": path,
                         "source": "crawl4ai"
                     })
@@ -571,31 +553,14 @@ async def firecrawl_httpx_discover(base_url: str) -> Dict[str, Any]:
             try:
                 activity.logger.info(f"HTTPX scraping discovered URL: {url}")
 
-                response = await client.get(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; QuestBot/1.0)"
-                    }
-                )
-
-                if response.status_code == 200:
-                    from bs4 import BeautifulSoup
-
-                    soup = BeautifulSoup(response.text, 'html.parser')
-
-                    # Remove script and style elements
-                    for script in soup(["script", "style"]):
-                        script.decompose()
-
-                    # Get text
-                    text = soup.get_text(separator=' ', strip=True)
+                page = await fetch_page(client, url, max_chars=5000)
 
-                    # Limit to 5000 chars
-                    text = text[:5000]
+                if page["success"]:
+                    text = page["content"]
 
                     crawled_pages.append({
                         "url": url,
-                        "title": soup.title.string if soup.title else "",
+                        "title": page["title"],
                         "content": text,
                         "source": "crawl4ai_discovered"
                     })
@@ -2,15 +2,20 @@
 Crawl4AI Service Client
 
 Calls external Railway Crawl4AI microservice for browser automation.
-Falls back to httpx + BeautifulSoup if service unavailable.
+Falls back to httpx + lxml if service unavailable.
 """
 
+import asyncio
+import time
+from datetime import datetime, timezone
+
 import httpx
 from temporalio import activity
-from typing import Dict, Any
-from bs4 import BeautifulSoup
+from typing import Dict, Any, List, Callable, Awaitable
 
 from src.utils.config import config
+from src.utils.page_fetch import fetch_page
+from src.activities.research.url_relevance import candidate_text, score_candidates, select_relevant
 
 
 def normalize_url(url: str) -> str:
@@ -48,7 +53,7 @@ async def crawl4ai_service_crawl(url: str) -> Dict[str, Any]:
 
     Strategy:
     1. Try external Crawl4AI service first (handles JavaScript-heavy sites)
-    2. Fall back to httpx + BeautifulSoup if service unavailable
+    2. Fall back to httpx + lxml if service unavailable
 
     Args:
         url: Company website URL
@@ -150,6 +155,135 @@ async def call_crawl4ai_service(base_url: str) -> Dict[str, Any]:
             }
 
 
+# Batch crawl: URLs per service request, and requests in flight at once
+BATCH_CHUNK_SIZE = 5
+BATCH_CONCURRENCY = 3
+BATCH_REQUEST_TIMEOUT = 120.0
+
+# httpx fallback: URLs crawled (one request each) and requests in flight
+HTTPX_FALLBACK_MAX_URLS = 20
+HTTPX_FALLBACK_CONCURRENCY = 5
+
+# Stop collecting this long before the activity's start_to_close deadline
+DEADLINE_MARGIN_SECONDS = 15
+# Time budget when the activity has no start_to_close_timeout
+DEFAULT_BATCH_BUDGET_SECONDS = 270
+
+# Page content kept in heartbeat checkpoints (heartbeat payloads are size-limited)
+CHECKPOINT_CONTENT_CHARS = 10000
+
+# Heartbeat at least this often while chunks are in flight; a chunk can take
+# up to BATCH_REQUEST_TIMEOUT, longer than callers' heartbeat_timeout
+HEARTBEAT_INTERVAL_SECONDS = 10.0
+
+
+def _attempts_remaining() -> bool:
+    """True if the retry policy allows another attempt (unlimited counts as no)."""
+    info = activity.info()
+    policy = getattr(info, "retry_policy", None)
+    if policy is None or not policy.maximum_attempts:
+        return False
+    return info.attempt < policy.maximum_attempts
+
+
+def _batch_deadline() -> float:
+    """Monotonic time by which a batch crawl must return what it has."""
+    info = activity.info()
+    budget = DEFAULT_BATCH_BUDGET_SECONDS
+    if info.start_to_close_timeout:
+        elapsed = max(0.0, (datetime.now(timezone.utc) - info.started_time).total_seconds())
+        budget = info.start_to_close_timeout.total_seconds() - elapsed
+    return time.monotonic() + budget - DEADLINE_MARGIN_SECONDS
+
+
+async def _run_chunked_crawl(
+    urls: List[str],
+    chunk_size: int,
+    concurrency: int,
+    crawl_chunk: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]],
+) -> Dict[str, Any]:
+    """
+    Crawl urls in chunks, collecting results as chunks finish.
+
+    The completed URLs and their pages are heartbeated after every finished
+    chunk, and at least every HEARTBEAT_INTERVAL_SECONDS while chunks are in
+    flight; a retried attempt resumes from that checkpoint and only crawls
+    what is left. When the activity deadline nears, unfinished chunks are
+    cancelled and the pages so far are returned.
+
+    Returns:
+        Dict with pages, completed, resumed, pending, errors, partial
+    """
+    details = activity.info().heartbeat_details
+    checkpoint = details[0] if details else {}
+    completed = set(checkpoint.get("completed", []))
+    pages = list(checkpoint.get("pages", []))
+    resumed = len(completed)
+    if resumed:
+        activity.logger.info(f"Resuming batch crawl: {resumed} URLs done, {len(pages)} pages from checkpoint")
+
+    remaining = [url for url in urls if url not in completed]
+    chunks = [remaining[i:i + chunk_size] for i in range(0, len(remaining), chunk_size)]
+    deadline = _batch_deadline()
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = []
+
+    async def run(chunk: List[str]):
+        async with semaphore:
+            try:
+                return chunk, await crawl_chunk(chunk), None
+            except Exception as e:
+                return chunk, [], f"{type(e).__name__}: {str(e) or 'no details'}"
+
+    def heartbeat():
+        activity.heartbeat({
+            "completed": sorted(completed),
+            "pages": [{**page, "content": (page.get("content") or "")[:CHECKPOINT_CONTENT_CHARS]} for page in pages],
+        })
+
+    pending = {asyncio.create_task(run(chunk)) for chunk in chunks}
+    try:
+        while pending:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=min(timeout, HEARTBEAT_INTERVAL_SECONDS),
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                chunk, chunk_pages, error = task.result()
+                if error:
+                    # Not marked completed, so a retry crawls these again
+                    activity.logger.warning(f"Crawl chunk of {len(chunk)} URLs failed: {error}")
+                    errors.append(error)
+                    continue
+                completed.update(chunk)
+                pages.extend(chunk_pages)
+            heartbeat()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    unfinished = len(urls) - len(completed & set(urls))
+    if pending:
+        activity.logger.warning(
+            f"Batch crawl deadline reached: returning {len(pages)} pages, {unfinished} URLs not crawled"
+        )
+
+    return {
+        "pages": pages,
+        "completed": len(completed),
+        "resumed": resumed,
+        "pending": unfinished,
+        "errors": errors,
+        "partial": bool(pending),
+    }
+
+
 @activity.defn(name="crawl4ai_batch")
 async def crawl4ai_batch_crawl(urls: list, topic: str = "", keywords: list = None) -> Dict[str, Any]:
     """
@@ -158,6 +292,16 @@ async def crawl4ai_batch_crawl(urls: list, topic: str = "", keywords: list = Non
     Uses BM25 content filtering to extract only topic-relevant content.
     Falls back to /crawl-many if topic not provided.
 
+    URLs are sent in chunks of BATCH_CHUNK_SIZE (BATCH_CONCURRENCY at a
+    time) and results are collected as each chunk finishes. Completed URLs
+    are heartbeated, so a retry after a timeout or worker restart skips
+    them, and partial results are returned when the deadline nears.
+    Callers should set a heartbeat_timeout.
+
+    Failed service chunks raise (so Temporal retries only those URLs) while
+    the retry policy has attempts left; the last attempt returns the pages
+    it has. With no pages at all the activity raises.
+
     Args:
         urls: List of URLs to crawl
         topic: Topic for BM25 relevance filtering (e.g., "Cyprus Digital Nomad Visa")
@@ -173,7 +317,7 @@ async def crawl4ai_batch_crawl(urls: list, topic: str = "", keywords: list = Non
     valid_urls = []
     for url in urls:
         normalized = normalize_url(url)
-        if normalized:
+        if normalized and normalized not in valid_urls:
             valid_urls.append(normalized)
 
     if not valid_urls:
@@ -183,124 +327,122 @@ async def crawl4ai_batch_crawl(urls: list, topic: str = "", keywords: list = Non
 
     if not config.CRAWL4AI_SERVICE_URL:
         activity.logger.warning("CRAWL4AI_SERVICE_URL not configured, falling back to httpx")
-        # Fallback: crawl each URL individually with httpx
-        pages = []
-        for url in valid_urls[:20]:  # Limit to 20 for httpx fallback
-            result = await crawl_with_httpx_fallback(url)
+
+        async def crawl_fallback_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+            result = await crawl_with_httpx_fallback(chunk[0])
             if result.get("success") and result.get("pages"):
-                pages.extend(result["pages"])
+                return result["pages"]
+            return []
+
+        crawl = await _run_chunked_crawl(
+            valid_urls[:HTTPX_FALLBACK_MAX_URLS], 1, HTTPX_FALLBACK_CONCURRENCY, crawl_fallback_chunk
+        )
         return {
             "success": True,
-            "pages": pages,
-            "stats": {"total": len(valid_urls), "crawled": len(pages), "crawler": "httpx_fallback"}
+            "pages": crawl["pages"],
+            "stats": {
+                "total": len(valid_urls),
+                "crawled": len(crawl["pages"]),
+                "crawler": "httpx_fallback",
+                "resumed": crawl["resumed"],
+                "pending": crawl["pending"],
+                "partial": crawl["partial"],
+            }
         }
 
     service_url = config.CRAWL4AI_SERVICE_URL.rstrip("/")
 
-    async with httpx.AsyncClient(timeout=270.0) as client:  # 4.5 min timeout (buffer before 5 min activity timeout)
-        try:
-            # Use /crawl-articles if topic provided, else /crawl-many
-            if topic:
-                # Optimized article research with BM25 filtering
-                payload = {
-                    "urls": valid_urls,
-                    "topic": topic,
-                    "keywords": keywords or [],
-                    "parallel": 5,
-                    "min_word_count": 50,
-                    "use_pruning": True,
-                    "use_bm25": True
-                }
-                endpoint = f"{service_url}/crawl-articles"
-                activity.logger.info(f"Using /crawl-articles with BM25 filtering for: '{topic}'")
-            else:
-                # Basic batch crawl
-                payload = {"urls": valid_urls}
-                endpoint = f"{service_url}/crawl-many"
-                activity.logger.info("Using /crawl-many (no topic filtering)")
+    # Use /crawl-articles if topic provided, else /crawl-many
+    if topic:
+        # Optimized article research with BM25 filtering
+        payload = {
+            "topic": topic,
+            "keywords": keywords or [],
+            "parallel": 5,
+            "min_word_count": 50,
+            "use_pruning": True,
+            "use_bm25": True
+        }
+        endpoint = f"{service_url}/crawl-articles"
+        activity.logger.info(f"Using /crawl-articles with BM25 filtering for: '{topic}'")
+    else:
+        # Basic batch crawl
+        payload = {}
+        endpoint = f"{service_url}/crawl-many"
+        activity.logger.info("Using /crawl-many (no topic filtering)")
+
+    source = "crawl4ai_articles" if topic else "crawl4ai_batch"
+    filters_used = {}
 
+    async with httpx.AsyncClient(timeout=BATCH_REQUEST_TIMEOUT) as client:
+
+        async def crawl_service_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
             response = await client.post(
                 endpoint,
-                json=payload,
+                json={**payload, "urls": chunk},
                 headers={"Content-Type": "application/json"}
             )
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}")
+
+            data = response.json()
+            filters_used.update(data.get("filters_used", {}))
+
+            # Transform results to pages format
+            pages = []
+            for result in data.get("results", []):
+                if result.get("success"):
+                    pages.append({
+                        "url": result.get("url"),
+                        "title": result.get("title", ""),
+                        "content": result.get("content", ""),
+                        "filtered": result.get("filtered", False),
+                        "source": source
+                    })
+            return pages
+
+        crawl = await _run_chunked_crawl(valid_urls, BATCH_CHUNK_SIZE, BATCH_CONCURRENCY, crawl_service_chunk)
+
+    pages = crawl["pages"]
+    activity.logger.info(
+        f"Crawl4AI complete: {len(pages)}/{len(valid_urls)} successful "
+        f"({crawl['resumed']} resumed, {crawl['pending']} not crawled), "
+        f"BM25={filters_used.get('bm25', False)}, Pruning={filters_used.get('pruning', False)}"
+    )
 
-            if response.status_code == 200:
-                data = response.json()
-
-                # Transform results to pages format
-                pages = []
-                for result in data.get("results", []):
-                    if result.get("success"):
-                        pages.append({
-                            "url": result.get("url"),
-                            "title": result.get("title", ""),
-                            "content": result.get("content", ""),
-                            "filtered": result.get("filtered", False),
-                            "source": "crawl4ai_articles" if topic else "crawl4ai_batch"
-                        })
-
-                filters_used = data.get("filters_used", {})
-                activity.logger.info(
-                    f"Crawl4AI complete: {data.get('successful', 0)}/{data.get('total_urls', 0)} successful, "
-                    f"BM25={filters_used.get('bm25', False)}, Pruning={filters_used.get('pruning', False)}"
-                )
+    stats = {
+        "total": len(valid_urls),
+        "successful": len(pages),
+        "failed": crawl["completed"] - len(pages),
+        "crawler": source,
+        "filters": filters_used,
+        "resumed": crawl["resumed"],
+        "pending": crawl["pending"],
+        "partial": crawl["partial"],
+    }
+    if crawl["partial"]:
+        stats["timeout"] = True
 
-                return {
-                    "success": True,
-                    "pages": pages,
-                    "stats": {
-                        "total": data.get("total_urls", 0),
-                        "successful": data.get("successful", 0),
-                        "failed": data.get("failed", 0),
-                        "crawler": "crawl4ai_articles" if topic else "crawl4ai_batch",
-                        "filters": filters_used
-                    }
-                }
-            else:
-                activity.logger.error(f"Crawl4AI failed: HTTP {response.status_code}")
-                return {
-                    "success": False,
-                    "pages": [],
-                    "error": f"HTTP {response.status_code}",
-                    "stats": {"crawler": "crawl4ai"}
-                }
+    if crawl["errors"] and (not pages or _attempts_remaining()):
+        # Completed chunks are checkpointed, so the retry only crawls the failed ones
+        activity.logger.error(f"Crawl4AI failed for {len(crawl['errors'])} chunks: {crawl['errors'][0]}")
+        raise RuntimeError(
+            f"Crawl4AI failed for {len(crawl['errors'])} chunks ({len(pages)} pages so far): {crawl['errors'][0]}"
+        )
 
-        except httpx.TimeoutException as e:
-            activity.logger.error(f"Crawl4AI timeout after 270s: {type(e).__name__}")
-            return {
-                "success": False,
-                "pages": [],
-                "error": f"Timeout after 270s: {type(e).__name__}",
-                "stats": {"crawler": "crawl4ai", "timeout": True}
-            }
-        except httpx.RequestError as e:
-            activity.logger.error(f"Crawl4AI request error: {type(e).__name__}: {e}")
-            return {
-                "success": False,
-                "pages": [],
-                "error": f"Request error: {type(e).__name__}: {str(e) or 'no details'}",
-                "stats": {"crawler": "crawl4ai"}
-            }
-        except Exception as e:
-            import traceback
-            tb = traceback.format_exc()
-            activity.logger.error(f"Crawl4AI error: {type(e).__name__}: {e}")
-            activity.logger.error(f"Traceback: {tb}")
-            return {
-                "success": False,
-                "pages": [],
-                "error": f"{type(e).__name__}: {str(e) or 'no message'} - see logs",
-                "stats": {"crawler": "crawl4ai"}
-            }
+    return {
+        "success": True,
+        "pages": pages,
+        "stats": stats
+    }
 
 
 async def crawl_with_httpx_fallback(base_url: str) -> Dict[str, Any]:
     """
-    Fallback crawling with httpx + BeautifulSoup (free, local).
+    Fallback crawling with httpx + lxml (free, local).
 
-    Uses httpx for HTTP requests and BeautifulSoup for HTML parsing.
-    No browser automation - pure HTTP scraping.
+    Byte-capped fetch with main-content extraction in the parse pool
+    (src/utils/page_fetch.py). No browser automation - pure HTTP scraping.
 
     Args:
         base_url: Company website URL
@@ -310,43 +452,17 @@ async def crawl_with_httpx_fallback(base_url: str) -> Dict[str, Any]:
     """
     async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
         try:
-            response = await client.get(
-                base_url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; QuestBot/1.0)"
-                }
-            )
-
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # Remove script, style, nav, footer
-                for element in soup(["script", "style", "nav", "footer", "header"]):
-                    element.decompose()
-
-                # Get text
-                text = soup.get_text(separator=' ', strip=True)
+            page = await fetch_page(client, base_url, max_chars=10000, with_links=True)
 
-                # Extract links
-                links = []
-                for a_tag in soup.find_all('a', href=True):
-                    href = a_tag['href']
-                    if href.startswith('http'):
-                        links.append(href)
-                    elif href.startswith('/'):
-                        # Convert relative to absolute
-                        from urllib.parse import urljoin
-                        links.append(urljoin(base_url, href))
-
-                # Limit to first 100 links
-                links = links[:100]
+            if page["success"]:
+                links = page["links"]
 
                 return {
                     "success": True,
                     "pages": [{
                         "url": base_url,
-                        "content": text[:10000],  # Limit to 10k chars
-                        "title": soup.title.string if soup.title else "",
+                        "content": page["content"],  # Limited to 10k chars
+                        "title": page["title"],
                         "links": links
                     }],
                     "links": links,
@@ -355,7 +471,7 @@ async def crawl_with_httpx_fallback(base_url: str) -> Dict[str, Any]:
             else:
                 return {
                     "success": False,
-                    "error": f"HTTP {response.status_code}",
+                    "error": page["error"],
                     "crawler": "httpx_fallback"
                 }
 
@@ -372,75 +488,84 @@ async def prefilter_urls_by_relevancy(
     url_candidates: list,
     topic: str,
     min_keyword_matches: int = 2,
-    max_urls: int = 30
+    max_urls: int = 30,
+    scorer: str = "embedding"
 ) -> Dict[str, Any]:
     """
     Pre-filter URLs by topic relevancy BEFORE crawling.
 
-    Checks if title/snippet contains topic keywords to avoid crawling irrelevant pages.
+    Scores title/snippet against the topic to avoid crawling irrelevant pages.
     This saves crawl time and improves content quality.
 
     Args:
         url_candidates: List of dicts with {url, title, snippet, source}
-        topic: Article topic for keyword extraction
-        min_keyword_matches: Minimum keywords that must match (default 2)
+        topic: Article topic
+        min_keyword_matches: Minimum keywords that must match (keyword scorer,
+                             and the embedding scorer's fallback)
         max_urls: Maximum URLs to return (default 30)
+        scorer: "embedding" (batched embeddings, falls back to keyword),
+                "tfidf" or "keyword" (see url_relevance.py)
 
     Returns:
-        Dict with relevant_urls, skipped_count, stats
+        Dict with relevant_urls (best first), skipped_count, stats
     """
-    activity.logger.info(f"Pre-filtering {len(url_candidates)} URLs for topic: '{topic}'")
+    activity.logger.info(f"Pre-filtering {len(url_candidates)} URLs for topic: '{topic}' (scorer={scorer})")
 
     # Extract keywords from topic (words > 2 chars, lowercase)
     topic_keywords = [w.lower() for w in topic.split() if len(w) > 2]
-    activity.logger.info(f"Topic keywords: {topic_keywords}")
-
-    def is_relevant(title: str, snippet: str) -> bool:
-        """Check if title/snippet mentions enough topic keywords."""
-        text = f"{title} {snippet}".lower()
-        matches = sum(1 for kw in topic_keywords if kw in text)
-        return matches >= min_keyword_matches
-
-    relevant_urls = []
-    skipped = []
 
+    # Deduplicate by URL; string URLs have no metadata to score and are kept
+    candidates = {}
+    unscored_urls = []
     for candidate in url_candidates:
         # Handle both string URLs and dict format
         if isinstance(candidate, str):
-            url = candidate
-            title = ""
-            snippet = ""
-            source = "unknown"
-        else:
-            url = candidate.get("url", "")
-            title = candidate.get("title", "")
-            snippet = candidate.get("snippet", "")
-            source = candidate.get("source", "unknown")
+            if candidate and candidate not in unscored_urls:
+                unscored_urls.append(candidate)
+            continue
 
-        if not url:
+        url = candidate.get("url", "")
+        title = candidate.get("title", "")
+        snippet = candidate.get("snippet", "")
+        if not url or url in candidates:
             continue
+        if not (title or snippet):
+            if url not in unscored_urls:
+                unscored_urls.append(url)
+            continue
+        candidates[url] = {"title": title, "snippet": snippet, "source": candidate.get("source", "unknown")}
 
-        # If no metadata available (string URLs), include by default
-        # Can only filter if we have title/snippet to check
-        has_metadata = bool(title or snippet)
+    urls = list(candidates)
+    threshold = None
 
-        if not has_metadata or is_relevant(title, snippet):
-            relevant_urls.append(url)
-        else:
-            skipped.append({
-                "url": url,
-                "title": title[:100],
-                "source": source,
-                "reason": "no_topic_match"
-            })
-
-    # Deduplicate while preserving order
-    seen = set()
-    unique_urls = []
-    for url in relevant_urls:
-        if url not in seen:
-            seen.add(url)
-            unique_urls.append(url)
+    scores = None
+    if scorer != "keyword":
+        texts = [candidate_text(candidates[url]["title"], candidates[url]["snippet"]) for url in urls]
+        scores, scorer = await score_candidates(topic, texts, scorer)
+
+    if scores is None:
+        # Keyword rule: requested, or embeddings unavailable
+        def keyword_matches(info: Dict[str, Any]) -> int:
+            text = f"{info['title']} {info['snippet']}".lower()
+            return sum(1 for kw in topic_keywords if kw in text)
+
+        kept = [i for i, url in enumerate(urls) if keyword_matches(candidates[url]) >= min_keyword_matches]
+    else:
+        kept, threshold = select_relevant(scores, scorer, max_urls)
+
+    kept_urls = [urls[i] for i in kept]
+    kept_set = set(kept_urls)
+    skipped = [
+        {
+            "url": url,
+            "title": candidates[url]["title"][:100],
+            "source": candidates[url]["source"],
+            "reason": "no_topic_match" if scores is None else f"score_{scores[i]:.3f}"
+        }
+        for i, url in enumerate(urls) if url not in kept_set
+    ]
+
+    unique_urls = kept_urls + [url for url in unscored_urls if url not in kept_set]
 
     # Cap at max_urls
     capped = len(unique_urls) > max_urls
@@ -448,7 +573,7 @@ async def prefilter_urls_by_relevancy(
 
     activity.logger.info(
         f"Pre-filter result: {len(final_urls)} relevant (from {len(url_candidates)} candidates), "
-        f"{len(skipped)} skipped, capped={capped}"
+        f"{len(skipped)} skipped, scorer={scorer}, threshold={threshold}, capped={capped}"
     )
 
     return {
@@ -458,5 +583,10 @@ async def prefilter_urls_by_relevancy(
         "total_candidates": len(url_candidates),
         "unique_before_cap": len(unique_urls),
         "capped": capped,
+        "scorer": scorer,
+        "threshold": threshold,
+        "top_scores": [
+            {"url": urls[i], "score": round(float(scores[i]), 4)} for i in kept[:5]
+        ] if scores is not None else [],
         "keywords_used": topic_keywords
     }
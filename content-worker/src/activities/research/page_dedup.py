@@ -0,0 +1,115 @@
+"""
+Crawled Page Deduplication
+
+Removes near-duplicate crawled pages before curation: syndicated copies of
+the same wire story, government pages mirrored under different URLs,
+print/AMP variants. Each copy would otherwise be sent to the LLM in full.
+
+Pages are fingerprinted with 64-bit SimHash and clustered via banded lookup
+(see src/utils/simhash.py). From each cluster the highest-authority copy is
+kept: official/high-authority domain first, then the longest content, then
+the earliest crawled.
+"""
+
+from temporalio import activity
+from typing import Dict, Any, List
+from urllib.parse import urlparse
+
+from src.activities.validation.link_validator import HIGH_AUTHORITY_DOMAINS
+from src.activities.validation.url_health import is_gov_domain
+from src.utils.simhash import SimHashIndex, simhash
+from src.utils.context_packer import CHARS_PER_TOKEN
+
+
+# Pages shorter than this are too small to fingerprint reliably
+MIN_WORDS = 50
+
+
+def authority_rank(url: str) -> int:
+    """2 = government/official, 1 = known high-authority, 0 = everything else."""
+    domain = urlparse(url or "").netloc.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+    if is_gov_domain(domain):
+        return 2
+    if any(domain == auth or domain.endswith("." + auth) for auth in HIGH_AUTHORITY_DOMAINS):
+        return 1
+    return 0
+
+
+@activity.defn
+async def dedupe_crawled_pages(pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Drop near-duplicate crawled pages, keeping the best copy of each.
+
+    Args:
+        pages: Crawled pages as {url, title, content}
+
+    Returns:
+        Dict with:
+        - pages: kept pages, in original order
+        - duplicate_clusters: [{kept, dropped: [urls], max_distance}]
+        - pages_in, pages_out, chars_saved, tokens_saved
+    """
+    index = SimHashIndex()
+    parent = list(range(len(pages)))
+    distances: Dict[int, int] = {}
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, page in enumerate(pages):
+        content = page.get("content") or ""
+        if len(content.split()) < MIN_WORDS:
+            continue
+        fingerprint = simhash(content)
+        for j, distance in index.near(fingerprint):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[root_i] = root_j
+            distances[i] = max(distances.get(i, 0), distance)
+        index.add(i, fingerprint)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(pages)):
+        clusters.setdefault(find(i), []).append(i)
+
+    def keep_order(i: int):
+        page = pages[i]
+        return (-authority_rank(page.get("url", "")), -len(page.get("content") or ""), i)
+
+    kept_indexes = set()
+    duplicate_clusters = []
+    chars_saved = 0
+    for members in clusters.values():
+        best = min(members, key=keep_order)
+        kept_indexes.add(best)
+        if len(members) == 1:
+            continue
+        dropped = [i for i in members if i != best]
+        chars_saved += sum(len(pages[i].get("content") or "") for i in dropped)
+        duplicate_clusters.append({
+            "kept": pages[best].get("url", ""),
+            "dropped": [pages[i].get("url", "") for i in dropped],
+            "max_distance": max(distances.get(i, 0) for i in members),
+        })
+
+    kept_pages = [page for i, page in enumerate(pages) if i in kept_indexes]
+    tokens_saved = chars_saved // CHARS_PER_TOKEN
+
+    activity.logger.info(
+        f"Page dedup: {len(pages)} -> {len(kept_pages)} pages, "
+        f"{len(duplicate_clusters)} duplicate clusters, ~{tokens_saved} tokens saved"
+    )
+
+    return {
+        "pages": kept_pages,
+        "duplicate_clusters": duplicate_clusters,
+        "pages_in": len(pages),
+        "pages_out": len(kept_pages),
+        "chars_saved": chars_saved,
+        "tokens_saved": tokens_saved,
+    }
@@ -9,7 +9,7 @@ from temporalio import activity
 from typing import Dict, Any, List
 
 from src.utils.config import config
-from bs4 import BeautifulSoup
+from src.utils.page_fetch import fetch_page
 
 
 # Geo-targeting map (Serper gl parameter)
@@ -492,7 +492,7 @@ async def serper_httpx_deep_articles(
     max_articles: int = 4
 ) -> Dict[str, Any]:
     """
-    Deep crawl news articles found by Serper using httpx + BeautifulSoup.
+    Deep crawl news articles found by Serper using httpx + lxml.
 
     Filters out paywalled content and scrapes full article text.
 
@@ -537,22 +537,11 @@ async def serper_httpx_deep_articles(
             try:
                 activity.logger.info(f"Crawl4AI scraping: {url}")
 
-                response = await client.get(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (compatible; QuestBot/1.0)"
-                    }
-                )
+                # Byte-capped fetch, main content extracted off the event loop (max 10,000 chars)
+                page = await fetch_page(client, url, max_chars=10000)
 
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-
-                    # Remove script, style, nav, footer
-                    for element in soup(["script", "style", "nav", "footer", "header"]):
-                        element.decompose()
-
-                    # Get text
-                    text = soup.get_text(separator=' ', strip=True)
+                if page["success"]:
+                    text = page["content"]
 
                     # Check if likely paywalled (very short content)
                     if len(text) < 500:
@@ -566,9 +555,6 @@ async def serper_httpx_deep_articles(
                         })
                         continue
 
-                    # Limit to 10,000 chars
-                    text = text[:10000]
-
                     crawled_articles.append({
                         "url": url,
                         "title": article.get("title", ""),
@@ -584,7 +570,7 @@ async def serper_httpx_deep_articles(
 
                 else:
                     activity.logger.warning(
-                        f"Crawl4AI failed: {response.status_code} for {url}"
+                        f"Crawl4AI failed: {page['error']} for {url}"
                     )
 
             except Exception as e:
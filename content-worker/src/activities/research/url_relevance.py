@@ -0,0 +1,98 @@
+"""
+URL Relevance Scoring
+
+Scores crawl candidates (title + snippet) against the topic before we pay
+30-90s per page to crawl them. Used by prefilter_urls_by_relevancy.
+
+Scorers:
+- "embedding": topic and all candidates embedded in one batched call,
+  cosine similarity in NumPy (falls back to keyword if unavailable)
+- "tfidf": local hashed TF-IDF (word + char n-grams), no network; less
+  precise than keyword min-2 on scripts/fixtures/url_candidates.json
+- "keyword": the original rule - count topic words in title/snippet
+
+Selection is adaptive: the cut-off is the Otsu split of the score
+distribution (the threshold that best separates two groups), relaxed to a
+fraction of the best score so a uniformly relevant set isn't halved, and
+never below a per-scorer floor. Then the top-K by score are kept.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.embeddings import embed_texts, hashed_tfidf
+
+
+# Minimum cosine similarity per scorer
+SCORE_FLOORS = {"embedding": 0.25, "tfidf": 0.04}
+
+# Anything within this fraction of the best score is kept
+RELATIVE_TO_BEST = {"embedding": 0.7, "tfidf": 0.2}
+
+# Characters of title + snippet sent for scoring
+MAX_CANDIDATE_CHARS = 500
+
+
+def candidate_text(title: str, snippet: str) -> str:
+    return f"{title}. {snippet}"[:MAX_CANDIDATE_CHARS]
+
+
+async def score_candidates(
+    topic: str,
+    texts: List[str],
+    scorer: str = "embedding"
+) -> Tuple[Optional[np.ndarray], str]:
+    """
+    Cosine similarity of each text to the topic.
+
+    Returns:
+        (scores array aligned with texts, scorer actually used); scores are
+        None with scorer "keyword" when embeddings are unavailable, so the
+        caller applies the keyword rule
+    """
+    if not texts:
+        return np.zeros(0, dtype=np.float32), scorer
+
+    if scorer == "embedding":
+        vectors = await embed_texts([topic] + texts)
+        if vectors is None:
+            return None, "keyword"
+    else:
+        vectors = hashed_tfidf([topic] + texts)
+
+    return vectors[1:] @ vectors[0], scorer
+
+
+def otsu_threshold(scores: np.ndarray) -> float:
+    """Threshold maximizing between-class variance of a 1-D score set."""
+    if len(scores) < 3:
+        return float(scores.min()) if len(scores) else 0.0
+
+    ordered = np.sort(scores)
+    n = len(ordered)
+    cumulative = np.cumsum(ordered)
+    weights_low = np.arange(1, n)
+    mean_low = cumulative[:-1] / weights_low
+    mean_high = (cumulative[-1] - cumulative[:-1]) / (n - weights_low)
+    between = weights_low * (n - weights_low) * (mean_low - mean_high) ** 2
+    split = int(np.argmax(between))
+    return float((ordered[split] + ordered[split + 1]) / 2)
+
+
+def select_relevant(scores: np.ndarray, scorer: str, max_urls: int) -> Tuple[List[int], float]:
+    """
+    Indexes of candidates to keep (best first) and the threshold used.
+    """
+    if not len(scores):
+        return [], 0.0
+
+    best = float(scores.max())
+    threshold = max(
+        SCORE_FLOORS[scorer],
+        min(otsu_threshold(scores), RELATIVE_TO_BEST[scorer] * best)
+    )
+
+    keep = np.flatnonzero(scores >= threshold)
+    ranked = keep[np.argsort(-scores[keep], kind="stable")]
+    return ranked[:max_urls].tolist(), threshold
@@ -7,10 +7,12 @@ Retrieves article data from Neon database.
 from temporalio import activity
 from typing import Dict, Any, List
 import os
+import time
 import psycopg
 from psycopg.rows import dict_row
 
 from src.utils.config import config
+from src.utils.article_index import article_text, classify, get_article_index, related_matches
 
 
 @activity.defn(name="neon_get_recent_articles")
@@ -74,3 +76,71 @@ async def get_recent_articles_from_neon(
                 conn.close()
             except Exception:
                 pass
+
+
+@activity.defn(name="neon_find_similar_articles")
+async def find_similar_articles(
+    stories: List[Dict[str, Any]],
+    app: str,
+    top_k: int = 3
+) -> Dict[str, Any]:
+    """
+    Nearest published articles for each story, with a duplicate verdict (graceful failure).
+
+    Uses the in-worker article index (src/utils/article_index.py), loaded
+    from Neon once and kept current by save_article_to_neon.
+
+    Args:
+        stories: News stories with title and snippet/description
+        app: Application name (placement, relocation, etc.)
+        top_k: Matches returned per story
+
+    Returns:
+        Dict with results (one per story: verdict "duplicate" / "developing" /
+        "new", matches with similarity, related - the matches above the
+        related threshold and not about another country or company),
+        scorer, indexed, elapsed_ms
+    """
+    start = time.perf_counter()
+    try:
+        index = await get_article_index(app)
+        texts = [
+            article_text(story.get("title", ""), story.get("snippet") or story.get("description", ""))
+            for story in stories
+        ]
+        query_start = time.perf_counter()
+        matches = index.search(await index.vectorize(texts), top_k) if texts else []
+        query_ms = (time.perf_counter() - query_start) * 1000
+
+    except Exception as e:
+        activity.logger.warning(f"⚠️ Article similarity lookup failed - treating stories as new: {e}")
+        return {
+            "results": [{"verdict": "new", "matches": [], "related": []} for _ in stories],
+            "scorer": None,
+            "indexed": 0,
+            "available": False,
+            "error": str(e)
+        }
+
+    results = [
+        {
+            "verdict": classify(m, index.scorer, title=story.get("title", "")),
+            "matches": m,
+            "related": related_matches(story.get("title", ""), m, index.scorer)
+        }
+        for story, m in zip(stories, matches)
+    ]
+    verdicts = [r["verdict"] for r in results]
+    activity.logger.info(
+        f"✅ Similarity check for {len(stories)} stories against {len(index)} {app} articles "
+        f"({index.scorer}, query {query_ms:.1f} ms): "
+        f"{verdicts.count('duplicate')} duplicate, {verdicts.count('developing')} developing"
+    )
+
+    return {
+        "results": results,
+        "scorer": index.scorer,
+        "indexed": len(index),
+        "available": True,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1)
+    }
@@ -719,15 +719,15 @@ async def generate_hub_content(
     hub_video_playback_id = payload.get("video_playback_id")
     if hub_video_playback_id and full_content:
         activity.logger.info("Injecting section images into hub content...")
-        from src.utils.inject_section_images import inject_section_images
+        from src.utils.html_pipeline import HtmlPipeline, SectionImageVisitor
 
-        full_content = inject_section_images(
-            full_content,
+        images = SectionImageVisitor(
             hub_video_playback_id,
             image_width=1200,
             max_sections=None  # Unlimited - inject for ALL H2 sections
         )
-        activity.logger.info("Section images injected to hub")
+        full_content = HtmlPipeline([images]).run(full_content)
+        activity.logger.info(f"Section images injected to hub: {images.injected}")
 
     activity.logger.info(f"Generated hub content: {len(full_content)} chars, {len(sections)} sections")
 
@@ -14,6 +14,7 @@ from datetime import datetime
 
 from src.utils.config import config
 from src.utils.helpers import generate_slug
+from src.utils.article_index import index_article
 
 
 @activity.defn
@@ -669,6 +670,12 @@ async def save_article_to_neon(
 
                 await conn.commit()
 
+                # Keep this worker's duplicate-detection index current (non-blocking)
+                try:
+                    await index_article(app, {"id": final_id, "title": title, "slug": slug, "excerpt": excerpt})
+                except Exception as e:
+                    activity.logger.warning(f"Article index update failed (non-blocking): {e}")
+
                 return str(final_id)
 
     except Exception as e:
@@ -0,0 +1,155 @@
+"""
+Pooled Link Checker
+
+One HTTP connection pool for all HEAD checks in a validation run, instead of
+a new session (DNS + TCP + TLS) per URL:
+- keep-alive connections reused across URLs on the same host
+- DNS resolved once per host (cached for the checker's lifetime)
+- concurrency limited overall and per host so one domain isn't hammered
+- the timeout covers each request once it has its slot, not time spent
+  queued behind other URLs on the same host
+- results streamed back as they complete
+
+Also provides the shared client for the Railway Playwright service, which
+uses HTTP/2 when the h2 package is installed.
+"""
+
+import asyncio
+import ssl
+from typing import Dict, Any, AsyncIterator, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+import httpx
+
+
+# Pool limits
+DEFAULT_CONCURRENCY = 50
+DEFAULT_PER_HOST = 6  # Same as browsers
+DEFAULT_TIMEOUT = 5.0
+KEEPALIVE_SECONDS = 30
+DNS_CACHE_SECONDS = 600
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def classify_status(status: int) -> Dict[str, Any]:
+    """Map a HEAD response status to {is_valid, reason}."""
+    if status == 200:
+        return {"is_valid": True, "reason": "ok_head"}
+    if status in (403, 401):
+        return {"is_valid": False, "reason": f"{status}_forbidden"}
+    if status == 404:
+        return {"is_valid": False, "reason": "404_not_found"}
+    if status >= 400:
+        return {"is_valid": False, "reason": f"{status}_error"}
+    return {"is_valid": True, "reason": f"ok_{status}"}
+
+
+def playwright_service_client(max_connections: int = 10) -> httpx.AsyncClient:
+    """
+    Client for the Playwright service: keep-alive pool sized to our
+    concurrency, multiplexed over HTTP/2 when available.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=KEEPALIVE_SECONDS,
+        ),
+    )
+
+
+class LinkChecker:
+    """
+    HEAD-request link checker sharing one connection pool.
+
+    Usage:
+        async with LinkChecker() as checker:
+            async for result in checker.stream(urls):
+                ...
+    """
+
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        per_host: int = DEFAULT_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._slots = asyncio.Semaphore(concurrency)
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "LinkChecker":
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.per_host,
+            ttl_dns_cache=DNS_CACHE_SECONDS,
+            keepalive_timeout=KEEPALIVE_SECONDS,
+            ssl=self.ssl_context or True,
+        )
+        # No session-wide total: aiohttp would count time waiting for a pooled
+        # connection against it. check() times each request after its slot.
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    def _host_slot(self, url: str) -> asyncio.Semaphore:
+        # Keyed like aiohttp's per-host pool limit: scheme, host and port
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.hostname or ''}:{parts.port or ''}"
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.per_host)
+        return self._host_slots[host]
+
+    async def check(self, url: str) -> Dict[str, Any]:
+        """
+        HEAD a single URL (following redirects).
+
+        Waits for an overall and a per-host slot first; the timeout starts
+        once both are held.
+
+        Returns:
+            Dict with url, is_valid, reason, status_code, final_url
+        """
+        result = {"url": url, "status_code": None, "final_url": None}
+        try:
+            async with self._host_slot(url), self._slots:
+                async with asyncio.timeout(self.timeout):
+                    async with self._session.head(url, allow_redirects=True) as response:
+                        result["status_code"] = response.status
+                        if str(response.url) != url:
+                            result["final_url"] = str(response.url)
+                        result.update(classify_status(response.status))
+        except asyncio.TimeoutError:
+            result.update(is_valid=False, reason="timeout")
+        except Exception as e:
+            result.update(is_valid=False, reason=f"error:{type(e).__name__}")
+        return result
+
+    async def stream(self, urls: Iterable[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Check URLs concurrently, yielding each result as soon as it completes."""
+        tasks = [asyncio.create_task(self.check(url)) for url in dict.fromkeys(urls)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -12,12 +12,18 @@ Uses real browser rendering via remote Playwright service.
 """
 
 import asyncio
+import re
+from bisect import bisect_right
+
 import httpx
 from temporalio import activity
 from typing import List, Dict, Any, Tuple
 from urllib.parse import urlparse
 
 from src.utils.config import config
+from src.activities.validation.url_health import get_url_health, put_url_health
+from src.activities.validation.link_checker import LinkChecker, playwright_service_client
+from src.utils.aho_corasick import AhoCorasick
 
 
 # Known paywall domains - skip these entirely (don't waste browser resources)
@@ -96,6 +102,23 @@ BOT_BLOCK_INDICATORS_WITH_CONTEXT = [
 ]
 
 
+def score_invalid_reason(reason: str) -> Tuple[str, float]:
+    """Map a failed-check reason to (status, score) for scored_urls."""
+    # Known paywalls = very low but not zero (might have free preview)
+    if "paywall" in reason:
+        return "paywall", 0.2
+    # Bot blocks = medium-low (might work for users)
+    if "bot_block" in reason:
+        return "bot_blocked", 0.3
+    # Timeouts/errors = medium (might be temporary)
+    if "timeout" in reason or "error" in reason:
+        return "uncertain", 0.5
+    # 404/broken = very low
+    if "404" in reason or "insufficient" in reason:
+        return "broken", 0.1
+    return "flagged", 0.4
+
+
 async def validate_url_with_playwright_service(
     url: str,
     client: httpx.AsyncClient,
@@ -297,27 +320,29 @@ async def _validate_urls_internal(urls: List[str], use_browser: bool = True) ->
 
         urls_to_check.append(url)
 
+    # Reuse recent outcomes from the URL health store (no network)
+    cached = await get_url_health(urls_to_check)
+    for url, record in cached.items():
+        if record["status"] == "validated":
+            valid_urls.append(url)
+        else:
+            invalid_urls.append({"url": url, "reason": record["reason"]})
+    urls_to_check = [u for u in urls_to_check if u not in cached]
+
     activity.logger.info(
         f"Pre-filter: {len(auto_approved)} auto-approved, "
         f"{len(paywall_blocked)} paywall domains blocked, "
+        f"{len(cached)} from URL health cache, "
         f"{len(urls_to_check)} URLs to browser-check"
     )
 
-    if not urls_to_check:
-        return {
-            "valid_urls": valid_urls,
-            "invalid_urls": invalid_urls,
-            "auto_approved": len(auto_approved),
-            "paywall_blocked": len(paywall_blocked),
-            "browser_checked": 0,
-            "total_checked": len(urls),
-            "validation_rate": len(valid_urls) / len(urls) if urls else 0
-        }
+    # Redirect targets seen during checks, stored with the outcome
+    final_urls: Dict[str, str] = {}
 
     # Use Railway Playwright service for browser-based validation
     service_url = config.PLAYWRIGHT_SERVICE_URL
 
-    if use_browser and service_url:
+    if use_browser and service_url and urls_to_check:
         activity.logger.info(f"Using Playwright service at {service_url} for {len(urls_to_check)} URLs")
 
         # Process ALL URLs in parallel (Playwright service handles one at a time, but we can fire many requests)
@@ -332,7 +357,7 @@ async def _validate_urls_internal(urls: List[str], use_browser: bool = True) ->
                 return url, is_valid, reason
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with playwright_service_client(max_connections=10) as client:
                 # Fire all requests in parallel
                 tasks = [check_with_semaphore(url, client) for url in urls_to_check]
 
@@ -363,40 +388,25 @@ async def _validate_urls_internal(urls: List[str], use_browser: bool = True) ->
 
     # Fallback: HEAD requests (fast but less thorough)
     if not use_browser or not service_url:
-        import aiohttp
-
         unchecked = [u for u in urls_to_check if u not in valid_urls and u not in [x['url'] for x in invalid_urls]]
 
         if unchecked:
             activity.logger.info(f"HEAD request fallback for {len(unchecked)} URLs")
 
-            async def check_url_head(url: str) -> Tuple[str, bool, str]:
-                try:
-                    timeout = aiohttp.ClientTimeout(total=5)
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        async with session.head(url, allow_redirects=True) as response:
-                            if response.status == 200:
-                                return (url, True, "ok_head")
-                            elif response.status in [403, 401]:
-                                return (url, False, f"{response.status}_forbidden")
-                            elif response.status == 404:
-                                return (url, False, "404_not_found")
-                            elif response.status >= 400:
-                                return (url, False, f"{response.status}_error")
-                            else:
-                                return (url, True, f"ok_{response.status}")
-                except asyncio.TimeoutError:
-                    return (url, False, "timeout")
-                except Exception as e:
-                    return (url, False, f"error:{type(e).__name__}")
-
-            results = await asyncio.gather(*[check_url_head(u) for u in unchecked])
-
-            for url, is_valid, reason in results:
-                if is_valid:
-                    valid_urls.append(url)
-                else:
-                    invalid_urls.append({"url": url, "reason": reason})
+            # One pooled session for all URLs; results arrive as they complete
+            done = 0
+            async with LinkChecker() as checker:
+                async for result in checker.stream(unchecked):
+                    url = result["url"]
+                    if result["final_url"]:
+                        final_urls[url] = result["final_url"]
+                    if result["is_valid"]:
+                        valid_urls.append(url)
+                    else:
+                        invalid_urls.append({"url": url, "reason": result["reason"]})
+                    done += 1
+                    if done % 25 == 0:
+                        activity.heartbeat(f"HEAD checked {done}/{len(unchecked)} URLs")
 
     browser_checked = len([x for x in invalid_urls if x.get("reason", "").startswith(("paywall:", "error_page:", "bot_block:", "ok"))]) + \
                       len([u for u in valid_urls if u not in auto_approved])
@@ -423,21 +433,16 @@ async def _validate_urls_internal(urls: List[str], use_browser: bool = True) ->
     for item in invalid_urls:
         url = item["url"]
         reason = item.get("reason", "unknown")
+        status, score = score_invalid_reason(reason)
+        scored_urls.append({"url": url, "score": score, "status": status, "reason": reason})
 
-        # Known paywalls = very low but not zero (might have free preview)
-        if "paywall" in reason:
-            scored_urls.append({"url": url, "score": 0.2, "status": "paywall", "reason": reason})
-        # Bot blocks = medium-low (might work for users)
-        elif "bot_block" in reason:
-            scored_urls.append({"url": url, "score": 0.3, "status": "bot_blocked", "reason": reason})
-        # Timeouts/errors = medium (might be temporary)
-        elif "timeout" in reason or "error" in reason:
-            scored_urls.append({"url": url, "score": 0.5, "status": "uncertain", "reason": reason})
-        # 404/broken = very low
-        elif "404" in reason or "insufficient" in reason:
-            scored_urls.append({"url": url, "score": 0.1, "status": "broken", "reason": reason})
-        else:
-            scored_urls.append({"url": url, "score": 0.4, "status": "flagged", "reason": reason})
+    # Remember outcomes of this run's network checks for later phases
+    checked = set(urls_to_check)
+    await put_url_health([
+        {**item, "final_url": final_urls.get(item["url"])}
+        for item in scored_urls
+        if item["url"] in checked
+    ])
 
     activity.logger.info(
         f"Validation complete: {len(valid_urls)} valid, {len(invalid_urls)} flagged "
@@ -451,6 +456,7 @@ async def _validate_urls_internal(urls: List[str], use_browser: bool = True) ->
         "auto_approved": len(auto_approved),
         "paywall_blocked": len(paywall_blocked),
         "browser_checked": browser_checked,
+        "cache_hits": len(cached),
         "total_checked": len(urls),
         "validation_rate": len(valid_urls) / len(urls) if urls else 0
     }
@@ -524,6 +530,34 @@ async def playwright_clean_links(profile_sections: Dict[str, Dict[str, Any]]) ->
     return cleaned_sections
 
 
+# Regions internal links must never be inserted into: existing links, code,
+# headings, any other tag, and markdown links
+_NO_LINK_REGIONS = re.compile(
+    r'<(a|script|style|code|pre|h[1-6])\b[^>]*>.*?</\1\s*>'
+    r'|<[^>]+>'
+    r'|\[[^\]]*\]\([^)]*\)',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def _link_spans(content: str) -> Tuple[List[int], List[int]]:
+    """Start/end offsets of regions that must not receive links (sorted)."""
+    starts, ends = [], []
+    for match in _NO_LINK_REGIONS.finditer(content):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
+
+
+def _in_spans(starts: List[int], ends: List[int], start: int, end: int) -> bool:
+    i = bisect_right(starts, start) - 1
+    if i >= 0 and start < ends[i]:
+        return True
+    # A region beginning inside the match also overlaps it
+    j = bisect_right(starts, start)
+    return j < len(starts) and starts[j] < end
+
+
 @activity.defn
 async def finesse_internal_links(
     cluster_articles: List[Dict[str, Any]],
@@ -539,6 +573,11 @@ async def finesse_internal_links(
     4. Ensures no article links to itself
     5. Uses short anchor text (2-4 words)
 
+    All anchors for the cluster go into one Aho-Corasick automaton, so each
+    article is scanned once regardless of cluster size. Matches inside
+    existing links, tags, headings and code are ignored, each sibling is
+    linked at most once, and the article is rebuilt in a single join.
+
     Args:
         cluster_articles: List of article dicts with {id, slug, content, target_keyword, article_mode}
         primary_article_id: ID of the primary (story) article to prioritize
@@ -546,20 +585,8 @@ async def finesse_internal_links(
     Returns:
         Updated cluster_articles with improved internal linking
     """
-    import re
-
     activity.logger.info(f"[Finesse Internal Links] Processing {len(cluster_articles)} cluster articles")
 
-    # Build lookup of slugs and keywords
-    article_lookup = {}
-    for article in cluster_articles:
-        article_lookup[article['id']] = {
-            'slug': article.get('slug', ''),
-            'target_keyword': article.get('target_keyword', ''),
-            'article_mode': article.get('article_mode', ''),
-            'title': article.get('title', '')
-        }
-
     # Short anchor text options for each mode
     mode_anchors = {
         'story': ['relocation guide', 'complete guide', 'full guide'],
@@ -567,66 +594,80 @@ async def finesse_internal_links(
         'yolo': ['adventure guide', 'YOLO guide', 'bold approach'],
         'voices': ['expat stories', 'real experiences', 'expat voices']
     }
+    mode_priority = {'story': 0, 'guide': 1, 'yolo': 2, 'voices': 3}
+
+    article_lookup = {article['id']: article for article in cluster_articles}
+
+    # Anchor options per article: its target keyword (if short) then its mode anchors
+    article_anchors = {}
+    for article in cluster_articles:
+        anchors = []
+        keyword = (article.get('target_keyword') or '').strip()
+        if 2 <= len(keyword.split()) <= 4:
+            anchors.append(keyword)
+        anchors.extend(mode_anchors.get(article.get('article_mode', ''), ['guide']))
+        article_anchors[article['id']] = anchors
+
+    # One automaton for every anchor in the cluster
+    anchor_index = {}
+    for anchors in article_anchors.values():
+        for anchor in anchors:
+            anchor_index.setdefault(anchor.lower(), len(anchor_index))
+    matcher = AhoCorasick(list(anchor_index))
 
     updated_articles = []
 
     for article in cluster_articles:
         article_id = article['id']
-        content = article.get('content', '')
-        current_slug = article.get('slug', '')
-
-        # Get sibling articles (not self)
-        siblings = [(aid, info) for aid, info in article_lookup.items() if aid != article_id]
+        content = article.get('content', '') or ''
+        is_html = bool(re.search(r'<(p|a|h[1-6]|div|ul|li)\b', content, re.IGNORECASE))
 
-        # Sort siblings: primary first, then by mode importance
-        mode_priority = {'story': 0, 'guide': 1, 'yolo': 2, 'voices': 3}
+        # Siblings (not self): primary first, then by mode importance
+        siblings = [(aid, info) for aid, info in article_lookup.items() if aid != article_id and info.get('slug')]
         siblings.sort(key=lambda x: (
             0 if x[0] == primary_article_id else 1,
-            mode_priority.get(x[1]['article_mode'], 99)
+            mode_priority.get(x[1].get('article_mode', ''), 99)
         ))
 
-        # Check existing internal links
+        # Existing internal links (HTML or markdown)
         existing_links = set(re.findall(r'\]\(/([^)]+)\)', content))
+        existing_links.update(re.findall(r'href=["\']/([^"\']+)["\']', content))
 
-        links_added = 0
-        max_links_to_add = 3  # Don't over-link
+        # Single scan: first free occurrence of every anchor
+        starts, ends = _link_spans(content)
+        first_match = {}
+        for start, end, index in matcher.find_all(content):
+            if index not in first_match and not _in_spans(starts, ends, start, end):
+                first_match[index] = (start, end)
 
+        # Pick one anchor per sibling (priority order), without overlapping picks
+        max_links_to_add = 3  # Don't over-link
+        chosen = []
         for sibling_id, sibling_info in siblings:
-            if links_added >= max_links_to_add:
+            if len(chosen) >= max_links_to_add:
                 break
-
-            sibling_slug = sibling_info['slug']
-
-            # Skip if already linked
-            if sibling_slug in existing_links:
+            if sibling_info['slug'] in existing_links:
                 continue
-
-            sibling_mode = sibling_info['article_mode']
-            sibling_keyword = sibling_info.get('target_keyword', '')
-
-            # Try to find natural insertion points
-            # Look for mentions of related terms that could become links
-            anchor_options = mode_anchors.get(sibling_mode, ['guide'])
-
-            for anchor in anchor_options:
-                # Find the anchor text in content (case insensitive)
-                pattern = rf'\b({re.escape(anchor)})\b'
-                match = re.search(pattern, content, re.IGNORECASE)
-
-                if match and f'](/' not in content[max(0, match.start()-5):match.end()+5]:
-                    # Found unlinked text - make it a link
-                    original_text = match.group(1)
-                    replacement = f'[{original_text}](/{sibling_slug})'
-                    content = content[:match.start()] + replacement + content[match.end():]
-                    links_added += 1
-                    activity.logger.info(f"  Added link: '{original_text}' -> /{sibling_slug}")
+            for anchor in article_anchors[sibling_id]:
+                span = first_match.get(anchor_index[anchor.lower()])
+                if span and not any(span[0] < e and s < span[1] for s, e, _ in chosen):
+                    chosen.append((span[0], span[1], sibling_info['slug']))
                     break
 
-        # Update article with new content
-        updated_article = {**article, 'content': content}
-        updated_articles.append(updated_article)
+        # Rebuild the content once
+        pieces = []
+        cursor = 0
+        for start, end, slug in sorted(chosen):
+            text = content[start:end]
+            link = f'<a href="/{slug}">{text}</a>' if is_html else f'[{text}](/{slug})'
+            pieces.extend([content[cursor:start], link])
+            cursor = end
+            activity.logger.info(f"  Added link: '{text}' -> /{slug}")
+        pieces.append(content[cursor:])
+
+        updated_articles.append({**article, 'content': ''.join(pieces)})
 
-        activity.logger.info(f"Article {article_id}: Added {links_added} internal links")
+        activity.logger.info(f"Article {article_id}: Added {len(chosen)} internal links")
 
     return updated_articles
 
@@ -681,6 +722,13 @@ async def verify_external_links(
         else:
             low_authority.append({'text': text, 'url': url, 'domain': domain})
 
+    # Links already known to be broken/paywalled (health store only, no network)
+    known_health = await get_url_health([url for _, url in all_links])
+    known_bad = sorted({
+        url for url, record in known_health.items()
+        if record["status"] in ("broken", "paywall")
+    })
+
     total_links = len(all_links)
     quality_score = (len(high_authority) * 1.0 + len(medium_authority) * 0.7 + len(low_authority) * 0.4) / max(total_links, 1)
 
@@ -697,6 +745,7 @@ async def verify_external_links(
         'quality_score': round(quality_score, 2),
         'meets_minimum': total_links >= min_links,
         'potential_claims': len(claims),
+        'known_bad_links': known_bad,
         'suggestions': []
     }
 
@@ -706,6 +755,9 @@ async def verify_external_links(
     if len(high_authority) < 3:
         result['suggestions'].append("Add more links to government/official sources")
 
+    if known_bad:
+        result['suggestions'].append(f"Replace {len(known_bad)} links known to be broken or paywalled")
+
     activity.logger.info(
         f"External links: {total_links} total ({len(high_authority)} high authority), "
         f"quality score: {quality_score:.2f}, meets minimum: {result['meets_minimum']}"
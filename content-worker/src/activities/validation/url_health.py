@@ -0,0 +1,227 @@
+"""
+URL Health Store
+
+Remembers the outcome of link checks so repeat URLs skip the network.
+Phase 4b (pre-cleanse), Phase 5b (post-cleanse) and company Phase 5.5
+all cite the same authoritative sources over and over.
+
+Records are keyed by normalized URL and hold status, score, reason, final
+redirect target and check time. Two tiers:
+- In-process dict (lives as long as the worker)
+- Neon url_health table (shared across workers and restarts)
+
+TTL depends on the outcome: a 200 on a government domain is trusted for a
+month, while a timeout is only remembered for an hour.
+
+Neon failures never block validation: the store falls back to memory only.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Iterable, List
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+import psycopg
+from temporalio import activity
+
+from src.utils.config import config
+
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = {'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'ref_src'}
+
+# TTLs by outcome
+GOV_OK_TTL = timedelta(days=30)
+OK_TTL = timedelta(days=7)
+PAYWALL_TTL = timedelta(days=30)
+BROKEN_TTL = timedelta(days=3)
+BOT_BLOCKED_TTL = timedelta(days=1)
+FLAGGED_TTL = timedelta(days=1)
+UNCERTAIN_TTL = timedelta(hours=1)
+
+# Reasons that say nothing about the URL itself - never cached
+UNCACHEABLE_REASONS = {'service_error_passthrough'}
+
+# In-memory entries kept before the oldest half is dropped
+MAX_MEMORY_ENTRIES = 20000
+
+# normalized url -> record (with "expires_at" as a unix timestamp)
+_memory: Dict[str, Dict[str, Any]] = {}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical cache key for a URL.
+
+    Lowercases scheme/host, drops "www.", default ports, fragments, utm_* and
+    other tracking params, sorts the query and strips a trailing slash.
+    """
+    parsed = urlparse(url.strip())
+    scheme = (parsed.scheme or 'https').lower()
+    host = (parsed.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parsed.port and (scheme, parsed.port) not in (('http', 80), ('https', 443)):
+        host = f"{host}:{parsed.port}"
+
+    path = parsed.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS
+    ))
+
+    return urlunparse((scheme, host, path, '', query, ''))
+
+
+def is_gov_domain(domain: str) -> bool:
+    """gov.uk, *.gov, *.gov.xx, europa.eu and similar official domains."""
+    domain = domain.lower().split(':')[0]
+    parts = domain.split('.')
+    return (
+        'gov' in parts
+        or domain.endswith(('.europa.eu', '.int'))
+        or domain in ('europa.eu',)
+    )
+
+
+def ttl_for(status: str, url: str) -> timedelta:
+    """How long a check outcome stays valid."""
+    if status in ('validated', 'trusted'):
+        return GOV_OK_TTL if is_gov_domain(urlparse(url).netloc) else OK_TTL
+    if status == 'paywall':
+        return PAYWALL_TTL
+    if status == 'broken':
+        return BROKEN_TTL
+    if status == 'bot_blocked':
+        return BOT_BLOCKED_TTL
+    if status == 'uncertain':
+        return UNCERTAIN_TTL
+    return FLAGGED_TTL
+
+
+def _remember(key: str, record: Dict[str, Any]) -> None:
+    if len(_memory) >= MAX_MEMORY_ENTRIES:
+        # Drop the entries closest to expiry
+        for stale in sorted(_memory, key=lambda k: _memory[k]['expires_at'])[:MAX_MEMORY_ENTRIES // 2]:
+            del _memory[stale]
+    _memory[key] = record
+
+
+async def get_url_health(urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Look up fresh health records.
+
+    Args:
+        urls: URLs as they appear in content (not normalized)
+
+    Returns:
+        Dict of original URL -> record {url, status, score, reason, final_url, checked_at}
+        for every URL with an unexpired record
+    """
+    now = time.time()
+    keys = {url: normalize_url(url) for url in urls}
+    found: Dict[str, Dict[str, Any]] = {}
+    missing = {}
+
+    for url, key in keys.items():
+        record = _memory.get(key)
+        if record and record['expires_at'] > now:
+            found[url] = record
+        else:
+            missing.setdefault(key, []).append(url)
+
+    if not missing or not config.DATABASE_URL:
+        return found
+
+    try:
+        async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    SELECT url, status, score, reason, final_url, checked_at, expires_at
+                    FROM url_health
+                    WHERE url = ANY(%s) AND expires_at > NOW()
+                    """,
+                    (list(missing),)
+                )
+                rows = await cur.fetchall()
+    except Exception as e:
+        activity.logger.warning(f"URL health lookup failed (continuing without it): {e}")
+        return found
+
+    for key, status, score, reason, final_url, checked_at, expires_at in rows:
+        record = {
+            'url': key,
+            'status': status,
+            'score': score,
+            'reason': reason,
+            'final_url': final_url,
+            'checked_at': checked_at.isoformat(),
+            'expires_at': expires_at.timestamp(),
+        }
+        _remember(key, record)
+        for url in missing[key]:
+            found[url] = record
+
+    return found
+
+
+async def put_url_health(results: List[Dict[str, Any]]) -> int:
+    """
+    Store check outcomes.
+
+    Args:
+        results: Dicts with url, status, score, reason and optional final_url
+
+    Returns:
+        Number of records stored
+    """
+    now = datetime.now(timezone.utc)
+    records = []
+
+    for result in results:
+        if result.get('reason') in UNCACHEABLE_REASONS:
+            continue
+        key = normalize_url(result['url'])
+        expires = now + ttl_for(result['status'], key)
+        record = {
+            'url': key,
+            'status': result['status'],
+            'score': result['score'],
+            'reason': result.get('reason', ''),
+            'final_url': result.get('final_url'),
+            'checked_at': now.isoformat(),
+            'expires_at': expires.timestamp(),
+        }
+        _remember(key, record)
+        records.append((key, record['status'], record['score'], record['reason'],
+                        record['final_url'], now, expires))
+
+    if not records or not config.DATABASE_URL:
+        return len(records)
+
+    try:
+        async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
+            async with conn.cursor() as cur:
+                await cur.executemany(
+                    """
+                    INSERT INTO url_health (url, status, score, reason, final_url, checked_at, expires_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (url) DO UPDATE SET
+                        status = EXCLUDED.status,
+                        score = EXCLUDED.score,
+                        reason = EXCLUDED.reason,
+                        final_url = EXCLUDED.final_url,
+                        checked_at = EXCLUDED.checked_at,
+                        expires_at = EXCLUDED.expires_at
+                    """,
+                    records
+                )
+            await conn.commit()
+    except Exception as e:
+        activity.logger.warning(f"URL health store write failed (memory only): {e}")
+
+    return len(records)
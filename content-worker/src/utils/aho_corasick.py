@@ -0,0 +1,93 @@
+"""
+Aho-Corasick multi-pattern matcher.
+
+Finds every occurrence of many phrases in one left-to-right scan of the
+text, instead of one regex search per phrase. Used by internal linking,
+where a cluster can have 20+ sibling articles with several anchors each.
+
+Example:
+    matcher = AhoCorasick(["complete guide", "golden visa"])
+    for start, end, index in matcher.find_all(html):
+        ...
+"""
+
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
+
+
+def _lower_same_length(text: str) -> str:
+    """Lowercase text without changing its length (so offsets still line up)."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class AhoCorasick:
+    """
+    Case-insensitive Aho-Corasick automaton over a fixed list of patterns.
+
+    Matches are reported as (start, end, pattern_index) with `end` exclusive,
+    in order of their end position.
+    """
+
+    def __init__(self, patterns: Iterable[str], whole_words: bool = True):
+        self.patterns: List[str] = list(patterns)
+        self.whole_words = whole_words
+
+        # Trie: per-node transitions, failure link and patterns ending here
+        self._goto: List[dict] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for char in _lower_same_length(pattern):
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            if pattern:
+                self._out[node].append(index)
+
+        # Breadth-first failure links; outputs inherit from their failure node
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def find_all(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield (start, end, pattern_index) for every match in text."""
+        lowered = _lower_same_length(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+
+        for position, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not out[node]:
+                continue
+
+            end = position + 1
+            for index in out[node]:
+                start = end - len(self.patterns[index])
+                if self.whole_words and not self._at_word_boundary(lowered, start, end):
+                    continue
+                yield start, end, index
+
+    @staticmethod
+    def _at_word_boundary(text: str, start: int, end: int) -> bool:
+        before = text[start - 1] if start > 0 else " "
+        after = text[end] if end < len(text) else " "
+        return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
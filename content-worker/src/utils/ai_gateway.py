@@ -12,13 +12,21 @@ Usage:
 
     # Async
     response = await get_completion_async("What is 2+2?", model="gpt-4o-mini")
+
+    # Streaming
+    async for delta in stream_completion_async("Write an article...", model="quality"):
+        ...
+
+The async calls acquire a provider slot (shared.provider_limits) per
+request, so every caller shares the account-wide rate limits.
 """
 
 import os
 import openai
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 
 from src.utils.config import config
+from shared.provider_limits import provider_for_model, provider_slot
 
 
 # Gateway configuration
@@ -182,12 +190,13 @@ async def get_completion_async(
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        async with provider_slot(provider_for_model(model)):
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
         return response.choices[0].message.content
 
     # Fallback to direct Anthropic
@@ -207,13 +216,77 @@ async def get_completion_async(
         else:
             anthropic_model = "claude-3-5-haiku-latest"
 
-        response = await client.messages.create(
+        async with provider_slot("anthropic"):
+            response = await client.messages.create(
+                model=anthropic_model,
+                max_tokens=max_tokens,
+                system=system_prompt or "",
+                messages=[{"role": "user", "content": prompt}],
+            )
+        return response.content[0].text
+
+    raise ValueError("No AI API key configured (need PYDANTIC_AI_GATEWAY_API_KEY or ANTHROPIC_API_KEY)")
+
+
+async def stream_completion_async(
+    prompt: str,
+    model: str = "gpt-4o-mini",
+    system_prompt: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+) -> AsyncIterator[str]:
+    """
+    Stream a completion via Gateway or direct provider, yielding text deltas.
+
+    Same provider order and model mapping as get_completion_async.
+    """
+    model = resolve_model(model)
+
+    # Try Gateway first
+    client = get_async_gateway_client()
+    if client:
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        async with provider_slot(provider_for_model(model)):
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        return
+
+    # Fallback to direct Anthropic
+    anthropic_key = os.environ.get("ANTHROPIC_API_KEY") or getattr(
+        config, "ANTHROPIC_API_KEY", None
+    )
+    if anthropic_key:
+        import anthropic
+
+        client = anthropic.AsyncAnthropic(api_key=anthropic_key)
+
+        # Map model to Anthropic equivalent
+        if "claude" in model.lower():
+            anthropic_model = model
+        else:
+            anthropic_model = "claude-3-5-haiku-latest"
+
+        async with provider_slot("anthropic"), client.messages.stream(
             model=anthropic_model,
             max_tokens=max_tokens,
             system=system_prompt or "",
             messages=[{"role": "user", "content": prompt}],
-        )
-        return response.content[0].text
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+        return
 
     raise ValueError("No AI API key configured (need PYDANTIC_AI_GATEWAY_API_KEY or ANTHROPIC_API_KEY)")
 
@@ -0,0 +1,391 @@
+"""
+Article Similarity Index
+
+In-worker nearest-neighbour index over published article titles and
+excerpts, per app, for news duplicate detection.
+
+- Loaded once from Neon (last INDEX_DAYS, up to INDEX_MAX_ARTICLES) and
+  embedded in batched calls; reloaded after INDEX_TTL_SECONDS so articles
+  saved by other workers are picked up.
+- save_article_to_neon appends/updates the saved article in place
+  (index_article), so stories published by this worker are matched
+  immediately.
+- Queries are one matrix product: milliseconds for thousands of articles.
+
+Vectors come from embed_texts (OpenAI or Gemini); if no embedding provider
+is available the index uses hashed_features at INDEX_HASH_DIMENSIONS, which
+don't depend on the batch and so stay comparable as the index grows. Each scorer has its own
+duplicate/related thresholds (scripts/calibrate_article_thresholds.py).
+
+Similarity alone can't tell "Cyprus digital nomad visa guide" from the Malta
+one, so matches are also checked on the places and names in the titles: a
+match naming only other countries or companies is not the same or a related
+story, and a duplicate must share a place or name with the story.
+
+Usage:
+    index = await get_article_index("relocation")
+    for title, matches in zip(titles, index.search(await index.vectorize(texts), top_k=3)):
+        verdict = classify(matches, index.scorer, title=title)
+"""
+
+import asyncio
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+import psycopg
+from psycopg.rows import dict_row
+
+from src.utils.config import config
+from src.utils.embeddings import embed_texts, embedding_provider, hashed_features
+
+
+INDEX_DAYS = 365
+INDEX_MAX_ARTICLES = 5000
+INDEX_TTL_SECONDS = 1800
+
+# Hashed fallback width: 5000 articles x 1024 float32 is 20 MB per app
+# (the 8192-wide default would be 164 MB in every worker replica)
+INDEX_HASH_DIMENSIONS = 1024
+
+# Preallocated rows; capacity doubles when full instead of copying per insert
+INITIAL_CAPACITY = 64
+
+# Texts per embedding request when loading
+EMBED_BATCH = 500
+MAX_TEXT_CHARS = 500
+
+# Cosine similarity at/above which a match is the same story / a related story,
+# per scorer (each embedding model has its own similarity scale). hashed is
+# calibrated on scripts/fixtures/headline_pairs.json; re-run
+# scripts/calibrate_article_thresholds.py with an API key to calibrate openai/google.
+THRESHOLDS = {
+    "openai": {"duplicate": 0.8, "related": 0.6},
+    "google": {"duplicate": 0.85, "related": 0.7},
+    "hashed": {"duplicate": 0.4, "related": 0.2},
+}
+
+# A same-story match published within this window means "already covered"
+DUPLICATE_WINDOW_HOURS = 48
+
+# Country names, demonyms and major cities -> country
+PLACES = {
+    "australia": "australia", "australian": "australia", "sydney": "australia", "melbourne": "australia",
+    "austria": "austria", "austrian": "austria", "vienna": "austria",
+    "belgium": "belgium", "belgian": "belgium", "brussels": "belgium",
+    "brazil": "brazil", "brazilian": "brazil",
+    "bulgaria": "bulgaria", "bulgarian": "bulgaria",
+    "canada": "canada", "canadian": "canada", "toronto": "canada", "vancouver": "canada",
+    "china": "china", "chinese": "china", "hong kong": "hong kong",
+    "colombia": "colombia", "colombian": "colombia",
+    "costa rica": "costa rica", "costa rican": "costa rica",
+    "croatia": "croatia", "croatian": "croatia",
+    "cyprus": "cyprus", "cypriot": "cyprus",
+    "czech": "czechia", "czechia": "czechia", "prague": "czechia",
+    "denmark": "denmark", "danish": "denmark",
+    "estonia": "estonia", "estonian": "estonia",
+    "france": "france", "french": "france", "paris": "france",
+    "germany": "germany", "german": "germany", "berlin": "germany", "munich": "germany",
+    "greece": "greece", "greek": "greece", "athens": "greece",
+    "hungary": "hungary", "hungarian": "hungary",
+    "india": "india", "indian": "india",
+    "indonesia": "indonesia", "indonesian": "indonesia", "bali": "indonesia",
+    "ireland": "ireland", "irish": "ireland", "dublin": "ireland",
+    "italy": "italy", "italian": "italy", "rome": "italy", "milan": "italy",
+    "japan": "japan", "japanese": "japan", "tokyo": "japan",
+    "malaysia": "malaysia", "malaysian": "malaysia",
+    "malta": "malta", "maltese": "malta",
+    "mexico": "mexico", "mexican": "mexico",
+    "netherlands": "netherlands", "dutch": "netherlands", "amsterdam": "netherlands",
+    "new zealand": "new zealand",
+    "norway": "norway", "norwegian": "norway",
+    "panama": "panama", "panamanian": "panama",
+    "philippines": "philippines",
+    "poland": "poland", "polish": "poland",
+    "portugal": "portugal", "portuguese": "portugal", "lisbon": "portugal", "porto": "portugal",
+    "romania": "romania", "romanian": "romania",
+    "saudi": "saudi arabia", "saudi arabia": "saudi arabia",
+    "singapore": "singapore",
+    "south africa": "south africa",
+    "south korea": "south korea", "korea": "south korea", "korean": "south korea",
+    "spain": "spain", "spanish": "spain", "madrid": "spain", "barcelona": "spain",
+    "sweden": "sweden", "swedish": "sweden",
+    "switzerland": "switzerland", "swiss": "switzerland", "zurich": "switzerland",
+    "thailand": "thailand", "thai": "thailand", "bangkok": "thailand",
+    "turkey": "turkey", "turkish": "turkey",
+    "uae": "uae", "emirates": "uae", "dubai": "uae", "abu dhabi": "uae",
+    "uk": "uk", "britain": "uk", "british": "uk", "united kingdom": "uk",
+    "england": "uk", "scotland": "uk", "wales": "uk", "london": "uk",
+    "us": "us", "usa": "us", "america": "us", "american": "us", "united states": "us", "new york": "us",
+    "vietnam": "vietnam", "vietnamese": "vietnam",
+}
+
+# Capitalized words that aren't names (sentence starts, title case)
+COMMON_WORDS = frozenset("""
+a about after against all an and as at be by ceo cfo coo cto down for from guide how
+in into is it its new news no of off on or out over per record report than that the
+their this to top up vs what when why will with
+jan feb mar apr may jun jul aug sep sept oct nov dec january february march april
+june july august september october november december monday tuesday wednesday
+thursday friday saturday sunday
+visa visas golden digital nomad nomads remote work worker workers residence permit
+permits passport tax citizenship property rental rentals investment investor
+interim fractional executive private equity fund funds firm firms bank banks
+startup startups deal deals market markets
+""".split())
+
+_TITLE_WORD = re.compile(r"[A-Za-z][A-Za-z&'-]*")
+
+_indexes: Dict[str, "ArticleIndex"] = {}
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+def article_text(title: str, excerpt: str = "") -> str:
+    return f"{title or ''}. {excerpt or ''}"[:MAX_TEXT_CHARS]
+
+
+class ArticleIndex:
+    """
+    Unit vectors of one app's articles, with their metadata rows.
+
+    _matrix is preallocated and grown geometrically; only its first
+    len(articles) rows are in use.
+    """
+
+    def __init__(self, app: str, scorer: str):
+        self.app = app
+        self.scorer = scorer
+        self.articles: List[Dict[str, Any]] = []
+        self.loaded_at = time.monotonic()
+        self._rows: Dict[Any, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.articles)
+
+    @property
+    def stale(self) -> bool:
+        return time.monotonic() - self.loaded_at > INDEX_TTL_SECONDS
+
+    async def vectorize(self, texts: List[str]) -> np.ndarray:
+        """Vectors for texts with this index's scorer."""
+        if self.scorer != "hashed":
+            parts = []
+            for start in range(0, len(texts), EMBED_BATCH):
+                vectors = await embed_texts(texts[start:start + EMBED_BATCH])
+                if vectors is None:
+                    raise RuntimeError("Embedding provider unavailable")
+                parts.append(vectors)
+            if parts:
+                return np.vstack(parts)
+            return np.zeros((0, 0), dtype=np.float32)
+        return hashed_features(texts, INDEX_HASH_DIMENSIONS)
+
+    def add(self, articles: List[Dict[str, Any]], vectors: np.ndarray) -> None:
+        """Add articles (or replace them, by id) with their vectors."""
+        new_rows = []
+        for article, vector in zip(articles, vectors):
+            row = self._rows.get(article["id"])
+            if row is not None:
+                self.articles[row] = article
+                self._matrix[row] = vector
+            else:
+                self._rows[article["id"]] = len(self.articles) + len(new_rows)
+                new_rows.append((article, vector))
+
+        if new_rows:
+            start = len(self.articles)
+            self._reserve(start + len(new_rows), len(new_rows[0][1]))
+            self._matrix[start:start + len(new_rows)] = [vector for _, vector in new_rows]
+            self.articles.extend(article for article, _ in new_rows)
+
+    def _reserve(self, rows: int, dimensions: int) -> None:
+        """Make room for `rows` vectors, doubling the capacity when it runs out."""
+        capacity = 0 if self._matrix is None else len(self._matrix)
+        if rows <= capacity:
+            return
+        grown = np.zeros((max(rows, 2 * capacity, INITIAL_CAPACITY), dimensions), dtype=np.float32)
+        if self._matrix is not None:
+            grown[:len(self.articles)] = self._matrix[:len(self.articles)]
+        self._matrix = grown
+
+    def search(self, vectors: np.ndarray, top_k: int = 3) -> List[List[Dict[str, Any]]]:
+        """
+        Nearest articles for each query vector.
+
+        Returns:
+            One list per query of article dicts plus "similarity", best first
+        """
+        if self._matrix is None or not len(vectors):
+            return [[] for _ in range(len(vectors))]
+
+        similarities = vectors @ self._matrix[:len(self.articles)].T
+        k = min(top_k, similarities.shape[1])
+        results = []
+        for row in similarities:
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top])]
+            results.append([{**self.articles[i], "similarity": round(float(row[i]), 4)} for i in top])
+        return results
+
+
+def title_entities(title: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    Places (countries) and names (capitalized words that aren't common
+    headline words) in a title.
+    """
+    words = _TITLE_WORD.findall(title or "")
+    lowered = [w.lower() for w in words]
+    places, names = set(), set()
+    i = 0
+    while i < len(words):
+        pair = " ".join(lowered[i:i + 2])
+        if i + 1 < len(words) and pair in PLACES:
+            places.add(PLACES[pair])
+            i += 2
+            continue
+        word = lowered[i]
+        if word in PLACES and (word != "us" or words[i] == "US"):
+            places.add(PLACES[word])
+        elif words[i][0].isupper() and word not in COMMON_WORDS:
+            names.add(word)
+        i += 1
+    return frozenset(places), frozenset(names)
+
+
+def _conflict(ours: FrozenSet[str], theirs: FrozenSet[str]) -> bool:
+    return bool(ours and theirs and not ours & theirs)
+
+
+def about_other_entity(title: str, match: Dict[str, Any]) -> bool:
+    """Both titles name places (or names) and none are shared: another country or company."""
+    places, names = title_entities(title)
+    match_places, match_names = title_entities(match.get("title", ""))
+    return _conflict(places, match_places) or _conflict(names, match_names)
+
+
+def related_matches(title: str, matches: List[Dict[str, Any]], scorer: str) -> List[Dict[str, Any]]:
+    """Matches at or above the related threshold that aren't about another country or company."""
+    threshold = THRESHOLDS[scorer]["related"]
+    return [m for m in matches if m["similarity"] >= threshold and not about_other_entity(title, m)]
+
+
+def same_story(title: str, match: Dict[str, Any]) -> bool:
+    """A related match that shares a place or name with the title (if the title has any)."""
+    places, names = title_entities(title)
+    if not places and not names:
+        return True
+    match_places, match_names = title_entities(match.get("title", ""))
+    return bool(places & match_places or names & match_names)
+
+
+def classify(
+    matches: List[Dict[str, Any]],
+    scorer: str,
+    now: Optional[datetime] = None,
+    title: str = ""
+) -> str:
+    """
+    "duplicate" (same story published within DUPLICATE_WINDOW_HOURS),
+    "developing" (same or related story covered before) or "new".
+
+    Only matches in related_matches count; a duplicate must also be the
+    same_story as the title.
+    """
+    related = related_matches(title, matches, scorer)
+    if not related:
+        return "new"
+    now = now or datetime.now(timezone.utc)
+    for match in related:
+        if match["similarity"] < THRESHOLDS[scorer]["duplicate"] or not same_story(title, match):
+            continue
+        created_at = match.get("created_at")
+        if created_at:
+            published = datetime.fromisoformat(created_at)
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            if (now - published).total_seconds() <= DUPLICATE_WINDOW_HOURS * 3600:
+                return "duplicate"
+    return "developing"
+
+
+async def _load_articles(app: str) -> List[Dict[str, Any]]:
+    async with await psycopg.AsyncConnection.connect(config.DATABASE_URL) as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(
+                """
+                SELECT id, title, slug, excerpt, created_at
+                FROM articles
+                WHERE app = %s
+                AND created_at >= CURRENT_TIMESTAMP - make_interval(days => %s)
+                AND status IN ('published', 'draft')
+                ORDER BY created_at DESC
+                LIMIT %s
+                """,
+                (app, INDEX_DAYS, INDEX_MAX_ARTICLES)
+            )
+            rows = await cur.fetchall()
+
+    return [_article_row(row) for row in rows]
+
+
+def _article_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    created_at = row.get("created_at")
+    return {
+        "id": str(row["id"]),
+        "title": row.get("title") or "",
+        "slug": row.get("slug") or "",
+        "excerpt": (row.get("excerpt") or "")[:300],
+        "created_at": created_at.isoformat() if isinstance(created_at, datetime) else created_at,
+    }
+
+
+async def _build_index(app: str) -> ArticleIndex:
+    articles = await _load_articles(app) if config.DATABASE_URL else []
+    texts = [article_text(a["title"], a["excerpt"]) for a in articles]
+
+    index = ArticleIndex(app, embedding_provider() or "hashed")
+    try:
+        vectors = await index.vectorize(texts)
+    except RuntimeError:
+        index = ArticleIndex(app, "hashed")
+        vectors = await index.vectorize(texts)
+
+    if articles:
+        index.add(articles, vectors)
+    return index
+
+
+async def get_article_index(app: str) -> ArticleIndex:
+    """The app's index, loading (or reloading when stale) from Neon."""
+    lock = _locks.setdefault(app, asyncio.Lock())
+    async with lock:
+        index = _indexes.get(app)
+        if index is None or index.stale:
+            index = await _build_index(app)
+            _indexes[app] = index
+        return index
+
+
+async def index_article(app: str, article: Dict[str, Any]) -> bool:
+    """
+    Add a just-saved article to the app's index if it is loaded in this worker.
+
+    (An index that isn't loaded yet will read the article from Neon.)
+    """
+    index = _indexes.get(app)
+    if index is None:
+        return False
+    row = _article_row(article)
+    if not row["created_at"]:
+        # Updates keep the original publish time
+        existing = index._rows.get(row["id"])
+        row["created_at"] = (
+            index.articles[existing]["created_at"] if existing is not None
+            else datetime.now(timezone.utc).isoformat()
+        )
+    vectors = await index.vectorize([article_text(row["title"], row["excerpt"])])
+    index.add([row], vectors)
+    return True
@@ -0,0 +1,272 @@
+"""
+Incremental parser for streamed article generation.
+
+Article prompts ask the model for:
+
+    TITLE: ...
+    META: ...
+    SLUG: ...
+    <p>...article HTML...</p>
+    ---MEDIA PROMPTS---        (optional)
+    ---STRUCTURED DATA---
+    ```json
+    { ...4-act sections, callouts, FAQ... }
+    ```
+
+ArticleStreamParser consumes the response chunk by chunk and picks these
+parts out as they arrive: metadata lines while in the header, the start
+of the trailing blocks while in the body, and the STRUCTURED DATA object
+via a string-aware brace scanner. Chunks are kept in a list (joined once,
+when the full text is read) and each feed only looks at the tail of the
+stream it hasn't scanned yet; nothing is re-parsed when the stream ends.
+
+Usage:
+    parser = ArticleStreamParser()
+    async for delta in stream:
+        parser.feed(delta)
+        activity.heartbeat(parser.progress())
+    parser.finish()
+    parser.title, parser.body, parser.structured_json
+"""
+
+import bisect
+import re
+from typing import Any, Dict, List, Optional
+
+from src.utils.html_pipeline import TRAILING_SECTION
+
+
+# Metadata lines are only looked for in the first lines of the response
+METADATA_LINES = 10
+
+_STRUCTURED_HEADER = re.compile(r'---\s*STRUCTURED\s*DATA\s*---', re.IGNORECASE)
+
+# Longest marker text a chunk boundary can split (markers allow inner whitespace)
+_MARKER_LOOKBEHIND = 64
+
+
+class JsonObjectScanner:
+    """
+    Finds the end of a JSON object, fed incrementally.
+
+    Tracks brace depth outside of strings (so braces inside string values
+    don't count) and handles escapes.
+    """
+
+    def __init__(self):
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def scan(self, text: str, pos: int, offset: int = 0) -> int:
+        """
+        Scan text from pos; returns the position to resume from.
+
+        text may be the stream from position offset on; pos, start, end and
+        the returned position are positions in the whole stream.
+        """
+        text_end = offset + len(text)
+        if self.end is not None:
+            return text_end
+
+        if self.start is None:
+            brace = text.find('{', pos - offset)
+            if brace == -1:
+                return text_end
+            self.start = pos = offset + brace
+
+        for i in range(pos - offset, len(text)):
+            char = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == '{':
+                self._depth += 1
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = offset + i + 1
+                    return text_end
+        return text_end
+
+
+def find_json_object(text: str, pos: int = 0) -> Optional[str]:
+    """First complete JSON object in text at or after pos, if any."""
+    scanner = JsonObjectScanner()
+    scanner.scan(text, pos)
+    if scanner.end is None:
+        return None
+    return text[scanner.start:scanner.end]
+
+
+class ArticleStreamParser:
+    """Incrementally splits a streamed article into metadata, body and trailing blocks."""
+
+    def __init__(self):
+        self.title: Optional[str] = None
+        self.meta_description: Optional[str] = None
+        self.slug: Optional[str] = None
+        self.first_line: Optional[str] = None
+        self.phase = "header"  # header -> body -> trailing
+
+        self._chunks: List[str] = []
+        self._chunk_starts: List[int] = []
+        self._length = 0
+        self._joined = ""
+        self._sections = 0
+        self._sections_pos: Optional[int] = None
+        self._line_start = 0
+        self._header_lines = 0
+        self._body_start = 0
+        self._scan_pos = 0
+        self._trailing_start: Optional[int] = None
+        self._json_pos: Optional[int] = None
+        self._json_header = False
+        self._json = JsonObjectScanner()
+
+    @property
+    def text(self) -> str:
+        if len(self._joined) != self._length:
+            self._joined = "".join(self._chunks)
+        return self._joined
+
+    def _tail(self, start: int) -> str:
+        """The stream from position start on, joining only the chunks it spans."""
+        if len(self._joined) == self._length:
+            return self._joined[start:]
+        first = max(bisect.bisect_right(self._chunk_starts, start) - 1, 0)
+        return "".join(self._chunks[first:])[start - self._chunk_starts[first]:]
+
+    def feed(self, delta: str) -> None:
+        if not delta:
+            return
+        self._chunk_starts.append(self._length)
+        self._chunks.append(delta)
+        self._length += len(delta)
+
+        if self.phase == "header":
+            self._parse_header_lines()
+        if self.phase == "body":
+            self._find_trailing()
+        if self.phase == "trailing":
+            self._scan_structured_data()
+        self._count_sections()
+
+    def finish(self) -> None:
+        """Handle a final line without a newline."""
+        if self.phase == "header":
+            self._parse_header_lines(final=True)
+            self.phase = "body"
+        if self.phase == "body":
+            self._find_trailing()
+        if self.phase == "trailing":
+            self._scan_structured_data()
+        self._count_sections()
+
+    def _parse_header_lines(self, final: bool = False) -> None:
+        base = self._line_start
+        text = self._tail(base)
+        while self.phase == "header":
+            newline = text.find('\n', self._line_start - base)
+            if newline == -1:
+                if not final or self._line_start >= self._length:
+                    return
+                newline = len(text)
+
+            line = text[self._line_start - base:newline].strip()
+            next_start = base + newline + 1
+
+            if not line and self.first_line is None:
+                # Leading blank lines don't count as header lines
+                self._body_start = self._line_start = next_start
+                continue
+            if self.first_line is None:
+                self.first_line = line
+
+            if line.startswith('TITLE:'):
+                self.title = line[6:].strip()
+                self._body_start = next_start
+            elif line.startswith('META:'):
+                self.meta_description = line[5:].strip()
+                self._body_start = next_start
+            elif line.startswith('SLUG:'):
+                self.slug = line[5:].strip().lower().replace(' ', '-')
+                self._body_start = next_start
+            elif line.startswith('<'):
+                # HTML content started
+                self.phase = "body"
+
+            self._line_start = next_start
+            self._header_lines += 1
+            if self._header_lines >= METADATA_LINES:
+                self.phase = "body"
+
+        self._scan_pos = self._body_start
+
+    def _find_trailing(self) -> None:
+        match = TRAILING_SECTION.search(self._tail(self._scan_pos))
+        if match:
+            self._trailing_start = self._json_pos = self._scan_pos + match.start()
+            self.phase = "trailing"
+        else:
+            self._scan_pos = max(self._body_start, self._length - _MARKER_LOOKBEHIND)
+
+    def _scan_structured_data(self) -> None:
+        if not self._json_header:
+            header = _STRUCTURED_HEADER.search(self._tail(self._json_pos))
+            if not header:
+                self._json_pos = max(self._trailing_start, self._length - _MARKER_LOOKBEHIND)
+                return
+            self._json_header = True
+            self._json_pos += header.end()
+        self._json_pos = self._json.scan(self._tail(self._json_pos), self._json_pos, offset=self._json_pos)
+
+    def _count_sections(self) -> None:
+        """Count <h2 headings in the body as they stream in (for progress)."""
+        if self.phase == "header":
+            return
+        start = self._body_start if self._sections_pos is None else self._sections_pos
+        self._sections += self._tail(start).count('<h2')
+        # A heading can't be counted twice: the two chars kept can't hold all of '<h2'
+        self._sections_pos = max(start, self._length - 2)
+
+    @property
+    def raw_content(self) -> str:
+        """Everything after the metadata lines."""
+        return self.text[self._body_start:].strip()
+
+    @property
+    def body(self) -> str:
+        """Article content before any trailing metadata block."""
+        end = self._trailing_start if self._trailing_start is not None else self._length
+        return self.text[self._body_start:end].strip()
+
+    @property
+    def trailing(self) -> str:
+        """MEDIA PROMPTS / STRUCTURED DATA blocks (empty if none)."""
+        return self.text[self._trailing_start:] if self._trailing_start is not None else ""
+
+    @property
+    def structured_json(self) -> Optional[str]:
+        """The complete STRUCTURED DATA JSON object, once it has streamed in."""
+        if self._json.end is None:
+            return None
+        return self.text[self._json.start:self._json.end]
+
+    def progress(self) -> Dict[str, Any]:
+        """Heartbeat details."""
+        return {
+            "phase": self.phase,
+            "chars": self._length,
+            "sections": self._sections,
+            "title": (self.title or "")[:80],
+            "structured_data": self._json.end is not None,
+        }
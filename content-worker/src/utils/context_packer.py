@@ -0,0 +1,291 @@
+"""
+Research Context Packer
+
+Fits research sources into a token budget before they go into an LLM prompt.
+Curation can otherwise send 75 crawled pages x 15k chars plus news and Exa
+results (over a million characters), and generation re-sends the same blobs.
+
+Per call:
+1. Split every source into paragraphs and estimate tokens (chars / 4, same
+   estimate as the rest of the worker)
+2. Drop boilerplate: cookie/newsletter/nav lines, link-only lines, and
+   short paragraphs repeated verbatim across 3+ sources (site templates)
+3. Rank paragraphs by topic relevance (BM25-style term scoring, small bonus
+   for facts - numbers, costs, dates - and for leading paragraphs)
+4. Fill the budget greedily: each source's best paragraph first, then the
+   rest by score, skipping near-duplicates of anything already kept
+   (Jaccard over hashed 5-word shingles)
+
+Kept paragraphs are returned in their original order within each source.
+
+Usage:
+    packed, stats = pack_sources(sources, topic, budget_for("quality"))
+    activity.logger.info(f"Context packed: {format_packing_stats(stats)}")
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Sequence, Tuple
+
+from src.utils.ai_gateway import resolve_model
+
+
+CHARS_PER_TOKEN = 4
+
+# Token budget for research content per model (leaves room for instructions
+# and output). Keys are model-name prefixes; the longest match wins.
+MODEL_CONTEXT_BUDGETS = {
+    "gpt-4o-mini": 40_000,
+    "gpt-4o": 60_000,
+    "claude": 80_000,
+    "gemini-2.5-flash": 100_000,
+    "gemini-2.5-pro": 100_000,
+}
+DEFAULT_CONTEXT_BUDGET = 40_000
+
+SHINGLE_WORDS = 5
+DUPLICATE_JACCARD = 0.7
+# Short paragraph repeated verbatim in this many sources = site template
+# (longer repeats, e.g. syndicated stories, keep one copy via near-dup check)
+TEMPLATE_MIN_SOURCES = 3
+TEMPLATE_MAX_CHARS = 300
+
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
+_WORD = re.compile(r'[a-z0-9]+')
+_TOPIC_WORD = re.compile(r'\b[a-z]{4,}\b')
+_FACT = re.compile(r'\d|[$£€¥%]')
+_MARKDOWN_LINK = re.compile(r'!?\[[^\]]*\]\([^)]*\)|https?://\S+')
+# Calls to action and site chrome, anchored to their usual phrasing so facts
+# like "sign up with the tax office" or "log in to ELSTER" are kept
+_BOILERPLATE = re.compile(
+    r'\b(?:we|this (?:site|website)) uses? cookies|\baccept (?:all )?cookies|\bcookie (?:policy|settings|preferences)|'
+    r'\b(?:sign up|subscribe|register|join)\b[^.!?\n]{0,30}\b(?:newsletter|mailing list|email updates|alerts)\b|'
+    r'\bsubscribe (?:to (?:our|my)|now|today|here)\b|\bsign up (?:now|today|here|free|for free|for (?:our|a free))\b|'
+    r'\b(?:log ?in|sign in) (?:to (?:continue|read|comment)|or (?:sign up|register))|\balready have an account|'
+    r'all rights reserved|privacy policy|terms (of|and) (use|service|conditions)|skip to (main )?content|share (this|on)|'
+    r'follow us|enable javascript|advertisement',
+    re.IGNORECASE
+)
+_STOPWORDS = {
+    "guide", "with", "from", "your", "that", "this", "what", "when", "where", "will",
+    "have", "into", "about", "their", "best", "complete", "2024", "2025", "2026",
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (4 chars per token)."""
+    return len(text or "") // CHARS_PER_TOKEN
+
+
+def budget_for(model: str) -> int:
+    """Research-content token budget for a model name or gateway alias."""
+    resolved = resolve_model(model or "")
+    matches = [prefix for prefix in MODEL_CONTEXT_BUDGETS if resolved.startswith(prefix)]
+    if not matches:
+        return DEFAULT_CONTEXT_BUDGET
+    return MODEL_CONTEXT_BUDGETS[max(matches, key=len)]
+
+
+def _is_boilerplate(paragraph: str) -> bool:
+    words = paragraph.split()
+    if len(words) < 3 and not paragraph.lstrip().startswith("#"):
+        return True
+    # Nav menus and link lists: mostly markdown links / bare URLs
+    link_chars = sum(len(m) for m in _MARKDOWN_LINK.findall(paragraph))
+    if link_chars > 0.6 * len(paragraph):
+        return True
+    return len(paragraph) < 300 and bool(_BOILERPLATE.search(paragraph))
+
+
+def _shingles(words: List[str]) -> set:
+    if len(words) < SHINGLE_WORDS:
+        return {hash(tuple(words))}
+    return {hash(tuple(words[i:i + SHINGLE_WORDS])) for i in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def _topic_terms(topic: str) -> set:
+    return set(_TOPIC_WORD.findall(topic.lower())) - _STOPWORDS
+
+
+def pack_sources(
+    sources: Sequence[Dict[str, Any]],
+    topic: str,
+    budget_tokens: int,
+    text_key: str = "content",
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Pack source texts into a token budget.
+
+    Args:
+        sources: Source dicts (not modified)
+        topic: Topic used to rank paragraphs
+        budget_tokens: Total tokens allowed for all source texts together
+        text_key: Key holding each source's text
+
+    Returns:
+        (packed copies of sources with text_key replaced, stats dict with
+        tokens_before, tokens_after, tokens_saved, boilerplate_dropped,
+        duplicates_dropped, over_budget_dropped)
+    """
+    terms = _topic_terms(topic)
+
+    # paragraph records: [source_index, position, text, words, tokens]
+    paragraphs = []
+    tokens_before = 0
+    for source_index, source in enumerate(sources):
+        text = source.get(text_key) or ""
+        tokens_before += estimate_tokens(text)
+        for position, para in enumerate(p.strip() for p in _PARAGRAPH_SPLIT.split(text)):
+            if para:
+                paragraphs.append((source_index, position, para, _WORD.findall(para.lower()), estimate_tokens(para)))
+
+    stats = {
+        "tokens_before": tokens_before,
+        "tokens_after": 0,
+        "tokens_saved": 0,
+        "boilerplate_dropped": 0,
+        "duplicates_dropped": 0,
+        "over_budget_dropped": 0,
+        "budget_tokens": budget_tokens,
+    }
+
+    # Boilerplate: pattern-based, plus verbatim repeats across many sources
+    sources_per_text = Counter()
+    for text in {(p[0], " ".join(p[3])) for p in paragraphs}:
+        sources_per_text[text[1]] += 1
+    candidates = []
+    for para in paragraphs:
+        is_template = len(para[2]) < TEMPLATE_MAX_CHARS and sources_per_text[" ".join(para[3])] >= TEMPLATE_MIN_SOURCES
+        if is_template or _is_boilerplate(para[2]):
+            stats["boilerplate_dropped"] += 1
+        else:
+            candidates.append(para)
+
+    # Relevance: BM25-style term score + fact density + lead-paragraph prior
+    doc_freq = Counter()
+    for para in candidates:
+        doc_freq.update(terms.intersection(para[3]))
+    total = max(len(candidates), 1)
+    avg_len = sum(len(p[3]) for p in candidates) / total if candidates else 1.0
+
+    def score(para) -> float:
+        words = para[3]
+        counts = Counter(w for w in words if w in terms)
+        length_norm = 0.25 + 0.75 * len(words) / max(avg_len, 1.0)
+        relevance = sum(
+            math.log(1 + (total - doc_freq[t] + 0.5) / (doc_freq[t] + 0.5)) * (tf * 2.2) / (tf + 1.2 * length_norm)
+            for t, tf in counts.items()
+        )
+        facts = min(len(_FACT.findall(para[2])) / 10, 1.0)
+        return relevance + facts + 0.5 / (1 + para[1])
+
+    ranked = sorted(candidates, key=score, reverse=True)
+
+    # Each source's best paragraph first so every source stays represented
+    first_round, seen_sources = [], set()
+    for para in ranked:
+        if para[0] not in seen_sources:
+            seen_sources.add(para[0])
+            first_round.append(para)
+    first_ids = {id(p) for p in first_round}
+    order = first_round + [p for p in ranked if id(p) not in first_ids]
+
+    kept: Dict[int, List[Tuple[int, str]]] = {}
+    kept_shingles: List[set] = []
+    shingle_index: Dict[int, List[int]] = {}
+    used = 0
+
+    for para in order:
+        source_index, position, text, words, tokens = para
+        if used + tokens > budget_tokens:
+            stats["over_budget_dropped"] += 1
+            continue
+
+        shingles = _shingles(words)
+        overlaps = Counter()
+        for shingle in shingles:
+            for kept_index in shingle_index.get(shingle, ()):
+                overlaps[kept_index] += 1
+        if any(
+            shared / (len(shingles) + len(kept_shingles[k]) - shared) >= DUPLICATE_JACCARD
+            for k, shared in overlaps.items()
+        ):
+            stats["duplicates_dropped"] += 1
+            continue
+
+        for shingle in shingles:
+            shingle_index.setdefault(shingle, []).append(len(kept_shingles))
+        kept_shingles.append(shingles)
+        kept.setdefault(source_index, []).append((position, text))
+        used += tokens
+
+    packed = []
+    tokens_after = 0
+    for source_index, source in enumerate(sources):
+        text = "\n\n".join(t for _, t in sorted(kept.get(source_index, [])))
+        tokens_after += estimate_tokens(text)
+        packed.append({**source, text_key: text})
+
+    stats["tokens_after"] = tokens_after
+    stats["tokens_saved"] = max(tokens_before - tokens_after, 0)
+    return packed, stats
+
+
+def format_packing_stats(stats: Dict[str, int]) -> str:
+    """One-line summary of pack_sources stats for logs."""
+    return (
+        f"{stats['tokens_before']} -> {stats['tokens_after']} tokens (saved {stats['tokens_saved']}; "
+        f"dropped {stats['boilerplate_dropped']} boilerplate, {stats['duplicates_dropped']} duplicate, "
+        f"{stats['over_budget_dropped']} over-budget paragraphs)"
+    )
+
+
+# (list key, text key) pairs in research_context that carry page text
+RESEARCH_TEXT_FIELDS = [
+    ("curated_sources", "full_content"),
+    ("crawled_sources", "content"),
+    ("crawled_pages", "content"),
+    ("summaries", "content"),
+    ("exa_results", "content"),
+]
+
+
+def pack_research_context(
+    research_context: Dict[str, Any],
+    topic: str,
+    budget_tokens: int,
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Pack the page texts inside a research_context so that its JSON dump fits
+    budget_tokens.
+
+    Everything except the RESEARCH_TEXT_FIELDS texts is kept as-is; their
+    size is taken off the budget first.
+
+    Returns:
+        (packed copy of research_context, pack_sources stats)
+    """
+    sources, owners = [], []
+    skeleton = dict(research_context)
+    for list_key, text_key in RESEARCH_TEXT_FIELDS:
+        items = research_context.get(list_key)
+        if not isinstance(items, list):
+            continue
+        skeleton[list_key] = []
+        for index, item in enumerate(items):
+            if isinstance(item, dict) and isinstance(item.get(text_key), str):
+                sources.append({"content": item[text_key]})
+                owners.append((list_key, index, text_key))
+                item = {**item, text_key: ""}
+            skeleton[list_key].append(item)
+
+    overhead = estimate_tokens(json.dumps(skeleton, indent=2, default=str))
+    # JSON escaping (\n, quotes) makes texts ~5% longer than raw
+    text_budget = int(max(budget_tokens - overhead, 0) / 1.05)
+
+    packed, stats = pack_sources(sources, topic, text_budget)
+    for (list_key, index, text_key), source in zip(owners, packed):
+        skeleton[list_key][index][text_key] = source["content"]
+    return skeleton, stats
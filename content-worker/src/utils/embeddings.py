@@ -0,0 +1,147 @@
+"""
+Text Embeddings
+
+Batched text embeddings for relevance scoring, with a local fallback.
+
+- embed_texts(): one API call for the whole batch (OpenAI
+  text-embedding-3-small, or Gemini text-embedding-004 when only a Google
+  key is configured). Returns None when no provider is available or the
+  call fails (logged as a warning), so callers can fall back.
+- hashed_tfidf(): local TF-IDF over word unigrams + character 4-grams,
+  hashed into a fixed number of dimensions. No network, no vocabulary, and
+  the character grams catch variants like "relocating"/"relocation".
+- hashed_features(): the same features without idf, for vectors that must
+  stay comparable across batches.
+
+All vectors are L2-normalized, so cosine similarity is a dot product.
+
+Usage:
+    vectors = await embed_texts([topic] + texts)
+    if vectors is None:
+        vectors = hashed_tfidf([topic] + texts)
+    scores = vectors[1:] @ vectors[0]
+"""
+
+import asyncio
+import logging
+import re
+import zlib
+from typing import List, Optional
+
+import numpy as np
+
+from src.utils.config import config
+
+
+OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+GOOGLE_EMBEDDING_MODEL = "models/text-embedding-004"
+EMBEDDING_TIMEOUT = 20.0
+
+HASH_DIMENSIONS = 1 << 13
+CHAR_NGRAM = 4
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def embedding_provider() -> Optional[str]:
+    """The provider embed_texts uses: "openai", "google" or None."""
+    return "openai" if config.OPENAI_API_KEY else "google" if config.GOOGLE_API_KEY else None
+
+
+async def embed_texts(texts: List[str]) -> Optional[np.ndarray]:
+    """
+    Embed texts in one batched API call.
+
+    Returns:
+        (len(texts), dim) float32 array of unit vectors, or None if no
+        embedding provider is configured or the call failed
+    """
+    if not texts:
+        return None
+
+    provider = embedding_provider()
+    if provider is None:
+        return None
+
+    try:
+        if provider == "openai":
+            import openai
+
+            client = openai.AsyncClient(api_key=config.OPENAI_API_KEY, timeout=EMBEDDING_TIMEOUT)
+            response = await client.embeddings.create(model=OPENAI_EMBEDDING_MODEL, input=texts)
+            vectors = [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+        else:
+            import google.generativeai as genai
+
+            genai.configure(api_key=config.GOOGLE_API_KEY)
+            response = await asyncio.wait_for(
+                asyncio.to_thread(
+                    genai.embed_content,
+                    model=GOOGLE_EMBEDDING_MODEL,
+                    content=texts,
+                    task_type="semantic_similarity",
+                ),
+                timeout=EMBEDDING_TIMEOUT
+            )
+            vectors = response["embedding"]
+
+    except Exception as e:
+        logger.warning(f"Embedding {len(texts)} texts with {provider} failed, falling back: {type(e).__name__}: {e}")
+        return None
+
+    return _normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+
+def _features(text: str) -> List[str]:
+    words = _WORD.findall(text.lower())
+    features = list(words)
+    for word in words:
+        padded = f" {word} "
+        features.extend(padded[i:i + CHAR_NGRAM] for i in range(len(padded) - CHAR_NGRAM + 1))
+    return features
+
+
+def _hashed_counts(texts: List[str], dimensions: int) -> np.ndarray:
+    counts = np.zeros((len(texts), dimensions), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for feature in _features(text):
+            counts[row, zlib.crc32(feature.encode()) % dimensions] += 1
+    return counts
+
+
+def hashed_features(texts: List[str], dimensions: int = HASH_DIMENSIONS) -> np.ndarray:
+    """
+    Local sublinear-tf vectors without idf.
+
+    Unlike hashed_tfidf the vector of a text doesn't depend on the rest of
+    the batch, so vectors computed at different times are comparable (for
+    indexes that grow incrementally).
+
+    Returns:
+        (len(texts), dimensions) float32 array of unit vectors
+    """
+    return _normalize_rows(np.log1p(_hashed_counts(texts, dimensions)))
+
+
+def hashed_tfidf(texts: List[str], dimensions: int = HASH_DIMENSIONS) -> np.ndarray:
+    """
+    Local TF-IDF vectors (sublinear tf, smoothed idf over this batch).
+
+    Returns:
+        (len(texts), dimensions) float32 array of unit vectors
+    """
+    counts = _hashed_counts(texts, dimensions)
+
+    doc_freq = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(texts)) / (1 + doc_freq)) + 1
+    tf = np.log1p(counts)
+    return _normalize_rows(tf * idf)
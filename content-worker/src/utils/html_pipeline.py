@@ -0,0 +1,247 @@
+"""
+Single-pass HTML post-processing for generated articles.
+
+Generated HTML used to be rewritten by a chain of separate regex passes
+(cleanup, broken-link removal, H2 image injection), each re-scanning and
+copying the whole document. HtmlPipeline parses the document once with lxml,
+walks the tree once calling every registered visitor, lets visitors apply
+their edits in finish(), and serializes once.
+
+Usage:
+    html = HtmlPipeline([
+        TextCleanupVisitor(),
+        UnlinkVisitor(broken_urls),
+        SectionImageVisitor(playback_id, image_width=1200),
+    ]).run(html)
+
+Trailing LLM metadata blocks (---MEDIA PROMPTS---, ---STRUCTURED DATA---)
+are plain text, not HTML; split_trailing_sections() cuts them off in one scan
+before parsing.
+"""
+
+import copy
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree, html as lxml_html
+
+from src.utils.inject_section_images import (
+    get_mux_thumbnail_url,
+    get_video_time_points,
+    match_sections_to_acts_with_ai,
+)
+
+
+# Start of the first trailing metadata block in a generated article
+TRAILING_SECTION = re.compile(r'---\s*(?:MEDIA|IMAGE|STRUCTURED)\s*(?:PROMPTS|DATA)\s*---', re.IGNORECASE)
+
+# Elements that mark a section as already having video
+_VIDEO_TAGS = {'video', 'iframe'}
+_VIDEO_SRC = re.compile(r'player\.vimeo\.com|youtube\.com/embed|youtu\.be/', re.IGNORECASE)
+
+# Parsed once; copied for every injected section image
+_FIGURE_TEMPLATE = lxml_html.fragment_fromstring(
+    '<figure class="section-image my-6">'
+    '<img src="" alt="Section visual" '
+    'class="w-full aspect-[21/9] object-cover rounded-xl shadow-md" loading="lazy">'
+    '</figure>'
+)
+
+
+def split_trailing_sections(text: str) -> Tuple[str, str]:
+    """
+    Split generated article text into (body, trailing metadata).
+
+    The trailing part starts at the first ---MEDIA PROMPTS---, ---IMAGE PROMPTS---
+    or ---STRUCTURED DATA--- marker and is empty if there is none.
+    """
+    match = TRAILING_SECTION.search(text)
+    if not match:
+        return text, ''
+    return text[:match.start()].rstrip(), text[match.start():]
+
+
+class HtmlVisitor:
+    """
+    A transform that runs inside HtmlPipeline.
+
+    visit() is called for every element in document order and should only
+    record what to change; finish() applies the changes after the walk.
+    """
+
+    def visit(self, el: etree._Element) -> None:
+        pass
+
+    def finish(self, root: etree._Element) -> None:
+        pass
+
+
+class HtmlPipeline:
+    """Parse once, walk once, serialize once."""
+
+    def __init__(self, visitors: Iterable[HtmlVisitor]):
+        self.visitors = list(visitors)
+
+    def run(self, html: str) -> str:
+        if not html or not html.strip():
+            return html
+
+        root = lxml_html.fragment_fromstring(html, create_parent='div')
+
+        for el in root.iter():
+            if not isinstance(el.tag, str):
+                # Comments and processing instructions
+                continue
+            for visitor in self.visitors:
+                visitor.visit(el)
+
+        for visitor in self.visitors:
+            visitor.finish(root)
+
+        # Serialize the wrapper once and strip its tags
+        out = lxml_html.tostring(root, encoding='unicode')
+        return out[len('<div>'):-len('</div>')].strip()
+
+
+def _replace_with_children(el: etree._Element) -> None:
+    """Remove an element but keep its text, children and tail in place."""
+    parent = el.getparent()
+    index = parent.index(el)
+    text = el.text or ''
+    tail = el.tail or ''
+    children = list(el)
+
+    if index == 0:
+        parent.text = (parent.text or '') + text
+    else:
+        prev = parent[index - 1]
+        prev.tail = (prev.tail or '') + text
+
+    for offset, child in enumerate(children):
+        parent.insert(index + offset, child)
+
+    if children:
+        last = children[-1]
+        last.tail = (last.tail or '') + tail
+    elif index == 0:
+        parent.text = (parent.text or '') + tail
+    else:
+        prev = parent[index - 1]
+        prev.tail = (prev.tail or '') + tail
+
+    parent.remove(el)
+
+
+class TextCleanupVisitor(HtmlVisitor):
+    """
+    Strip LLM formatting artifacts from text nodes (code fences, '---' rules,
+    "Copy like this"), put a blank line before every H2 and cap blank lines at two.
+    """
+
+    _ARTIFACTS = re.compile(
+        r'```\w*\n?'
+        r'|"Copy like this\.?"'
+        r'|^---[ \t]*$',
+        re.IGNORECASE | re.MULTILINE
+    )
+    _EXTRA_NEWLINES = re.compile(r'\n{4,}')
+
+    def _clean(self, text: str) -> str:
+        # Most text nodes have nothing to clean; skip the regexes for them
+        if '`' in text or '"' in text or '---' in text:
+            text = self._ARTIFACTS.sub('', text)
+        if '\n\n\n\n' in text:
+            text = self._EXTRA_NEWLINES.sub('\n\n\n', text)
+        return text
+
+    def visit(self, el: etree._Element) -> None:
+        if el.text:
+            el.text = self._clean(el.text)
+        if el.tail:
+            el.tail = self._clean(el.tail)
+
+        if el.tag == 'h2':
+            # Blank line before H2 headers for mobile readability
+            prev = el.getprevious()
+            if prev is not None:
+                prev.tail = (prev.tail or '').rstrip(' \t\n') + '\n\n'
+            elif el.getparent() is not None:
+                parent = el.getparent()
+                parent.text = (parent.text or '').rstrip(' \t\n') + '\n\n'
+
+
+class UnlinkVisitor(HtmlVisitor):
+    """Unwrap <a> tags pointing at the given URLs, keeping their text."""
+
+    def __init__(self, urls: Iterable[str]):
+        self.urls = set(urls)
+        self.removed: List[str] = []
+        self._links: List[etree._Element] = []
+
+    def visit(self, el: etree._Element) -> None:
+        if el.tag == 'a' and el.get('href') in self.urls:
+            self._links.append(el)
+
+    def finish(self, root: etree._Element) -> None:
+        for el in self._links:
+            self.removed.append(el.get('href'))
+            _replace_with_children(el)
+
+
+class SectionImageVisitor(HtmlVisitor):
+    """
+    Insert a Mux thumbnail figure after each H2, skipping sections that already
+    contain video. Same output as utils.inject_section_images, in the shared walk.
+    """
+
+    def __init__(
+        self,
+        video_playback_id: Optional[str],
+        image_width: int = 800,
+        max_sections: Optional[int] = None,
+        four_act_content: Optional[List[Dict]] = None,
+    ):
+        self.video_playback_id = video_playback_id
+        self.image_width = image_width
+        self.max_sections = max_sections
+        self.four_act_content = four_act_content
+        self.injected = 0
+        self._h2s: List[etree._Element] = []
+        self._has_video: List[bool] = []
+
+    def visit(self, el: etree._Element) -> None:
+        if not self.video_playback_id:
+            return
+        if el.tag == 'h2':
+            self._h2s.append(el)
+            self._has_video.append(False)
+        elif self._h2s and self._section_video(el):
+            self._has_video[-1] = True
+
+    @staticmethod
+    def _section_video(el: etree._Element) -> bool:
+        if el.tag in _VIDEO_TAGS or el.get('data-playback-id') is not None:
+            return True
+        return bool(el.tag == 'a' and _VIDEO_SRC.search(el.get('href', '')))
+
+    def finish(self, root: etree._Element) -> None:
+        if not self._h2s:
+            return
+
+        num_images = len(self._h2s) if self.max_sections is None else min(len(self._h2s), self.max_sections)
+
+        if self.four_act_content and len(self.four_act_content) >= 4:
+            titles = [h2.text_content().strip() for h2 in self._h2s[:num_images]]
+            time_points = match_sections_to_acts_with_ai(titles, self.four_act_content)
+        else:
+            time_points = get_video_time_points(num_images, video_duration=12.0)
+
+        for index, h2 in enumerate(self._h2s):
+            if index >= len(time_points) or self._has_video[index]:
+                continue
+            figure = copy.deepcopy(_FIGURE_TEMPLATE)
+            figure[0].set('src', get_mux_thumbnail_url(self.video_playback_id, time_points[index], self.image_width))
+            figure.tail = h2.tail
+            h2.tail = '\n'
+            h2.addnext(figure)
+            self.injected += 1
@@ -0,0 +1,333 @@
+"""
+Page Fetch and Extraction
+
+Shared fetch-and-extract path for the httpx crawlers.
+
+- fetch_html(): streams the response body and stops at MAX_PAGE_BYTES, so a
+  multi-megabyte page (or a PDF/video served from an article URL) is never
+  fully downloaded. Non-HTML content types are rejected from the headers.
+- extract_page(): lxml parse, boilerplate removal (script/style/nav/footer/
+  header/aside...), readability-style main content selection, text
+  capped at max_chars while it is being joined.
+- fetch_page(): both of the above, with extraction run in a process pool
+  (run_parser) so parsing doesn't block the event loop that also serves
+  Temporal heartbeats.
+
+Main content: elements whose class/id look like comments, sidebars, share
+bars etc. are dropped; then <p>/<pre>/<td> blocks score their parent (and half to the
+grandparent) by length and comma count; class/id names like "article" or
+"content" add weight, "sidebar"/"comment"/"share" subtract; the score is
+scaled down by link density. The best candidate plus strong siblings is
+used when it holds at least MIN_MAIN_CHARS, otherwise the whole cleaned
+body (company pages built from lists and cards, not paragraphs).
+
+Usage:
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        page = await fetch_page(client, url, max_chars=10000)
+        if page["success"]:
+            page["title"], page["content"]
+"""
+
+import asyncio
+import functools
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from urllib.parse import urljoin
+
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+
+
+USER_AGENT = "Mozilla/5.0 (compatible; QuestBot/1.0)"
+
+# Stop reading a response body after this many bytes
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Removed before any text is extracted
+BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "template", "svg", "iframe",
+    "nav", "footer", "header", "aside",
+)
+
+# Main content must hold at least this much text, else the whole body is used
+MIN_MAIN_CHARS = 400
+
+# Processes used for HTML extraction
+PARSE_WORKERS = max(1, min(4, (os.cpu_count() or 1)))
+
+_POSITIVE = re.compile(r'article|body|content|entry|main|post|story|text', re.IGNORECASE)
+_NEGATIVE = re.compile(
+    r'comment|sidebar|footer|menu|nav|share|social|related|promo|advert|cookie|banner|newsletter|subscribe',
+    re.IGNORECASE
+)
+_SCORED_TAGS = ("p", "pre", "td")
+
+_parser = lxml_html.HTMLParser(remove_comments=True, remove_pis=True)
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+# ===== FETCH =====
+
+async def fetch_html(
+    client: httpx.AsyncClient,
+    url: str,
+    max_bytes: int = MAX_PAGE_BYTES,
+) -> Dict[str, Any]:
+    """
+    GET url, reading at most max_bytes of an HTML body.
+
+    Returns:
+        Dict with status, url (after redirects), html (bytes or None),
+        encoding, truncated, error
+    """
+    result = {"status": 0, "url": url, "html": None, "encoding": None, "truncated": False, "error": None}
+
+    async with client.stream("GET", url, headers={"User-Agent": USER_AGENT}) as response:
+        result["status"] = response.status_code
+        result["url"] = str(response.url)
+        if response.status_code != 200:
+            result["error"] = f"HTTP {response.status_code}"
+            return result
+
+        content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type and content_type not in HTML_CONTENT_TYPES:
+            result["error"] = f"Not HTML: {content_type}"
+            return result
+
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                result["truncated"] = True
+                break
+
+        result["html"] = b"".join(chunks)[:max_bytes]
+        result["encoding"] = response.charset_encoding
+
+    return result
+
+
+# ===== EXTRACT (runs in worker processes) =====
+
+def parse_html(html: bytes, encoding: Optional[str] = None):
+    """lxml document for html bytes, or None if it can't be parsed."""
+    if not html or not html.strip():
+        return None
+    parser = _parser
+    if encoding:
+        parser = lxml_html.HTMLParser(remove_comments=True, remove_pis=True, encoding=encoding)
+    try:
+        return lxml_html.document_fromstring(html, parser=parser)
+    except (etree.ParserError, ValueError, LookupError):
+        return None
+
+
+def _text(node, max_chars: int = 0) -> str:
+    """Whitespace-normalized text of node, stopping once max_chars is reached."""
+    parts = []
+    length = 0
+    for piece in node.itertext():
+        piece = piece.strip()
+        if not piece:
+            continue
+        parts.append(piece)
+        length += len(piece) + 1
+        if max_chars and length >= max_chars:
+            break
+    text = " ".join(" ".join(parts).split())
+    return text[:max_chars] if max_chars else text
+
+
+def _class_weight(node) -> int:
+    names = f"{node.get('class', '')} {node.get('id', '')}"
+    weight = 0
+    if _POSITIVE.search(names):
+        weight += 25
+    if _NEGATIVE.search(names):
+        weight -= 25
+    return weight
+
+
+def _link_density(node, text_length: int) -> float:
+    if not text_length:
+        return 1.0
+    link_chars = sum(len(_text(a)) for a in node.iter("a"))
+    return min(1.0, link_chars / text_length)
+
+
+def main_content(body) -> Optional[List[Any]]:
+    """
+    Best main-content container under body (readability-style), or None.
+
+    Returns a list of nodes: the top candidate plus siblings scoring at
+    least a fifth of it, in document order.
+    """
+    scores: Dict[Any, float] = {}
+    for block in body.iter(*_SCORED_TAGS):
+        text = _text(block)
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = block.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, 0) + score
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0) + score / 2
+
+    if not scores:
+        return None
+
+    final = {}
+    for node, score in scores.items():
+        length = len(_text(node))
+        final[node] = (score + _class_weight(node)) * (1 - _link_density(node, length))
+
+    best = max(final, key=final.get)
+    if final[best] <= 0:
+        return None
+
+    parent = best.getparent()
+    if parent is None:
+        return [best]
+    threshold = max(10.0, final[best] * 0.2)
+    return [node for node in parent if node is best or final.get(node, 0) >= threshold]
+
+
+def extract_page(
+    html: bytes,
+    url: str,
+    max_chars: int = 10000,
+    encoding: Optional[str] = None,
+    strip_tags: Sequence[str] = BOILERPLATE_TAGS,
+    with_links: bool = False,
+) -> Dict[str, Any]:
+    """
+    Title, main text and (optionally) absolute links from an HTML page.
+
+    Returns:
+        Dict with title, content (at most max_chars), links, main_content (bool)
+    """
+    result = {"title": "", "content": "", "links": [], "main_content": False}
+    doc = parse_html(html, encoding)
+    if doc is None:
+        return result
+
+    title = doc.findtext(".//title")
+    result["title"] = " ".join(title.split()) if title else ""
+
+    etree.strip_elements(doc, *strip_tags, with_tail=False)
+
+    if with_links:
+        links = []
+        for a in doc.iter("a"):
+            href = a.get("href", "")
+            if href.startswith("http"):
+                links.append(href)
+            elif href.startswith("/"):
+                links.append(urljoin(url, href))
+            if len(links) >= 100:
+                break
+        result["links"] = links
+
+    body = doc.find("body")
+    if body is None:
+        body = doc
+
+    # Drop unlikely containers (comments, sidebars, share bars...) unless
+    # their class/id also looks like content
+    for element in list(body.iter()):
+        if element is body or not isinstance(element.tag, str):
+            continue
+        names = f"{element.get('class', '')} {element.get('id', '')}"
+        if names.strip() and _NEGATIVE.search(names) and not _POSITIVE.search(names):
+            element.drop_tree()
+
+    nodes = main_content(body)
+    if nodes:
+        text = " ".join(_text(node, max_chars) for node in nodes)[:max_chars]
+        if len(text) >= MIN_MAIN_CHARS:
+            result["content"] = text
+            result["main_content"] = True
+            return result
+
+    result["content"] = _text(body, max_chars)
+    return result
+
+
+# ===== POOL =====
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # forkserver: children don't inherit the worker's threads (Temporal core, httpx)
+        _pool = ProcessPoolExecutor(
+            max_workers=PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver")
+        )
+    return _pool
+
+
+async def run_parser(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a module-level parse function in the extraction process pool.
+
+    Falls back to a thread if the pool can't be used.
+    """
+    global _pool
+    call = functools.partial(func, *args, **kwargs)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_pool(), call)
+    except (BrokenProcessPool, OSError):
+        _pool = None
+        return await asyncio.to_thread(call)
+
+
+async def fetch_page(
+    client: httpx.AsyncClient,
+    url: str,
+    max_chars: int = 10000,
+    max_bytes: int = MAX_PAGE_BYTES,
+    strip_tags: Sequence[str] = BOILERPLATE_TAGS,
+    with_links: bool = False,
+) -> Dict[str, Any]:
+    """
+    Fetch url (byte-capped) and extract it off the event loop.
+
+    Returns:
+        Dict with success, status, url, title, content, links, error
+    """
+    try:
+        fetched = await fetch_html(client, url, max_bytes)
+    except httpx.HTTPError as e:
+        return {"success": False, "status": 0, "url": url, "error": f"{type(e).__name__}: {e}"}
+
+    if fetched["html"] is None:
+        return {"success": False, "status": fetched["status"], "url": fetched["url"], "error": fetched["error"]}
+
+    page = await run_parser(
+        extract_page,
+        fetched["html"],
+        fetched["url"],
+        max_chars=max_chars,
+        encoding=fetched["encoding"],
+        strip_tags=tuple(strip_tags),
+        with_links=with_links,
+    )
+    return {
+        "success": True,
+        "status": fetched["status"],
+        "url": fetched["url"],
+        "truncated": fetched["truncated"],
+        **page,
+    }
@@ -0,0 +1,105 @@
+"""
+SimHash near-duplicate detection.
+
+64-bit SimHash fingerprints over word 3-shingles of normalized text. Pages
+that differ only in boilerplate, tracking params, bylines or a reworded
+sentence land within a few bits of each other.
+
+Lookup is banded: the fingerprint is split into BANDS blocks of 16 bits and
+indexed per block. Two fingerprints within MAX_DISTANCE bits (< BANDS) must
+agree exactly on at least one block (pigeonhole), so candidates come from
+the block buckets instead of comparing every pair.
+
+Example:
+    index = SimHashIndex()
+    for i, text in enumerate(texts):
+        fingerprint = simhash(text)
+        for j, distance in index.near(fingerprint):
+            ...  # text i is a near-duplicate of text j
+        index.add(i, fingerprint)
+"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple
+
+
+BITS = 64
+BANDS = 4
+BAND_BITS = BITS // BANDS
+MAX_DISTANCE = 3
+SHINGLE_WORDS = 3
+
+_WORD = re.compile(r'[a-z0-9]+')
+_URL = re.compile(r'https?://\S+|www\.\S+')
+_MARKDOWN_LINK = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+
+
+def normalize_text(text: str) -> List[str]:
+    """Lowercased words with URLs, link targets and punctuation removed."""
+    text = _MARKDOWN_LINK.sub(r'\1', text or "")
+    text = _URL.sub(' ', text)
+    return _WORD.findall(text.lower())
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of text (0 for empty text)."""
+    words = normalize_text(text)
+    if len(words) < SHINGLE_WORDS:
+        features = Counter(words)
+    else:
+        features = Counter(
+            " ".join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)
+        )
+
+    # One binary string per feature occurrence; count 1s per column
+    rows = []
+    for feature, count in features.items():
+        rows.extend([format(_feature_hash(feature), '064b')] * count)
+    if not rows:
+        return 0
+
+    half = len(rows) / 2
+    bits = ''.join('1' if column.count('1') > half else '0' for column in zip(*rows))
+    return int(bits, 2)
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _bands(fingerprint: int) -> Iterator[Tuple[int, int]]:
+    mask = (1 << BAND_BITS) - 1
+    for band in range(BANDS):
+        yield band, fingerprint >> (band * BAND_BITS) & mask
+
+
+class SimHashIndex:
+    """Banded index of fingerprints keyed by caller-supplied ids."""
+
+    def __init__(self, max_distance: int = MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._fingerprints: Dict[int, int] = {}
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+
+    def add(self, key: int, fingerprint: int) -> None:
+        self._fingerprints[key] = fingerprint
+        for band in _bands(fingerprint):
+            self._buckets.setdefault(band, []).append(key)
+
+    def near(self, fingerprint: int) -> Iterator[Tuple[int, int]]:
+        """Yield (key, distance) for indexed fingerprints within max_distance."""
+        seen = set()
+        for band in _bands(fingerprint):
+            for key in self._buckets.get(band, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                distance = hamming(fingerprint, self._fingerprints[key])
+                if distance <= self.max_distance:
+                    yield key, distance
@@ -0,0 +1,117 @@
+"""
+Worker Startup Profiling
+
+Import-time report for the worker entrypoint:
+
+    python worker.py --import-profile              # lazy activities (default)
+    python worker.py --import-profile --eager      # LAZY_ACTIVITIES=false
+    python worker.py --import-profile --top 40
+    python worker.py --import-profile --module shared.app_config
+
+Imports the worker (and, with --eager, every activity module) in a fresh
+interpreter under `python -X importtime`, so nothing is already cached,
+and reports:
+- total import wall time
+- self time per top-level package (google, anthropic, openai, temporalio,
+  src, ...) - which SDKs the cold start is paying for
+- the slowest individual modules by cumulative time
+
+With --module, profiles importing just that module instead of the worker.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+WORKER_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+# Imports the worker module and builds its activity list, like startup does
+IMPORT_WORKER = "import worker; from src.activities.registry import worker_activities; worker_activities()"
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of `python -X importtime` output: module, self_us, cumulative_us, depth."""
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2,
+            })
+    return rows
+
+
+def profile_imports(eager: bool = False, statement: str = IMPORT_WORKER) -> Tuple[float, List[Dict[str, Any]], str]:
+    """
+    Run statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        (wall seconds, importtime rows, other stderr output)
+    """
+    env = {**os.environ, "LAZY_ACTIVITIES": "false" if eager else "true"}
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=WORKER_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - start
+    other = "\n".join(line for line in proc.stderr.splitlines() if not line.startswith("import time:"))
+    if proc.returncode:
+        raise RuntimeError(f"import failed ({proc.returncode}):\n{other[-2000:]}")
+    return wall, parse_importtime(proc.stderr), other
+
+
+def importtime_report(wall: float, rows: List[Dict[str, Any]], top: int = 25) -> str:
+    by_package = defaultdict(int)
+    for row in rows:
+        by_package[row["module"].split(".")[0]] += row["self_us"]
+    total_us = sum(by_package.values())
+
+    lines = [
+        f"Import wall time: {wall:.2f}s ({total_us / 1e6:.2f}s in imports, {len(rows)} modules)",
+        "",
+        f"{'package':<32} {'self ms':>9} {'share':>6}",
+    ]
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"{package:<32} {self_us / 1000:>9.1f} {self_us / total_us:>6.1%}")
+
+    lines += ["", f"{'module (slowest cumulative)':<56} {'cumulative ms':>14}"]
+    for row in sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[:top]:
+        lines.append(f"{'  ' * min(row['depth'], 6)}{row['module']:<{56 - 2 * min(row['depth'], 6)}} {row['cumulative_us'] / 1000:>14.1f}")
+    return "\n".join(lines)
+
+
+def import_profile_main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="worker.py --import-profile", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--import-profile", action="store_true")
+    parser.add_argument("--eager", action="store_true", help="Import every activity module up front")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--module", help="Profile importing this module instead of the worker")
+    args = parser.parse_args(argv)
+
+    statement = f"import {args.module}" if args.module else IMPORT_WORKER
+    try:
+        wall, rows, _ = profile_imports(eager=args.eager, statement=statement)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"Module: {args.module}" if args.module else f"Activities: {'eager' if args.eager else 'lazy'}")
+    print(importtime_report(wall, rows, args.top))
+    return 0
@@ -79,6 +79,7 @@ class ArticleCreationWorkflow:
         keyword_volume = input_dict.get("keyword_volume")
         keyword_difficulty = input_dict.get("keyword_difficulty")
         secondary_keywords = input_dict.get("secondary_keywords", [])
+        previous_coverage = input_dict.get("previous_coverage", [])  # Earlier articles on a developing news story
 
         # ===== PHASE 0: KEYWORD RESEARCH (if not provided) =====
         # Auto-research keywords for SEO optimization
@@ -315,6 +316,21 @@ class ArticleCreationWorkflow:
             f"({successful_count}/{len(urls_to_crawl[:15])} successful via child workflows)"
         )
 
+        # ===== PHASE 2c: DROP NEAR-DUPLICATE PAGES =====
+        # Syndicated wire stories / mirrored pages - keep the highest-authority copy
+        crawl_dedup = {"duplicate_clusters": [], "pages_in": len(crawled_pages), "pages_out": len(crawled_pages), "tokens_saved": 0}
+        if len(crawled_pages) > 1:
+            crawl_dedup = await workflow.execute_activity(
+                "dedupe_crawled_pages",
+                args=[crawled_pages],
+                start_to_close_timeout=timedelta(seconds=60)
+            )
+            crawled_pages = crawl_dedup["pages"]
+            workflow.logger.info(
+                f"Dedup: {crawl_dedup['pages_in']} -> {crawl_dedup['pages_out']} pages, "
+                f"{len(crawl_dedup['duplicate_clusters'])} duplicate clusters, ~{crawl_dedup['tokens_saved']} tokens saved"
+            )
+
         # ===== PHASE 3: CURATE RESEARCH SOURCES =====
         workflow.logger.info("Phase 3: Curating research sources with AI (filter, dedupe, summarize)")
 
@@ -546,13 +562,16 @@ class ArticleCreationWorkflow:
             "news_articles": all_news_articles[:20],
             "crawled_pages": crawled_pages[:15],
             "exa_results": exa_data.get("results", [])[:10],
-            "zep_context": zep_context
+            "zep_context": zep_context,
+            "previous_coverage": previous_coverage
         }
 
         article_result = await workflow.execute_activity(
             "generate_four_act_article",
             args=[topic, article_type, app, research_context, target_word_count, custom_slug, target_keyword, secondary_keywords],
-            start_to_close_timeout=timedelta(minutes=3)
+            start_to_close_timeout=timedelta(minutes=3),
+            # Heartbeats arrive with streamed output; allow for time-to-first-token
+            heartbeat_timeout=timedelta(seconds=45)
         )
 
         # Continue with whatever article we got (even minimal fallback)
@@ -1047,5 +1066,11 @@ class ArticleCreationWorkflow:
             "video_playback_id": video_result.get("video_playback_id") if video_result else None,
             "research_cost": total_cost,
             "spawn_candidates_saved": spawn_candidates_saved,
+            "crawl_dedup": {
+                "pages_in": crawl_dedup["pages_in"],
+                "pages_out": crawl_dedup["pages_out"],
+                "tokens_saved": crawl_dedup["tokens_saved"],
+                "duplicate_clusters": crawl_dedup["duplicate_clusters"],
+            },
             "article": article
         }
@@ -506,6 +506,22 @@ class CountryGuideCreationWorkflow:
                     metrics["crawled_urls"] = len(crawled_content)
                     workflow.logger.info(f"Crawled {len(crawled_content)} sources successfully via child workflows")
 
+                    # Drop near-duplicate pages (syndicated/mirrored copies), keep highest-authority copy
+                    if len(crawled_content) > 1:
+                        crawl_dedup = await workflow.execute_activity(
+                            "dedupe_crawled_pages",
+                            args=[crawled_content],
+                            start_to_close_timeout=timedelta(seconds=60)
+                        )
+                        crawled_content = crawl_dedup["pages"]
+                        metrics["duplicate_pages_removed"] = crawl_dedup["pages_in"] - crawl_dedup["pages_out"]
+                        metrics["duplicate_tokens_saved"] = crawl_dedup["tokens_saved"]
+                        metrics["duplicate_clusters"] = crawl_dedup["duplicate_clusters"]
+                        workflow.logger.info(
+                            f"Dedup: {crawl_dedup['pages_in']} -> {crawl_dedup['pages_out']} pages, "
+                            f"~{crawl_dedup['tokens_saved']} tokens saved"
+                        )
+
             except Exception as e:
                 workflow.logger.warning(f"Crawl phase failed (non-blocking): {e}")
 
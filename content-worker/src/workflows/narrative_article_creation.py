@@ -124,9 +124,11 @@ class NarrativeArticleCreationWorkflow:
         if urls_to_crawl:
             try:
                 crawl_result = await workflow.execute_activity(
-                    "crawl4ai_batch_crawl",
+                    "crawl4ai_batch",
                     args=[urls_to_crawl[:30], topic],
                     start_to_close_timeout=timedelta(seconds=180),
+                    # Completed URLs are heartbeated, so the retry resumes instead of restarting
+                    heartbeat_timeout=timedelta(seconds=60),
                     retry_policy=RetryPolicy(maximum_attempts=2)
                 )
                 crawled_pages = crawl_result.get("pages", [])
@@ -7,10 +7,10 @@ Pipeline:
 1. Fetch news from DataForSEO (primary - ISO timestamps)
 2. Fetch news from Serper (supplementary)
 3. Deduplicate and merge results
-4. Get recent articles (Neon) for duplicate check
+4. Duplicate check against published articles (in-worker vector index), recent articles (Neon) as AI context
 5. AI assessment: relevance, priority
-6. Build intelligent video prompt for each story
-7. Spawn ArticleCreationWorkflow with video-first configuration
+6. Concurrent keyword research for the top stories
+7. Spawn ArticleCreationWorkflows in parallel (capped) with video-first configuration
 """
 
 import re
@@ -20,7 +20,7 @@ from typing import Dict, Any, List
 
 with workflow.unsafe.imports_passed_through():
     import asyncio
-    from src.config.app_config import get_app_config, get_all_apps
+    from shared.app_config import get_app_config, get_all_apps
 
 
 @workflow.defn
@@ -45,7 +45,8 @@ class NewsCreationWorkflow:
                 "app": "placement",
                 "min_relevance_score": 0.7,
                 "auto_create_articles": True,
-                "max_articles_to_create": 3
+                "max_articles_to_create": 3,
+                "max_concurrent_articles": 3  # ArticleCreationWorkflows running at once
             }
 
         Returns:
@@ -55,6 +56,7 @@ class NewsCreationWorkflow:
         min_relevance = input_dict.get("min_relevance_score", 0.7)
         auto_create = input_dict.get("auto_create_articles", True)
         max_articles = input_dict.get("max_articles_to_create", 3)
+        max_concurrent_articles = max(1, int(input_dict.get("max_concurrent_articles") or 3))
 
         # Get full app configuration
         app_config = get_app_config(app)
@@ -138,16 +140,54 @@ class NewsCreationWorkflow:
                 "message": "No news stories found for today"
             }
 
-        # ===== PHASE 2: GET RECENT ARTICLES =====
-        workflow.logger.info("Phase 2: Getting recently published from Neon")
-
-        recent_articles = await workflow.execute_activity(
-            "neon_get_recent_articles",
-            args=[app, 7, 50],
-            start_to_close_timeout=timedelta(seconds=30)
+        # ===== PHASE 2: DUPLICATE CHECK AGAINST PUBLISHED ARTICLES =====
+        # One lookup for all stories in the worker's article vector index,
+        # before any AI assessment is spent on them
+        workflow.logger.info("Phase 2: Checking stories against published articles")
+
+        # Recent articles are still given to the AI assessment as context
+        similarity, recent_articles = await asyncio.gather(
+            workflow.execute_activity(
+                "neon_find_similar_articles",
+                args=[stories, app],
+                start_to_close_timeout=timedelta(minutes=2)
+            ),
+            workflow.execute_activity(
+                "neon_get_recent_articles",
+                args=[app, 7, 50],
+                start_to_close_timeout=timedelta(seconds=30)
+            )
         )
 
+        new_stories = []
+        for story, result in zip(stories, similarity.get("results", [])):
+            verdict = result.get("verdict", "new")
+            # Only matches above the related threshold, not about another country/company
+            related = result.get("related", [])
+            if verdict == "duplicate":
+                workflow.logger.info(
+                    f"⏭️  SKIP: Recent duplicate - {story.get('title', '')[:50]}... "
+                    f"(matches '{related[0].get('title', '')[:50]}', {related[0].get('similarity')})"
+                )
+                continue
+            if verdict == "developing":
+                # Same topic covered before - reference it as an ongoing saga
+                story["previous_coverage"] = [
+                    {"title": m.get("title"), "slug": m.get("slug"), "similarity": m.get("similarity")}
+                    for m in related
+                ]
+                workflow.logger.info(
+                    f"📰 REFERENCE: Developing story - {story.get('title', '')[:50]}... "
+                    f"(Previous coverage: {related[0].get('title', '')})"
+                )
+            new_stories.append(story)
+
+        duplicates_skipped = len(stories) - len(new_stories)
         workflow.logger.info(f"Found {len(recent_articles)} recent articles")
+        workflow.logger.info(
+            f"{duplicates_skipped} duplicates skipped against {similarity.get('indexed', 0)} articles "
+            f"({similarity.get('scorer')}, {similarity.get('elapsed_ms')} ms)"
+        )
 
         # ===== PHASE 3: AI ASSESSMENT =====
         workflow.logger.info("Phase 3: AI assessment of story relevance")
@@ -164,7 +204,7 @@ class NewsCreationWorkflow:
         assessment_result = await workflow.execute_activity(
             "assess_news_relevancy",
             args=[
-                stories,
+                new_stories,
                 app,
                 app_context,
                 recent_articles,
@@ -197,84 +237,69 @@ class NewsCreationWorkflow:
                 )
             )
 
-            # Create articles for top stories
-            for story_assessment in sorted_stories[:max_articles]:
-                story = story_assessment.get("story", {})
-                priority = story_assessment.get("priority", "medium")
-                story_title = story.get("title", "")
+            stories_to_create = sorted_stories[:max_articles]
+            location = geographic_focus[0] if geographic_focus else "UK"
 
-                workflow.logger.info(f"Creating article: {story_title[:50]}...")
+            # ===== PHASE 3.6: KEYWORD RESEARCH (if not provided, all stories concurrently) =====
+            # Auto-research keywords for SEO optimization
+            async def research_keywords(story: Dict[str, Any]) -> Dict[str, Any]:
+                story_title = story.get("title", "")
+                seo = {
+                    "target_keyword": story.get("target_keyword"),  # From dashboard, if specified
+                    "secondary_keywords": story.get("secondary_keywords", []),
+                    "keyword_volume": None,
+                    "keyword_difficulty": None
+                }
+                if seo["target_keyword"]:
+                    return seo
 
-                # ===== PHASE 3.5: CHECK ZEP FOR EXISTING COVERAGE =====
-                # Query Zep to see if this story already exists
-                zep_check = await workflow.execute_activity(
-                    "query_zep_for_context",
-                    args=[story_title, "", app],  # Story title as company_name, empty domain
-                    start_to_close_timeout=timedelta(seconds=30)
-                )
+                workflow.logger.info(f"Phase 3.6: Auto-researching keywords for: {story_title[:50]}...")
+                try:
+                    keyword_result = await workflow.execute_activity(
+                        "dataforseo_keyword_research",
+                        args=[story_title, location, 10],
+                        start_to_close_timeout=timedelta(minutes=2)
+                    )
 
-                existing_articles = zep_check.get("articles", [])
-
-                if existing_articles:
-                    # Check if it's a recent duplicate or old developing story
-                    most_recent = existing_articles[0] if existing_articles else None
-                    if most_recent:
-                        recent_timestamp = most_recent.get("created_at") or most_recent.get("timestamp", "")
-                        story_timestamp = story.get("timestamp", story.get("time_published", ""))
-
-                        # Simple time check: if both from today, skip as duplicate
-                        # In real implementation, would parse timestamps properly
-                        if recent_timestamp and story_timestamp:
-                            # Skip if both are from same date (avoid republishing same day)
-                            if recent_timestamp[:10] == story_timestamp[:10]:  # Compare YYYY-MM-DD
-                                workflow.logger.info(f"⏭️  SKIP: Recent duplicate - {story_title[:50]}...")
-                                continue
-                            else:
-                                # Old story but same topic - reference it as ongoing saga
-                                workflow.logger.info(
-                                    f"📰 REFERENCE: Developing story - {story_title[:50]}... "
-                                    f"(Previous coverage: {most_recent.get('title', '')})"
-                                )
-
-                # ===== PHASE 3.6: KEYWORD RESEARCH (if not provided) =====
-                # Auto-research keywords for SEO optimization
-                target_keyword = story.get("target_keyword")  # From dashboard, if specified
-                secondary_keywords = story.get("secondary_keywords", [])
-                keyword_volume = None
-                keyword_difficulty = None
-
-                if not target_keyword:
-                    workflow.logger.info(f"Phase 3.6: Auto-researching keywords for: {story_title[:50]}...")
-                    try:
-                        keyword_result = await workflow.execute_activity(
-                            "dataforseo_keyword_research",
-                            args=[story_title, geographic_focus[0] if geographic_focus else "UK", 10],
-                            start_to_close_timeout=timedelta(minutes=2)
+                    keywords_list = keyword_result.get("keywords", [])
+                    if keywords_list:
+                        # Pick best keyword (highest opportunity_score)
+                        best = max(keywords_list, key=lambda k: k.get("opportunity_score", 0))
+                        seo["target_keyword"] = best.get("keyword")
+                        seo["keyword_volume"] = best.get("search_volume")
+                        seo["keyword_difficulty"] = best.get("difficulty_score")
+
+                        # Get 3-5 secondary keywords (excluding best)
+                        seo["secondary_keywords"] = [
+                            k.get("keyword") for k in keywords_list[:6]
+                            if k.get("keyword") != seo["target_keyword"]
+                        ][:5]
+
+                        workflow.logger.info(
+                            f"Keyword selected: '{seo['target_keyword']}' "
+                            f"(vol={seo['keyword_volume']}, diff={seo['keyword_difficulty'] or 0:.1f}, "
+                            f"opp={best.get('opportunity_score', 0):.2f})"
                         )
+                    else:
+                        workflow.logger.info("No keywords returned from research")
+                except Exception as e:
+                    workflow.logger.warning(f"Keyword research failed (non-blocking): {e}")
+                    # Continue without keywords - article still generates
 
-                        keywords_list = keyword_result.get("keywords", [])
-                        if keywords_list:
-                            # Pick best keyword (highest opportunity_score)
-                            best = max(keywords_list, key=lambda k: k.get("opportunity_score", 0))
-                            target_keyword = best.get("keyword")
-                            keyword_volume = best.get("search_volume")
-                            keyword_difficulty = best.get("difficulty_score")
-
-                            # Get 3-5 secondary keywords (excluding best)
-                            secondary_keywords = [
-                                k.get("keyword") for k in keywords_list[:6]
-                                if k.get("keyword") != target_keyword
-                            ][:5]
-
-                            workflow.logger.info(
-                                f"Keyword selected: '{target_keyword}' "
-                                f"(vol={keyword_volume}, diff={keyword_difficulty:.1f}, opp={best.get('opportunity_score', 0):.2f})"
-                            )
-                        else:
-                            workflow.logger.info("No keywords returned from research")
-                    except Exception as e:
-                        workflow.logger.warning(f"Keyword research failed (non-blocking): {e}")
-                        # Continue without keywords - article still generates
+                return seo
+
+            keyword_research = await asyncio.gather(*(
+                research_keywords(s.get("story", {})) for s in stories_to_create
+            ))
+
+            # ===== PHASE 4b: SPAWN ARTICLE WORKFLOWS (in parallel, capped) =====
+            # Each ArticleCreationWorkflow takes 5-10 minutes; run up to
+            # max_concurrent_articles at once and record each as it finishes
+            child_slots = asyncio.Semaphore(max_concurrent_articles)
+
+            async def create_article(story_assessment: Dict[str, Any], seo: Dict[str, Any]) -> None:
+                story = story_assessment.get("story", {})
+                priority = story_assessment.get("priority", "medium")
 
                 # ===== BUILD ARTICLE INPUT WITH 4-ACT VIDEO CONFIGURATION =====
                 # Video prompt is now generated FROM the article's 4-act sections (article-first approach)
@@ -285,7 +310,7 @@ class NewsCreationWorkflow:
                     "article_type": "news",
                     "app": app,
                     "target_word_count": 1500,
-                    "jurisdiction": geographic_focus[0] if geographic_focus else "UK",
+                    "jurisdiction": location,
                     "generate_images": True,
                     "video_quality": "medium" if priority in ["high", "medium"] else None,  # High/medium priority get videos
                     "video_model": "seedance",
@@ -293,41 +318,48 @@ class NewsCreationWorkflow:
                     "content_images": "with_content",
                     "num_research_sources": 10,
                     # SEO keyword targeting (Phase 3.6)
-                    "target_keyword": target_keyword,
-                    "keyword_volume": keyword_volume,
-                    "keyword_difficulty": keyword_difficulty,
-                    "secondary_keywords": secondary_keywords
+                    "target_keyword": seo["target_keyword"],
+                    "keyword_volume": seo["keyword_volume"],
+                    "keyword_difficulty": seo["keyword_difficulty"],
+                    "secondary_keywords": seo["secondary_keywords"],
+                    # Earlier articles on the same story (Phase 2), linked from the new one
+                    "previous_coverage": story.get("previous_coverage", [])
                 }
 
-                workflow.logger.info(f"Spawning 4-act article workflow for: {story.get('title', '')[:50]}...")
-
                 # Spawn child workflow with descriptive ID including topic
                 story_title = story.get("title", "untitled")
                 # Slugify: lowercase, replace spaces/special chars with hyphens, limit length
                 topic_slug = re.sub(r'[^a-z0-9]+', '-', story_title.lower())[:50].strip('-')
                 workflow_id = f"4act-{app}-{topic_slug}-{workflow.uuid4().hex[:6]}"
 
-                try:
-                    result = await workflow.execute_child_workflow(
-                        "ArticleCreationWorkflow",
-                        article_input,
-                        id=workflow_id,
-                        task_queue=workflow.info().task_queue
-                    )
+                async with child_slots:
+                    workflow.logger.info(f"Spawning 4-act article workflow for: {story_title[:50]}...")
+                    try:
+                        result = await workflow.execute_child_workflow(
+                            "ArticleCreationWorkflow",
+                            article_input,
+                            id=workflow_id,
+                            task_queue=workflow.info().task_queue
+                        )
 
-                    articles_created.append({
-                        "title": story.get("title"),
-                        "article_id": result.get("article_id"),
-                        "slug": result.get("slug"),
-                        "priority": story_assessment.get("priority"),
-                        "target_keyword": target_keyword,
-                        "keyword_volume": keyword_volume
-                    })
+                        articles_created.append({
+                            "title": story.get("title"),
+                            "article_id": result.get("article_id"),
+                            "slug": result.get("slug"),
+                            "priority": story_assessment.get("priority"),
+                            "target_keyword": seo["target_keyword"],
+                            "keyword_volume": seo["keyword_volume"]
+                        })
 
-                    workflow.logger.info(f"Article created: {result.get('slug')}")
+                        workflow.logger.info(f"Article created: {result.get('slug')}")
 
-                except Exception as e:
-                    workflow.logger.error(f"Failed to create article: {str(e)}")
+                    except Exception as e:
+                        workflow.logger.error(f"Failed to create article: {str(e)}")
+
+            await asyncio.gather(*(
+                create_article(story_assessment, seo)
+                for story_assessment, seo in zip(stories_to_create, keyword_research)
+            ))
 
         # ===== COMPLETE =====
         workflow.logger.info(
@@ -340,6 +372,7 @@ class NewsCreationWorkflow:
             "app": app,
             "keywords": keywords[:3],
             "stories_found": len(stories),
+            "duplicates_skipped": duplicates_skipped,
             "stories_assessed": assessment_result.get("stories_assessed", 0),
             "stories_relevant": len(relevant_stories),
             "articles_created": len(articles_created),
@@ -13,23 +13,6 @@ from temporalio import workflow
 from datetime import timedelta
 from typing import Dict, Any
 
-with workflow.unsafe.imports_passed_through():
-    from src.activities.storage.neon_database import (
-        get_article_by_slug,
-        update_article_four_act_content,
-    )
-    from src.activities.generation.article_generation import (
-        generate_four_act_video_prompt_brief,
-        generate_four_act_video_prompt,
-    )
-    from src.activities.media.video_generation import (
-        generate_four_act_video,
-    )
-    from src.activities.media.mux_client import (
-        upload_video_to_mux,
-        inject_section_images_activity,
-    )
-
 
 @workflow.defn
 class VideoEnrichmentWorkflow:
@@ -70,7 +53,7 @@ class VideoEnrichmentWorkflow:
         # Step 1: Fetch article
         workflow.logger.info("Step 1/6: Fetching article from database...")
         article = await workflow.execute_activity(
-            get_article_by_slug,
+            "get_article_by_slug",
             slug,
             start_to_close_timeout=timedelta(seconds=30),
         )
@@ -97,7 +80,7 @@ class VideoEnrichmentWorkflow:
         # Step 2: Generate 4-act video prompt briefs from article content
         workflow.logger.info("Step 2/6: Generating 4-act video prompt briefs from article...")
         brief_result = await workflow.execute_activity(
-            generate_four_act_video_prompt_brief,
+            "generate_four_act_video_prompt_brief",
             args=[article, app, None],  # character_style = None (use app default)
             start_to_close_timeout=timedelta(minutes=3),
         )
@@ -111,7 +94,7 @@ class VideoEnrichmentWorkflow:
 
         # Save briefs to article
         await workflow.execute_activity(
-            update_article_four_act_content,
+            "update_article_four_act_content",
             args=[article_id, four_act_content, None],  # video_prompt will be set later
             start_to_close_timeout=timedelta(seconds=30),
         )
@@ -122,7 +105,7 @@ class VideoEnrichmentWorkflow:
         # Step 3: Generate 4-act video prompt
         workflow.logger.info("Step 3/6: Assembling 4-act video prompt...")
         prompt_result = await workflow.execute_activity(
-            generate_four_act_video_prompt,
+            "generate_four_act_video_prompt",
             args=[article, app, video_model, None],  # character_style = None
             start_to_close_timeout=timedelta(seconds=30),
         )
@@ -136,7 +119,7 @@ class VideoEnrichmentWorkflow:
         # Step 4: Generate 4-act video
         workflow.logger.info(f"Step 4/6: Generating 12-second 4-act video with {video_model}...")
         video_result = await workflow.execute_activity(
-            generate_four_act_video,
+            "generate_four_act_video",
             args=[video_prompt, video_model],
             start_to_close_timeout=timedelta(minutes=5),  # Video generation can take time
         )
@@ -150,7 +133,7 @@ class VideoEnrichmentWorkflow:
         # Step 5: Upload to MUX with proper naming
         workflow.logger.info("Step 5/6: Uploading video to MUX...")
         mux_result = await workflow.execute_activity(
-            upload_video_to_mux,
+            "upload_video_to_mux",
             args=[
                 video_url,
                 {
@@ -175,7 +158,7 @@ class VideoEnrichmentWorkflow:
 
         # Update article with video_playback_id and video_prompt
         await workflow.execute_activity(
-            update_article_four_act_content,
+            "update_article_four_act_content",
             args=[article_id, four_act_content, video_prompt],
             start_to_close_timeout=timedelta(seconds=30),
         )
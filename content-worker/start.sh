@@ -26,7 +26,7 @@ echo "📦 Activating virtual environment..."
 source venv/bin/activate
 
 echo "📦 Installing dependencies..."
-pip install -q -r requirements.txt
+pip install -q ../shared -r requirements.txt  # shared/: app registry and telemetry
 
 echo ""
 echo "🚀 Starting worker..."
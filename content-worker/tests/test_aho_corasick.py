@@ -0,0 +1,76 @@
+import asyncio
+import random
+import re
+
+from temporalio.testing import ActivityEnvironment
+
+from src.activities.validation.link_validator import finesse_internal_links
+from src.utils.aho_corasick import AhoCorasick
+
+
+def naive(patterns, text, whole_words=True):
+    matches = set()
+    for index, pattern in enumerate(patterns):
+        boundary = r"(?<![\w])" if whole_words else ""
+        end = r"(?![\w])" if whole_words else ""
+        for m in re.finditer(f"(?={boundary}({re.escape(pattern)}){end})", text, re.IGNORECASE):
+            matches.add((m.start(1), m.end(1), index))
+    return matches
+
+
+def test_overlapping_patterns_without_word_boundaries():
+    matcher = AhoCorasick(["he", "she", "his", "hers"], whole_words=False)
+
+    assert sorted(matcher.find_all("ushers")) == [(1, 4, 1), (2, 4, 0), (2, 6, 3)]
+
+
+def test_whole_words_and_case():
+    matcher = AhoCorasick(["golden visa", "visa"])
+
+    found = {(s, e, i) for s, e, i in matcher.find_all("Golden Visa rules; visas and VISA fees")}
+
+    assert found == {(0, 11, 0), (7, 11, 1), (29, 33, 1)}
+
+
+def test_matches_regex_reference_on_random_text():
+    rng = random.Random(3)
+    words = ["guide", "golden", "visa", "nomad", "tax", "go", "gold", "an", "and", "expat"]
+    patterns = ["golden visa", "visa", "gold", "go", "nomad tax", "and", "expat guide"]
+    matcher = AhoCorasick(patterns)
+
+    for _ in range(200):
+        text = " ".join(rng.choice(words) for _ in range(30))
+        assert set(matcher.find_all(text)) == naive(patterns, text)
+
+
+def test_offsets_survive_length_changing_lowercase():
+    text = "İstanbul golden visa"
+    (start, end, index), = AhoCorasick(["golden visa"]).find_all(text)
+
+    assert text[start:end] == "golden visa"
+
+
+def test_internal_links_skip_self_existing_links_and_headings():
+    articles = [
+        {"id": 1, "slug": "portugal-story", "article_mode": "story", "target_keyword": "portugal golden visa",
+         "content": "<h2>Portugal golden visa</h2><p>Read the practical guide and the expat stories.</p>"},
+        {"id": 2, "slug": "portugal-guide", "article_mode": "guide", "target_keyword": "",
+         "content": "<p>The portugal golden visa ended. See <a href=\"/x\">expat stories</a> or expat stories.</p>"},
+        {"id": 3, "slug": "portugal-voices", "article_mode": "voices", "target_keyword": "",
+         "content": "Markdown: the complete guide covers the practical guide."},
+    ]
+
+    result = asyncio.run(ActivityEnvironment().run(finesse_internal_links, articles, 1))
+    content = {a["id"]: a["content"] for a in result}
+
+    # No link inside the heading; siblings linked once each, never to itself
+    assert content[1] == (
+        '<h2>Portugal golden visa</h2><p>Read the <a href="/portugal-guide">practical guide</a> '
+        'and the <a href="/portugal-voices">expat stories</a>.</p>'
+    )
+    # The anchor inside the existing link is skipped; the later plain one is used
+    assert content[2].endswith('or <a href="/portugal-voices">expat stories</a>.</p>')
+    assert '<a href="/portugal-story">portugal golden visa</a>' in content[2]
+    assert content[3] == (
+        "Markdown: the [complete guide](/portugal-story) covers the [practical guide](/portugal-guide)."
+    )
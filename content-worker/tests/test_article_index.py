@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.utils import article_index
+from src.utils.article_index import (
+    ArticleIndex,
+    article_text,
+    classify,
+    index_article,
+    related_matches,
+    title_entities,
+)
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+RECENT = (NOW - timedelta(hours=3)).isoformat()
+OLD = (NOW - timedelta(days=30)).isoformat()
+
+
+def match(title, similarity, created_at=RECENT):
+    return {"id": title, "title": title, "slug": "", "similarity": similarity, "created_at": created_at}
+
+
+def test_title_entities_maps_places_and_skips_common_words():
+    assert title_entities("Greek golden visa threshold rises in Athens") == (frozenset({"greece"}), frozenset())
+    assert title_entities("UK private equity firm acquires US fintech") == (frozenset({"uk", "us"}), frozenset())
+    assert title_entities("Costa Rica extends digital nomad stays") == (frozenset({"costa rica"}), frozenset())
+    assert title_entities("Goldman Sachs cuts bankers in April")[1] == {"goldman", "sachs"}
+    # Lower-case "us" is a pronoun, not the country
+    assert title_entities("How to tell us about your move") == (frozenset(), frozenset())
+
+
+def test_same_story_in_another_country_is_new():
+    matches = [match("Malta digital nomad visa guide", 0.797)]
+
+    assert classify(matches, "hashed", NOW, title="Cyprus digital nomad visa guide") == "new"
+    assert related_matches("Cyprus digital nomad visa guide", matches, "hashed") == []
+
+
+def test_different_countries_are_not_developing():
+    matches = [match("US private equity firm sells logistics business", 0.42)]
+
+    assert classify(matches, "hashed", NOW, title="UK private equity firm acquires fintech startup") == "new"
+
+
+def test_different_company_is_not_a_duplicate():
+    matches = [match("Brookfield raises 20bn dollar infrastructure fund", 0.85)]
+
+    assert classify(matches, "hashed", NOW, title="KKR raises 20bn dollar infrastructure fund") == "new"
+
+
+def test_recent_same_story_is_duplicate_and_old_one_developing():
+    title = "Portugal ends golden visa property route"
+
+    assert classify([match("Portugal scraps real estate option for golden visa", 0.48)], "hashed", NOW, title) == "duplicate"
+    assert classify([match("Portugal scraps real estate option for golden visa", 0.48, OLD)], "hashed", NOW, title) == "developing"
+    assert classify([match("Portugal golden visa reform", 0.3)], "hashed", NOW, title) == "developing"
+    assert classify([match("Portugal golden visa reform", 0.1)], "hashed", NOW, title) == "new"
+
+
+def test_duplicate_checks_beyond_the_top_match():
+    title = "Spain to abolish golden visa scheme in April"
+    matches = [
+        match("Greece to abolish golden visa scheme", 0.9),  # other country: ignored
+        match("Spain confirms end of golden visa programme from April", 0.5),
+    ]
+
+    assert classify(matches, "hashed", NOW, title) == "duplicate"
+    assert [m["title"] for m in related_matches(title, matches, "hashed")] == [matches[1]["title"]]
+
+
+def test_thresholds_are_per_scorer():
+    title = "Japan launches digital nomad visa"
+    matches = [match("Japan digital nomad visa opens", 0.75)]
+
+    assert classify(matches, "hashed", NOW, title) == "duplicate"
+    assert classify(matches, "openai", NOW, title) == "developing"
+    assert classify(matches, "google", NOW, title) == "developing"
+
+
+def test_index_search_and_incremental_add():
+    index = ArticleIndex("relocation", "hashed")
+    articles = [
+        {"id": "1", "title": "Portugal golden visa ends", "slug": "pt", "excerpt": "", "created_at": OLD},
+        {"id": "2", "title": "Thailand extends visa-free stays", "slug": "th", "excerpt": "", "created_at": OLD},
+    ]
+    index.add(articles, asyncio.run(index.vectorize([article_text(a["title"]) for a in articles])))
+    article_index._indexes["relocation"] = index
+    try:
+        assert asyncio.run(index_article("relocation", {"id": "3", "title": "Malta nomad permit fees cut", "excerpt": ""}))
+        # Re-saving keeps one row and the original publish time
+        assert asyncio.run(index_article("relocation", {"id": "1", "title": "Portugal golden visa property route ends", "excerpt": ""}))
+    finally:
+        article_index._indexes.pop("relocation")
+
+    assert len(index) == 3
+    assert index.articles[0]["created_at"] == OLD
+
+    queries = asyncio.run(index.vectorize([article_text("Portugal ends golden visa property route"), article_text("Malta cuts nomad permit fees")]))
+    results = index.search(queries, top_k=2)
+    assert [r[0]["id"] for r in results] == ["1", "3"]
+    assert results[0][0]["similarity"] >= results[0][1]["similarity"]
+    assert index.search(np.zeros((0, 0)), top_k=2) == []
+
+
+def test_index_grows_capacity_geometrically():
+    index = ArticleIndex("relocation", "hashed")
+    capacities = set()
+    for i in range(200):
+        article = {"id": str(i), "title": f"Story {i}", "slug": str(i), "excerpt": "", "created_at": OLD}
+        index.add([article], asyncio.run(index.vectorize([article_text(article["title"])])))
+        capacities.add(len(index._matrix))
+
+    assert len(index) == 200
+    assert capacities == {64, 128, 256}
+    assert index._matrix.shape[1] == article_index.INDEX_HASH_DIMENSIONS
+    [results] = index.search(asyncio.run(index.vectorize([article_text("Story 150")])), top_k=1)
+    assert results[0]["id"] == "150"
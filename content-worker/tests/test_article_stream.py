@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from src.utils.article_stream import ArticleStreamParser, find_json_object
+
+STRUCTURED = {
+    "sections": [{"act": 1, "title": "Arrive {fast}", "hint": "quote \" and brace }"}],
+    "faq": [{"q": "Cost?", "a": "From EUR 90"}],
+}
+
+ARTICLE = (
+    "\n"
+    "TITLE: Portugal D7 Visa Guide\n"
+    "META: Everything about the D7 visa.\n"
+    "SLUG: Portugal D7 Visa\n"
+    "<p>Intro paragraph.</p>\n"
+    "<h2>Requirements</h2>\n<p>Income of EUR 820 a month.</p>\n"
+    "<h2>Costs</h2>\n<p>Fees are modest.</p>\n"
+    "---MEDIA PROMPTS---\n"
+    "Hero: Lisbon tram at dusk\n"
+    "--- STRUCTURED DATA ---\n"
+    "```json\n" + json.dumps(STRUCTURED, indent=2) + "\n```\n"
+)
+
+
+def _parse(text, chunk_size):
+    parser = ArticleStreamParser()
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i:i + chunk_size])
+    parser.finish()
+    return parser
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, len(ARTICLE)])
+def test_chunked_stream_matches_whole_response(chunk_size):
+    parser = _parse(ARTICLE, chunk_size)
+
+    assert parser.title == "Portugal D7 Visa Guide"
+    assert parser.meta_description == "Everything about the D7 visa."
+    assert parser.slug == "portugal-d7-visa"
+    assert parser.body.startswith("<p>Intro paragraph.</p>")
+    assert parser.body.endswith("<p>Fees are modest.</p>")
+    assert parser.trailing.startswith("---MEDIA PROMPTS---")
+    assert json.loads(parser.structured_json) == STRUCTURED
+    assert parser.progress()["sections"] == 2
+    assert parser.progress()["structured_data"]
+
+
+def test_structured_data_is_none_until_object_closes():
+    cut = ARTICLE.rindex("}")
+    parser = ArticleStreamParser()
+    parser.feed(ARTICLE[:cut])
+
+    assert parser.phase == "trailing"
+    assert parser.structured_json is None
+
+    parser.feed(ARTICLE[cut:])
+    assert json.loads(parser.structured_json) == STRUCTURED
+
+
+def test_response_without_metadata_or_trailing_blocks():
+    parser = _parse("<p>Only body.</p>\n<h2>One</h2>", 5)
+
+    assert parser.title is None
+    assert parser.first_line == "<p>Only body.</p>"
+    assert parser.body == "<p>Only body.</p>\n<h2>One</h2>"
+    assert parser.trailing == ""
+    assert parser.structured_json is None
+
+
+def test_final_metadata_line_without_newline():
+    parser = _parse("TITLE: Short", 4)
+
+    assert parser.title == "Short"
+    assert parser.body == ""
+
+
+def test_find_json_object_skips_braces_in_strings():
+    text = 'prefix {"a": "}{", "b": {"c": "\\"}"}} suffix {"d": 1}'
+
+    assert json.loads(find_json_object(text)) == {"a": "}{", "b": {"c": '"}'}}
+    assert find_json_object('{"unterminated": {') is None
@@ -0,0 +1,69 @@
+import pytest
+
+from src.utils.context_packer import _is_boilerplate, estimate_tokens, pack_sources
+
+
+@pytest.mark.parametrize("paragraph", [
+    "Sign up for our newsletter to get the latest relocation news.",
+    "Subscribe to our weekly digest and never miss an update.",
+    "Join 20,000 readers - subscribe now!",
+    "We use cookies to improve your experience. Accept all cookies?",
+    "Log in or sign up to read the full article.",
+    "Already have an account? Sign in to continue.",
+    "© 2025 Relocation Weekly. All rights reserved.",
+])
+def test_calls_to_action_are_boilerplate(paragraph):
+    assert _is_boilerplate(paragraph)
+
+
+@pytest.mark.parametrize("paragraph", [
+    "You must sign up with the tax office within 30 days of arriving in Portugal.",
+    "Newcomers subscribe to the national health insurance scheme after three months of residence.",
+    "Log in to ELSTER with your certificate to file the annual German tax return.",
+    "Employers register new hires with social security before their first day of work.",
+])
+def test_facts_mentioning_sign_up_or_log_in_are_kept(paragraph):
+    assert not _is_boilerplate(paragraph)
+
+
+def test_link_lists_and_fragments_are_boilerplate():
+    assert _is_boilerplate("[Home](/) [Visas](/visas) [Tax](/tax) [Contact](/contact)")
+    assert _is_boilerplate("Menu")
+
+
+def _source(*paragraphs):
+    return {"url": "https://example.com", "content": "\n\n".join(paragraphs)}
+
+
+def test_pack_sources_keeps_facts_and_drops_templates_and_duplicates():
+    template = "Relocation Weekly is an independent publication for people moving abroad."
+    fact = "The Portugal D7 visa requires passive income of at least EUR 820 per month."
+    sources = [
+        _source(template, fact, "Sign up for our newsletter for weekly visa updates."),
+        _source(template, fact + " "),
+        _source(template, "Applicants book a consulate appointment and provide a criminal record check."),
+    ]
+
+    packed, stats = pack_sources(sources, "Portugal D7 visa requirements", budget_tokens=1000)
+
+    text = "\n\n".join(s["content"] for s in packed)
+    assert text.count(fact) == 1
+    assert template not in text
+    assert "newsletter" not in text
+    assert "criminal record check" in text
+    assert stats["boilerplate_dropped"] == 4
+    assert stats["duplicates_dropped"] == 1
+    assert sources[0]["content"].startswith(template)  # inputs are not modified
+
+
+def test_pack_sources_respects_budget_and_keeps_every_source():
+    filler = "Portugal visa residency income requirement applies to applicants from outside the EU. "
+    sources = [_source(*(f"{filler * 4} Paragraph {i}." for i in range(10))) for _ in range(3)]
+    sources = [{**s, "content": s["content"].replace("Paragraph", f"Source {n} paragraph")} for n, s in enumerate(sources)]
+
+    packed, stats = pack_sources(sources, "Portugal visa", budget_tokens=300)
+
+    assert stats["tokens_after"] <= 300
+    assert all(s["content"] for s in packed)
+    assert stats["over_budget_dropped"] > 0
+    assert sum(estimate_tokens(s["content"]) for s in packed) == stats["tokens_after"]
@@ -0,0 +1,146 @@
+import asyncio
+import dataclasses
+import socket
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp import web
+from temporalio.common import RetryPolicy
+from temporalio.testing import ActivityEnvironment
+
+from src.activities.research import crawl4ai_service
+from src.activities.research.crawl4ai_service import crawl4ai_batch_crawl
+from src.utils.config import config
+
+URLS = [f"https://site{i}.example/page" for i in range(12)]
+
+
+class CrawlService:
+    """Local stand-in for the Crawl4AI /crawl-articles endpoint."""
+
+    def __init__(self, latency: float = 0.0, failing_urls=()):
+        self.latency = latency
+        self.failing_urls = set(failing_urls)
+        self.requested = []
+
+    async def crawl_articles(self, request):
+        urls = (await request.json())["urls"]
+        self.requested.extend(urls)
+        await asyncio.sleep(self.latency)
+        if self.failing_urls.intersection(urls):
+            return web.Response(status=502)
+        return web.json_response({
+            "results": [{"url": url, "success": True, "title": url, "content": f"Content of {url}"} for url in urls],
+            "filters_used": {"bm25": True},
+        })
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_post("/crawl-articles", self.crawl_articles)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        await web.TCPSite(self.runner, "127.0.0.1", port).start()
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.runner.cleanup()
+
+
+def _environment(heartbeat_details=(), attempt=1, maximum_attempts=2):
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(
+        env.info,
+        start_to_close_timeout=timedelta(seconds=60),
+        started_time=datetime.now(timezone.utc),
+        heartbeat_details=list(heartbeat_details),
+        attempt=attempt,
+        retry_policy=RetryPolicy(maximum_attempts=maximum_attempts),
+    )
+    heartbeats = []
+    env.on_heartbeat = lambda *details: heartbeats.append(details[0])
+    return env, heartbeats
+
+
+def _crawl(service, env, urls=URLS):
+    async def run():
+        async with service:
+            config.CRAWL4AI_SERVICE_URL = service.url
+            return await env.run(crawl4ai_batch_crawl, urls, "topic")
+    return asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def _service_url(monkeypatch):
+    monkeypatch.setattr(config, "CRAWL4AI_SERVICE_URL", None)
+
+
+def test_crawls_every_url_in_chunks():
+    service = CrawlService()
+    env, heartbeats = _environment()
+
+    result = _crawl(service, env)
+
+    assert result["success"]
+    assert sorted(p["url"] for p in result["pages"]) == sorted(URLS)
+    assert result["stats"]["successful"] == len(URLS)
+    assert heartbeats[-1]["completed"] == sorted(URLS)
+
+
+def test_heartbeats_while_a_slow_chunk_is_in_flight(monkeypatch):
+    monkeypatch.setattr(crawl4ai_service, "HEARTBEAT_INTERVAL_SECONDS", 0.05)
+    service = CrawlService(latency=0.4)
+    env, heartbeats = _environment()
+
+    _crawl(service, env, URLS[:5])
+
+    # Several heartbeats before the only chunk finished, then the checkpoint
+    assert len([h for h in heartbeats if not h["completed"]]) >= 3
+    assert heartbeats[-1]["completed"] == sorted(URLS[:5])
+
+
+def test_resumes_from_heartbeat_checkpoint():
+    done = URLS[:5]
+    checkpoint = {"completed": done, "pages": [{"url": url, "content": "cached"} for url in done]}
+    service = CrawlService()
+    env, _ = _environment(heartbeat_details=[checkpoint])
+
+    result = _crawl(service, env)
+
+    assert sorted(service.requested) == sorted(URLS[5:])
+    assert len(result["pages"]) == len(URLS)
+    assert result["stats"]["resumed"] == 5
+
+
+def test_failed_chunk_raises_while_attempts_remain():
+    service = CrawlService(failing_urls=[URLS[0]])
+    env, heartbeats = _environment(attempt=1, maximum_attempts=2)
+
+    with pytest.raises(RuntimeError, match="HTTP 502"):
+        _crawl(service, env)
+
+    # The other chunks are checkpointed for the retry
+    assert URLS[0] not in heartbeats[-1]["completed"]
+    assert set(URLS[5:]) <= set(heartbeats[-1]["completed"])
+
+
+def test_last_attempt_returns_partial_pages():
+    service = CrawlService(failing_urls=[URLS[0]])
+    env, _ = _environment(attempt=2, maximum_attempts=2)
+
+    result = _crawl(service, env)
+
+    assert result["success"]
+    assert URLS[0] not in {p["url"] for p in result["pages"]}
+    assert result["stats"]["successful"] == len(URLS) - crawl4ai_service.BATCH_CHUNK_SIZE
+
+
+def test_no_pages_raises_even_on_last_attempt():
+    service = CrawlService(failing_urls=URLS)
+    env, _ = _environment(attempt=2, maximum_attempts=2)
+
+    with pytest.raises(RuntimeError):
+        _crawl(service, env)
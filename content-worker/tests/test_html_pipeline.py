@@ -0,0 +1,81 @@
+from src.utils.html_pipeline import (
+    HtmlPipeline,
+    SectionImageVisitor,
+    TextCleanupVisitor,
+    UnlinkVisitor,
+    split_trailing_sections,
+)
+
+
+def test_split_trailing_sections():
+    body, trailing = split_trailing_sections("<p>Body</p>\n\n--- MEDIA PROMPTS ---\nprompt one")
+
+    assert body == "<p>Body</p>"
+    assert trailing == "--- MEDIA PROMPTS ---\nprompt one"
+    assert split_trailing_sections("<p>Body</p>") == ("<p>Body</p>", "")
+
+
+def test_empty_html_is_returned_unchanged():
+    pipeline = HtmlPipeline([TextCleanupVisitor()])
+
+    assert pipeline.run("") == ""
+    assert pipeline.run("  \n") == "  \n"
+
+
+def test_text_cleanup_strips_artifacts_and_spaces_h2s():
+    html = '<p>Intro "Copy like this." ```html</p>\n---\n\n\n\n\n<p>More</p><h2>Costs</h2><p>Fees</p>'
+
+    out = HtmlPipeline([TextCleanupVisitor()]).run(html)
+
+    assert "Copy like this" not in out and "```" not in out and "---" not in out
+    assert "\n\n\n\n" not in out
+    assert "<p>More</p>\n\n<h2>Costs</h2>" in out
+
+
+def test_unlink_keeps_text_children_and_tail():
+    html = '<p>See <a href="https://dead.example">the <b>old</b> guide</a> here. <a href="https://ok.example">Live</a></p>'
+    unlink = UnlinkVisitor(["https://dead.example"])
+
+    out = HtmlPipeline([unlink]).run(html)
+
+    assert out == '<p>See the <b>old</b> guide here. <a href="https://ok.example">Live</a></p>'
+    assert unlink.removed == ["https://dead.example"]
+
+
+def test_section_images_skip_sections_with_video():
+    html = (
+        "<h2>One</h2><p>a</p>"
+        '<h2>Two</h2><iframe src="https://player.vimeo.com/video/1"></iframe>'
+        "<h2>Three</h2><p>c</p>"
+    )
+    images = SectionImageVisitor("abc123", image_width=1200)
+
+    out = HtmlPipeline([images]).run(html)
+
+    assert images.injected == 2
+    assert out.count("<figure") == 2
+    assert "image.mux.com/abc123/thumbnail" in out and "width=1200" in out
+    assert out.index("<figure") > out.index("<h2>One</h2>")
+    assert "<h2>Two</h2><iframe" in out
+
+
+def test_section_images_respect_max_sections_and_missing_playback_id():
+    html = "<h2>One</h2><p>a</p><h2>Two</h2><p>b</p><h2>Three</h2><p>c</p>"
+
+    limited = SectionImageVisitor("abc123", max_sections=1)
+    HtmlPipeline([limited]).run(html)
+    assert limited.injected == 1
+
+    disabled = SectionImageVisitor(None)
+    assert HtmlPipeline([disabled]).run(html) == html
+    assert disabled.injected == 0
+
+
+def test_visitors_share_one_walk():
+    html = '<h2>Visa</h2><p><a href="https://dead.example">Apply</a> ```now```</p>'
+    images = SectionImageVisitor("abc123")
+
+    out = HtmlPipeline([TextCleanupVisitor(), UnlinkVisitor(["https://dead.example"]), images]).run(html)
+
+    assert "<a " not in out and "```" not in out
+    assert images.injected == 1
@@ -0,0 +1,72 @@
+import asyncio
+import socket
+
+from aiohttp import web
+
+from src.activities.validation.link_checker import LinkChecker, classify_status
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _serve(latency: float, slow_paths=()):
+    """One local host answering HEAD /<kind>/<n> after `latency` seconds."""
+    async def handle(request):
+        await asyncio.sleep(latency * (20 if request.match_info["kind"] in slow_paths else 1))
+        if request.match_info["kind"] == "missing":
+            return web.Response(status=404)
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/{kind}/{n}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = _free_port()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _check_all(urls, **checker_kwargs):
+    async with LinkChecker(**checker_kwargs) as checker:
+        return {r["url"]: r async for r in checker.stream(urls)}
+
+
+def test_queueing_behind_same_host_does_not_count_against_timeout():
+    async def run():
+        runner, base = await _serve(latency=0.2)
+        try:
+            # 40 URLs through 4 connections is 10 rounds of 0.2s, well past the 0.5s timeout
+            urls = [f"{base}/ok/{i}" for i in range(40)]
+            return urls, await _check_all(urls, per_host=4, timeout=0.5)
+        finally:
+            await runner.cleanup()
+
+    urls, results = asyncio.run(run())
+
+    assert [results[u]["reason"] for u in urls] == ["ok_head"] * 40
+
+
+def test_slow_url_still_times_out():
+    async def run():
+        runner, base = await _serve(latency=0.05, slow_paths=("slow",))
+        try:
+            return base, await _check_all([f"{base}/slow/1", f"{base}/ok/2", f"{base}/missing/3"], timeout=0.5)
+        finally:
+            await runner.cleanup()
+
+    base, results = asyncio.run(run())
+
+    assert results[f"{base}/slow/1"]["reason"] == "timeout"
+    assert results[f"{base}/ok/2"]["is_valid"]
+    assert results[f"{base}/missing/3"]["reason"] == "404_not_found"
+
+
+def test_classify_status():
+    assert classify_status(200) == {"is_valid": True, "reason": "ok_head"}
+    assert classify_status(301) == {"is_valid": True, "reason": "ok_301"}
+    assert classify_status(403)["reason"] == "403_forbidden"
+    assert classify_status(404)["reason"] == "404_not_found"
+    assert classify_status(500) == {"is_valid": False, "reason": "500_error"}
@@ -0,0 +1,89 @@
+import asyncio
+import random
+
+from temporalio.testing import ActivityEnvironment
+
+from src.activities.research.page_dedup import authority_rank, dedupe_crawled_pages
+from src.utils.simhash import SimHashIndex, hamming, normalize_text, simhash
+
+
+VOCABULARY = (
+    "cyprus residency permit applicants must submit proof of income health insurance "
+    "and a clean criminal record to the civil registry office in nicosia before the "
+    "visa expires while family members may join under the same scheme after approval"
+).split()
+
+
+def story(seed, words=200):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCABULARY) for _ in range(words))
+
+
+def test_normalize_strips_urls_and_link_targets():
+    text = "See [the Guide](https://example.com/guide) at www.example.com, or https://x.io/a!"
+
+    assert normalize_text(text) == ["see", "the", "guide", "at", "or"]
+
+
+def test_simhash_is_stable_under_boilerplate_changes():
+    base = story(1, words=600)
+    restyled = base.replace("nicosia", "Nicosia") + " https://t.co/abc"
+    bylined = "Published by Staff. " + base
+
+    assert simhash("") == 0
+    assert simhash(restyled) == simhash(base)
+    assert hamming(simhash(base), simhash(bylined)) <= 3
+    assert hamming(simhash(base), simhash(story(2, words=600))) > 3
+
+
+def test_index_finds_every_fingerprint_within_distance():
+    rng = random.Random(7)
+    index = SimHashIndex(max_distance=3)
+    fingerprints = {}
+    for key in range(300):
+        fingerprints[key] = rng.getrandbits(64)
+        index.add(key, fingerprints[key])
+    # Plant near neighbours of a few keys
+    for key in range(10):
+        flipped = fingerprints[key]
+        for bit in rng.sample(range(64), key % 4):
+            flipped ^= 1 << bit
+        fingerprints[300 + key] = flipped
+        index.add(300 + key, flipped)
+
+    for probe in range(0, 310, 17):
+        fingerprint = fingerprints[probe]
+        expected = {k for k, f in fingerprints.items() if hamming(f, fingerprint) <= 3}
+        assert {k for k, _ in index.near(fingerprint)} == expected
+
+
+def test_authority_rank():
+    assert authority_rank("https://www.gov.uk/visas") == 2
+    assert authority_rank("https://en.wikipedia.org/wiki/Cyprus") == 1
+    assert authority_rank("https://blog.example.com/cyprus") == 0
+    assert authority_rank("") == 0
+
+
+def test_dedupe_keeps_highest_authority_copy():
+    text = story(1, words=600)
+    pages = [
+        {"url": "https://blog.example.com/a", "content": text + " extra words for length"},
+        {"url": "https://news.example.org/b", "content": story(2)},
+        {"url": "https://www.gov.uk/c", "content": "Source: gov. " + text},
+        {"url": "https://short.example.com/d", "content": "too short to fingerprint"},
+        {"url": "https://short.example.com/e", "content": "too short to fingerprint"},
+    ]
+
+    result = asyncio.run(ActivityEnvironment().run(dedupe_crawled_pages, pages))
+
+    assert [p["url"] for p in result["pages"]] == [
+        "https://news.example.org/b",
+        "https://www.gov.uk/c",
+        "https://short.example.com/d",
+        "https://short.example.com/e",
+    ]
+    (cluster,) = result["duplicate_clusters"]
+    assert cluster["kept"] == "https://www.gov.uk/c"
+    assert cluster["dropped"] == ["https://blog.example.com/a"]
+    assert result["pages_in"] == 5 and result["pages_out"] == 4
+    assert result["chars_saved"] == len(pages[0]["content"])
@@ -0,0 +1,103 @@
+import asyncio
+
+import httpx
+
+from src.utils.page_fetch import MIN_MAIN_CHARS, extract_page, fetch_html, fetch_page
+
+PARAGRAPH = (
+    "<p>The D7 visa lets retirees and remote earners live in Portugal, provided they show "
+    "a stable passive income, private health insurance, and a clean criminal record.</p>"
+)
+
+ARTICLE_PAGE = f"""<html><head><title>  Portugal D7
+ Visa Guide </title><script>var tracking = 1;</script></head>
+<body>
+  <nav><a href="/">Home</a> <a href="/visas">Visas</a></nav>
+  <div class="sidebar"><p>Popular posts, subscribe, and more links, all in one place for you.</p></div>
+  <div id="main" class="article-content">{PARAGRAPH * 6}</div>
+  <div class="comments"><p>Great article, thanks, very helpful, will share with friends!</p></div>
+  <footer>Copyright, all rights reserved, 2025</footer>
+  <a href="https://other.example/page">Other</a>
+</body></html>""".encode()
+
+
+def test_extract_page_picks_main_content_and_drops_chrome():
+    page = extract_page(ARTICLE_PAGE, "https://site.example/guide", with_links=True)
+
+    assert page["title"] == "Portugal D7 Visa Guide"
+    assert page["main_content"]
+    assert page["content"].startswith("The D7 visa lets retirees")
+    for chrome in ("tracking", "Popular posts", "Great article", "Copyright", "Home"):
+        assert chrome not in page["content"]
+    assert page["links"] == ["https://other.example/page"]  # nav links are stripped first
+
+
+def test_extract_page_caps_content():
+    page = extract_page(ARTICLE_PAGE, "https://site.example/guide", max_chars=100)
+
+    assert len(page["content"]) <= 100
+
+
+def test_extract_page_falls_back_to_whole_body_without_paragraphs():
+    html = b"<html><body><ul>" + b"".join(
+        f"<li>Service {i}: executive search and interim placement</li>".encode() for i in range(20)
+    ) + b"</ul></body></html>"
+
+    page = extract_page(html, "https://company.example")
+
+    assert not page["main_content"]
+    assert "Service 19" in page["content"]
+    assert len(page["content"]) >= MIN_MAIN_CHARS
+
+
+def test_extract_page_handles_empty_and_broken_input():
+    assert extract_page(b"", "https://x.example")["content"] == ""
+    assert extract_page(b"   ", "https://x.example")["title"] == ""
+
+
+def _client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler), follow_redirects=True)
+
+
+def test_fetch_html_stops_at_byte_cap():
+    body = b"<html><body>" + b"x" * 100_000 + b"</body></html>"
+
+    async def run():
+        async with _client(lambda request: httpx.Response(200, content=body, headers={"content-type": "text/html"})) as client:
+            return await fetch_html(client, "https://big.example", max_bytes=10_000)
+
+    result = asyncio.run(run())
+
+    assert result["truncated"]
+    assert len(result["html"]) == 10_000
+
+
+def test_fetch_html_rejects_non_html_and_errors():
+    def handler(request):
+        if request.url.path == "/file.pdf":
+            return httpx.Response(200, content=b"%PDF", headers={"content-type": "application/pdf"})
+        return httpx.Response(404)
+
+    async def run():
+        async with _client(handler) as client:
+            return (
+                await fetch_html(client, "https://site.example/file.pdf"),
+                await fetch_html(client, "https://site.example/missing"),
+            )
+
+    pdf, missing = asyncio.run(run())
+
+    assert pdf["html"] is None and pdf["error"] == "Not HTML: application/pdf"
+    assert missing["html"] is None and missing["error"] == "HTTP 404"
+
+
+def test_fetch_page_extracts_off_the_event_loop():
+    async def run():
+        async with _client(lambda request: httpx.Response(200, content=ARTICLE_PAGE, headers={"content-type": "text/html"})) as client:
+            return await fetch_page(client, "https://site.example/guide")
+
+    page = asyncio.run(run())
+
+    assert page["success"]
+    assert page["title"] == "Portugal D7 Visa Guide"
+    assert page["content"].startswith("The D7 visa")
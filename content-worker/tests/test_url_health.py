@@ -0,0 +1,89 @@
+import asyncio
+import time
+from datetime import timedelta
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from src.activities.validation import url_health
+from src.activities.validation.url_health import (
+    get_url_health,
+    is_gov_domain,
+    normalize_url,
+    put_url_health,
+    ttl_for,
+)
+
+
+@pytest.fixture(autouse=True)
+def memory_only(monkeypatch):
+    monkeypatch.setattr(url_health.config, "DATABASE_URL", "")
+    monkeypatch.setattr(url_health, "_memory", {})
+
+
+def run(fn, *args):
+    return asyncio.run(ActivityEnvironment().run(fn, *args))
+
+
+def test_normalize_url():
+    assert normalize_url("HTTPS://WWW.Example.com:443/Path/?utm_source=x&b=2&a=1&fbclid=z#top") == \
+        "https://example.com/Path?a=1&b=2"
+    assert normalize_url("http://example.com:8080") == "http://example.com:8080/"
+    assert normalize_url("https://example.com/") == normalize_url("https://www.example.com")
+
+
+def test_gov_domains_and_ttls():
+    assert is_gov_domain("www.gov.uk")
+    assert is_gov_domain("moi.gov.cy:443")
+    assert is_gov_domain("ec.europa.eu")
+    assert not is_gov_domain("governance.example.com")
+
+    assert ttl_for("validated", "https://gov.uk/visa") == timedelta(days=30)
+    assert ttl_for("validated", "https://example.com") == timedelta(days=7)
+    assert ttl_for("uncertain", "https://gov.uk/visa") == timedelta(hours=1)
+    assert ttl_for("something_else", "https://example.com") == timedelta(days=1)
+
+
+def test_put_then_get_matches_equivalent_urls():
+    stored = run(put_url_health, [
+        {"url": "https://www.example.com/guide/", "status": "validated", "score": 1.0, "reason": "ok"},
+        {"url": "https://example.com/down", "status": "uncertain", "score": 0.5,
+         "reason": "service_error_passthrough"},
+    ])
+
+    found = run(get_url_health, ["https://example.com/guide?utm_medium=email", "https://example.com/down"])
+
+    assert stored == 1
+    assert list(found) == ["https://example.com/guide?utm_medium=email"]
+    assert found["https://example.com/guide?utm_medium=email"]["status"] == "validated"
+
+
+def test_expired_records_are_ignored():
+    run(put_url_health, [{"url": "https://example.com/a", "status": "broken", "score": 0.0}])
+    url_health._memory["https://example.com/a"]["expires_at"] = time.time() - 1
+
+    assert run(get_url_health, ["https://example.com/a"]) == {}
+
+
+def test_memory_drops_entries_closest_to_expiry(monkeypatch):
+    monkeypatch.setattr(url_health, "MAX_MEMORY_ENTRIES", 4)
+    for i, expires in enumerate([40, 10, 30, 20]):
+        url_health._remember(f"k{i}", {"expires_at": expires})
+
+    url_health._remember("new", {"expires_at": 50})
+
+    assert set(url_health._memory) == {"k0", "k2", "new"}
+
+
+def test_database_failure_falls_back_to_memory(monkeypatch):
+    async def refuse(*args, **kwargs):
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(url_health.config, "DATABASE_URL", "postgresql://unreachable/db")
+    monkeypatch.setattr(url_health.psycopg.AsyncConnection, "connect", refuse)
+
+    stored = run(put_url_health, [{"url": "https://gov.uk/visa", "status": "validated", "score": 1.0}])
+    found = run(get_url_health, ["https://gov.uk/visa", "https://example.com/unknown"])
+
+    assert stored == 1
+    assert list(found) == ["https://gov.uk/visa"]
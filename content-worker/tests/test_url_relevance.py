@@ -0,0 +1,73 @@
+import asyncio
+import logging
+
+import numpy as np
+
+from src.activities.research import url_relevance
+from src.activities.research.crawl4ai_service import prefilter_urls_by_relevancy
+from src.activities.research.url_relevance import otsu_threshold, select_relevant
+from src.utils import embeddings
+from src.utils.config import config
+
+CANDIDATES = [
+    {"url": "https://a.example/d7", "title": "Portugal D7 visa requirements", "snippet": "Income and documents for the D7 visa"},
+    {"url": "https://b.example/d8", "title": "Portugal digital nomad visa", "snippet": "Remote workers can apply for the D8 visa"},
+    {"url": "https://c.example/food", "title": "Best pastel de nata in Lisbon", "snippet": "Where to eat in Portugal"},
+    {"url": "https://d.example/spain", "title": "Spain non-lucrative visa", "snippet": "Requirements for retirees"},
+]
+
+
+def test_otsu_threshold_splits_two_groups():
+    scores = np.array([0.05, 0.08, 0.1, 0.62, 0.7, 0.75])
+
+    assert 0.1 < otsu_threshold(scores) < 0.62
+
+
+def test_select_relevant_keeps_high_scores_best_first():
+    scores = np.array([0.3, 0.8, 0.1, 0.75, 0.05], dtype=np.float32)
+
+    kept, threshold = select_relevant(scores, "embedding", max_urls=10)
+
+    assert kept == [1, 3]
+    assert threshold >= url_relevance.SCORE_FLOORS["embedding"]
+
+
+def test_select_relevant_caps_at_max_urls():
+    kept, _ = select_relevant(np.array([0.9, 0.85, 0.88, 0.1]), "embedding", max_urls=2)
+
+    assert kept == [0, 2]
+
+
+def test_embedding_scorer_falls_back_to_keyword_without_provider(monkeypatch):
+    monkeypatch.setattr(config, "OPENAI_API_KEY", None)
+    monkeypatch.setattr(config, "GOOGLE_API_KEY", None)
+
+    result = asyncio.run(prefilter_urls_by_relevancy(CANDIDATES, "Portugal D7 visa", 2, 30, "embedding"))
+
+    assert result["scorer"] == "keyword"
+    assert result["relevant_urls"] == ["https://a.example/d7", "https://b.example/d8"]
+
+
+def test_failed_embedding_call_is_logged(monkeypatch, caplog):
+    import openai
+
+    class FailingClient:
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("quota exceeded")
+
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(openai, "AsyncClient", FailingClient)
+
+    with caplog.at_level(logging.WARNING, logger=embeddings.__name__):
+        vectors = asyncio.run(embeddings.embed_texts(["topic", "text"]))
+
+    assert vectors is None
+    assert "quota exceeded" in caplog.text
+
+
+def test_hashed_vectors_are_unit_length_and_rank_related_text_higher():
+    vectors = embeddings.hashed_tfidf(["relocating to Portugal", "relocation guide for Portugal", "chocolate cake recipe"])
+
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0)
+    scores = vectors[1:] @ vectors[0]
+    assert scores[0] > scores[1]
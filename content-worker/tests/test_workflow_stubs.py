@@ -0,0 +1,67 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+import benchmark_workflows  # noqa: E402  (blanks provider credentials on import)
+from src.activities.generation.country_guide_generation import extract_country_facts  # noqa: E402
+from workflow_stubs import ProviderStubs  # noqa: E402
+
+
+@pytest.fixture
+def stubs():
+    return ProviderStubs.from_fixture(latency_scale=0, seed=7)
+
+
+def _activity(stubs, name):
+    for fn in stubs.activities():
+        if fn.__name__ == f"stub_{name}":
+            return fn
+    raise KeyError(name)
+
+
+def test_every_benchmarked_activity_is_served(stubs, capsys):
+    assert benchmark_workflows.check_coverage(stubs) == 0
+    assert "returns {} (no stub)" not in capsys.readouterr().out
+
+
+def test_stub_results_are_deterministic(stubs):
+    search = _activity(stubs, "serper_news_search")
+
+    first = asyncio.run(search("portugal visa"))
+    second = asyncio.run(search("portugal visa"))
+
+    assert first == second
+    assert first["articles"]
+
+
+def test_news_searches_accept_a_keywords_list(stubs):
+    serper = asyncio.run(_activity(stubs, "serper_news_search")(["portugal visa", "lisbon"]))
+    dataforseo = asyncio.run(_activity(stubs, "dataforseo_news_search")(["portugal visa", "lisbon"]))
+
+    assert all("portugal-visa" in a["url"] for a in serper["articles"])
+    assert all("portugal-visa" in a["url"] for a in dataforseo["articles"])
+
+
+def test_stub_failure_is_non_retryable(stubs):
+    generate = _activity(stubs, "generate_four_act_article")
+
+    with pytest.raises(ApplicationError) as exc:
+        asyncio.run(generate("topic", "guide", "relocation", None))
+
+    assert exc.value.non_retryable
+    assert exc.value.type == "StubError"
+
+
+def test_country_guide_stub_feeds_fact_extraction(stubs):
+    guide = asyncio.run(_activity(stubs, "generate_country_guide_content")(
+        "Portugal", "PT", {"curated_sources": []}, {}, 4000, "story"
+    ))
+
+    facts = asyncio.run(extract_country_facts(guide))
+
+    assert facts["dn_visa_duration"] == "Valid for 1 year"
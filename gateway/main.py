@@ -36,7 +36,9 @@ async def lifespan(app: FastAPI):
     - Validate environment variables
 
     Shutdown:
+    - Flush pending ZEP user graph syncs
     - Close Temporal client connection
+    - Close profile database connection pool
     """
     # Startup
     print("🚀 Quest Gateway starting...")
@@ -59,7 +61,17 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("\n👋 Quest Gateway shutting down...")
+    try:
+        from services.zep_sync_queue import zep_user_sync_queue
+        await zep_user_sync_queue.close()
+    except Exception as e:
+        print(f"⚠️  ZEP sync queue flush failed: {e}")
     await TemporalClientManager.close()
+    try:
+        from services.user_profile_service import user_profile_service
+        await user_profile_service.close()
+    except Exception as e:
+        print(f"⚠️  Profile DB pool close failed: {e}")
     print("✅ Cleanup complete")
 
 
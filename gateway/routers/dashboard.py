@@ -40,6 +40,13 @@ except ImportError:
     CONTENT_SERVICE_ENABLED = False
     logger.warning("content_service_not_available")
 
+# Import ZEP user graph sync queue
+try:
+    from services.zep_sync_queue import zep_user_sync_queue
+except ImportError:
+    zep_user_sync_queue = None
+    logger.warning("zep_user_sync_queue_not_available")
+
 
 # ============================================================================
 # AUTH
@@ -111,6 +118,9 @@ async def stream_dashboard_events(
             pass
         finally:
             await unsubscribe(effective_user_id, queue)
+            # Dashboard closed - push any pending profile changes to ZEP now
+            if zep_user_sync_queue:
+                zep_user_sync_queue.session_ended(effective_user_id)
 
     return EventSourceResponse(event_generator())
 
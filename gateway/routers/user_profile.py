@@ -39,6 +39,12 @@ except ImportError as e:
     ZEP_USER_GRAPH_ENABLED = False
     logger.warning("zep_user_graph_service_import_failed", error=str(e))
 
+try:
+    from services.zep_sync_queue import zep_user_sync_queue
+except ImportError as e:
+    zep_user_sync_queue = None
+    logger.warning("zep_user_sync_queue_import_failed", error=str(e))
+
 
 # ============================================================================
 # REQUEST/RESPONSE MODELS
@@ -415,21 +421,10 @@ async def update_fact_simple(
             except Exception as evt_err:
                 logger.debug("emit_fact_updated_error", error=str(evt_err))
 
-            # Sync to ZEP User Graph after fact update
+            # Sync to ZEP User Graph after fact update (background, debounced)
             try:
-                if ZEP_USER_GRAPH_ENABLED and zep_user_graph_service:
-                    profile = await user_profile_service.get_profile_by_stack_id(user_id)
-                    all_facts = await user_profile_service.get_facts_by_stack_id(user_id, active_only=True)
-                    sync_result = await zep_user_graph_service.sync_user_profile(
-                        user_id=user_id,
-                        profile=profile or {},
-                        facts=all_facts,
-                        app_id="relocation"
-                    )
-                    logger.info("zep_graph_synced_from_repo",
-                               user_id=user_id,
-                               fact_type=request.fact_type,
-                               facts_synced=sync_result.get("facts_synced", 0))
+                if ZEP_USER_GRAPH_ENABLED and zep_user_sync_queue:
+                    zep_user_sync_queue.schedule(user_id, app_id="relocation")
             except Exception as zep_err:
                 logger.warning("zep_sync_error_from_repo", error=str(zep_err))
 
@@ -453,15 +448,8 @@ async def update_fact_simple(
                     if success:
                         # Sync to ZEP after update by type
                         try:
-                            if ZEP_USER_GRAPH_ENABLED and zep_user_graph_service:
-                                profile = await user_profile_service.get_profile_by_stack_id(user_id)
-                                all_facts = await user_profile_service.get_facts_by_stack_id(user_id, active_only=True)
-                                await zep_user_graph_service.sync_user_profile(
-                                    user_id=user_id,
-                                    profile=profile or {},
-                                    facts=all_facts,
-                                    app_id="relocation"
-                                )
+                            if ZEP_USER_GRAPH_ENABLED and zep_user_sync_queue:
+                                zep_user_sync_queue.schedule(user_id, app_id="relocation")
                         except Exception as zep_err:
                             logger.warning("zep_sync_error_from_repo", error=str(zep_err))
 
@@ -484,15 +472,8 @@ async def update_fact_simple(
 
             # Sync to ZEP after new fact creation
             try:
-                if ZEP_USER_GRAPH_ENABLED and zep_user_graph_service:
-                    profile = await user_profile_service.get_profile_by_stack_id(user_id)
-                    all_facts = await user_profile_service.get_facts_by_stack_id(user_id, active_only=True)
-                    await zep_user_graph_service.sync_user_profile(
-                        user_id=user_id,
-                        profile=profile or {},
-                        facts=all_facts,
-                        app_id="relocation"
-                    )
+                if ZEP_USER_GRAPH_ENABLED and zep_user_sync_queue:
+                    zep_user_sync_queue.schedule(user_id, app_id="relocation")
             except Exception as zep_err:
                 logger.warning("zep_sync_error_from_repo", error=str(zep_err))
 
@@ -604,19 +585,18 @@ async def sync_profile_to_zep(
         )
 
     try:
-        # Get profile from Neon
-        profile = await user_profile_service.get_profile_by_stack_id(user_id)
-
-        # Get facts from Neon
-        facts = await user_profile_service.get_facts_by_stack_id(user_id, active_only=True)
-
-        # Sync to ZEP
-        result = await zep_user_graph_service.sync_user_profile(
-            user_id=user_id,
-            profile=profile or {},
-            facts=facts,
-            app_id=request.app_id
-        )
+        if zep_user_sync_queue:
+            # Sync now, folding in any pending debounced sync for this user
+            result = await zep_user_sync_queue.flush(user_id, app_id=request.app_id)
+        else:
+            profile = await user_profile_service.get_profile_by_stack_id(user_id)
+            facts = await user_profile_service.get_facts_by_stack_id(user_id, active_only=True)
+            result = await zep_user_graph_service.sync_user_profile(
+                user_id=user_id,
+                profile=profile or {},
+                facts=facts,
+                app_id=request.app_id
+            )
 
         return ZepSyncResponse(
             success=result.get("success", False),
@@ -53,6 +53,26 @@ except Exception as e:
     USER_PROFILE_ENABLED = False
     logger.warning("user_profile_service_init_failed", error=str(e))
 
+# Import semantic answer cache (shared tier for non-personalized answers)
+try:
+    from services.answer_cache import answer_cache
+    ANSWER_CACHE_ENABLED = answer_cache.enabled
+    logger.info("answer_cache_imported", enabled=ANSWER_CACHE_ENABLED)
+except Exception as e:
+    answer_cache = None
+    ANSWER_CACHE_ENABLED = False
+    logger.warning("answer_cache_import_failed", error=str(e))
+
+# Import ZEP user graph sync queue (debounced background profile syncs)
+try:
+    from services.zep_sync_queue import zep_user_sync_queue
+    ZEP_USER_GRAPH_ENABLED = zep_user_sync_queue.enabled
+    logger.info("zep_user_sync_queue_imported", enabled=ZEP_USER_GRAPH_ENABLED)
+except Exception as e:
+    zep_user_sync_queue = None
+    ZEP_USER_GRAPH_ENABLED = False
+    logger.warning("zep_user_sync_queue_import_failed", error=str(e))
+
 
 # ============================================================================
 # CONFIGURATION
@@ -295,14 +315,93 @@ class GeminiAssistant:
             logger.error("gemini_init_error", error=str(e))
             self.model = None
 
-    async def process_query(self, query: str, thread_id: str = None, user_id: str = "anonymous") -> str:
+    async def prepare_query(self, query: str, thread_id: str = None, user_id: str = "anonymous") -> Dict[str, Any]:
+        """
+        Load per-user context for a query and, if the turn isn't personalized,
+        look it up in the shared semantic answer cache.
+
+        Returns:
+            Dict with supermemory_context, neon_profile_context, zep_memory_context,
+            shareable (no per-user context or personal details) and cached
+            (answer_cache hit or None)
+        """
+        # Get SuperMemory personalized context (user preferences, past conversations)
+        supermemory_context = ""
+        if self.memory_manager and user_id != "anonymous":
+            try:
+                supermemory_context = await self.memory_manager.get_personalized_context(
+                    user_id=user_id,
+                    current_query=query
+                )
+                if supermemory_context:
+                    supermemory_context = f"\n\nUser personalization (from memory):\n{supermemory_context}"
+                    logger.info("supermemory_context_loaded", user_id=user_id)
+            except Exception as e:
+                logger.warning("supermemory_context_error", error=str(e), user_id=user_id)
+
+        # Get Neon profile context (structured facts from database)
+        neon_profile_context = ""
+        if user_profile_service and USER_PROFILE_ENABLED and user_id != "anonymous":
+            try:
+                profile_context = await user_profile_service.get_profile_context_for_prompt(user_id)
+                if profile_context:
+                    neon_profile_context = f"\n\n{profile_context}"
+                    logger.info("neon_profile_context_loaded", user_id=user_id)
+            except Exception as e:
+                logger.warning("neon_profile_context_error", error=str(e), user_id=user_id)
+
+        # Get ZEP conversation context if thread exists
+        zep_memory_context = ""
+        if thread_id and self.zep_graph.client:
+            try:
+                memory = self.zep_graph.client.thread.get_user_context(thread_id=thread_id)
+                if memory and hasattr(memory, 'context') and memory.context:
+                    zep_memory_context = f"\n\nConversation context:\n{memory.context}"
+                    logger.info("zep_memory_loaded", thread_id=thread_id)
+            except Exception as e:
+                logger.warning("zep_memory_error", error=str(e), thread_id=thread_id)
+
+        prepared = {
+            "supermemory_context": supermemory_context,
+            "neon_profile_context": neon_profile_context,
+            "zep_memory_context": zep_memory_context,
+            "shareable": False,
+            "cached": None
+        }
+
+        # Shared answers only for turns with nothing user-specific in or around them
+        prepared["shareable"] = bool(
+            answer_cache is not None and ANSWER_CACHE_ENABLED
+            and not (supermemory_context or neon_profile_context or zep_memory_context)
+            and not self._extract_user_info(query)
+        )
+        if prepared["shareable"]:
+            try:
+                prepared["cached"] = await answer_cache.lookup(query)
+            except Exception as e:
+                logger.warning("answer_cache_lookup_error", error=str(e))
+
+        return prepared
+
+    async def process_query(
+        self,
+        query: str,
+        thread_id: str = None,
+        user_id: str = "anonymous",
+        prepared: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Process a query using Gemini + Zep knowledge graph + Neon fallback + SuperMemory
 
+        Non-personalized turns are answered from the semantic answer cache
+        when a similar question was answered before, and their answers are
+        added to it.
+
         Args:
             query: User's question
             thread_id: Optional ZEP thread ID for conversation memory
             user_id: User identifier for SuperMemory personalization
+            prepared: Result of prepare_query() if the caller already ran it
 
         Returns:
             Generated response text optimized for voice, with links section appended
@@ -311,41 +410,36 @@ class GeminiAssistant:
             return "I apologize, but the assistant is currently unavailable. Please try again later."
 
         try:
-            # Get SuperMemory personalized context (user preferences, past conversations)
-            supermemory_context = ""
-            if self.memory_manager and user_id != "anonymous":
-                try:
-                    supermemory_context = await self.memory_manager.get_personalized_context(
-                        user_id=user_id,
-                        current_query=query
-                    )
-                    if supermemory_context:
-                        supermemory_context = f"\n\nUser personalization (from memory):\n{supermemory_context}"
-                        logger.info("supermemory_context_loaded", user_id=user_id)
-                except Exception as e:
-                    logger.warning("supermemory_context_error", error=str(e), user_id=user_id)
-
-            # Get Neon profile context (structured facts from database)
-            neon_profile_context = ""
-            if user_profile_service and USER_PROFILE_ENABLED and user_id != "anonymous":
-                try:
-                    profile_context = await user_profile_service.get_profile_context_for_prompt(user_id)
-                    if profile_context:
-                        neon_profile_context = f"\n\n{profile_context}"
-                        logger.info("neon_profile_context_loaded", user_id=user_id)
-                except Exception as e:
-                    logger.warning("neon_profile_context_error", error=str(e), user_id=user_id)
-
-            # Get ZEP conversation context if thread exists
-            zep_memory_context = ""
-            if thread_id and self.zep_graph.client:
-                try:
-                    memory = self.zep_graph.client.thread.get_user_context(thread_id=thread_id)
-                    if memory and hasattr(memory, 'context') and memory.context:
-                        zep_memory_context = f"\n\nConversation context:\n{memory.context}"
-                        logger.info("zep_memory_loaded", thread_id=thread_id)
-                except Exception as e:
-                    logger.warning("zep_memory_error", error=str(e), thread_id=thread_id)
+            if prepared is None:
+                prepared = await self.prepare_query(query, thread_id=thread_id, user_id=user_id)
+            supermemory_context = prepared["supermemory_context"]
+            neon_profile_context = prepared["neon_profile_context"]
+            zep_memory_context = prepared["zep_memory_context"]
+
+            cached = prepared["cached"]
+            if cached:
+                # Keep the user's conversation history even when the answer is shared
+                if self.memory_manager and user_id != "anonymous":
+                    try:
+                        await self.memory_manager.store_conversation_turn(
+                            user_id=user_id,
+                            user_message=query,
+                            assistant_response=cached["answer"][:500],
+                            extracted_info={}
+                        )
+                    except Exception as e:
+                        logger.warning("supermemory_store_error", error=str(e))
+
+                memory_json = json.dumps({
+                    "neon_profile_used": False,
+                    "supermemory_used": False,
+                    "zep_thread_used": False,
+                    "zep_knowledge_used": cached["source"] == "zep",
+                    "knowledge_source": cached["source"],
+                    "answer_cache": {"similarity": cached["similarity"]},
+                    "user_id": user_id if user_id != "anonymous" else None
+                })
+                return f"{cached['answer']}\n\n---MEMORY---\n{memory_json}"
 
             # Search knowledge graph for relevant context (using graph_id now)
             kg_results = await self.zep_graph.search(query)
@@ -613,22 +707,13 @@ TONE:
                                            user_id=user_id,
                                            facts_count=len(extracted_info))
 
-                                # Auto-sync to ZEP User Graph after fact storage
+                                # Sync to ZEP User Graph in the background (debounced,
+                                # one episode per pause in the conversation)
                                 try:
-                                    if ZEP_USER_GRAPH_ENABLED and zep_user_graph_service:
-                                        profile = await user_profile_service.get_profile_by_stack_id(user_id)
-                                        all_facts = await user_profile_service.get_facts_by_stack_id(user_id, active_only=True)
-                                        sync_result = await zep_user_graph_service.sync_user_profile(
-                                            user_id=user_id,
-                                            profile=profile or {},
-                                            facts=all_facts,
-                                            app_id="relocation"
-                                        )
-                                        logger.info("zep_graph_synced",
-                                                   user_id=user_id,
-                                                   facts_synced=sync_result.get("facts_synced", 0))
+                                    if ZEP_USER_GRAPH_ENABLED and zep_user_sync_queue:
+                                        zep_user_sync_queue.schedule(user_id, app_id="relocation")
                                 except Exception as zep_err:
-                                    logger.warning("zep_sync_error", error=str(zep_err))
+                                    logger.warning("zep_sync_schedule_error", error=str(zep_err))
 
                     except Exception as e:
                         logger.warning("neon_facts_store_error", error=str(e))
@@ -644,6 +729,10 @@ TONE:
                     links_json = json.dumps(related_links)
                     response_text = f"{response_text}\n\n---LINKS---\n{links_json}"
 
+                # Share non-personalized answers (without per-user memory metadata)
+                if prepared["shareable"]:
+                    answer_cache.store_soon(query, response_text, source, related_links)
+
                 # Add memory metadata for debugging/UX
                 memory_meta = {
                     "neon_profile_used": bool(neon_profile_context),
@@ -1320,6 +1409,10 @@ async def voice_chat(
         # Text-only mode (no Hume voice)
         await handle_text_chat(websocket, user_id, gemini_assistant)
 
+    # Session over - push any pending profile changes to ZEP now
+    if zep_user_sync_queue:
+        zep_user_sync_queue.session_ended(user_id)
+
 
 @router.post("/query")
 async def text_query(
@@ -1510,6 +1603,11 @@ async def _generate_sse_response(messages: list, user_id: str = "anonymous"):
 
     chunk_id = f"chatcmpl-{int(datetime.utcnow().timestamp())}"
 
+    # Per-user context + shared answer cache lookup, running while the bridge is sent
+    prepare_task = asyncio.create_task(
+        gemini_assistant.prepare_query(user_message, user_id=user_id or "anonymous")
+    )
+
     try:
         # Send bridge expression for complex queries to hide processing time
         if is_complex_query:
@@ -1527,8 +1625,12 @@ async def _generate_sse_response(messages: list, user_id: str = "anonymous"):
             }
             yield f"data: {json.dumps(bridge_chunk)}\n\n"
 
+        prepared = await prepare_task
+
         # Get response from Gemini + Zep (with user_id for profile/fact storage)
-        response_text = await gemini_assistant.process_query(user_message, user_id=user_id)
+        response_text = await gemini_assistant.process_query(
+            user_message, user_id=user_id, prepared=prepared
+        )
 
         # Stream response in chunks (simulating streaming for better UX)
         words = response_text.split()
@@ -1566,6 +1668,11 @@ async def _generate_sse_response(messages: list, user_id: str = "anonymous"):
         yield f"data: {json.dumps(error_event)}\n\n"
         yield "data: [DONE]\n\n"
 
+    finally:
+        # Client disconnected before the lookup finished
+        if not prepare_task.done():
+            prepare_task.cancel()
+
 
 @router.post("/chat/completions")
 async def custom_llm_endpoint_sse(request: Request, custom_session_id: Optional[str] = Query(None)):
@@ -1641,6 +1748,11 @@ async def service_status():
                 "api_key_set": bool(GEMINI_API_KEY),
                 "assistant_initialized": gemini_assistant is not None,
                 "model_ready": gemini_assistant is not None and gemini_assistant.model is not None
+            },
+            "answer_cache": {
+                "enabled": ANSWER_CACHE_ENABLED,
+                "entries": len(answer_cache) if answer_cache is not None else 0,
+                **(answer_cache.stats if answer_cache is not None else {})
             }
         },
         "overall_ready": all([
@@ -17,6 +17,16 @@ from .zep_user_graph import (
     zep_user_graph_service
 )
 
+from .answer_cache import (
+    SemanticAnswerCache,
+    answer_cache
+)
+
+from .zep_sync_queue import (
+    ZepUserSyncQueue,
+    zep_user_sync_queue
+)
+
 __all__ = [
     "SuperMemoryClient",
     "UserMemoryManager",
@@ -25,5 +35,9 @@ __all__ = [
     "UserProfileService",
     "user_profile_service",
     "ZepUserGraphService",
-    "zep_user_graph_service"
+    "zep_user_graph_service",
+    "SemanticAnswerCache",
+    "answer_cache",
+    "ZepUserSyncQueue",
+    "zep_user_sync_queue"
 ]
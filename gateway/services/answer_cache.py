@@ -0,0 +1,380 @@
+"""
+Semantic Answer Cache
+
+Shared cache of non-personalized voice/text assistant answers, matched by
+query embedding similarity.
+
+- lookup(): exact (normalized) query match, else cosine similarity of the
+  query's Gemini embedding against cached queries, at or above
+  ANSWER_CACHE_SIMILARITY, for a cached query naming the same countries and
+  numbers ("cost of living in Cyprus" never gets the Malta answer, however
+  similar the embeddings).
+- store(): only called for turns with no per-user context (no profile,
+  SuperMemory or thread memory, no personal details in the query), so
+  personalized answers never enter the shared tier.
+- Invalidation: every CONTENT_CHECK_SECONDS a lookup triggers a background
+  check for articles/countries updated (republished) since the last check;
+  entries linking those slugs or mentioning those countries are dropped.
+  ANSWER_CACHE_TTL_SECONDS bounds everything else (Zep-sourced answers).
+"""
+
+import os
+import re
+import time
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Set
+import structlog
+
+import numpy as np
+
+logger = structlog.get_logger()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+ANSWER_CACHE_SIMILARITY = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.92"))
+ANSWER_CACHE_TTL_SECONDS = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "2000"))
+CONTENT_CHECK_SECONDS = 60
+EMBEDDING_MODEL = "models/text-embedding-004"
+
+# Recent query embeddings, so a miss isn't embedded again when its answer is stored
+QUERY_VECTOR_CACHE_SIZE = 256
+
+
+# Countries, cities and demonyms -> country, for the entity guard
+PLACES = {
+    "cyprus": "cyprus", "cypriot": "cyprus", "limassol": "cyprus", "paphos": "cyprus",
+    "portugal": "portugal", "portuguese": "portugal", "lisbon": "portugal", "porto": "portugal",
+    "spain": "spain", "spanish": "spain", "madrid": "spain", "barcelona": "spain", "valencia": "spain",
+    "malta": "malta", "maltese": "malta",
+    "greece": "greece", "greek": "greece", "athens": "greece",
+    "italy": "italy", "italian": "italy", "rome": "italy", "milan": "italy",
+    "france": "france", "french": "france", "paris": "france",
+    "germany": "germany", "german": "germany", "berlin": "germany",
+    "netherlands": "netherlands", "dutch": "netherlands", "amsterdam": "netherlands",
+    "dubai": "uae", "uae": "uae", "emirates": "uae", "abu dhabi": "uae",
+    "uk": "uk", "britain": "uk", "british": "uk", "england": "uk", "united kingdom": "uk", "london": "uk",
+    "usa": "usa", "america": "usa", "american": "usa", "united states": "usa",
+    "canada": "canada", "canadian": "canada",
+    "australia": "australia", "australian": "australia",
+    "thailand": "thailand", "thai": "thailand", "bangkok": "thailand",
+    "bali": "indonesia", "indonesia": "indonesia",
+    "mexico": "mexico", "mexican": "mexico",
+    "costa rica": "costa rica", "panama": "panama", "colombia": "colombia", "brazil": "brazil",
+    "ireland": "ireland", "irish": "ireland", "dublin": "ireland",
+    "switzerland": "switzerland", "swiss": "switzerland",
+    "austria": "austria", "poland": "poland", "hungary": "hungary", "croatia": "croatia",
+    "estonia": "estonia", "latvia": "latvia", "lithuania": "lithuania",
+    "czech republic": "czech republic", "czech": "czech republic", "prague": "czech republic",
+    "singapore": "singapore", "japan": "japan", "japanese": "japan",
+    "new zealand": "new zealand",
+}
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, punctuation-free, single-spaced query text."""
+    return " ".join(re.sub(r"[^\w\s]", " ", query.lower()).split())
+
+
+def query_entities(normalized: str) -> frozenset:
+    """Places (as countries) and numbers named in a normalized query."""
+    words = normalized.split()
+    entities = set()
+    i = 0
+    while i < len(words):
+        pair = " ".join(words[i:i + 2])
+        if i + 1 < len(words) and pair in PLACES:
+            entities.add(PLACES[pair])
+            i += 2
+            continue
+        if words[i] in PLACES:
+            entities.add(PLACES[words[i]])
+        elif words[i].isdigit():
+            entities.add(words[i])
+        i += 1
+    return frozenset(entities)
+
+
+async def gemini_embed(text: str) -> Optional[List[float]]:
+    """Gemini embedding for text, or None if unavailable."""
+    if not GEMINI_API_KEY:
+        return None
+    import google.generativeai as genai
+
+    def embed():
+        genai.configure(api_key=GEMINI_API_KEY)
+        result = genai.embed_content(model=EMBEDDING_MODEL, content=text, task_type="semantic_similarity")
+        return result["embedding"]
+
+    return await asyncio.to_thread(embed)
+
+
+class SemanticAnswerCache:
+    """
+    In-process semantic cache of shared (non-personalized) answers.
+
+    Usage:
+        hit = await answer_cache.lookup(query)
+        if hit:
+            return hit["answer"]
+        ...
+        answer_cache.store_soon(query, answer, source, related_links)
+    """
+
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        embed=gemini_embed,
+        similarity: float = ANSWER_CACHE_SIMILARITY,
+        ttl_seconds: float = ANSWER_CACHE_TTL_SECONDS,
+        max_entries: int = ANSWER_CACHE_MAX_ENTRIES
+    ):
+        self.database_url = database_url or DATABASE_URL
+        self.enabled = ANSWER_CACHE_ENABLED and bool(GEMINI_API_KEY or embed is not gemini_embed)
+        self._embed = embed
+        self.similarity = similarity
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # Rows of _matrix line up with _entries
+        self._entries: List[Dict[str, Any]] = []
+        self._matrix: Optional[np.ndarray] = None
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+
+        self._content_checked_at = datetime.now(timezone.utc)
+        self._next_content_check = time.monotonic() + CONTENT_CHECK_SECONDS
+
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "invalidated": 0, "expired": 0}
+
+        if self.enabled:
+            logger.info("answer_cache_initialized", similarity=similarity, ttl_seconds=ttl_seconds)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========================================================================
+    # LOOKUP / STORE
+    # ========================================================================
+
+    async def _vector(self, normalized: str) -> Optional[np.ndarray]:
+        vector = self._vectors.get(normalized)
+        if vector is not None:
+            self._vectors.move_to_end(normalized)
+            return vector
+
+        embedding = await self._embed(normalized)
+        if not embedding:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if not norm:
+            return None
+        vector /= norm
+
+        self._vectors[normalized] = vector
+        while len(self._vectors) > QUERY_VECTOR_CACHE_SIZE:
+            self._vectors.popitem(last=False)
+        return vector
+
+    async def lookup(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached answer for a query similar to one answered before.
+
+        Returns:
+            Dict with answer, source, similarity, matched_query - or None
+        """
+        if not self.enabled:
+            return None
+
+        self._maybe_check_content()
+        self._expire()
+        normalized = normalize_query(query)
+        if not normalized or not self._entries:
+            self.stats["misses"] += 1
+            return None
+
+        best = None
+        for i, entry in enumerate(self._entries):
+            if entry["normalized"] == normalized:
+                best, similarity = i, 1.0
+                break
+        else:
+            vector = await self._vector(normalized)
+            if vector is not None and self._matrix is not None and len(vector) == self._matrix.shape[1]:
+                similarities = self._matrix @ vector
+                entities = query_entities(normalized)
+                # Most similar first; the answer must be about the same places/numbers
+                for i in sorted(np.flatnonzero(similarities >= self.similarity), key=lambda i: -similarities[i]):
+                    if self._entries[i]["entities"] == entities:
+                        best, similarity = int(i), float(similarities[i])
+                        break
+
+        if best is None:
+            self.stats["misses"] += 1
+            return None
+
+        entry = self._entries[best]
+        entry["hits"] += 1
+        self.stats["hits"] += 1
+        logger.info("answer_cache_hit", query=query[:100], matched=entry["query"][:100], similarity=round(similarity, 4))
+        return {
+            "answer": entry["answer"],
+            "source": entry["source"],
+            "similarity": round(similarity, 4),
+            "matched_query": entry["query"]
+        }
+
+    async def store(
+        self,
+        query: str,
+        answer: str,
+        source: Optional[str] = None,
+        related_links: Optional[Dict[str, List[Dict[str, str]]]] = None
+    ) -> bool:
+        """Add a non-personalized answer to the shared cache."""
+        if not self.enabled or not answer:
+            return False
+
+        normalized = normalize_query(query)
+        vector = await self._vector(normalized) if normalized else None
+        if vector is None:
+            return False
+        if self._matrix is not None and len(vector) != self._matrix.shape[1]:
+            return False
+
+        # Slugs linked from the answer, for republish invalidation
+        slugs = set()
+        for links in (related_links or {}).values():
+            for link in links:
+                slug = link.get("url", "").rstrip("/").rsplit("/", 1)[-1]
+                if slug:
+                    slugs.add(slug)
+
+        self._entries.append({
+            "query": query,
+            "normalized": normalized,
+            "entities": query_entities(normalized),
+            "answer": answer,
+            "source": source,
+            "slugs": slugs,
+            "text": f"{normalized} {answer.lower()}",
+            "stored_at": time.monotonic(),
+            "hits": 0
+        })
+        row = vector.reshape(1, -1)
+        self._matrix = row if self._matrix is None else np.vstack([self._matrix, row])
+        self.stats["stored"] += 1
+
+        if len(self._entries) > self.max_entries:
+            self._remove(range(len(self._entries) - self.max_entries))
+        return True
+
+    def store_soon(self, *args, **kwargs) -> None:
+        """store() in the background (the response doesn't wait for the embedding)."""
+        if not self.enabled:
+            return
+        task = asyncio.create_task(self._store_quietly(*args, **kwargs))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _store_quietly(self, *args, **kwargs) -> None:
+        try:
+            await self.store(*args, **kwargs)
+        except Exception as e:
+            logger.warning("answer_cache_store_error", error=str(e))
+
+    # ========================================================================
+    # INVALIDATION
+    # ========================================================================
+
+    def _remove(self, indexes) -> None:
+        drop = set(indexes)
+        if not drop:
+            return
+        keep = [i for i in range(len(self._entries)) if i not in drop]
+        self._entries = [self._entries[i] for i in keep]
+        self._matrix = self._matrix[keep] if keep else None
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [i for i, entry in enumerate(self._entries) if entry["stored_at"] < cutoff]
+        if expired:
+            self._remove(expired)
+            self.stats["expired"] += len(expired)
+
+    def invalidate(self, slugs: Optional[Set[str]] = None, names: Optional[Set[str]] = None) -> int:
+        """
+        Drop entries linking any of slugs or mentioning any of names
+        (both None: drop everything).
+
+        Returns:
+            Number of entries dropped
+        """
+        if slugs is None and names is None:
+            dropped = list(range(len(self._entries)))
+        else:
+            slugs = slugs or set()
+            names = {name.lower() for name in (names or set()) if name}
+            dropped = [
+                i for i, entry in enumerate(self._entries)
+                if entry["slugs"] & slugs or any(name in entry["text"] for name in names)
+            ]
+        self._remove(dropped)
+        self.stats["invalidated"] += len(dropped)
+        return len(dropped)
+
+    def _maybe_check_content(self) -> None:
+        if not self.database_url or time.monotonic() < self._next_content_check:
+            return
+        self._next_content_check = time.monotonic() + CONTENT_CHECK_SECONDS
+        task = asyncio.create_task(self.check_content_updates())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def check_content_updates(self) -> int:
+        """Invalidate entries for articles/countries updated since the last check."""
+        # Small overlap so rows committed during the previous check aren't missed
+        since = self._content_checked_at - timedelta(seconds=5)
+        checked_at = datetime.now(timezone.utc)
+
+        try:
+            import psycopg
+
+            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute("""
+                        SELECT a.slug, c.name
+                        FROM articles a
+                        LEFT JOIN countries c ON c.code = a.country_code
+                        WHERE a.app = 'relocation'
+                        AND a.updated_at > %s
+                        UNION ALL
+                        SELECT slug, name
+                        FROM countries
+                        WHERE updated_at > %s
+                    """, (since, since))
+                    rows = await cur.fetchall()
+
+        except Exception as e:
+            logger.warning("answer_cache_content_check_error", error=str(e))
+            return 0
+
+        self._content_checked_at = checked_at
+        if not rows:
+            return 0
+
+        dropped = self.invalidate(
+            slugs={row[0] for row in rows if row[0]},
+            names={row[1] for row in rows if row[1]}
+        )
+        logger.info("answer_cache_content_invalidated", updated=len(rows), dropped=dropped)
+        return dropped
+
+
+# Singleton instance
+answer_cache = SemanticAnswerCache()
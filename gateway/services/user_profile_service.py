@@ -2,12 +2,23 @@
 User Profile Service
 
 Database operations for user profile facts and voice sessions.
-Uses psycopg3 async for Neon PostgreSQL connections.
+Uses psycopg3 async for Neon PostgreSQL connections, from a shared pool.
+
+Profile reads (profile row + active facts) are served from a per-user
+snapshot cache, loaded with one query and kept for PROFILE_CACHE_TTL_SECONDS.
+Fact writes through this service update cached snapshots in place, so a
+voice turn (context, get-or-create, existing facts, store) reads the
+database at most once. Writes made elsewhere (another gateway instance)
+show up when the snapshot expires.
 """
 
 import os
 import json
 import re
+import time
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
@@ -17,6 +28,38 @@ logger = structlog.get_logger()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+POOL_MIN_SIZE = int(os.getenv("USER_PROFILE_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.getenv("USER_PROFILE_POOL_MAX_SIZE", "10"))
+# Neon closes idle connections; recycle ours before it does
+POOL_MAX_IDLE_SECONDS = 240
+
+PROFILE_CACHE_TTL_SECONDS = float(os.getenv("USER_PROFILE_CACHE_TTL_SECONDS", "30"))
+PROFILE_CACHE_MAX_USERS = 1000
+
+try:
+    from psycopg_pool import AsyncConnectionPool
+    POOL_AVAILABLE = True
+except ImportError:
+    AsyncConnectionPool = None
+    POOL_AVAILABLE = False
+    logger.warning("psycopg_pool_not_available", fallback="connection per query")
+
+PROFILE_COLUMNS = """
+    id, user_id, email,
+    current_country, current_city, nationality,
+    destination_countries, has_children, number_of_children,
+    employment_status, remote_work, industry, job_title,
+    income_range, budget_monthly, timeline,
+    created_at, updated_at
+"""
+
+FACT_COLUMNS = """
+    id, fact_type, fact_value, source, confidence,
+    session_id, extracted_from_message,
+    is_user_verified, is_active,
+    created_at, updated_at, verified_at
+"""
+
 # Import models
 try:
     import sys
@@ -49,11 +92,168 @@ class UserProfileService:
     def __init__(self, database_url: Optional[str] = None):
         self.database_url = database_url or DATABASE_URL
         self.enabled = bool(self.database_url)
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+        # stack_user_id -> {"profile_id", "profile", "facts", "loaded_at"}
+        self._profile_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # str(profile_id) -> stack_user_id, to route fact writes to snapshots
+        self._profile_users: Dict[str, str] = {}
+        # Bumped on every write; a snapshot loaded across a write isn't cached
+        self._write_count = 0
+        self.cache_stats = {"hits": 0, "misses": 0}
+
         if self.enabled:
-            logger.info("user_profile_service_initialized")
+            logger.info("user_profile_service_initialized", pooled=POOL_AVAILABLE)
         else:
             logger.warning("user_profile_service_disabled", reason="No DATABASE_URL")
 
+    # ========================================================================
+    # CONNECTIONS
+    # ========================================================================
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    pool = AsyncConnectionPool(
+                        self.database_url,
+                        min_size=POOL_MIN_SIZE,
+                        max_size=POOL_MAX_SIZE,
+                        max_idle=POOL_MAX_IDLE_SECONDS,
+                        check=AsyncConnectionPool.check_connection,
+                        open=False
+                    )
+                    await pool.open()
+                    self._pool = pool
+                    logger.info("user_profile_pool_opened", min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE)
+        return self._pool
+
+    @asynccontextmanager
+    async def _connection(self):
+        """Database connection from the pool (or a new one if pooling is unavailable)."""
+        if POOL_AVAILABLE:
+            pool = await self._get_pool()
+            async with pool.connection() as conn:
+                yield conn
+        else:
+            import psycopg
+            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+                yield conn
+
+    async def close(self) -> None:
+        """Close the connection pool (shutdown)."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    # ========================================================================
+    # PROFILE SNAPSHOT CACHE
+    # ========================================================================
+
+    @staticmethod
+    def _profile_from_row(row) -> Dict[str, Any]:
+        return {
+            "id": str(row[0]),
+            "user_id": row[1],
+            "email": row[2],
+            "current_country": row[3],
+            "current_city": row[4],
+            "nationality": row[5],
+            "destination_countries": row[6] or [],
+            "has_children": row[7],
+            "number_of_children": row[8],
+            "employment_status": row[9],
+            "remote_work": row[10],
+            "industry": row[11],
+            "job_title": row[12],
+            "income_range": row[13],
+            "budget_monthly": row[14],
+            "timeline": row[15],
+            "created_at": row[16].isoformat() if row[16] else None,
+            "updated_at": row[17].isoformat() if row[17] else None
+        }
+
+    @staticmethod
+    def _fact_from_row(row) -> Dict[str, Any]:
+        return {
+            "id": row[0],
+            "fact_type": row[1],
+            "fact_value": row[2] if isinstance(row[2], dict) else json.loads(row[2]) if row[2] else {},
+            "source": row[3],
+            "confidence": float(row[4]) if row[4] else 0.5,
+            "session_id": row[5],
+            "extracted_from_message": row[6],
+            "is_user_verified": row[7],
+            "is_active": row[8],
+            "created_at": row[9].isoformat() if row[9] else None,
+            "updated_at": row[10].isoformat() if row[10] else None,
+            "verified_at": row[11].isoformat() if row[11] else None
+        }
+
+    async def _load_snapshot(self, stack_user_id: str) -> Dict[str, Any]:
+        """Profile row and active facts for a user in one query."""
+        writes_before = self._write_count
+        profile_columns = ", ".join(f"p.{c.strip()}" for c in PROFILE_COLUMNS.split(","))
+        fact_columns = ", ".join(f"f.{c.strip()}" for c in FACT_COLUMNS.split(","))
+
+        async with self._connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(f"""
+                    SELECT {profile_columns}, {fact_columns}
+                    FROM user_profiles p
+                    LEFT JOIN user_profile_facts f
+                        ON f.user_profile_id = p.id AND f.is_active = TRUE
+                    WHERE p.user_id = %s
+                    ORDER BY f.created_at DESC
+                """, (stack_user_id,))
+                rows = await cur.fetchall()
+
+        entry = {"profile_id": None, "profile": None, "facts": [], "loaded_at": time.monotonic()}
+        if rows:
+            entry["profile_id"] = rows[0][0]
+            entry["profile"] = self._profile_from_row(rows[0][:18])
+            entry["facts"] = [self._fact_from_row(row[18:]) for row in rows if row[18] is not None]
+
+        if self._write_count == writes_before:
+            self._cache_snapshot(stack_user_id, entry)
+        return entry
+
+    def _cache_snapshot(self, stack_user_id: str, entry: Dict[str, Any]) -> None:
+        self._profile_cache[stack_user_id] = entry
+        self._profile_cache.move_to_end(stack_user_id)
+        if entry["profile_id"] is not None:
+            self._profile_users[str(entry["profile_id"])] = stack_user_id
+        while len(self._profile_cache) > PROFILE_CACHE_MAX_USERS:
+            evicted_user, evicted = self._profile_cache.popitem(last=False)
+            if evicted["profile_id"] is not None:
+                self._profile_users.pop(str(evicted["profile_id"]), None)
+
+    async def _snapshot(self, stack_user_id: str) -> Dict[str, Any]:
+        """Cached snapshot for a user, loading it if missing or expired."""
+        entry = self._profile_cache.get(stack_user_id)
+        if entry and time.monotonic() - entry["loaded_at"] < PROFILE_CACHE_TTL_SECONDS:
+            self.cache_stats["hits"] += 1
+            self._profile_cache.move_to_end(stack_user_id)
+            return entry
+        self.cache_stats["misses"] += 1
+        return await self._load_snapshot(stack_user_id)
+
+    def _cached_for_profile(self, user_profile_id) -> Optional[Dict[str, Any]]:
+        stack_user_id = self._profile_users.get(str(user_profile_id))
+        return self._profile_cache.get(stack_user_id) if stack_user_id else None
+
+    def invalidate_profile_cache(self, stack_user_id: Optional[str] = None) -> None:
+        """Drop a user's cached snapshot (or all snapshots)."""
+        self._write_count += 1
+        if stack_user_id is None:
+            self._profile_cache.clear()
+            self._profile_users.clear()
+            return
+        entry = self._profile_cache.pop(stack_user_id, None)
+        if entry and entry["profile_id"] is not None:
+            self._profile_users.pop(str(entry["profile_id"]), None)
+
     # ========================================================================
     # USER PROFILE OPERATIONS
     # ========================================================================
@@ -73,11 +273,13 @@ class UserProfileService:
             return None
 
         try:
-            import psycopg
+            snapshot = await self._snapshot(stack_user_id)
+            if snapshot["profile_id"] is not None:
+                return snapshot["profile_id"]
 
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
-                    # Try to get existing profile
+                    # Re-check: the profile may have been created since the snapshot
                     await cur.execute("""
                         SELECT id FROM user_profiles WHERE user_id = %s
                     """, (stack_user_id,))
@@ -85,13 +287,14 @@ class UserProfileService:
                     row = await cur.fetchone()
                     if row:
                         logger.info("profile_found", stack_user_id=stack_user_id)
+                        self.invalidate_profile_cache(stack_user_id)
                         return row[0]
 
                     # Create new profile (user_profiles table has user_id, created_at, updated_at)
                     await cur.execute("""
                         INSERT INTO user_profiles (user_id, created_at, updated_at)
                         VALUES (%s, NOW(), NOW())
-                        RETURNING id
+                        RETURNING id, created_at, updated_at
                     """, (stack_user_id,))
 
                     row = await cur.fetchone()
@@ -99,6 +302,15 @@ class UserProfileService:
 
                     if row:
                         logger.info("profile_created", stack_user_id=stack_user_id, profile_id=str(row[0]))
+                        # New profile: empty row, no facts
+                        self._write_count += 1
+                        profile_row = [row[0], stack_user_id] + [None] * 14 + [row[1], row[2]]
+                        self._cache_snapshot(stack_user_id, {
+                            "profile_id": row[0],
+                            "profile": self._profile_from_row(profile_row),
+                            "facts": [],
+                            "loaded_at": time.monotonic()
+                        })
                         return row[0]
 
                     return None
@@ -108,51 +320,13 @@ class UserProfileService:
             return None
 
     async def get_profile_by_stack_id(self, stack_user_id: str) -> Optional[Dict[str, Any]]:
-        """Get full profile data for a user."""
+        """Get full profile data for a user (cached snapshot)."""
         if not self.enabled:
             return None
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
-                async with conn.cursor() as cur:
-                    await cur.execute("""
-                        SELECT
-                            id, user_id, email,
-                            current_country, current_city, nationality,
-                            destination_countries, has_children, number_of_children,
-                            employment_status, remote_work, industry, job_title,
-                            income_range, budget_monthly, timeline,
-                            created_at, updated_at
-                        FROM user_profiles
-                        WHERE user_id = %s
-                    """, (stack_user_id,))
-
-                    row = await cur.fetchone()
-                    if not row:
-                        return None
-
-                    return {
-                        "id": str(row[0]),
-                        "user_id": row[1],
-                        "email": row[2],
-                        "current_country": row[3],
-                        "current_city": row[4],
-                        "nationality": row[5],
-                        "destination_countries": row[6] or [],
-                        "has_children": row[7],
-                        "number_of_children": row[8],
-                        "employment_status": row[9],
-                        "remote_work": row[10],
-                        "industry": row[11],
-                        "job_title": row[12],
-                        "income_range": row[13],
-                        "budget_monthly": row[14],
-                        "timeline": row[15],
-                        "created_at": row[16].isoformat() if row[16] else None,
-                        "updated_at": row[17].isoformat() if row[17] else None
-                    }
+            snapshot = await self._snapshot(stack_user_id)
+            return dict(snapshot["profile"]) if snapshot["profile"] else None
 
         except Exception as e:
             logger.error("get_profile_error", stack_user_id=stack_user_id, error=str(e))
@@ -170,7 +344,8 @@ class UserProfileService:
         source: str = "voice",
         confidence: float = 0.5,
         session_id: Optional[str] = None,
-        extracted_from: Optional[str] = None
+        extracted_from: Optional[str] = None,
+        is_verified: bool = False
     ) -> Optional[int]:
         """
         Store a new fact for a user.
@@ -183,6 +358,7 @@ class UserProfileService:
             confidence: Confidence score 0-1
             session_id: Voice session that extracted this
             extracted_from: Original message text
+            is_verified: Confirmed by the user (human-in-the-loop)
 
         Returns:
             ID of created fact, or None on failure
@@ -191,21 +367,21 @@ class UserProfileService:
             return None
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
-                    await cur.execute("""
+                    await cur.execute(f"""
                         INSERT INTO user_profile_facts (
                             user_profile_id, fact_type, fact_value,
                             source, confidence, session_id, extracted_from_message,
+                            is_user_verified, verified_at,
                             created_at, updated_at
                         )
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-                        RETURNING id
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, CASE WHEN %s THEN NOW() END, NOW(), NOW())
+                        RETURNING {FACT_COLUMNS}
                     """, (
                         str(user_profile_id), fact_type, json.dumps(fact_value),
-                        source, confidence, session_id, extracted_from
+                        source, confidence, session_id, extracted_from,
+                        is_verified, is_verified
                     ))
 
                     row = await cur.fetchone()
@@ -216,6 +392,10 @@ class UserProfileService:
                                    user_profile_id=str(user_profile_id),
                                    fact_type=fact_type,
                                    fact_id=row[0])
+                        self._write_count += 1
+                        snapshot = self._cached_for_profile(user_profile_id)
+                        if snapshot is not None:
+                            snapshot["facts"].insert(0, self._fact_from_row(row))
                         return row[0]
 
                     return None
@@ -248,16 +428,10 @@ class UserProfileService:
             return []
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
-                    query = """
-                        SELECT
-                            id, fact_type, fact_value, source, confidence,
-                            session_id, extracted_from_message,
-                            is_user_verified, is_active,
-                            created_at, updated_at, verified_at
+                    query = f"""
+                        SELECT {FACT_COLUMNS}
                         FROM user_profile_facts
                         WHERE user_profile_id = %s
                     """
@@ -275,24 +449,7 @@ class UserProfileService:
                     await cur.execute(query, params)
                     rows = await cur.fetchall()
 
-                    facts = []
-                    for row in rows:
-                        facts.append({
-                            "id": row[0],
-                            "fact_type": row[1],
-                            "fact_value": row[2] if isinstance(row[2], dict) else json.loads(row[2]) if row[2] else {},
-                            "source": row[3],
-                            "confidence": float(row[4]) if row[4] else 0.5,
-                            "session_id": row[5],
-                            "extracted_from_message": row[6],
-                            "is_user_verified": row[7],
-                            "is_active": row[8],
-                            "created_at": row[9].isoformat() if row[9] else None,
-                            "updated_at": row[10].isoformat() if row[10] else None,
-                            "verified_at": row[11].isoformat() if row[11] else None
-                        })
-
-                    return facts
+                    return [self._fact_from_row(row) for row in rows]
 
         except Exception as e:
             logger.error("get_facts_error",
@@ -306,26 +463,19 @@ class UserProfileService:
         fact_type: Optional[str] = None,
         active_only: bool = True
     ) -> List[Dict[str, Any]]:
-        """Get facts using Stack Auth user ID."""
+        """Get facts using Stack Auth user ID (active facts from the cached snapshot)."""
         if not self.enabled:
             return []
 
         try:
-            import psycopg
+            if not active_only:
+                profile_id = (await self._snapshot(stack_user_id))["profile_id"]
+                if profile_id is None:
+                    return []
+                return await self.get_facts(profile_id, fact_type, active_only=False)
 
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
-                async with conn.cursor() as cur:
-                    # First get profile ID
-                    await cur.execute("""
-                        SELECT id FROM user_profiles WHERE user_id = %s
-                    """, (stack_user_id,))
-
-                    row = await cur.fetchone()
-                    if not row:
-                        return []
-
-                    profile_id = row[0]
-                    return await self.get_facts(profile_id, fact_type, active_only)
+            facts = (await self._snapshot(stack_user_id))["facts"]
+            return [dict(f) for f in facts if not fact_type or f["fact_type"] == fact_type]
 
         except Exception as e:
             logger.error("get_facts_by_stack_id_error",
@@ -354,9 +504,7 @@ class UserProfileService:
             return False
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     updates = ["updated_at = NOW()"]
                     params = []
@@ -378,11 +526,16 @@ class UserProfileService:
                         UPDATE user_profile_facts
                         SET {', '.join(updates)}
                         WHERE id = %s
+                        RETURNING user_profile_id, {FACT_COLUMNS}
                     """, params)
 
+                    row = await cur.fetchone()
                     await conn.commit()
 
                     logger.info("fact_updated", fact_id=fact_id)
+                    self._write_count += 1
+                    if row:
+                        self._replace_cached_fact(row[0], fact_id, self._fact_from_row(row[1:]))
                     return True
 
         except Exception as e:
@@ -404,30 +557,45 @@ class UserProfileService:
             return False
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     if soft:
                         await cur.execute("""
                             UPDATE user_profile_facts
                             SET is_active = FALSE, updated_at = NOW()
                             WHERE id = %s
+                            RETURNING user_profile_id
                         """, (fact_id,))
                     else:
                         await cur.execute("""
                             DELETE FROM user_profile_facts WHERE id = %s
+                            RETURNING user_profile_id
                         """, (fact_id,))
 
+                    row = await cur.fetchone()
                     await conn.commit()
 
                     logger.info("fact_deleted", fact_id=fact_id, soft=soft)
+                    self._write_count += 1
+                    if row:
+                        self._replace_cached_fact(row[0], fact_id, None)
                     return True
 
         except Exception as e:
             logger.error("delete_fact_error", fact_id=fact_id, error=str(e))
             return False
 
+    def _replace_cached_fact(self, user_profile_id, fact_id: int, fact: Optional[Dict[str, Any]]) -> None:
+        """Update (or remove, if fact is None or inactive) a fact in a cached snapshot."""
+        snapshot = self._cached_for_profile(user_profile_id)
+        if snapshot is None:
+            return
+        facts = [f for f in snapshot["facts"] if f["id"] != fact_id]
+        if fact is not None and fact["is_active"]:
+            facts.append(fact)
+            facts.sort(key=lambda f: f["created_at"] or "", reverse=True)
+        snapshot["facts"] = facts
+
     # ========================================================================
     # VOICE SESSION OPERATIONS
     # ========================================================================
@@ -442,9 +610,7 @@ class UserProfileService:
             return None
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     # Get profile ID if user is logged in
                     profile_id = None
@@ -492,8 +658,6 @@ class UserProfileService:
             return False
 
         try:
-            import psycopg
-
             message = {
                 "role": role,
                 "content": content,
@@ -501,7 +665,7 @@ class UserProfileService:
                 "extracted_facts": extracted_facts or []
             }
 
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute("""
                         UPDATE voice_sessions
@@ -529,9 +693,7 @@ class UserProfileService:
             return False
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute("""
                         UPDATE voice_sessions
@@ -559,9 +721,7 @@ class UserProfileService:
             return None
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute("""
                         SELECT
@@ -608,9 +768,7 @@ class UserProfileService:
             return []
 
         try:
-            import psycopg
-
-            async with await psycopg.AsyncConnection.connect(self.database_url) as conn:
+            async with self._connection() as conn:
                 async with conn.cursor() as cur:
                     await cur.execute("""
                         SELECT
@@ -0,0 +1,192 @@
+"""
+ZEP User Graph Sync Queue
+
+Background, per-user debounced sync of profiles to the ZEP users graph.
+
+Callers schedule a sync when a user's facts change and return immediately;
+the queue waits for the user to go quiet (DEBOUNCE_SECONDS, but never more
+than MAX_DELAY_SECONDS after the first change), then reads the profile and
+facts from Neon once and pushes a single episode. A voice session that
+stores a fact on every turn produces one episode per pause instead of one
+per turn, and the turn itself never waits on Neon re-reads or ZEP writes.
+
+Pending syncs are flushed early on session end and on gateway shutdown.
+"""
+
+import os
+import asyncio
+from typing import Optional, Dict, Any, Set
+import structlog
+
+logger = structlog.get_logger()
+
+DEBOUNCE_SECONDS = float(os.getenv("ZEP_SYNC_DEBOUNCE_SECONDS", "10"))
+MAX_DELAY_SECONDS = float(os.getenv("ZEP_SYNC_MAX_DELAY_SECONDS", "60"))
+
+
+class ZepUserSyncQueue:
+    """
+    Debounced, coalescing queue of user profile syncs to ZEP.
+
+    Usage:
+        zep_user_sync_queue.schedule(user_id)        # after storing facts
+        zep_user_sync_queue.session_ended(user_id)   # flush now, in background
+        await zep_user_sync_queue.flush(user_id)     # flush now and wait
+        await zep_user_sync_queue.close()            # on shutdown
+    """
+
+    def __init__(
+        self,
+        graph_service=None,
+        profile_service=None,
+        debounce_seconds: float = DEBOUNCE_SECONDS,
+        max_delay_seconds: float = MAX_DELAY_SECONDS
+    ):
+        self._graph_service = graph_service
+        self._profile_service = profile_service
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+
+        # user_id -> {"app_id", "first_at", "changes", "timer"}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        # Serializes syncs per user so episodes land in order:
+        # user_id -> [lock, flushes holding or waiting for it]. Dropped when
+        # the last of those finishes, so only users mid-flush have an entry
+        self._locks: Dict[str, list] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.stats = {"scheduled": 0, "coalesced": 0, "synced": 0, "unchanged": 0, "failed": 0}
+
+    @property
+    def graph_service(self):
+        if self._graph_service is None:
+            from services.zep_user_graph import zep_user_graph_service
+            self._graph_service = zep_user_graph_service
+        return self._graph_service
+
+    @property
+    def profile_service(self):
+        if self._profile_service is None:
+            from services.user_profile_service import user_profile_service
+            self._profile_service = user_profile_service
+        return self._profile_service
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.graph_service.enabled and self.profile_service.enabled)
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    # ========================================================================
+    # SCHEDULING
+    # ========================================================================
+
+    def schedule(self, user_id: str, app_id: str = "relocation") -> bool:
+        """
+        Mark a user's profile as changed; sync after the debounce window.
+
+        Never blocks. Returns False if syncing is disabled or there is no user.
+        """
+        if not user_id or user_id == "anonymous" or not self.enabled:
+            return False
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        self.stats["scheduled"] += 1
+
+        pending = self._pending.get(user_id)
+        if pending:
+            pending["timer"].cancel()
+            pending["changes"] += 1
+            pending["app_id"] = app_id
+            self.stats["coalesced"] += 1
+        else:
+            pending = {"app_id": app_id, "first_at": now, "changes": 1}
+            self._pending[user_id] = pending
+
+        # Debounce, but don't let a continuously chatty session starve the sync
+        delay = min(self.debounce_seconds, max(0.0, pending["first_at"] + self.max_delay_seconds - now))
+        pending["timer"] = loop.call_later(delay, self._start_flush, user_id)
+        return True
+
+    def session_ended(self, user_id: str) -> None:
+        """Flush a user's pending sync now, in the background."""
+        if user_id in self._pending:
+            self._start_flush(user_id)
+
+    def _start_flush(self, user_id: str) -> None:
+        task = asyncio.create_task(self.flush(user_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # ========================================================================
+    # FLUSHING
+    # ========================================================================
+
+    async def flush(self, user_id: str, app_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Sync a user's current profile and facts to ZEP now.
+
+        Cancels any pending debounced sync for the user (it is folded into
+        this one). Unchanged data since the last sync is not pushed again.
+
+        Returns:
+            sync_user_profile result dict
+        """
+        pending = self._pending.pop(user_id, None)
+        if pending:
+            pending["timer"].cancel()
+            app_id = app_id or pending["app_id"]
+
+        lock = self._locks.setdefault(user_id, [asyncio.Lock(), 0])
+        lock[1] += 1
+        try:
+            async with lock[0]:
+                try:
+                    profile = await self.profile_service.get_profile_by_stack_id(user_id)
+                    facts = await self.profile_service.get_facts_by_stack_id(user_id, active_only=True)
+
+                    result = await self.graph_service.sync_user_profile(
+                        user_id=user_id,
+                        profile=profile or {},
+                        facts=facts,
+                        app_id=app_id or "relocation",
+                        skip_unchanged=True
+                    )
+                except Exception as e:
+                    logger.error("zep_sync_queue_flush_error", user_id=user_id, error=str(e))
+                    result = {"success": False, "error": str(e)}
+        finally:
+            lock[1] -= 1
+            if not lock[1]:
+                del self._locks[user_id]
+
+        if result.get("unchanged"):
+            self.stats["unchanged"] += 1
+        elif result.get("success"):
+            self.stats["synced"] += 1
+        else:
+            self.stats["failed"] += 1
+
+        logger.info(
+            "zep_sync_queue_flushed",
+            user_id=user_id,
+            changes=pending["changes"] if pending else 0,
+            success=result.get("success", False),
+            unchanged=result.get("unchanged", False),
+            facts_synced=result.get("facts_synced", 0)
+        )
+        return result
+
+    async def close(self) -> None:
+        """Flush all pending syncs and wait for in-flight ones (shutdown)."""
+        for user_id in list(self._pending):
+            self._start_flush(user_id)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("zep_sync_queue_closed", **self.stats)
+
+
+# Singleton instance
+zep_user_sync_queue = ZepUserSyncQueue()
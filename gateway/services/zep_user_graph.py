@@ -7,6 +7,8 @@ Uses the user ontology (User, Destination, CareerProfile, etc.) for structured e
 
 import os
 import json
+import hashlib
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any
 import structlog
 
@@ -15,6 +17,9 @@ logger = structlog.get_logger()
 ZEP_API_KEY = os.getenv("ZEP_API_KEY")
 ZEP_USERS_GRAPH_ID = os.getenv("ZEP_GRAPH_ID_USERS", "users")
 
+# Users whose last-synced digest is kept; an evicted user just re-syncs once
+SYNCED_DIGESTS_MAX_USERS = 10000
+
 # Import ontology helpers
 try:
     import sys
@@ -52,6 +57,10 @@ class ZepUserGraphService:
         self.enabled = bool(ZEP_API_KEY)
         self.graph_id = ZEP_USERS_GRAPH_ID
         self._client = None
+        self._async_client = None
+        self._graph_ready = False
+        # user_id -> digest of the last data synced (skip_unchanged), least recent first
+        self._synced_digests: "OrderedDict[str, str]" = OrderedDict()
 
         if self.enabled:
             logger.info("zep_user_graph_initialized", graph_id=self.graph_id)
@@ -67,11 +76,13 @@ class ZepUserGraphService:
         return self._client
 
     async def get_async_client(self):
-        """Get async ZEP client."""
+        """Get async ZEP client (shared)."""
         if not self.enabled:
             return None
-        from zep_cloud.client import AsyncZep
-        return AsyncZep(api_key=ZEP_API_KEY)
+        if not self._async_client:
+            from zep_cloud.client import AsyncZep
+            self._async_client = AsyncZep(api_key=ZEP_API_KEY)
+        return self._async_client
 
     # ========================================================================
     # GRAPH INITIALIZATION
@@ -81,11 +92,15 @@ class ZepUserGraphService:
         """
         Ensure the users graph exists, creating it if needed.
 
+        Checked once per process; later calls return immediately.
+
         Returns:
             True if graph exists/created, False on failure
         """
         if not self.enabled:
             return False
+        if self._graph_ready:
+            return True
 
         try:
             client = await self.get_async_client()
@@ -105,6 +120,7 @@ class ZepUserGraphService:
                 else:
                     logger.warning("zep_graph_create_warning", error=str(e))
 
+            self._graph_ready = True
             return True
 
         except Exception as e:
@@ -120,11 +136,15 @@ class ZepUserGraphService:
         user_id: str,
         profile: Dict[str, Any],
         facts: List[Dict[str, Any]],
-        app_id: str = "relocation"
+        app_id: str = "relocation",
+        skip_unchanged: bool = False
     ) -> Dict[str, Any]:
         """
         Sync user profile and facts to ZEP graph.
 
+        Prefer zep_user_sync_queue.schedule() from request paths: it debounces
+        and coalesces changes and runs this in the background.
+
         Creates nodes for:
         - User (central node)
         - Destinations (countries interested in)
@@ -139,6 +159,8 @@ class ZepUserGraphService:
             profile: User profile dict from Neon
             facts: List of user_profile_facts from Neon
             app_id: Source application
+            skip_unchanged: Don't add an episode if the data is the same as
+                the last one synced for this user (success, unchanged=True)
 
         Returns:
             Dict with success status and episode_id
@@ -147,18 +169,35 @@ class ZepUserGraphService:
             return {"success": False, "error": "ZEP not configured"}
 
         try:
-            client = await self.get_async_client()
-            await self.ensure_graph_exists()
-
             # Build structured user data for ZEP
             user_data = self._build_user_graph_data(user_id, profile, facts, app_id)
+            data = json.dumps(user_data, sort_keys=True, default=str)
+            digest = hashlib.sha256(data.encode()).hexdigest()
+
+            if skip_unchanged and self._synced_digests.get(user_id) == digest:
+                self._synced_digests.move_to_end(user_id)
+                logger.info("user_profile_unchanged_skip_zep", user_id=user_id)
+                return {
+                    "success": True,
+                    "graph_id": self.graph_id,
+                    "episode_id": None,
+                    "facts_synced": 0,
+                    "unchanged": True
+                }
+
+            client = await self.get_async_client()
+            await self.ensure_graph_exists()
 
             # Add to ZEP graph
             response = await client.graph.add(
                 graph_id=self.graph_id,
                 type="json",
-                data=json.dumps(user_data)
+                data=data
             )
+            self._synced_digests[user_id] = digest
+            self._synced_digests.move_to_end(user_id)
+            while len(self._synced_digests) > SYNCED_DIGESTS_MAX_USERS:
+                self._synced_digests.popitem(last=False)
 
             episode_id = None
             if response and hasattr(response, 'episode_id'):
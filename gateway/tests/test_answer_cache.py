@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import numpy as np
+
+from routers import voice
+from services.answer_cache import SemanticAnswerCache, normalize_query, query_entities
+
+
+def fake_embed(similar_groups):
+    """Embeddings where queries in the same group are near-identical (cosine ~0.99)."""
+    def group_of(text):
+        for g, queries in enumerate(similar_groups):
+            if text in {normalize_query(q) for q in queries}:
+                return g
+        return len(similar_groups)
+
+    async def embed(text):
+        vector = np.zeros(16, dtype=np.float32)
+        vector[group_of(text)] = 1.0
+        vector[15] = 0.1 * (sum(map(ord, text)) % 7) / 7  # small per-query difference
+        return vector.tolist()
+
+    return embed
+
+
+def make_cache(*groups):
+    return SemanticAnswerCache(database_url="", embed=fake_embed(groups), similarity=0.92)
+
+
+def test_query_entities():
+    assert query_entities(normalize_query("Cost of living in Lisbon?")) == {"portugal"}
+    assert query_entities(normalize_query("Costa Rica vs Panama for retirees")) == {"costa rica", "panama"}
+    assert query_entities(normalize_query("Digital nomad visa 2025 income")) == {"2025"}
+    assert query_entities(normalize_query("How do I open a bank account")) == frozenset()
+
+
+def test_similar_query_about_another_country_misses():
+    cache = make_cache(["cost of living in Cyprus", "cost of living in Malta", "what does it cost to live in Cyprus"])
+
+    async def run():
+        await cache.store("cost of living in Cyprus", "Cyprus answer", "zep")
+        return (
+            await cache.lookup("cost of living in Malta"),
+            await cache.lookup("what does it cost to live in Cyprus"),
+        )
+
+    malta, cyprus = asyncio.run(run())
+
+    assert malta is None
+    assert cyprus["answer"] == "Cyprus answer"
+    assert cyprus["similarity"] >= 0.92
+
+
+def test_numbers_must_match():
+    cache = make_cache(["digital nomad visa income 2024", "digital nomad visa income 2025"])
+
+    async def run():
+        await cache.store("digital nomad visa income 2024", "2024 answer")
+        return await cache.lookup("digital nomad visa income 2025")
+
+    assert asyncio.run(run()) is None
+
+
+def test_picks_most_similar_entry_with_matching_entities():
+    cache = make_cache(["golden visa in Spain", "golden visa in Portugal", "Portugal golden visa"])
+
+    async def run():
+        await cache.store("golden visa in Spain", "Spain answer")
+        await cache.store("golden visa in Portugal", "Portugal answer")
+        return await cache.lookup("Portugal golden visa")
+
+    assert asyncio.run(run())["answer"] == "Portugal answer"
+
+
+def test_exact_match_and_invalidation():
+    cache = make_cache(["Malta tax rates"])
+
+    async def run():
+        await cache.store("Malta tax rates", "Malta answer", related_links={"articles": [{"url": "https://x/malta-tax"}]})
+        hit = await cache.lookup("malta  tax rates!")
+        dropped = cache.invalidate(slugs={"malta-tax"})
+        return hit, dropped, await cache.lookup("Malta tax rates")
+
+    hit, dropped, after = asyncio.run(run())
+
+    assert hit["similarity"] == 1.0
+    assert dropped == 1
+    assert after is None
+
+
+class SlowAssistant:
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.prepared = False
+
+    async def prepare_query(self, query, thread_id=None, user_id="anonymous"):
+        await self.release.wait()
+        self.prepared = True
+        return {"cached": None}
+
+    async def process_query(self, query, thread_id=None, user_id="anonymous", prepared=None):
+        return "Here is the answer"
+
+
+def test_bridge_is_sent_before_prepare_query_finishes(monkeypatch):
+    assistant = SlowAssistant()
+    monkeypatch.setattr(voice, "gemini_assistant", assistant)
+
+    async def run():
+        stream = voice._generate_sse_response(
+            [{"role": "user", "content": "Can you explain the difference between the D7 and D8 visas?"}]
+        )
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        prepared_before_bridge = assistant.prepared
+        assistant.release.set()
+        rest = [chunk async for chunk in stream]
+        return first, prepared_before_bridge, rest
+
+    first, prepared_before_bridge, rest = asyncio.run(run())
+
+    assert not prepared_before_bridge
+    assert json.loads(first[len("data: "):])["choices"][0]["delta"]["content"] in {
+        bridge + " " for bridge in (
+            "Let me think about that...", "Hmm, that's a great question...", "Let me look into that for you...",
+            "One moment while I check...", "Good question, let me see...",
+        )
+    }
+    assert rest[-1] == "data: [DONE]\n\n"
+    assert "answer" in "".join(rest)
@@ -0,0 +1,62 @@
+import asyncio
+from types import SimpleNamespace
+
+from services import zep_user_graph
+from services.zep_sync_queue import ZepUserSyncQueue
+
+
+class FakeProfiles:
+    enabled = True
+
+    async def get_profile_by_stack_id(self, user_id):
+        await asyncio.sleep(0)
+        return {"id": user_id}
+
+    async def get_facts_by_stack_id(self, user_id, active_only=True):
+        return []
+
+
+class FakeGraph:
+    enabled = True
+
+    def __init__(self):
+        self.synced = []
+
+    async def sync_user_profile(self, user_id, **kwargs):
+        self.synced.append(user_id)
+        return {"success": True}
+
+
+def test_locks_are_dropped_once_flushes_finish():
+    graph = FakeGraph()
+    queue = ZepUserSyncQueue(graph_service=graph, profile_service=FakeProfiles())
+
+    async def run():
+        await asyncio.gather(*(queue.flush(user_id) for user_id in ["a", "a", "b"]))
+
+    asyncio.run(run())
+
+    assert sorted(graph.synced) == ["a", "a", "b"]
+    assert queue._locks == {}
+
+
+def test_synced_digests_are_bounded(monkeypatch):
+    monkeypatch.setattr(zep_user_graph, "SYNCED_DIGESTS_MAX_USERS", 3)
+    service = zep_user_graph.ZepUserGraphService()
+    service.enabled = True
+
+    async def get_async_client():
+        async def add(**kwargs):
+            return SimpleNamespace(episode_id="e")
+        return SimpleNamespace(graph=SimpleNamespace(add=add))
+
+    monkeypatch.setattr(service, "get_async_client", get_async_client)
+    monkeypatch.setattr(service, "ensure_graph_exists", lambda: asyncio.sleep(0, True), raising=False)
+
+    async def run():
+        for user_id in ["u1", "u2", "u3", "u4"]:
+            await service.sync_user_profile(user_id=user_id, profile={"id": user_id}, facts=[])
+
+    asyncio.run(run())
+
+    assert list(service._synced_digests) == ["u2", "u3", "u4"]
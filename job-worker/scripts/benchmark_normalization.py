@@ -0,0 +1,161 @@
+"""
+Micro-benchmark: per-job Pydantic normalization vs BatchJobNormalizer.
+
+Usage:
+    # Record a fixture from the jobs table (needs DATABASE_URL)
+    python scripts/benchmark_normalization.py --record fixtures/jobs_10k.json --count 10000
+
+    # Benchmark against a recorded fixture
+    python scripts/benchmark_normalization.py --fixture fixtures/jobs_10k.json
+
+    # No fixture: a deterministic synthetic 10k set shaped like our scrapes
+    python scripts/benchmark_normalization.py
+
+Every run also checks that both paths produce identical output dicts.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.activities.normalization import BatchJobNormalizer, normalize_job
+
+TITLES = [
+    "Fractional CFO", "Interim Finance Director", "Part-time CMO", "Head of Engineering",
+    "Senior Software Engineer", "VP of Sales", "Chief Operating Officer", "Product Designer",
+    "Data Analyst", "Fractional CTO (2 days/week)", "Customer Success Manager",
+    "Marketing Manager", "Chief People Officer", "Director of Operations",
+    "Backend Engineer - Python", "General Counsel", "Head of Growth", "Account Executive",
+]
+LOCATIONS = [
+    "London, UK", "London", "Manchester, United Kingdom", "Remote - UK", "Remote",
+    "San Francisco, CA", "New York, USA", "Berlin, Germany", "Bristol", "Edinburgh, Scotland",
+    "Dublin, Ireland", "Amsterdam/Netherlands", "Hybrid - London", "UK", None, "",
+]
+DEPARTMENTS = [
+    "Finance", "Engineering", "Marketing & Growth", "People", "Sales", "Product",
+    "Operations", "Legal", "Data & Analytics", "Design", "Customer Support", None, "",
+]
+EMPLOYMENT_TYPES = ["Full-time", "Part-time", "Contract", "FullTime", "Fractional", "Interim", None]
+SENIORITY = ["Senior", "Director", "Head", "C-Suite", "Mid-Level", None]
+WORKPLACE = ["Remote", "Hybrid", "On-site", "Office based", None]
+SALARIES = [
+    "£100,000 - £150,000", "$200k - $300k", "£800/day", "Competitive + equity",
+    "€90,000", "£45k-£55k per annum", None, None, None,
+]
+
+
+def synthesize(count: int, seed: int = 7) -> list:
+    """Deterministic raw jobs covering the shapes Ashby/Greenhouse/Lever/Apify return."""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        job = {
+            "title": rng.choice(TITLES),
+            "company_name": f"Company {rng.randint(1, 400)}",
+            "url": f"https://jobs.example.com/{i}",
+            "location": rng.choice(LOCATIONS),
+            "department": rng.choice(DEPARTMENTS),
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "seniority_level": rng.choice(SENIORITY),
+            "workplace_type": rng.choice(WORKPLACE),
+            "description_plain": "We are hiring. " * rng.randint(5, 40),
+            "posted_date": f"2025-11-{rng.randint(1, 28):02d}",
+        }
+        salary = rng.choice(SALARIES)
+        if salary:
+            job["compensation"] = salary
+        if rng.random() < 0.05:
+            # Ashby-style numeric id takes the Pydantic fallback path
+            job["id"] = rng.randint(1, 10_000)
+        jobs.append(job)
+    return jobs
+
+
+async def fetch_recent_jobs(count: int) -> list:
+    """Recent jobs from Neon in the raw shape the scrapers emit."""
+    import asyncpg
+
+    conn = await asyncpg.connect(os.environ["DATABASE_URL"])
+    try:
+        rows = await conn.fetch("""
+            SELECT title, company_name, url, location, department, employment_type,
+                   seniority_level, full_description, posted_date
+            FROM jobs
+            ORDER BY first_seen_at DESC
+            LIMIT $1
+        """, count)
+    finally:
+        await conn.close()
+
+    jobs = []
+    for row in rows:
+        job = dict(row)
+        job["description_plain"] = job.pop("full_description")
+        job["posted_date"] = job["posted_date"].isoformat() if job["posted_date"] else None
+        jobs.append(job)
+    return jobs
+
+
+def record(path: str, count: int):
+    """Write a fixture of recent jobs from Neon."""
+    jobs = asyncio.run(fetch_recent_jobs(count))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(jobs, f)
+    print(f"Recorded {len(jobs)} jobs to {path}")
+
+
+def bench(jobs: list, repeat: int):
+    def per_job():
+        return [normalize_job(j, source="bench") for j in jobs]
+
+    def batch():
+        return BatchJobNormalizer(source="bench").normalize(jobs)
+
+    expected = per_job()
+    actual = batch()
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"Jobs: {len(jobs)}  |  output mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+    for name, fn in (("pydantic per-job", per_job), ("batch", batch)):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        print(f"{name:>18}: best {best * 1000:8.1f} ms  ({len(jobs) / best:,.0f} jobs/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", help="JSON list of raw jobs")
+    parser.add_argument("--record", help="Write a fixture from the jobs table to this path")
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.count)
+        return
+
+    if args.fixture:
+        with open(args.fixture) as f:
+            jobs = json.load(f)
+    else:
+        jobs = synthesize(args.count)
+
+    bench(jobs, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ import httpx
 from typing import List, Optional
 from temporalio import activity
 from ..config.settings import get_settings
+from shared.provider_limits import provider_slot
 from ..models.classification import JobClassification, EmploymentType, SeniorityLevel
 
 
@@ -52,17 +53,18 @@ async def classify_jobs_with_gemini(jobs: List[dict]) -> List[dict]:
                     description=job.get("description", "")[:2000],  # Limit tokens
                 )
 
-                response = await client.post(
-                    f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent",
-                    params={"key": settings.google_api_key},
-                    json={
-                        "contents": [{"parts": [{"text": prompt}]}],
-                        "generationConfig": {
-                            "temperature": 0.1,
-                            "responseMimeType": "application/json",
+                async with provider_slot("gemini"):
+                    response = await client.post(
+                        f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash-exp:generateContent",
+                        params={"key": settings.google_api_key},
+                        json={
+                            "contents": [{"parts": [{"text": prompt}]}],
+                            "generationConfig": {
+                                "temperature": 0.1,
+                                "responseMimeType": "application/json",
+                            }
                         }
-                    }
-                )
+                    )
                 response.raise_for_status()
                 data = response.json()
 
@@ -200,11 +202,12 @@ async def save_jobs_to_zep(jobs: List[dict]) -> dict:
 
             # Check if job already exists in graph by searching
             try:
-                search_result = await zep.graph.search(
-                    graph_id="jobs",
-                    query=unique_id,
-                    limit=1,
-                )
+                async with provider_slot("zep"):
+                    search_result = await zep.graph.search(
+                        graph_id="jobs",
+                        query=unique_id,
+                        limit=1,
+                    )
 
                 # If exact match found, skip
                 if search_result and len(search_result.edges) > 0:
@@ -279,11 +282,12 @@ The company {company_name} has posted a position for {job_title}"""
                 episode_text += f"\nApply: {job_url}"
 
             try:
-                await zep.graph.add(
-                    graph_id="jobs",
-                    type="text",  # Changed from "json" to "text" for entity extraction
-                    data=episode_text
-                )
+                async with provider_slot("zep"):
+                    await zep.graph.add(
+                        graph_id="jobs",
+                        type="text",  # Changed from "json" to "text" for entity extraction
+                        data=episode_text
+                    )
                 saved += 1
                 activity.logger.info(f"Added job to ZEP: {job_title} at {company_name}")
             except Exception as e:
@@ -3,7 +3,9 @@ import json
 from datetime import datetime
 from temporalio import activity
 from ..config.settings import get_settings
+from shared.provider_limits import provider_slot
 from .normalization import compute_enhanced_site_tags
+from shared.near_duplicates import link_near_duplicate
 
 
 def compute_site_tags(job: dict) -> list:
@@ -25,6 +27,7 @@ async def save_jobs_to_database(data: dict) -> dict:
 
     added = 0
     updated = 0
+    duplicates_linked = 0
     errors = []
 
     try:
@@ -88,7 +91,7 @@ async def save_jobs_to_database(data: dict) -> dict:
                     updated += 1
                 else:
                     # Insert new job with all classification fields
-                    await conn.execute("""
+                    job_id = await conn.fetchval("""
                         INSERT INTO jobs (
                             board_id, company_name, title, full_description, department,
                             location, employment_type, seniority_level, is_fractional,
@@ -96,6 +99,7 @@ async def save_jobs_to_database(data: dict) -> dict:
                             is_remote, hours_per_week, site_tags,
                             url, posted_date, first_seen_at, last_seen_at, external_id
                         ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $17, $18)
+                        RETURNING id
                     """,
                         board_id,
                         company["name"],
@@ -118,10 +122,23 @@ async def save_jobs_to_database(data: dict) -> dict:
                     )
                     added += 1
 
+                    # Link to the same role already saved from another board
+                    try:
+                        if await link_near_duplicate(conn, job_id, {**job, "company_name": company["name"]}):
+                            duplicates_linked += 1
+                    except Exception as e:
+                        # Dedup is best-effort; the job itself is already saved
+                        activity.logger.warning(f"Near-duplicate check failed for {job_id}: {e}")
+
             except Exception as e:
                 errors.append(f"Job '{job.get('title')}': {str(e)}")
 
-        return {"added": added, "updated": updated, "errors": errors}
+        return {
+            "added": added,
+            "updated": updated,
+            "duplicates_linked": duplicates_linked,
+            "errors": errors,
+        }
 
     finally:
         await conn.close()
@@ -161,11 +178,12 @@ async def update_job_graphs(results: list) -> dict:
                 "department": row["department"],
             }
 
-            await zep.graph.add(
-                graph_id="jobs",
-                type="json",
-                data=json.dumps(job_data)
-            )
+            async with provider_slot("zep"):
+                await zep.graph.add(
+                    graph_id="jobs",
+                    type="json",
+                    data=json.dumps(job_data)
+                )
 
             # Also add to vertical graph (jobs-tech for now)
             detailed_data = {
@@ -179,11 +197,12 @@ async def update_job_graphs(results: list) -> dict:
                 "description": row.get("description", "")[:500],  # Truncate
             }
 
-            await zep.graph.add(
-                graph_id="jobs-tech",
-                type="json",
-                data=json.dumps(detailed_data)
-            )
+            async with provider_slot("zep"):
+                await zep.graph.add(
+                    graph_id="jobs-tech",
+                    type="json",
+                    data=json.dumps(detailed_data)
+                )
 
         return {"jobs_added_to_graph": len(rows)}
 
@@ -3,6 +3,7 @@ import json
 from temporalio import activity
 from openai import AsyncOpenAI
 from ..config.settings import get_settings
+from shared.provider_limits import provider_slot
 
 
 SKILL_PATTERNS = {
@@ -38,12 +39,13 @@ async def extract_job_skills(jobs: list[dict]) -> list[dict]:
             continue
 
         try:
-            response = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """Extract skills from job descriptions. Return JSON:
+            async with provider_slot("openai"):
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": """Extract skills from job descriptions. Return JSON:
 {
   "skills": [
     {"name": "Python", "importance": "essential", "category": "technical"},
@@ -52,15 +54,15 @@ async def extract_job_skills(jobs: list[dict]) -> list[dict]:
 }
 Categories: technical, soft, domain, tool
 Importance: essential (required/must have), beneficial (nice to have), bonus"""
-                    },
-                    {
-                        "role": "user",
-                        "content": job["description"][:4000]  # Limit tokens
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0,
-            )
+                        },
+                        {
+                            "role": "user",
+                            "content": job["description"][:4000]  # Limit tokens
+                        }
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0,
+                )
 
             skills_data = json.loads(response.choices[0].message.content)
             job["skills"] = skills_data.get("skills", [])
@@ -110,8 +112,8 @@ async def calculate_company_trends(company_names: list[str]) -> dict:
             rows = await conn.fetch("""
                 SELECT j.title, j.department, j.location, j.posted_date
                 FROM jobs j
-                JOIN job_boards jb ON j.job_board_id = jb.id
-                WHERE jb.name = $1
+                JOIN job_boards jb ON j.board_id = jb.id
+                WHERE jb.company_name = $1
             """, company_name)
 
             if not rows:
@@ -5,6 +5,20 @@ from datetime import datetime
 from typing import List, Optional
 from temporalio import activity
 from ..config.settings import get_settings
+from shared.provider_limits import provider_slot
+from shared.rule_classification import pre_classify_job, RULE_CONFIDENCE_THRESHOLD
+from shared.near_duplicates import link_near_duplicate
+
+# Rule-based employment types → fractional_type values used by the LLM prompt
+_FRACTIONAL_TYPES = {
+    "Fractional": "fractional",
+    "Part-Time": "part-time",
+    "Contract": "contract",
+    "Interim": "contract",
+    "Temporary": "contract",
+    "Freelance": "contract",
+    "Full-Time": "full-time",
+}
 
 
 @activity.defn
@@ -71,16 +85,34 @@ async def classify_fractional_jobs(jobs: List[dict]) -> List[dict]:
     Use AI to classify if jobs are truly fractional/part-time/contract roles.
 
     Adds 'is_fractional' boolean and 'fractional_type' to each job.
+    Executive jobs the rule-based pre-classifier is confident about skip the
+    LLM (classification_method "rules"); the rest are sent to OpenAI.
     """
     settings = get_settings()
 
-    # Use OpenAI to classify
-    from openai import AsyncOpenAI
-
-    openai = AsyncOpenAI(api_key=settings.openai_api_key)
+    # OpenAI client, created only once a job falls through to the LLM
+    openai = None
 
     classified = []
+    resolved_by_rules = 0
     for job in jobs:
+        rules = pre_classify_job(
+            title=job.get('title', ''),
+            description=job.get('description', ''),
+            employment_type=job.get('employment_type'),
+            location=job.get('location'),
+            hours_per_week=job.get('hours_per_week'),
+        )
+        if rules.is_executive and rules.confidence >= RULE_CONFIDENCE_THRESHOLD:
+            job["is_fractional"] = rules.is_fractional
+            job["fractional_type"] = _FRACTIONAL_TYPES.get(rules.employment_type.value, "unknown")
+            job["classification_confidence"] = rules.confidence
+            job["classification_reasoning"] = rules.reasoning
+            job["classification_method"] = "rules"
+            resolved_by_rules += 1
+            classified.append(job)
+            continue
+
         # Build context for classification
         job_context = f"""
 Title: {job.get('title', '')}
@@ -90,33 +122,40 @@ Compensation: {job.get('compensation', '')}
 Description: {job.get('description', '')[:500]}
 """
 
+        if openai is None:
+            from openai import AsyncOpenAI
+
+            openai = AsyncOpenAI(api_key=settings.openai_api_key)
+
         try:
-            response = await openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """You are a job classification expert. Analyze job listings and determine if they are:
+            async with provider_slot("openai"):
+                response = await openai.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": """You are a job classification expert. Analyze job listings and determine if they are:
 1. Fractional executive roles (C-suite/leadership working part-time for multiple companies)
 2. Part-time permanent roles
 3. Contract/temporary roles
 4. Full-time roles (not fractional)
 
 Respond with JSON: {"is_fractional": true/false, "fractional_type": "fractional|part-time|contract|full-time", "confidence": 0.0-1.0}"""
-                    },
-                    {
-                        "role": "user",
-                        "content": f"Classify this job:\n{job_context}"
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,
-            )
+                        },
+                        {
+                            "role": "user",
+                            "content": f"Classify this job:\n{job_context}"
+                        }
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.1,
+                )
 
             result = json.loads(response.choices[0].message.content)
             job["is_fractional"] = result.get("is_fractional", False)
             job["fractional_type"] = result.get("fractional_type", "unknown")
             job["classification_confidence"] = result.get("confidence", 0.0)
+            job["classification_method"] = "llm"
 
         except Exception as e:
             # Default to fractional if classification fails (from fractional job board)
@@ -124,9 +163,16 @@ Respond with JSON: {"is_fractional": true/false, "fractional_type": "fractional|
             job["fractional_type"] = "unknown"
             job["classification_confidence"] = 0.5
             job["classification_error"] = str(e)
+            job["classification_method"] = "fallback"
 
         classified.append(job)
 
+    if jobs:
+        activity.logger.info(
+            f"Rule fast path resolved {resolved_by_rules}/{len(jobs)} jobs "
+            f"({resolved_by_rules / len(jobs):.0%}) without an LLM call"
+        )
+
     return classified
 
 
@@ -141,6 +187,7 @@ async def save_fractional_jobs_to_database(data: dict) -> dict:
 
     added = 0
     updated = 0
+    duplicates_linked = 0
     errors = []
 
     try:
@@ -186,12 +233,13 @@ async def save_fractional_jobs_to_database(data: dict) -> dict:
                     updated += 1
                 else:
                     # Insert new job
-                    await conn.execute("""
+                    job_id = await conn.fetchval("""
                         INSERT INTO jobs (
                             board_id, company_name, title, full_description, department,
                             location, employment_type, url, posted_date,
                             first_seen_at, last_seen_at, external_id
                         ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $10, $11)
+                        RETURNING id
                     """,
                         board_id,
                         job.get("company_name"),
@@ -207,10 +255,23 @@ async def save_fractional_jobs_to_database(data: dict) -> dict:
                     )
                     added += 1
 
+                    # Fractional boards re-list roles from company career pages
+                    try:
+                        if await link_near_duplicate(conn, job_id, job):
+                            duplicates_linked += 1
+                    except Exception as e:
+                        # Dedup is best-effort; the job itself is already saved
+                        activity.logger.warning(f"Near-duplicate check failed for {job_id}: {e}")
+
             except Exception as e:
                 errors.append(f"Job '{job.get('title')}': {str(e)}")
 
-        return {"added": added, "updated": updated, "errors": errors}
+        return {
+            "added": added,
+            "updated": updated,
+            "duplicates_linked": duplicates_linked,
+            "errors": errors,
+        }
 
     finally:
         await conn.close()
@@ -4,15 +4,38 @@ Normalization activity for converting raw scraped jobs to normalized format.
 Uses Pydantic models for validation and normalization of job data.
 """
 
+import re
+from typing import Any
+
+from shared.job_taxonomy import (
+    C_SUITE_ROLES,
+    COUNTRY_MAP,
+    COUNTRY_ONLY_LOCATIONS,
+    DEPARTMENT_KEYWORDS,
+    EMPLOYMENT_TYPE_MAP,
+    EXECUTIVE_ROLE_DEPARTMENTS,
+    EXECUTIVE_ROLE_PATTERNS,
+    REMOTE_LOCATION_KEYWORDS,
+    SENIORITY_LEVEL_MAP,
+    UK_CITY_MAP,
+    UK_INFERENCE_CITIES,
+    US_CITY_MAP,
+    US_INFERENCE_CITIES,
+    WORKPLACE_KEYWORDS,
+    Country,
+    Department,
+    EmploymentType,
+    ExecutiveRole,
+    SeniorityLevel,
+    WorkplaceType,
+)
 from temporalio import activity
-from typing import List, Dict, Any
 
-from ..models.normalized import (
-    NormalizedJob,
-    NormalizedLocation,
-    NormalizedCompany,
-    NormalizedSalary,
-)
+from ..models.normalized import NormalizedJob, NormalizedLocation, NormalizedSalary
+
+# What parsing a malformed scraped job can raise (pydantic's ValidationError
+# is a ValueError). Anything else is a bug and should surface.
+NORMALIZE_ERRORS = (ValueError, TypeError, AttributeError, KeyError)
 
 
 def normalize_job(raw_job: dict, source: str = "unknown") -> dict:
@@ -93,7 +116,7 @@ def normalize_job(raw_job: dict, source: str = "unknown") -> dict:
             "raw_data": raw_job,
         }
 
-    except Exception as e:
+    except NORMALIZE_ERRORS as e:
         # If normalization fails, return basic fields
         return {
             "title": raw_job.get("title", "Unknown"),
@@ -110,6 +133,391 @@ def normalize_job(raw_job: dict, source: str = "unknown") -> dict:
         }
 
 
+# =============================================================================
+# BATCH NORMALIZATION
+# =============================================================================
+
+def _keyword_matcher(keywords: list[str]) -> "re.Pattern":
+    """Compile a substring-any matcher equivalent to any(k in s for k in keywords)."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+_DEPARTMENT_MATCHERS = [(dept, _keyword_matcher(kws)) for dept, kws in DEPARTMENT_KEYWORDS]
+_WORKPLACE_MATCHERS = [(wt, _keyword_matcher(kws)) for wt, kws in WORKPLACE_KEYWORDS]
+_EXECUTIVE_ROLE_MATCHERS = [(role, _keyword_matcher(p)) for role, p in EXECUTIVE_ROLE_PATTERNS.items()]
+_REMOTE_LOCATION_MATCHER = _keyword_matcher(REMOTE_LOCATION_KEYWORDS)
+_LOCATION_SPLIT = re.compile(r'[,\-/]')
+_SALARY_NUMBER = re.compile(r'[\d,]+(?:\.\d+)?k?')
+
+# Seniority implied by a detected executive role (mirrors NormalizedJob.post_process)
+_ROLE_SENIORITY = {}
+for _role in ExecutiveRole:
+    if _role in C_SUITE_ROLES:
+        _ROLE_SENIORITY[_role] = SeniorityLevel.C_SUITE
+    elif 'VP' in _role.value:
+        _ROLE_SENIORITY[_role] = SeniorityLevel.VP
+    elif _role == ExecutiveRole.DIRECTOR:
+        _ROLE_SENIORITY[_role] = SeniorityLevel.DIRECTOR
+    elif _role == ExecutiveRole.HEAD_OF:
+        _ROLE_SENIORITY[_role] = SeniorityLevel.HEAD
+
+# Raw fields NormalizedJob validates as Optional[str] / List[str]
+_OPTIONAL_STR_FIELDS = (
+    "id", "external_id", "hours_per_week", "description_html", "about_company",
+    "about_team", "application_deadline", "classification_reasoning",
+)
+_LIST_FIELDS = (
+    "responsibilities", "requirements", "qualifications", "nice_to_have",
+    "benefits", "skills_required", "site_tags",
+)
+
+
+def _is_str_list(value) -> bool:
+    return type(value) is list and all(type(v) is str for v in value)
+
+
+def _fast_path_eligible(raw_job: dict) -> bool:
+    """
+    True if the raw job only has the plain field types the batch path handles.
+
+    Anything Pydantic would coerce or reject (int ids, None lists, Ashby-style
+    `locations` arrays, ...) goes through normalize_job() instead so the output,
+    including the error fallback, stays identical.
+    """
+    if isinstance(raw_job.get("locations"), list):
+        return False
+    if type(raw_job.get("title", "Unknown")) is not str:
+        return False
+    if type(raw_job.get("url", "")) is not str:
+        return False
+    if type(raw_job.get("company_name", "Unknown")) is not str:
+        return False
+    for field in _OPTIONAL_STR_FIELDS:
+        value = raw_job.get(field)
+        if value is not None and type(value) is not str:
+            return False
+    for value in (
+        raw_job.get("location"),
+        raw_job.get("description_snippet") or raw_job.get("overview"),
+        raw_job.get("full_description") or raw_job.get("description_plain"),
+        raw_job.get("posted_date") or raw_job.get("published_date"),
+    ):
+        if value is not None and type(value) is not str:
+            return False
+    for field in _LIST_FIELDS:
+        if not _is_str_list(raw_job.get(field, [])):
+            return False
+    salary_str = raw_job.get("compensation") or raw_job.get("salary_info") or raw_job.get("salary")
+    if salary_str and type(salary_str) is not str:
+        return False
+    if type(raw_job.get("is_fractional", False)) is not bool:
+        return False
+    return type(raw_job.get("classification_confidence", 0.0)) in (float, int)
+
+
+def _parse_location(location_str: str | None) -> tuple[str | None, str, bool, str | None]:
+    """NormalizedLocation.from_string() as (city, country_code, is_remote, raw)."""
+    if not location_str:
+        return None, Country.UNKNOWN.value, False, location_str
+
+    is_remote = _REMOTE_LOCATION_MATCHER.search(location_str.lower()) is not None
+
+    parts = [p.strip() for p in _LOCATION_SPLIT.split(location_str) if p.strip()]
+
+    city = None
+    country = Country.UNKNOWN
+
+    if len(parts) >= 2:
+        city = parts[0]
+        country = COUNTRY_MAP.get(parts[-1].lower().strip(), Country.UNKNOWN)
+    elif len(parts) == 1:
+        val = parts[0].lower()
+        if val in COUNTRY_ONLY_LOCATIONS:
+            country = COUNTRY_MAP.get(val.strip(), Country.UNKNOWN)
+        else:
+            city = parts[0]
+            if val in UK_INFERENCE_CITIES:
+                country = Country.UK
+            elif val in US_INFERENCE_CITIES:
+                country = Country.US
+
+    if city:
+        city_lower = city.lower().strip()
+        city = UK_CITY_MAP.get(city_lower) or US_CITY_MAP.get(city_lower) or city.strip().title()
+    else:
+        city = None
+
+    return city, country.value, is_remote, location_str
+
+
+def _parse_salary(salary_str: str) -> tuple[int | None, int | None, str]:
+    """NormalizedSalary.from_string() as (min_amount, max_amount, currency)."""
+    s = salary_str.lower()
+
+    currency = "GBP"
+    if '$' in s or 'usd' in s or 'dollar' in s:
+        currency = "USD"
+    elif '€' in s or 'eur' in s:
+        currency = "EUR"
+
+    amounts = []
+    for n in _SALARY_NUMBER.findall(s):
+        n = n.replace(',', '')
+        if n.endswith('k'):
+            amounts.append(int(float(n[:-1]) * 1000))
+        else:
+            try:
+                amounts.append(int(float(n)))
+            except ValueError:
+                pass
+
+    min_amount = amounts[0] if len(amounts) >= 1 else None
+    max_amount = amounts[1] if len(amounts) >= 2 else min_amount
+    return min_amount, max_amount, currency
+
+
+def _employment_type(v) -> EmploymentType:
+    if isinstance(v, EmploymentType):
+        return v
+    if not v:
+        return EmploymentType.UNKNOWN
+    key = str(v).lower().strip().replace('-', '_').replace(' ', '_')
+    return EMPLOYMENT_TYPE_MAP.get(key, EmploymentType.UNKNOWN)
+
+
+def _seniority_level(v) -> SeniorityLevel:
+    if isinstance(v, SeniorityLevel):
+        return v
+    if not v:
+        return SeniorityLevel.UNKNOWN
+    key = str(v).lower().strip().replace('-', '_').replace(' ', '_')
+    return SENIORITY_LEVEL_MAP.get(key, SeniorityLevel.UNKNOWN)
+
+
+def _department(v) -> Department:
+    if isinstance(v, Department):
+        return v
+    if not v:
+        return Department.OTHER
+    v_lower = str(v).lower().strip()
+    for department, matcher in _DEPARTMENT_MATCHERS:
+        if matcher.search(v_lower):
+            return department
+    return Department.OTHER
+
+
+def _workplace_type(v) -> WorkplaceType:
+    if isinstance(v, WorkplaceType):
+        return v
+    if not v:
+        return WorkplaceType.UNKNOWN
+    v_lower = str(v).lower().strip()
+    for workplace_type, matcher in _WORKPLACE_MATCHERS:
+        if matcher.search(v_lower):
+            return workplace_type
+    return WorkplaceType.UNKNOWN
+
+
+def _title_signals(title: str) -> tuple[ExecutiveRole | None, EmploymentType | None]:
+    """Executive role and fractional employment override implied by a title."""
+    title_lower = title.lower()
+
+    role = None
+    for candidate, matcher in _EXECUTIVE_ROLE_MATCHERS:
+        if matcher.search(title_lower):
+            role = candidate
+            break
+
+    override = None
+    if 'fractional' in title_lower:
+        override = EmploymentType.FRACTIONAL
+    elif 'interim' in title_lower:
+        override = EmploymentType.INTERIM
+    elif 'part-time' in title_lower:
+        override = EmploymentType.PART_TIME
+
+    return role, override
+
+
+class _ParseFailed:
+    """Column value whose parse raised; the job falls back to normalize_job()."""
+
+
+_PARSE_FAILED = _ParseFailed()
+
+
+def _apply(fn, v):
+    try:
+        return fn(v)
+    except NORMALIZE_ERRORS:
+        return _PARSE_FAILED
+
+
+def _column(values: list, fn, cache: dict) -> list:
+    """Map fn over a column, computing each distinct (hashable) value once."""
+    out = []
+    for v in values:
+        try:
+            hit = cache.get(v, cache)
+        except TypeError:
+            out.append(_apply(fn, v))
+            continue
+        if hit is cache:
+            hit = _apply(fn, v)
+            cache[v] = hit
+        out.append(hit)
+    return out
+
+
+class BatchJobNormalizer:
+    """
+    Normalize a list of raw jobs column-wise.
+
+    Produces exactly the dicts normalize_job() would, but without building
+    Pydantic models per job: lookup tables and keyword matchers are compiled
+    once at import, each column (titles, locations, salaries, departments, ...)
+    is processed in one pass, and repeated strings are parsed once and cached
+    for the lifetime of the normalizer.
+    """
+
+    def __init__(self, source: str = "unknown"):
+        self.source = source
+        self._locations: dict[Any, tuple] = {}
+        self._salaries: dict[Any, tuple] = {}
+        self._titles: dict[Any, tuple] = {}
+        self._employment_types: dict[Any, EmploymentType] = {}
+        self._seniority_levels: dict[Any, SeniorityLevel] = {}
+        self._departments: dict[Any, Department] = {}
+        self._workplace_types: dict[Any, WorkplaceType] = {}
+
+    def normalize(self, raw_jobs: list[dict]) -> list[dict]:
+        results: list[dict | None] = [None] * len(raw_jobs)
+
+        fast = []
+        for i, raw_job in enumerate(raw_jobs):
+            if _fast_path_eligible(raw_job):
+                fast.append(i)
+            else:
+                results[i] = normalize_job(raw_job, source=self.source)
+
+        if not fast:
+            return results
+
+        jobs = [raw_jobs[i] for i in fast]
+
+        locations = _column([j.get("location") for j in jobs], _parse_location, self._locations)
+        salaries = _column(
+            [j.get("compensation") or j.get("salary_info") or j.get("salary") or None for j in jobs],
+            lambda s: _parse_salary(s) if s else None,
+            self._salaries,
+        )
+        titles = [j.get("title", "Unknown") for j in jobs]
+        title_signals = _column(titles, _title_signals, self._titles)
+        employment_types = _column([j.get("employment_type") for j in jobs], _employment_type, self._employment_types)
+        seniority_levels = _column([j.get("seniority_level") for j in jobs], _seniority_level, self._seniority_levels)
+        departments = _column([j.get("department") for j in jobs], _department, self._departments)
+        workplace_types = _column([j.get("workplace_type") for j in jobs], _workplace_type, self._workplace_types)
+
+        for n, i in enumerate(fast):
+            raw_job = raw_jobs[i]
+            row = (
+                locations[n],
+                salaries[n],
+                title_signals[n],
+                employment_types[n],
+                seniority_levels[n],
+                departments[n],
+                workplace_types[n],
+            )
+            if any(value is _PARSE_FAILED for value in row):
+                results[i] = normalize_job(raw_job, source=self.source)
+                continue
+            try:
+                results[i] = self._assemble(raw_job, titles[n], *row)
+            except NORMALIZE_ERRORS:
+                results[i] = normalize_job(raw_job, source=self.source)
+
+        return results
+
+    @staticmethod
+    def _assemble(raw_job, title, location, salary, title_signal, employment_type,
+                  seniority_level, department, workplace_type) -> dict:
+        city, country, loc_is_remote, raw_location = location
+        executive_role, employment_override = title_signal
+
+        is_fractional = raw_job.get("is_fractional", False)
+        if employment_override:
+            is_fractional = True
+            employment_type = employment_override
+
+        if executive_role and seniority_level == SeniorityLevel.UNKNOWN:
+            seniority_level = _ROLE_SENIORITY.get(executive_role, seniority_level)
+
+        if department == Department.OTHER and executive_role in EXECUTIVE_ROLE_DEPARTMENTS:
+            department = EXECUTIVE_ROLE_DEPARTMENTS[executive_role]
+
+        site_tags = list(raw_job.get("site_tags", []))
+        if is_fractional and "fractional" not in site_tags:
+            site_tags.append("fractional")
+
+        return {
+            # Core fields
+            "title": title,
+            "company_name": raw_job.get("company_name", "Unknown"),
+            "url": raw_job.get("url", ""),
+
+            # Location (normalized)
+            "location": city or raw_location,
+            "location_city": city,
+            "location_country": country,
+            "is_remote": loc_is_remote or workplace_type == WorkplaceType.REMOTE,
+
+            # Classification (normalized)
+            "employment_type": employment_type.value,
+            "seniority_level": seniority_level.value,
+            "department": department.value,
+            "is_fractional": is_fractional,
+            "executive_role": executive_role.value if executive_role else None,
+            "workplace_type": workplace_type.value,
+
+            # Salary (normalized)
+            "salary_min": salary[0] if salary else None,
+            "salary_max": salary[1] if salary else None,
+            "salary_currency": salary[2] if salary else None,
+
+            # Time commitment
+            "hours_per_week": raw_job.get("hours_per_week"),
+
+            # Description
+            "description_snippet": raw_job.get("description_snippet") or raw_job.get("overview"),
+            "full_description": raw_job.get("full_description") or raw_job.get("description_plain"),
+
+            # Structured content
+            "responsibilities": list(raw_job.get("responsibilities", [])),
+            "requirements": list(raw_job.get("requirements", [])),
+            "qualifications": list(raw_job.get("qualifications", [])),
+            "benefits": list(raw_job.get("benefits", [])),
+            "skills_required": list(raw_job.get("skills_required", [])),
+
+            # Company context
+            "about_company": raw_job.get("about_company"),
+            "about_team": raw_job.get("about_team"),
+
+            # Dates
+            "posted_date": raw_job.get("posted_date") or raw_job.get("published_date"),
+
+            # Classification metadata
+            "classification_confidence": float(raw_job.get("classification_confidence", 0.0)),
+            "classification_reasoning": raw_job.get("classification_reasoning"),
+
+            # Site routing
+            "site_tags": site_tags,
+
+            # Raw data for reference
+            "raw_data": raw_job,
+        }
+
+
 @activity.defn
 async def normalize_jobs(data: dict) -> dict:
     """
@@ -122,7 +530,7 @@ async def normalize_jobs(data: dict) -> dict:
     jobs = data["jobs"]
     source = data.get("source", "unknown")
 
-    normalized_jobs = []
+    prepared_jobs = []
     errors = []
 
     for raw_job in jobs:
@@ -131,15 +539,16 @@ async def normalize_jobs(data: dict) -> dict:
             if "company_name" not in raw_job:
                 raw_job["company_name"] = company.get("name", "Unknown")
 
-            normalized = normalize_job(raw_job, source=source)
-            normalized_jobs.append(normalized)
+            prepared_jobs.append(raw_job)
 
-        except Exception as e:
+        except (TypeError, AttributeError) as e:
             errors.append({
                 "title": raw_job.get("title", "Unknown"),
                 "error": str(e)
             })
 
+    normalized_jobs = BatchJobNormalizer(source=source).normalize(prepared_jobs)
+
     return {
         "company": company,
         "jobs": normalized_jobs,
@@ -156,7 +565,7 @@ async def normalize_single_job(job_data: dict) -> dict:
     return normalize_job(job_data, source=source)
 
 
-def compute_enhanced_site_tags(job: dict) -> List[str]:
+def compute_enhanced_site_tags(job: dict) -> list[str]:
     """
     Compute site tags based on normalized classification.
 
@@ -173,10 +582,12 @@ def compute_enhanced_site_tags(job: dict) -> List[str]:
     employment_type = (job.get("employment_type") or "").lower()
     seniority = (job.get("seniority_level") or "").lower()
 
-    if employment_type in ("part-time", "contract", "interim", "temporary", "fractional"):
-        if seniority in ("c-suite", "vp", "director", "head"):
-            if "fractional" not in tags:
-                tags.append("fractional")
+    if (
+        employment_type in ("part-time", "contract", "interim", "temporary", "fractional")
+        and seniority in ("c-suite", "vp", "director", "head")
+        and "fractional" not in tags
+    ):
+        tags.append("fractional")
 
     # Department-specific tags
     department = (job.get("department") or "").lower()
@@ -6,6 +6,7 @@ import json
 from temporalio import activity
 from zep_cloud.client import AsyncZep
 from ..config.settings import get_settings
+from shared.provider_limits import provider_slot
 
 
 @activity.defn
@@ -26,11 +27,12 @@ async def get_job_skill_graph(job_id: str) -> dict:
         zep = AsyncZep(api_key=settings.zep_api_key)
 
         # Search for the specific job
-        job_results = await zep.graph.search(
-            graph_id="jobs",
-            query=f"job id {job_id}",
-            limit=5
-        )
+        async with provider_slot("zep"):
+            job_results = await zep.graph.search(
+                graph_id="jobs",
+                query=f"job id {job_id}",
+                limit=5
+            )
 
         skills = []
         related_jobs = []
@@ -66,11 +68,12 @@ async def get_job_skill_graph(job_id: str) -> dict:
             if skill_names:
                 similarity_query = f"jobs requiring {' or '.join(skill_names[:3])}"
 
-                similar_results = await zep.graph.search(
-                    graph_id="jobs",
-                    query=similarity_query,
-                    limit=5
-                )
+                async with provider_slot("zep"):
+                    similar_results = await zep.graph.search(
+                        graph_id="jobs",
+                        query=similarity_query,
+                        limit=5
+                    )
 
                 if hasattr(similar_results, 'nodes') and similar_results.nodes:
                     for node in similar_results.nodes:
@@ -116,11 +119,12 @@ async def get_skills_for_company(company_name: str) -> dict:
         zep = AsyncZep(api_key=settings.zep_api_key)
 
         # Search for all jobs from this company
-        results = await zep.graph.search(
-            graph_id="jobs",
-            query=f"jobs at {company_name} required skills",
-            limit=20
-        )
+        async with provider_slot("zep"):
+            results = await zep.graph.search(
+                graph_id="jobs",
+                query=f"jobs at {company_name} required skills",
+                limit=20
+            )
 
         skill_counts = {}
 
@@ -167,11 +171,12 @@ async def search_jobs_by_skills(skill_names: list[str], limit: int = 10) -> dict
         # Build search query
         query = f"jobs requiring {' and '.join(skill_names)}"
 
-        results = await zep.graph.search(
-            graph_id="jobs",
-            query=query,
-            limit=limit
-        )
+        async with provider_slot("zep"):
+            results = await zep.graph.search(
+                graph_id="jobs",
+                query=query,
+                limit=limit
+            )
 
         jobs = []
 
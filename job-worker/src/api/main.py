@@ -4,6 +4,8 @@ from temporalio.client import Client
 from datetime import datetime
 import asyncpg
 
+from shared.pagination import count_rows, encode_cursor, keyset_condition
+
 from ..config.settings import get_settings
 from ..workflows import JobScrapingWorkflow
 
@@ -108,49 +110,99 @@ async def list_jobs(
     company: str | None = None,
     department: str | None = None,
     location: str | None = None,
+    employment_type: str | None = None,
+    is_fractional: bool | None = None,
+    site_tag: str | None = None,
+    active_only: bool = False,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
+    include_total: bool = False,
 ):
-    """List jobs with optional filters"""
+    """
+    List jobs with optional filters.
+
+    Ordered by (posted_date, id). Pass next_cursor back as `cursor` for the
+    following page; `offset` is kept for existing callers but gets slower the
+    deeper it goes. `include_total` adds an estimated total. Inactive jobs
+    are listed too unless `active_only` is set; active-only listings use the
+    partial (WHERE is_active) indexes and are the fast path.
+    """
+    conditions = ["j.is_active = true"] if active_only else ["1=1"]
+    params = []
+
+    if company:
+        params.append(company)
+        # A scalar subquery, so the board filter is an index condition on
+        # j.board_id and the (board_id, posted_date, id) index serves the order
+        conditions.append(f"j.board_id = (SELECT id FROM job_boards WHERE company_name = ${len(params)})")
+
+    if department:
+        params.append(f"%{department}%")
+        conditions.append(f"j.department ILIKE ${len(params)}")
+
+    if location:
+        params.append(f"%{location}%")
+        conditions.append(f"j.location ILIKE ${len(params)}")
+
+    if employment_type:
+        params.append(employment_type)
+        conditions.append(f"j.employment_type = ${len(params)}")
+
+    if is_fractional is not None:
+        params.append(is_fractional)
+        conditions.append(f"j.is_fractional = ${len(params)}")
+
+    if site_tag:
+        params.append(site_tag)
+        conditions.append(f"j.site_tags @> ARRAY[${len(params)}]::text[]")
+
+    from_where = f"jobs j JOIN job_boards jb ON j.board_id = jb.id WHERE {' AND '.join(conditions)}"
+    filter_params = list(params)
+
+    if cursor:
+        try:
+            conditions.append(keyset_condition(cursor, params))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        offset = 0
+
+    query = f"""
+        SELECT j.*, jb.company_name
+        FROM jobs j
+        JOIN job_boards jb ON j.board_id = jb.id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY j.posted_date DESC NULLS LAST, j.id DESC
+        LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+    """
+    # One extra row tells us whether there is a next page
+    params.extend([limit + 1, offset])
+
     conn = await asyncpg.connect(settings.database_url)
 
     try:
-        query = """
-            SELECT j.*, jb.name as company_name
-            FROM jobs j
-            JOIN job_boards jb ON j.job_board_id = jb.id
-            WHERE 1=1
-        """
-        params = []
-        param_count = 0
-
-        if company:
-            param_count += 1
-            query += f" AND jb.name = ${param_count}"
-            params.append(company)
-
-        if department:
-            param_count += 1
-            query += f" AND j.department ILIKE ${param_count}"
-            params.append(f"%{department}%")
-
-        if location:
-            param_count += 1
-            query += f" AND j.location ILIKE ${param_count}"
-            params.append(f"%{location}%")
-
-        query += f" ORDER BY j.created_at DESC LIMIT ${param_count + 1} OFFSET ${param_count + 2}"
-        params.extend([limit, offset])
-
         rows = await conn.fetch(query, *params)
+        jobs = [dict(row) for row in rows[:limit]]
 
-        return {
-            "jobs": [dict(row) for row in rows],
-            "count": len(rows),
+        next_cursor = None
+        if len(rows) > limit and jobs:
+            next_cursor = encode_cursor(jobs[-1]["posted_date"], jobs[-1]["id"])
+
+        result = {
+            "jobs": jobs,
+            "count": len(jobs),
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
 
+        if include_total:
+            total, total_is_estimate = await count_rows(conn, from_where, filter_params)
+            result["total"] = total
+            result["total_is_estimate"] = total_is_estimate
+
+        return result
+
     finally:
         await conn.close()
 
@@ -191,13 +243,13 @@ async def list_companies():
         rows = await conn.fetch("""
             SELECT
                 jb.id,
-                jb.name,
-                jb.careers_url,
+                jb.company_name AS name,
+                jb.url AS careers_url,
                 COUNT(j.id) as job_count
             FROM job_boards jb
-            LEFT JOIN jobs j ON j.job_board_id = jb.id
+            LEFT JOIN jobs j ON j.board_id = jb.id
             WHERE jb.is_active = true
-            GROUP BY jb.id, jb.name, jb.careers_url
+            GROUP BY jb.id, jb.company_name, jb.url
             ORDER BY job_count DESC
         """)
 
@@ -216,8 +268,8 @@ async def get_company_trends(company_name: str):
         rows = await conn.fetch("""
             SELECT j.department, j.location, j.title, j.created_at
             FROM jobs j
-            JOIN job_boards jb ON j.job_board_id = jb.id
-            WHERE jb.name = $1
+            JOIN job_boards jb ON j.board_id = jb.id
+            WHERE jb.company_name = $1
         """, company_name)
 
         if not rows:
@@ -2,182 +2,42 @@
 Normalized Pydantic models with AI-powered validation.
 
 Uses Pydantic AI for intelligent normalization of job data from
-different sources (Ashby, Greenhouse, Lever, LinkedIn/Apify).
+different sources (Ashby, Greenhouse, Lever, LinkedIn/Apify). The enums
+and lookup tables live in shared.job_taxonomy.
 """
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_ai import Agent
 from typing import Optional, List, Literal
-from enum import Enum
 import re
 
-
-# =============================================================================
-# ENUMS - Standardized categories
-# =============================================================================
-
-class Country(str, Enum):
-    """ISO country codes for job locations"""
-    UK = "GB"
-    US = "US"
-    GERMANY = "DE"
-    FRANCE = "FR"
-    NETHERLANDS = "NL"
-    IRELAND = "IE"
-    SPAIN = "ES"
-    ITALY = "IT"
-    CANADA = "CA"
-    AUSTRALIA = "AU"
-    SINGAPORE = "SG"
-    UAE = "AE"
-    REMOTE = "REMOTE"
-    UNKNOWN = "UNKNOWN"
-
-
-class UKCity(str, Enum):
-    """Major UK cities for filtering"""
-    LONDON = "London"
-    MANCHESTER = "Manchester"
-    BIRMINGHAM = "Birmingham"
-    BRISTOL = "Bristol"
-    LEEDS = "Leeds"
-    LIVERPOOL = "Liverpool"
-    EDINBURGH = "Edinburgh"
-    GLASGOW = "Glasgow"
-    CARDIFF = "Cardiff"
-    BELFAST = "Belfast"
-    CAMBRIDGE = "Cambridge"
-    OXFORD = "Oxford"
-    READING = "Reading"
-    OTHER = "Other UK"
-
-
-class USCity(str, Enum):
-    """Major US cities for filtering"""
-    NEW_YORK = "New York"
-    SAN_FRANCISCO = "San Francisco"
-    LOS_ANGELES = "Los Angeles"
-    SEATTLE = "Seattle"
-    AUSTIN = "Austin"
-    BOSTON = "Boston"
-    CHICAGO = "Chicago"
-    DENVER = "Denver"
-    MIAMI = "Miami"
-    OTHER = "Other US"
-
-
-class Department(str, Enum):
-    """Standardized department categories"""
-    FINANCE = "Finance"
-    MARKETING = "Marketing"
-    ENGINEERING = "Engineering"
-    OPERATIONS = "Operations"
-    HUMAN_RESOURCES = "Human Resources"
-    SALES = "Sales"
-    PRODUCT = "Product"
-    LEGAL = "Legal"
-    STRATEGY = "Strategy"
-    DATA = "Data"
-    DESIGN = "Design"
-    CUSTOMER_SUCCESS = "Customer Success"
-    GENERAL_MANAGEMENT = "General Management"
-    OTHER = "Other"
-
-
-class ExecutiveRole(str, Enum):
-    """C-suite and executive role categories"""
-    CEO = "CEO"
-    CFO = "CFO"
-    CTO = "CTO"
-    CMO = "CMO"
-    COO = "COO"
-    CHRO = "CHRO"
-    CPO = "CPO"  # Chief Product Officer
-    CRO = "CRO"  # Chief Revenue Officer
-    CDO = "CDO"  # Chief Data Officer
-    CIO = "CIO"  # Chief Information Officer
-    VP_FINANCE = "VP Finance"
-    VP_ENGINEERING = "VP Engineering"
-    VP_MARKETING = "VP Marketing"
-    VP_SALES = "VP Sales"
-    VP_PRODUCT = "VP Product"
-    VP_OPERATIONS = "VP Operations"
-    VP_HR = "VP HR"
-    DIRECTOR = "Director"
-    HEAD_OF = "Head of"
-    NON_EXECUTIVE = "Non-Executive"
-
-
-class EmploymentType(str, Enum):
-    """Employment arrangement types"""
-    FRACTIONAL = "Fractional"
-    PART_TIME = "Part-Time"
-    CONTRACT = "Contract"
-    INTERIM = "Interim"
-    TEMPORARY = "Temporary"
-    FULL_TIME = "Full-Time"
-    FREELANCE = "Freelance"
-    UNKNOWN = "Unknown"
-
-
-class SeniorityLevel(str, Enum):
-    """Job seniority levels"""
-    C_SUITE = "C-Suite"
-    VP = "VP"
-    DIRECTOR = "Director"
-    HEAD = "Head"
-    SENIOR_MANAGER = "Senior Manager"
-    MANAGER = "Manager"
-    SENIOR = "Senior"
-    MID = "Mid"
-    JUNIOR = "Junior"
-    ENTRY = "Entry"
-    UNKNOWN = "Unknown"
-
-
-class WorkplaceType(str, Enum):
-    """Workplace arrangement"""
-    REMOTE = "Remote"
-    HYBRID = "Hybrid"
-    ONSITE = "On-site"
-    FLEXIBLE = "Flexible"
-    UNKNOWN = "Unknown"
-
-
-class Industry(str, Enum):
-    """Company industry categories"""
-    TECHNOLOGY = "Technology"
-    FINTECH = "Fintech"
-    HEALTHTECH = "Healthtech"
-    ECOMMERCE = "E-commerce"
-    SAAS = "SaaS"
-    AI_ML = "AI/ML"
-    CYBERSECURITY = "Cybersecurity"
-    CONSULTING = "Consulting"
-    FINANCIAL_SERVICES = "Financial Services"
-    HEALTHCARE = "Healthcare"
-    MANUFACTURING = "Manufacturing"
-    RETAIL = "Retail"
-    MEDIA = "Media"
-    EDUCATION = "Education"
-    REAL_ESTATE = "Real Estate"
-    ENERGY = "Energy"
-    OTHER = "Other"
-
-
-class CompanyStage(str, Enum):
-    """Company funding/growth stage"""
-    PRE_SEED = "Pre-Seed"
-    SEED = "Seed"
-    SERIES_A = "Series A"
-    SERIES_B = "Series B"
-    SERIES_C = "Series C"
-    SERIES_D_PLUS = "Series D+"
-    GROWTH = "Growth"
-    PUBLIC = "Public"
-    PRIVATE_EQUITY = "Private Equity"
-    BOOTSTRAPPED = "Bootstrapped"
-    UNKNOWN = "Unknown"
+from shared.job_taxonomy import (
+    UK_CITY_MAP,
+    US_CITY_MAP,
+    COUNTRY_MAP,
+    COUNTRY_ONLY_LOCATIONS,
+    UK_INFERENCE_CITIES,
+    US_INFERENCE_CITIES,
+    REMOTE_LOCATION_KEYWORDS,
+    CURRENCY_MAP,
+    EQUITY_KEYWORDS,
+    EMPLOYMENT_TYPE_MAP,
+    SENIORITY_LEVEL_MAP,
+    DEPARTMENT_KEYWORDS,
+    WORKPLACE_KEYWORDS,
+    EXECUTIVE_ROLE_PATTERNS,
+    C_SUITE_ROLES,
+    EXECUTIVE_ROLE_DEPARTMENTS,
+    FRACTIONAL_TITLE_KEYWORDS,
+    Country,
+    Department,
+    ExecutiveRole,
+    EmploymentType,
+    SeniorityLevel,
+    WorkplaceType,
+    Industry,
+    CompanyStage,
+)
 
 
 # =============================================================================
@@ -200,49 +60,12 @@ class NormalizedLocation(BaseModel):
         if not v:
             return None
 
-        # UK city normalization
-        uk_city_map = {
-            'london': 'London',
-            'greater london': 'London',
-            'city of london': 'London',
-            'manchester': 'Manchester',
-            'birmingham': 'Birmingham',
-            'bristol': 'Bristol',
-            'leeds': 'Leeds',
-            'liverpool': 'Liverpool',
-            'edinburgh': 'Edinburgh',
-            'glasgow': 'Glasgow',
-            'cardiff': 'Cardiff',
-            'belfast': 'Belfast',
-            'cambridge': 'Cambridge',
-            'oxford': 'Oxford',
-            'reading': 'Reading',
-        }
-
-        # US city normalization
-        us_city_map = {
-            'new york': 'New York',
-            'nyc': 'New York',
-            'new york city': 'New York',
-            'san francisco': 'San Francisco',
-            'sf': 'San Francisco',
-            'bay area': 'San Francisco',
-            'los angeles': 'Los Angeles',
-            'la': 'Los Angeles',
-            'seattle': 'Seattle',
-            'austin': 'Austin',
-            'boston': 'Boston',
-            'chicago': 'Chicago',
-            'denver': 'Denver',
-            'miami': 'Miami',
-        }
-
         v_lower = v.lower().strip()
 
-        if v_lower in uk_city_map:
-            return uk_city_map[v_lower]
-        if v_lower in us_city_map:
-            return us_city_map[v_lower]
+        if v_lower in UK_CITY_MAP:
+            return UK_CITY_MAP[v_lower]
+        if v_lower in US_CITY_MAP:
+            return US_CITY_MAP[v_lower]
 
         # Title case for unknown cities
         return v.strip().title()
@@ -257,44 +80,7 @@ class NormalizedLocation(BaseModel):
 
         v_lower = str(v).lower().strip()
 
-        country_map = {
-            'uk': Country.UK,
-            'united kingdom': Country.UK,
-            'england': Country.UK,
-            'scotland': Country.UK,
-            'wales': Country.UK,
-            'northern ireland': Country.UK,
-            'gb': Country.UK,
-            'great britain': Country.UK,
-            'us': Country.US,
-            'usa': Country.US,
-            'united states': Country.US,
-            'america': Country.US,
-            'germany': Country.GERMANY,
-            'de': Country.GERMANY,
-            'france': Country.FRANCE,
-            'fr': Country.FRANCE,
-            'netherlands': Country.NETHERLANDS,
-            'nl': Country.NETHERLANDS,
-            'holland': Country.NETHERLANDS,
-            'ireland': Country.IRELAND,
-            'ie': Country.IRELAND,
-            'spain': Country.SPAIN,
-            'es': Country.SPAIN,
-            'italy': Country.ITALY,
-            'it': Country.ITALY,
-            'canada': Country.CANADA,
-            'ca': Country.CANADA,
-            'australia': Country.AUSTRALIA,
-            'au': Country.AUSTRALIA,
-            'singapore': Country.SINGAPORE,
-            'sg': Country.SINGAPORE,
-            'uae': Country.UAE,
-            'dubai': Country.UAE,
-            'remote': Country.REMOTE,
-        }
-
-        return country_map.get(v_lower, Country.UNKNOWN)
+        return COUNTRY_MAP.get(v_lower, Country.UNKNOWN)
 
     @classmethod
     def from_string(cls, location_str: Optional[str]) -> "NormalizedLocation":
@@ -306,7 +92,7 @@ class NormalizedLocation(BaseModel):
         loc_lower = location_str.lower()
 
         # Check for remote
-        is_remote = any(r in loc_lower for r in ['remote', 'anywhere', 'distributed', 'work from home', 'wfh'])
+        is_remote = any(r in loc_lower for r in REMOTE_LOCATION_KEYWORDS)
 
         # Try to extract city and country
         # Common patterns: "London, UK", "San Francisco, CA", "London", "Remote - UK"
@@ -329,17 +115,14 @@ class NormalizedLocation(BaseModel):
         elif len(parts) == 1:
             # Single value - could be city or country
             val = parts[0].lower()
-            if val in ['uk', 'us', 'usa', 'remote', 'germany', 'france']:
+            if val in COUNTRY_ONLY_LOCATIONS:
                 country = NormalizedLocation.normalize_country(val)
             else:
                 city = parts[0]
                 # Infer country from city
-                uk_cities = ['london', 'manchester', 'birmingham', 'bristol', 'leeds', 'edinburgh', 'glasgow']
-                us_cities = ['new york', 'san francisco', 'los angeles', 'seattle', 'austin', 'boston', 'chicago']
-
-                if val in uk_cities:
+                if val in UK_INFERENCE_CITIES:
                     country = Country.UK
-                elif val in us_cities:
+                elif val in US_INFERENCE_CITIES:
                     country = Country.US
 
         return cls(
@@ -401,22 +184,7 @@ class NormalizedSalary(BaseModel):
         if not v:
             return "GBP"
 
-        currency_map = {
-            '£': 'GBP',
-            'gbp': 'GBP',
-            'pound': 'GBP',
-            'pounds': 'GBP',
-            '$': 'USD',
-            'usd': 'USD',
-            'dollar': 'USD',
-            'dollars': 'USD',
-            '€': 'EUR',
-            'eur': 'EUR',
-            'euro': 'EUR',
-            'euros': 'EUR',
-        }
-
-        return currency_map.get(v.lower().strip(), v.upper())
+        return CURRENCY_MAP.get(v.lower().strip(), v.upper())
 
     @classmethod
     def from_string(cls, salary_str: Optional[str]) -> Optional["NormalizedSalary"]:
@@ -468,7 +236,7 @@ class NormalizedSalary(BaseModel):
         max_amount = amounts[1] if len(amounts) >= 2 else min_amount
 
         # Check for equity
-        is_equity = any(e in s for e in ['equity', 'stock', 'options', 'shares'])
+        is_equity = any(e in s for e in EQUITY_KEYWORDS)
 
         return cls(
             min_amount=min_amount,
@@ -558,24 +326,7 @@ class NormalizedJob(BaseModel):
 
         v_lower = str(v).lower().strip().replace('-', '_').replace(' ', '_')
 
-        type_map = {
-            'fractional': EmploymentType.FRACTIONAL,
-            'part_time': EmploymentType.PART_TIME,
-            'part time': EmploymentType.PART_TIME,
-            'parttime': EmploymentType.PART_TIME,
-            'contract': EmploymentType.CONTRACT,
-            'contractor': EmploymentType.CONTRACT,
-            'interim': EmploymentType.INTERIM,
-            'temporary': EmploymentType.TEMPORARY,
-            'temp': EmploymentType.TEMPORARY,
-            'full_time': EmploymentType.FULL_TIME,
-            'full time': EmploymentType.FULL_TIME,
-            'fulltime': EmploymentType.FULL_TIME,
-            'permanent': EmploymentType.FULL_TIME,
-            'freelance': EmploymentType.FREELANCE,
-        }
-
-        return type_map.get(v_lower, EmploymentType.UNKNOWN)
+        return EMPLOYMENT_TYPE_MAP.get(v_lower, EmploymentType.UNKNOWN)
 
     @field_validator('seniority_level', mode='before')
     @classmethod
@@ -587,27 +338,7 @@ class NormalizedJob(BaseModel):
 
         v_lower = str(v).lower().strip().replace('-', '_').replace(' ', '_')
 
-        level_map = {
-            'c_suite': SeniorityLevel.C_SUITE,
-            'csuite': SeniorityLevel.C_SUITE,
-            'c_level': SeniorityLevel.C_SUITE,
-            'chief': SeniorityLevel.C_SUITE,
-            'vp': SeniorityLevel.VP,
-            'vice_president': SeniorityLevel.VP,
-            'director': SeniorityLevel.DIRECTOR,
-            'head': SeniorityLevel.HEAD,
-            'head_of': SeniorityLevel.HEAD,
-            'senior_manager': SeniorityLevel.SENIOR_MANAGER,
-            'manager': SeniorityLevel.MANAGER,
-            'senior': SeniorityLevel.SENIOR,
-            'mid': SeniorityLevel.MID,
-            'mid_level': SeniorityLevel.MID,
-            'junior': SeniorityLevel.JUNIOR,
-            'entry': SeniorityLevel.ENTRY,
-            'entry_level': SeniorityLevel.ENTRY,
-        }
-
-        return level_map.get(v_lower, SeniorityLevel.UNKNOWN)
+        return SENIORITY_LEVEL_MAP.get(v_lower, SeniorityLevel.UNKNOWN)
 
     @field_validator('department', mode='before')
     @classmethod
@@ -620,32 +351,9 @@ class NormalizedJob(BaseModel):
         v_lower = str(v).lower().strip()
 
         # Keywords to department mapping
-        if any(k in v_lower for k in ['finance', 'accounting', 'cfo', 'financial']):
-            return Department.FINANCE
-        if any(k in v_lower for k in ['marketing', 'cmo', 'brand', 'growth']):
-            return Department.MARKETING
-        if any(k in v_lower for k in ['engineering', 'cto', 'development', 'software', 'tech']):
-            return Department.ENGINEERING
-        if any(k in v_lower for k in ['operations', 'coo', 'ops']):
-            return Department.OPERATIONS
-        if any(k in v_lower for k in ['hr', 'human resources', 'people', 'talent', 'chro']):
-            return Department.HUMAN_RESOURCES
-        if any(k in v_lower for k in ['sales', 'cro', 'revenue', 'business development']):
-            return Department.SALES
-        if any(k in v_lower for k in ['product', 'cpo']):
-            return Department.PRODUCT
-        if any(k in v_lower for k in ['legal', 'compliance', 'general counsel']):
-            return Department.LEGAL
-        if any(k in v_lower for k in ['strategy', 'corporate development']):
-            return Department.STRATEGY
-        if any(k in v_lower for k in ['data', 'analytics', 'cdo']):
-            return Department.DATA
-        if any(k in v_lower for k in ['design', 'ux', 'ui', 'creative']):
-            return Department.DESIGN
-        if any(k in v_lower for k in ['customer success', 'customer service', 'support']):
-            return Department.CUSTOMER_SUCCESS
-        if any(k in v_lower for k in ['ceo', 'general manager', 'managing director']):
-            return Department.GENERAL_MANAGEMENT
+        for department, keywords in DEPARTMENT_KEYWORDS:
+            if any(k in v_lower for k in keywords):
+                return department
 
         return Department.OTHER
 
@@ -659,14 +367,9 @@ class NormalizedJob(BaseModel):
 
         v_lower = str(v).lower().strip()
 
-        if any(k in v_lower for k in ['remote', 'work from home', 'wfh', 'anywhere']):
-            return WorkplaceType.REMOTE
-        if any(k in v_lower for k in ['hybrid', 'mixed']):
-            return WorkplaceType.HYBRID
-        if any(k in v_lower for k in ['onsite', 'on-site', 'office', 'in-person']):
-            return WorkplaceType.ONSITE
-        if any(k in v_lower for k in ['flexible']):
-            return WorkplaceType.FLEXIBLE
+        for workplace_type, keywords in WORKPLACE_KEYWORDS:
+            if any(k in v_lower for k in keywords):
+                return workplace_type
 
         return WorkplaceType.UNKNOWN
 
@@ -674,29 +377,7 @@ class NormalizedJob(BaseModel):
         """Detect executive role from title"""
         title_lower = self.title.lower()
 
-        role_patterns = {
-            ExecutiveRole.CEO: ['ceo', 'chief executive', 'managing director'],
-            ExecutiveRole.CFO: ['cfo', 'chief financial', 'finance director'],
-            ExecutiveRole.CTO: ['cto', 'chief technology', 'chief technical'],
-            ExecutiveRole.CMO: ['cmo', 'chief marketing'],
-            ExecutiveRole.COO: ['coo', 'chief operating', 'chief operations'],
-            ExecutiveRole.CHRO: ['chro', 'chief human resources', 'chief people'],
-            ExecutiveRole.CPO: ['cpo', 'chief product'],
-            ExecutiveRole.CRO: ['cro', 'chief revenue'],
-            ExecutiveRole.CDO: ['cdo', 'chief data'],
-            ExecutiveRole.CIO: ['cio', 'chief information'],
-            ExecutiveRole.VP_FINANCE: ['vp finance', 'vp of finance', 'vice president finance'],
-            ExecutiveRole.VP_ENGINEERING: ['vp engineering', 'vp of engineering', 'vice president engineering'],
-            ExecutiveRole.VP_MARKETING: ['vp marketing', 'vp of marketing', 'vice president marketing'],
-            ExecutiveRole.VP_SALES: ['vp sales', 'vp of sales', 'vice president sales'],
-            ExecutiveRole.VP_PRODUCT: ['vp product', 'vp of product', 'vice president product'],
-            ExecutiveRole.VP_OPERATIONS: ['vp operations', 'vp of operations', 'vice president operations'],
-            ExecutiveRole.VP_HR: ['vp hr', 'vp of hr', 'vp people', 'vice president hr'],
-            ExecutiveRole.DIRECTOR: ['director'],
-            ExecutiveRole.HEAD_OF: ['head of'],
-        }
-
-        for role, patterns in role_patterns.items():
+        for role, patterns in EXECUTIVE_ROLE_PATTERNS.items():
             if any(p in title_lower for p in patterns):
                 return role
 
@@ -711,7 +392,7 @@ class NormalizedJob(BaseModel):
 
         # Auto-detect fractional from title
         title_lower = self.title.lower()
-        if any(k in title_lower for k in ['fractional', 'part-time', 'interim']):
+        if any(k in title_lower for k in FRACTIONAL_TITLE_KEYWORDS):
             self.is_fractional = True
             if 'fractional' in title_lower:
                 self.employment_type = EmploymentType.FRACTIONAL
@@ -722,10 +403,7 @@ class NormalizedJob(BaseModel):
 
         # Set seniority from executive role
         if self.executive_role and self.seniority_level == SeniorityLevel.UNKNOWN:
-            if self.executive_role in [ExecutiveRole.CEO, ExecutiveRole.CFO, ExecutiveRole.CTO,
-                                        ExecutiveRole.CMO, ExecutiveRole.COO, ExecutiveRole.CHRO,
-                                        ExecutiveRole.CPO, ExecutiveRole.CRO, ExecutiveRole.CDO,
-                                        ExecutiveRole.CIO]:
+            if self.executive_role in C_SUITE_ROLES:
                 self.seniority_level = SeniorityLevel.C_SUITE
             elif 'VP' in self.executive_role.value:
                 self.seniority_level = SeniorityLevel.VP
@@ -736,26 +414,8 @@ class NormalizedJob(BaseModel):
 
         # Set department from executive role if not set
         if self.department == Department.OTHER and self.executive_role:
-            role_to_dept = {
-                ExecutiveRole.CFO: Department.FINANCE,
-                ExecutiveRole.VP_FINANCE: Department.FINANCE,
-                ExecutiveRole.CMO: Department.MARKETING,
-                ExecutiveRole.VP_MARKETING: Department.MARKETING,
-                ExecutiveRole.CTO: Department.ENGINEERING,
-                ExecutiveRole.VP_ENGINEERING: Department.ENGINEERING,
-                ExecutiveRole.COO: Department.OPERATIONS,
-                ExecutiveRole.VP_OPERATIONS: Department.OPERATIONS,
-                ExecutiveRole.CHRO: Department.HUMAN_RESOURCES,
-                ExecutiveRole.VP_HR: Department.HUMAN_RESOURCES,
-                ExecutiveRole.CRO: Department.SALES,
-                ExecutiveRole.VP_SALES: Department.SALES,
-                ExecutiveRole.CPO: Department.PRODUCT,
-                ExecutiveRole.VP_PRODUCT: Department.PRODUCT,
-                ExecutiveRole.CDO: Department.DATA,
-                ExecutiveRole.CEO: Department.GENERAL_MANAGEMENT,
-            }
-            if self.executive_role in role_to_dept:
-                self.department = role_to_dept[self.executive_role]
+            if self.executive_role in EXECUTIVE_ROLE_DEPARTMENTS:
+                self.department = EXECUTIVE_ROLE_DEPARTMENTS[self.executive_role]
 
         # Add site tags based on classification
         if self.is_fractional and 'fractional' not in self.site_tags:
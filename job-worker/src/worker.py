@@ -3,6 +3,9 @@ import logging
 from temporalio.client import Client
 from temporalio.worker import Worker
 
+from shared.provider_limits import configure_provider_limits
+from shared.telemetry import telemetry_interceptors
+
 from .config.settings import get_settings
 from .workflows import (
     JobScrapingWorkflow,
@@ -48,6 +51,9 @@ async def main():
         tls=settings.temporal_tls,
     )
 
+    # Gemini/OpenAI/Zep calls share account-wide limits with the other workers
+    configure_provider_limits(database_url=settings.database_url)
+
     worker = Worker(
         client,
         task_queue=settings.temporal_task_queue,
@@ -76,6 +82,7 @@ async def main():
             deep_scrape_job_urls,
             save_jobs_to_zep,
         ],
+        interceptors=telemetry_interceptors("job-worker"),
     )
 
     logger.info("Starting Temporal worker...")
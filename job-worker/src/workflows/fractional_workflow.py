@@ -59,6 +59,10 @@ class FractionalJobsScraperWorkflow:
             retry_policy=RetryPolicy(maximum_attempts=2),
         )
 
+        # Share of jobs classified without an LLM call
+        rule_classified = sum(1 for j in classified_jobs if j.get("classification_method") == "rules")
+        rule_resolution_rate = rule_classified / len(classified_jobs) if classified_jobs else 0.0
+
         # Filter to only fractional jobs
         fractional_jobs = [j for j in classified_jobs if j.get("is_fractional", False)]
 
@@ -67,6 +71,8 @@ class FractionalJobsScraperWorkflow:
                 "source": config.get("source_url", "https://www.fractionaljobs.io/"),
                 "jobs_scraped": len(raw_jobs),
                 "jobs_classified_fractional": 0,
+                "jobs_classified_by_rules": rule_classified,
+                "rule_resolution_rate": rule_resolution_rate,
                 "jobs_added": 0,
                 "jobs_updated": 0,
                 "errors": ["No jobs classified as fractional"],
@@ -93,8 +99,11 @@ class FractionalJobsScraperWorkflow:
             "source": config.get("source_url", "https://www.fractionaljobs.io/"),
             "jobs_scraped": len(raw_jobs),
             "jobs_classified_fractional": len(fractional_jobs),
+            "jobs_classified_by_rules": rule_classified,
+            "rule_resolution_rate": rule_resolution_rate,
             "jobs_added": db_result.get("added", 0),
             "jobs_updated": db_result.get("updated", 0),
+            "jobs_linked_as_duplicates": db_result.get("duplicates_linked", 0),
             "errors": db_result.get("errors", []),
             "duration_seconds": duration,
         }
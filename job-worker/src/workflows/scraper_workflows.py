@@ -43,6 +43,7 @@ class AshbyScraperWorkflow:
             "jobs_found": len(jobs),
             "jobs_added": db_result.get("added", 0),
             "jobs_updated": db_result.get("updated", 0),
+            "jobs_linked_as_duplicates": db_result.get("duplicates_linked", 0),
             "errors": db_result.get("errors", []),
             "duration_seconds": duration,
         }
@@ -118,6 +119,7 @@ class GreenhouseScraperWorkflow:
             "jobs_fractional": fractional_count,
             "jobs_added": db_result.get("added", 0),
             "jobs_updated": db_result.get("updated", 0),
+            "jobs_linked_as_duplicates": db_result.get("duplicates_linked", 0),
             "jobs_saved_to_zep": zep_result.get("jobs_saved_to_graph", 0),
             "zep_skipped_duplicates": zep_result.get("skipped_duplicates", 0),
             "errors": db_result.get("errors", []),
@@ -161,6 +163,7 @@ class LeverScraperWorkflow:
             "jobs_found": len(jobs),
             "jobs_added": db_result.get("added", 0),
             "jobs_updated": db_result.get("updated", 0),
+            "jobs_linked_as_duplicates": db_result.get("duplicates_linked", 0),
             "errors": db_result.get("errors", []),
             "duration_seconds": duration,
         }
@@ -202,6 +205,7 @@ class UnknownScraperWorkflow:
             "jobs_found": len(jobs),
             "jobs_added": db_result.get("added", 0),
             "jobs_updated": db_result.get("updated", 0),
+            "jobs_linked_as_duplicates": db_result.get("duplicates_linked", 0),
             "errors": db_result.get("errors", []),
             "duration_seconds": duration,
         }
@@ -0,0 +1,38 @@
+import asyncio
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+from src.activities import fractional
+
+
+def test_rule_resolved_jobs_never_create_an_openai_client(monkeypatch):
+    def no_client(*args, **kwargs):
+        pytest.fail("OpenAI client created for a rule-resolved batch")
+
+    monkeypatch.setattr(openai, "AsyncOpenAI", no_client)
+    jobs = [{"title": "Fractional CFO"}, {"title": "Interim Head of Finance"}]
+
+    classified = asyncio.run(fractional.classify_fractional_jobs(jobs))
+
+    assert [job["classification_method"] for job in classified] == ["rules", "rules"]
+    assert all(job["is_fractional"] for job in classified)
+
+
+def test_non_executive_part_time_job_goes_to_the_llm(monkeypatch):
+    class Completions:
+        async def create(self, **kwargs):
+            message = SimpleNamespace(content='{"is_fractional": false, "fractional_type": "part-time", "confidence": 0.9}')
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    def client(*args, **kwargs):
+        return SimpleNamespace(chat=SimpleNamespace(completions=Completions()))
+
+    monkeypatch.setattr(openai, "AsyncOpenAI", client)
+    jobs = [{"title": "Part-time Sales Assistant"}, {"title": "Contract Software Engineer", "employment_type": "Contract"}]
+
+    classified = asyncio.run(fractional.classify_fractional_jobs(jobs))
+
+    assert [job["classification_method"] for job in classified] == ["llm", "llm"]
+    assert not any(job["is_fractional"] for job in classified)
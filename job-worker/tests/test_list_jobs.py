@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from src.api import main
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+
+    async def fetch(self, query, *params):
+        self.queries.append(query)
+        return []
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    conn = FakeConnection()
+
+    async def connect(*args, **kwargs):
+        return conn
+
+    monkeypatch.setattr(main.asyncpg, "connect", connect)
+    return conn
+
+
+def test_lists_every_job_by_default(conn):
+    asyncio.run(main.list_jobs(employment_type="contract"))
+
+    assert "is_active" not in conn.queries[0]
+
+
+def test_active_only_uses_the_active_filter(conn):
+    asyncio.run(main.list_jobs(active_only=True))
+
+    assert "j.is_active = true" in conn.queries[0]
+
+
+def test_company_filter_is_on_the_indexed_board_column(conn):
+    asyncio.run(main.list_jobs(company="Acme", active_only=True))
+
+    assert "j.board_id = (SELECT id FROM job_boards WHERE company_name = $1)" in conn.queries[0]
+    assert "job_board_id" not in conn.queries[0]
@@ -0,0 +1,117 @@
+import asyncio
+import random
+
+from temporalio.testing import ActivityEnvironment
+
+from src.activities import normalization
+from src.activities.normalization import BatchJobNormalizer, normalize_job, normalize_jobs
+
+TITLES = [
+    "Fractional CFO", "Interim Finance Director", "Part-time CMO", "Head of Engineering",
+    "Senior Software Engineer", "VP of Sales", "Chief Operating Officer", "Data Analyst",
+    "Fractional CTO (2 days/week)", "General Counsel", "Chief People Officer", "",
+]
+LOCATIONS = [
+    "London, UK", "London", "Remote - UK", "Remote", "San Francisco, CA", "New York, USA",
+    "Berlin, Germany", "Hybrid - London", "Amsterdam/Netherlands", "UK", None, "",
+]
+DEPARTMENTS = ["Finance", "Engineering", "Marketing & Growth", "People", "Legal", "Design", None, ""]
+EMPLOYMENT_TYPES = ["Full-time", "Part-time", "Contract", "FullTime", "Fractional", "Interim", None]
+SENIORITY = ["Senior", "Director", "Head", "C-Suite", "Mid-Level", None]
+WORKPLACE = ["Remote", "Hybrid", "On-site", "Office based", None]
+SALARIES = ["£100,000 - £150,000", "$200k - $300k", "£800/day", "Competitive", "€90,000", "£45k-£55k", None]
+
+
+def raw_jobs(count, seed):
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        job = {
+            "title": rng.choice(TITLES),
+            "company_name": f"Company {rng.randint(1, 20)}",
+            "url": f"https://jobs.example.com/{i}",
+            "location": rng.choice(LOCATIONS),
+            "department": rng.choice(DEPARTMENTS),
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "seniority_level": rng.choice(SENIORITY),
+            "workplace_type": rng.choice(WORKPLACE),
+            "description_plain": "We are hiring. " * rng.randint(1, 5),
+            "posted_date": f"2025-11-{rng.randint(1, 28):02d}",
+            "site_tags": rng.choice([[], ["uk"], ["fractional", "uk"]]),
+            "is_fractional": rng.random() < 0.2,
+        }
+        salary = rng.choice(SALARIES)
+        if salary:
+            job["compensation"] = salary
+        jobs.append(job)
+    return jobs
+
+
+def test_batch_matches_per_job_normalization():
+    jobs = raw_jobs(400, seed=11)
+
+    assert BatchJobNormalizer(source="ashby").normalize(jobs) == [
+        normalize_job(job, source="ashby") for job in jobs
+    ]
+
+
+def test_unusual_shapes_fall_back_to_per_job_path():
+    jobs = [
+        {"title": "Fractional CFO", "id": 1234, "location": "London"},
+        {"title": "CTO", "locations": [{"city": "Berlin"}], "company_name": "Acme"},
+        {"title": "CMO", "responsibilities": None},
+        {"title": None, "url": "https://jobs.example.com/x"},
+        {"title": "COO", "classification_confidence": "high"},
+        {"title": "VP Sales", "compensation": 150000},
+    ]
+
+    assert BatchJobNormalizer().normalize(jobs) == [normalize_job(job) for job in jobs]
+
+
+def test_repeated_values_are_parsed_once(monkeypatch):
+    calls = []
+    parse_location = normalization._parse_location
+
+    def counting(value):
+        calls.append(value)
+        return parse_location(value)
+
+    monkeypatch.setattr(normalization, "_parse_location", counting)
+    normalizer = BatchJobNormalizer()
+    jobs = [{"title": "CFO", "location": location} for location in ["London", "Remote", "London"] * 10]
+
+    normalizer.normalize(jobs)
+    normalizer.normalize(jobs)
+
+    assert sorted(calls) == ["London", "Remote"]
+
+
+def test_parse_failure_falls_back_for_that_job_only(monkeypatch):
+    parse_salary = normalization._parse_salary
+
+    def flaky(value):
+        if value == "broken":
+            raise ValueError(value)
+        return parse_salary(value)
+
+    monkeypatch.setattr(normalization, "_parse_salary", flaky)
+    jobs = [{"title": "CFO", "compensation": "£100k"}, {"title": "CTO", "compensation": "broken"}]
+
+    results = BatchJobNormalizer().normalize(jobs)
+
+    assert results[0] == normalize_job(jobs[0])
+    assert results[1] == normalize_job(jobs[1])
+
+
+def test_normalize_jobs_fills_company_name():
+    data = {
+        "company": {"name": "Acme"},
+        "jobs": [{"title": "Fractional CFO", "location": "London, UK"}, {"title": "CTO", "company_name": "Beta"}],
+        "source": "lever",
+    }
+
+    result = asyncio.run(ActivityEnvironment().run(normalize_jobs, data))
+
+    assert [job["company_name"] for job in result["jobs"]] == ["Acme", "Beta"]
+    assert result["jobs"][0]["is_fractional"] is True
+    assert result["normalization_errors"] == []
@@ -0,0 +1,29 @@
+"""
+Code and data shared by the Quest workers and the gateway.
+
+One copy of modules that used to be pasted into each service:
+- app_config: the app registry (app_configs.json) and character style prompts
+- telemetry: per-activity latency/size/cost interceptor and report CLI
+- provider_limits: account-wide rate and concurrency limits for the external
+  APIs (Gemini, OpenAI, Zep, ...) every worker calls
+- pagination: keyset cursors and cheap counts for the job listing APIs
+- job_taxonomy: job enums and lookup tables (countries, seniority, roles...)
+- rule_classification: the deterministic job pre-classifier both job workers
+  run before falling back to an LLM
+- near_duplicates: MinHash/LSH linking of the same job scraped from two boards
+
+Installed as the quest-shared distribution. Services don't list it in their
+requirements.txt: pip resolves paths in a requirements file from the
+current directory, so a relative ../shared only works from inside the
+service directory. Instead every service builds from the repository root:
+
+    pip install ./shared -r <service>/requirements.txt
+    cd <service> && python worker.py
+
+Each service's railway.toml/railway.json runs exactly that. On Railway,
+leave the Root Directory empty (shared/ must be in the build context) and
+set the config path to /<service>/railway.toml (or .json). For local work:
+
+    pip install -e shared        # from the repository root
+    cd shared && python -m pytest
+"""
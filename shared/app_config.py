@@ -0,0 +1,739 @@
+"""
+App Configurations for Quest
+
+Each app has specific:
+- Keywords for news monitoring
+- Exclusions (topics to avoid)
+- Interests (what to prioritize)
+- Geographic focus
+- Target audience context
+
+The apps themselves are defined in app_configs.json next to this module,
+the one registry used by content-worker and video-worker. It is loaded
+and validated once at import, then frozen into slotted, immutable
+dataclasses. Derived values such as act timestamps and the 4-act prompt
+block for each template are computed at load time, so prompt builders
+only read attributes.
+
+=============================================================================
+ARTICLE TYPES (VideoActTemplate.name)
+=============================================================================
+Sonnet should select the appropriate template based on article topic:
+
+PLACEMENT APP:
+- "deal_story" - Deal/transaction story arc (default)
+  Use for: Acquisitions, fundraising, exits
+  Example: "Apollo Closes $25B Fund VIII"
+
+- "market_analysis" - Industry trends, market overview
+  Use for: Industry reports, market overviews
+  Example: "Q3 2025 PE Fundraising Report"
+
+- "profile" - Company/firm spotlight
+  Use for: Placement agent profiles, GP spotlights
+  Example: "Inside Park Hill: How They Dominate PE Placement"
+
+- "deal_summary" - Quick transaction overview
+  Use for: Transaction summaries, deal briefs
+  Example: "Carlyle's Healthcare Exit: Deal Breakdown"
+
+- "deal_of_week" - Featured transaction spotlight
+  Use for: Deal of the Week, notable transactions
+  Example: "Deal of the Week: KKR's Infrastructure Play"
+
+- "investment_guide" - Educational content (REQUIRES DISCLAIMER)
+  Use for: "How to invest in X", "Understanding Y"
+  Example: "Understanding GP Stakes Investing"
+  NOTE: Must include InvestmentDisclaimer component prominently!
+
+RELOCATION APP:
+- "transformation" - Personal journey from current life to new life
+  Use for: Visa guides, moving abroad, lifestyle change articles
+  Example: "Cyprus Digital Nomad Visa 2025"
+
+- "country_guide" - Destination showcase
+  Use for: Country guides, city guides, "living in X" articles
+  Example: "Living in Lisbon: A Complete Guide"
+
+- "comparison" - Side-by-side evaluation
+  Use for: "X vs Y" articles, comparison guides
+  Example: "Portugal vs Spain: Which is Better for Remote Workers?"
+
+- "listicle" - Multiple highlights
+  Use for: "Top X" articles, "Best Y" lists
+  Example: "Top 10 Digital Nomad Destinations 2025"
+
+=============================================================================
+NEON DATABASE REQUIREMENTS
+=============================================================================
+For articles to render correctly on the frontend, these fields MUST be populated:
+
+REQUIRED:
+- video_playback_id: Mux playback ID for the video
+- video_narrative: JSON with acts structure:
+  {
+    "playback_id": "xxx",
+    "acts": {
+      "act_1": {"start": 0, "end": 3, "title": "The Grind"},
+      "act_2": {"start": 3, "end": 6, "title": "The Dream"},
+      "act_3": {"start": 6, "end": 9, "title": "The Journey"},
+      "act_4": {"start": 9, "end": 12, "title": "The Reality"}
+    }
+  }
+- payload: JSON with structured content:
+  {
+    "four_act_content": [
+      {"title": "...", "factoid": "...", "video_title": "...", "four_act_visual_hint": "..."},
+      ...4 sections
+    ],
+    "faq": [{"q": "...", "a": "..."}],
+    "callouts": [{"type": "pro_tip", "title": "...", "content": "...", "placement": "after_section_2"}],
+    "comparison": {"title": "...", "items": [{"name": "Cyprus", "cost": "€800/mo", ...}]},
+    "timeline": [{"date": "2022", "title": "...", "description": "..."}],
+    "stat_highlight": {"headline": "...", "stats": [{"value": "3,400", "label": "Hours of sunshine"}]},
+    "sources": [{"name": "...", "url": "...", "description": "..."}]
+  }
+- content: HTML article content
+- meta_description: SEO excerpt
+
+OPTIONAL:
+- article_angle: Category label (e.g., "Relocation Guide", "Visa Guide")
+- word_count: Article length
+
+=============================================================================
+MUX VIDEO TRICKS
+=============================================================================
+Mux provides powerful URL-based features:
+
+THUMBNAILS:
+  https://image.mux.com/{playback_id}/thumbnail.jpg?time=1.5&width=800
+
+ANIMATED GIFS (bounded loops!):
+  https://image.mux.com/{playback_id}/animated.gif?start=0&end=3&width=480&fps=12
+  - Max width: 640px (larger fails with "Invalid width")
+  - fps: 12-15 recommended
+  - start/end: Time range in seconds
+  - This is the SECRET to bounded video loops without JavaScript!
+
+STORYBOARD:
+  https://image.mux.com/{playback_id}/storyboard.vtt
+
+HLS STREAM:
+  https://stream.mux.com/{playback_id}.m3u8
+
+=============================================================================
+"""
+
+import json
+import os
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+# Definitions live in a data file shipped with this package
+APP_CONFIGS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app_configs.json")
+
+
+# ============================================================================
+# ARTICLE MODE - Story vs Guide
+# ============================================================================
+
+class ArticleMode(str, Enum):
+    """
+    Article generation mode.
+
+    STORY: 4-act narrative structure (current default)
+        - Emotional journey, cinematic
+        - Setup → Opportunity → Journey → Payoff
+        - 1500-4000 words
+        - Timeline, comparison, FAQ components
+
+    GUIDE: Step-by-step instructional structure (new)
+        - Practical, educational
+        - Introduction → Steps → Conclusion
+        - 800-2000 words
+        - Checklist, requirements, cost breakdown components
+    """
+    STORY = "story"
+    GUIDE = "guide"
+
+
+class CharacterStyle(str, Enum):
+    """
+    Character demographic options for video generation.
+
+    Organized by region, then gender/group type.
+    Dashboard should present as 2-level selector:
+    1. Region: None / North European / South European / East Asian / Southeast Asian / South Asian / Middle Eastern / Black / Diverse
+    2. Type: Male / Female / Group (if applicable)
+
+    Prompt text for each style lives in app_configs.json (character_style_prompts, one set per worker).
+    """
+    # No people
+    NONE = "none"
+
+    # North European (Nordic, British, German, Dutch)
+    NORTH_EUROPEAN_MALE = "north_european_male"
+    NORTH_EUROPEAN_FEMALE = "north_european_female"
+    NORTH_EUROPEAN_GROUP = "north_european_group"
+
+    # South European (Mediterranean - Spanish, Italian, Greek, Portuguese)
+    SOUTH_EUROPEAN_MALE = "south_european_male"
+    SOUTH_EUROPEAN_FEMALE = "south_european_female"
+    SOUTH_EUROPEAN_GROUP = "south_european_group"
+
+    # East Asian (Chinese, Japanese, Korean)
+    EAST_ASIAN_MALE = "east_asian_male"
+    EAST_ASIAN_FEMALE = "east_asian_female"
+    EAST_ASIAN_GROUP = "east_asian_group"
+
+    # Southeast Asian (Singaporean, Thai, Vietnamese, Filipino, Indonesian, Malaysian)
+    SOUTHEAST_ASIAN_MALE = "southeast_asian_male"
+    SOUTHEAST_ASIAN_FEMALE = "southeast_asian_female"
+    SOUTHEAST_ASIAN_GROUP = "southeast_asian_group"
+
+    # South Asian (Indian, Pakistani, Bangladeshi, Sri Lankan)
+    SOUTH_ASIAN_MALE = "south_asian_male"
+    SOUTH_ASIAN_FEMALE = "south_asian_female"
+    SOUTH_ASIAN_GROUP = "south_asian_group"
+
+    # Middle Eastern / Arab (UAE, Saudi, Qatari, etc.)
+    MIDDLE_EASTERN_MALE = "middle_eastern_male"
+    MIDDLE_EASTERN_FEMALE = "middle_eastern_female"
+    MIDDLE_EASTERN_GROUP = "middle_eastern_group"
+
+    # Black (African, Caribbean, African-American)
+    BLACK_MALE = "black_male"
+    BLACK_FEMALE = "black_female"
+    BLACK_GROUP = "black_group"
+
+    # Diverse (mixed ethnicity and gender)
+    DIVERSE = "diverse"
+
+
+# ============================================================================
+# CONFIG OBJECTS
+# ============================================================================
+# Frozen, slotted dataclasses: built once from app_configs.json, shared by
+# every activity, never mutated. Lists in the data file become tuples.
+# Derived values (init=False) are computed once in __post_init__.
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideoConfig:
+    """Video generation configuration."""
+    model: str = "seedance-1-pro-fast"  # or "wan-2.5" for high quality
+    duration: int = 12  # seconds
+    resolution: str = "720p"  # upgraded from 480p
+    acts: int = 4  # number of narrative acts
+    cost_per_video: float = 0.30  # estimated cost (720p is ~$0.025/sec)
+
+    # Precomputed from duration/acts
+    act_duration: float = field(init=False, repr=False, compare=False)
+    act_timestamps: Tuple[Tuple[float, float, float], ...] = field(init=False, repr=False, compare=False)  # (start, mid, end)
+    act_labels: Tuple[str, ...] = field(init=False, repr=False, compare=False)  # "0-3s", "3-6s", ...
+
+    def __post_init__(self):
+        if self.duration <= 0 or self.acts <= 0:
+            raise ValueError(f"VideoConfig needs positive duration and acts, got {self.duration}s / {self.acts}")
+        act_len = self.duration / self.acts
+        timestamps = tuple((i * act_len, i * act_len + act_len / 2, (i + 1) * act_len) for i in range(self.acts))
+        object.__setattr__(self, "act_duration", act_len)
+        object.__setattr__(self, "act_timestamps", timestamps)
+        object.__setattr__(self, "act_labels", tuple(f"{start:g}-{end:g}s" for start, _, end in timestamps))
+
+    def get_act_timestamps(self) -> Dict[str, Dict[str, float]]:
+        """Get start/mid/end timestamps for each act."""
+        return {
+            f"act_{i + 1}": {"start": start, "mid": mid, "end": end}
+            for i, (start, mid, end) in enumerate(self.act_timestamps)
+        }
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ThumbnailStrategy:
+    """Thumbnail extraction strategy for different uses."""
+    # Section headers - one per act (video loops preferred)
+    section_headers: Tuple[float, ...] = (1.5, 4.5, 7.5, 10.5)
+
+    # FAQ/callout thumbnails - spread across acts
+    supplementary: Tuple[float, ...] = (1.0, 4.0, 7.0, 10.0)
+
+    # Timeline/event thumbnails
+    timeline: Tuple[float, ...] = (1.5, 4.5, 7.5, 10.5)
+
+    # Background/translucent images
+    backgrounds: Tuple[float, ...] = (10.0, 5.0)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ComponentLibrary:
+    """Available components for article layout."""
+    # Which components to include by default
+    hero_video: bool = True
+    chapter_scrubber: bool = True
+    section_video_headers: bool = True  # Video loops vs static thumbnails
+    pro_tip_callouts: bool = True
+    event_timeline: bool = True
+    stat_highlight: bool = True  # "The Bottom Line" section
+    comparison_table: bool = True
+    faq_grid: bool = True
+    cta_video_section: bool = True
+    sources_with_thumbnails: bool = True
+
+    # Callout types available
+    callout_types: Tuple[str, ...] = ("pro_tip", "warning", "insight", "did_you_know")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideoActTemplate:
+    """Single 4-act video template - one story type."""
+    name: str  # e.g., "transformation", "deal_story", "comparison"
+    description: str = ""  # When to use this template
+
+    act_1_role: str
+    act_1_mood: str
+    act_1_example: str = ""
+
+    act_2_role: str
+    act_2_mood: str
+    act_2_example: str = ""
+
+    act_3_role: str
+    act_3_mood: str
+    act_3_example: str = ""
+
+    act_4_role: str
+    act_4_mood: str
+    act_4_example: str = ""
+
+    @property
+    def acts(self) -> Tuple[Tuple[str, str], ...]:
+        """(role, mood) per act."""
+        return (
+            (self.act_1_role, self.act_1_mood),
+            (self.act_2_role, self.act_2_mood),
+            (self.act_3_role, self.act_3_mood),
+            (self.act_4_role, self.act_4_mood),
+        )
+
+
+def format_act_structure(template: VideoActTemplate, video: VideoConfig) -> str:
+    """
+    The per-act role/mood block used in video prompt briefs:
+
+        ACT 1 (0-3s): THE SETUP - ...
+          Mood: Tension, ...
+    """
+    return "\n\n".join(
+        f"ACT {i} ({label}): {role}\n  Mood: {mood}"
+        for i, (label, (role, mood)) in enumerate(zip(video.act_labels, template.acts), start=1)
+    )
+
+
+# ============================================================================
+# GUIDE MODE TEMPLATES
+# ============================================================================
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GuideStep:
+    """Single step in a guide template."""
+    name: str  # e.g., "Requirements", "Application Process", "Timeline"
+    description: str = ""  # What this step covers
+    visual_hint: str = ""  # Visual style for this step's thumbnail
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GuideTemplate:
+    """
+    Guide article template - step-by-step instructional structure.
+
+    Unlike story mode (4-act narrative), guide mode uses:
+    - Introduction (what you'll learn)
+    - Numbered steps (practical how-to)
+    - Conclusion (next steps / summary)
+
+    Components: checklist, requirements box, cost breakdown, timeline, FAQ
+    """
+    name: str  # e.g., "visa_guide", "process_guide"
+    description: str = ""  # When to use this template
+
+    # Section structure
+    intro_role: str = "What you'll learn and who this is for"
+    steps: Tuple[GuideStep, ...] = ()  # The actual steps (3-6 typical)
+    conclusion_role: str = "Next steps and key takeaways"
+
+    # Tone and voice
+    voice: str = "Direct, practical, authoritative"
+
+    # Components to include (frontend renders these)
+    include_checklist: bool = True
+    include_requirements_box: bool = True
+    include_cost_breakdown: bool = True
+    include_timeline: bool = True
+    include_faq: bool = True
+
+    # Video style (guides use process demonstration style)
+    video_style: str = "Educational, step-by-step demonstration"
+
+
+def _by_name(templates) -> Mapping[str, Any]:
+    by_name = {}
+    for template in templates:
+        if template.name in by_name:
+            raise ValueError(f"Duplicate template name: {template.name}")
+        by_name[template.name] = template
+    return MappingProxyType(by_name)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GuideConfig:
+    """
+    Collection of guide templates for an app.
+
+    Similar to VideoPromptTemplate but for guide-mode articles.
+    """
+    templates: Tuple[GuideTemplate, ...] = ()
+    default_template: str = ""
+
+    # Global guide style
+    no_text_rule: str = "CRITICAL: NO text, words, letters, numbers on screens, documents, or anywhere."
+    technical_notes: str = "Clean, professional aesthetic. Educational documentary style."
+
+    templates_by_name: Mapping[str, GuideTemplate] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "templates_by_name", _by_name(self.templates))
+
+    def get_template(self, name: str = None) -> Optional[GuideTemplate]:
+        """Get a template by name, or default."""
+        template = self.templates_by_name.get(name or self.default_template)
+        if template is None and self.templates:
+            return self.templates[0]
+        return template
+
+    def get_template_names(self) -> List[str]:
+        """Get all available template names."""
+        return list(self.templates_by_name)
+
+
+# ============================================================================
+# YOLO MODE - Action-Oriented "Just Do It" View
+# ============================================================================
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class YOLOAction:
+    """Single action item in YOLO mode."""
+    type: str  # "flight", "job", "apply", "email", "guide", "book"
+    label: str  # Button text
+    description: str = ""  # Why this action
+    url_template: str = ""  # URL with {placeholders}
+    icon: str = ""  # Emoji or icon class
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class YOLOConfig:
+    """
+    YOLO Mode configuration - the "just fucking do it" view.
+
+    For career changers, students, dreamers who need a push.
+    Turns every article into an action launchpad.
+
+    DISCLAIMER: Tongue-in-cheek motivation, not financial/legal advice.
+    """
+    enabled: bool = True
+
+    # Personality & Voice
+    personality: str = "motivational_chaos"  # The YOLO voice for this app
+    tagline: str = "Stop reading. Start doing."
+    voice: str = "Direct, irreverent, motivational. No hedging. Action-oriented."
+
+    # Target audience
+    target_audience: str = "Career changers, students, dreamers, people who've read 50 articles but done nothing"
+
+    # Disclaimer (legally necessary but on-brand)
+    disclaimer: str = """YOLO Mode is motivational entertainment, not financial, legal, or career advice.
+We're not responsible if you actually book a one-way flight to Singapore.
+(But honestly? You probably should. Life's short. Grey skies are long.)
+Do your own research. Then do the thing."""
+
+    disclaimer_short: str = "Not advice. Just vibes. Do your research, then do the thing."
+
+    # Action types available for this app
+    action_types: Tuple[str, ...] = ("flight", "job", "apply", "guide", "email_template")
+
+    # Available actions
+    actions: Tuple[YOLOAction, ...] = ()
+
+    # Motivational phrases (randomly selected)
+    motivational_kicks: Tuple[str, ...] = (
+        "Everyone else is 'thinking about it'. You're booking the flight.",
+        "Your LinkedIn connections are watching. Make them jealous.",
+        "The worst they can say is no. The best? Your life changes.",
+        "You didn't read this far to not do anything.",
+        "Fortune favors the bold. And the ones who actually apply.",
+    )
+
+    # CTA styles
+    primary_cta: str = "Just YOLO It"
+    secondary_cta: str = "Fine, I'll Think About It"
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideoPromptTemplate:
+    """
+    Collection of 4-act video templates for an app.
+
+    Sonnet picks the best template OR creates its own if none fit.
+    The ONLY requirement is 4 acts - themes are flexible.
+    """
+    # Multiple templates - add more over time
+    templates: Tuple[VideoActTemplate, ...] = ()
+
+    # Default template used when no specific match
+    default_template: str = "transformation"  # Name of template to use as fallback
+
+    # Global constraints (apply to ALL templates)
+    no_text_rule: str = "CRITICAL: NO text, words, letters, numbers, signs, logos anywhere. Screens show abstract colors only."
+    technical_notes: str = "Smooth transitions, cinematic color grading, natural motion."
+
+    templates_by_name: Mapping[str, VideoActTemplate] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "templates_by_name", _by_name(self.templates))
+
+    def get_template(self, name: str = None) -> Optional[VideoActTemplate]:
+        """Get a template by name, or default."""
+        template = self.templates_by_name.get(name or self.default_template)
+        if template is None and self.templates:
+            return self.templates[0]
+        return template
+
+    def get_template_names(self) -> List[str]:
+        """Get all available template names."""
+        return list(self.templates_by_name)
+
+
+# Legacy support - single template format
+@dataclass(frozen=True, slots=True, kw_only=True)
+class VideoPromptTemplateLegacy:
+    """4-act video prompt template for an app (legacy single-template format)."""
+    act_1_role: str = "THE SETUP - Problem/current situation/pain point"
+    act_1_mood: str = "Tension, confinement, challenge"
+    act_1_example: str = ""
+
+    act_2_role: str = "THE OPPORTUNITY - Discovery/revelation/hope"
+    act_2_mood: str = "Hope, possibility, curiosity"
+    act_2_example: str = ""
+
+    act_3_role: str = "THE JOURNEY - Process/action/transition"
+    act_3_mood: str = "Movement, progress, anticipation"
+    act_3_example: str = ""
+
+    act_4_role: str = "THE PAYOFF - Resolution/success/new reality"
+    act_4_mood: str = "Joy, freedom, satisfaction"
+    act_4_example: str = ""
+
+    no_text_rule: str = "CRITICAL: NO text, words, letters, numbers, signs, logos anywhere. Screens show abstract colors only."
+    technical_notes: str = "Smooth transitions, cinematic color grading, natural motion."
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArticleTheme:
+    """Complete article theme configuration."""
+    video: VideoConfig = field(default_factory=VideoConfig)
+    thumbnails: ThumbnailStrategy = field(default_factory=ThumbnailStrategy)
+    components: ComponentLibrary = field(default_factory=ComponentLibrary)
+    video_prompt_template: VideoPromptTemplate = field(default_factory=VideoPromptTemplate)
+
+    # Guide mode configuration (optional - for guide-mode articles)
+    guide_config: Optional[GuideConfig] = None
+
+    # YOLO mode configuration (optional - action-oriented "just do it" view)
+    yolo_config: Optional[YOLOConfig] = None
+
+    # Default article mode for this app
+    default_article_mode: ArticleMode = ArticleMode.STORY
+
+    # Branding
+    brand_name: str = "Relocation Quest"
+    brand_position: str = "top-right"  # Where to show brand on thumbnails
+    accent_color: str = "amber"  # Tailwind color name
+
+    # Typography
+    factoid_style: str = "overlay"  # "overlay" on thumbnail or "below" as separate element
+
+    # Precomputed: template name -> "ACT 1 (0-3s): role / Mood: mood ..." block
+    act_structure_prompts: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.video.acts != 4:
+            raise ValueError(f"Video templates are 4-act, but video.acts is {self.video.acts}")
+        object.__setattr__(self, "act_structure_prompts", MappingProxyType({
+            template.name: format_act_structure(template, self.video)
+            for template in self.video_prompt_template.templates
+        }))
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AppConfig:
+    """Configuration for a Quest app."""
+    name: str
+    display_name: str
+    description: str
+
+    # News monitoring
+    keywords: Tuple[str, ...]
+    exclusions: Tuple[str, ...]
+    priority_sources: Tuple[str, ...]
+
+    # Content focus
+    interests: Tuple[str, ...]
+    target_audience: str
+    content_tone: str
+
+    # Geographic focus
+    geographic_focus: Tuple[str, ...]
+
+    # Media style for images and videos
+    media_style: str = "Cinematic, professional, high production value"
+    media_style_details: str = ""
+
+    # Character style for video generation (default demographic)
+    # Can be overridden per-article via payload
+    character_style: CharacterStyle = CharacterStyle.DIVERSE
+
+    # Article theme and component library
+    article_theme: ArticleTheme = field(default_factory=ArticleTheme)
+
+
+# ============================================================================
+# LOADING + VALIDATION
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _field_types(cls) -> Dict[str, Any]:
+    hints = get_type_hints(cls)
+    return {f.name: hints[f.name] for f in fields(cls) if f.init}
+
+
+def _build(tp: Any, value: Any, path: str) -> Any:
+    """Validate a JSON value against a type annotation and convert it (lists -> tuples, dicts -> dataclasses)."""
+    origin = get_origin(tp)
+
+    if origin is Union:  # Optional[X]
+        if value is None:
+            return None
+        inner = next(arg for arg in get_args(tp) if arg is not type(None))
+        return _build(inner, value, path)
+
+    if origin is tuple:
+        if not isinstance(value, list):
+            raise ValueError(f"{path}: expected a list, got {type(value).__name__}")
+        item_type = get_args(tp)[0]
+        return tuple(_build(item_type, item, f"{path}[{i}]") for i, item in enumerate(value))
+
+    if is_dataclass(tp):
+        if not isinstance(value, dict):
+            raise ValueError(f"{path}: expected an object, got {type(value).__name__}")
+        types = _field_types(tp)
+        unknown = set(value) - set(types)
+        if unknown:
+            raise ValueError(f"{path}: unknown field(s) for {tp.__name__}: {sorted(unknown)}")
+        missing = [
+            f.name for f in fields(tp)
+            if f.init and f.name not in value and f.default is MISSING and f.default_factory is MISSING
+        ]
+        if missing:
+            raise ValueError(f"{path}: missing required field(s) for {tp.__name__}: {missing}")
+        kwargs = {name: _build(types[name], item, f"{path}.{name}") for name, item in value.items()}
+        try:
+            return tp(**kwargs)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from e
+
+    if isinstance(tp, type) and issubclass(tp, Enum):
+        try:
+            return tp(value)
+        except ValueError:
+            raise ValueError(f"{path}: {value!r} is not a valid {tp.__name__}") from None
+
+    if tp is float and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, bool) and tp is not bool:
+        raise ValueError(f"{path}: expected {tp.__name__}, got bool")
+    if isinstance(value, tp):
+        return value
+    raise ValueError(f"{path}: expected {getattr(tp, '__name__', tp)}, got {type(value).__name__}")
+
+
+def _load_character_prompts(prompts: Any, path: str) -> Mapping[CharacterStyle, str]:
+    if not isinstance(prompts, dict):
+        raise ValueError(f"{path}: expected an object, got {type(prompts).__name__}")
+    missing = [style.value for style in CharacterStyle if style.value not in prompts]
+    if missing:
+        raise ValueError(f"{path}: missing {missing}")
+    return MappingProxyType({
+        _build(CharacterStyle, style, path): _build(str, prompt, f"{path}.{style}")
+        for style, prompt in prompts.items()
+    })
+
+
+def load_app_configs(
+    path: str = APP_CONFIGS_PATH,
+) -> Tuple[Mapping[str, AppConfig], Mapping[str, Mapping[CharacterStyle, str]]]:
+    """
+    Load, validate and freeze app definitions from a JSON data file.
+
+    Returns:
+        (app name -> AppConfig, worker name -> CharacterStyle -> prompt text), all read-only
+
+    Raises:
+        ValueError: naming the offending path if the file does not match the schema
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    prompt_sets = {
+        worker: _load_character_prompts(prompts, f"character_style_prompts.{worker}")
+        for worker, prompts in data.get("character_style_prompts", {}).items()
+    }
+
+    apps = {}
+    for name, definition in data.get("apps", {}).items():
+        app_config = _build(AppConfig, definition, f"apps.{name}")
+        if app_config.name != name:
+            raise ValueError(f"apps.{name}: name is {app_config.name!r}")
+        apps[name] = app_config
+
+    return MappingProxyType(apps), MappingProxyType(prompt_sets)
+
+
+# ============================================================================
+# APP REGISTRY
+# ============================================================================
+
+# Loaded once per process. CHARACTER_STYLE_PROMPT_SETS holds the prompt text
+# for each character style (injected into video prompts), per worker: the
+# video-worker cast wording adds age and skin details the content-worker one
+# leaves out. Keep entries concise to stay within the 2000 char limit.
+APP_CONFIGS: Mapping[str, AppConfig]
+CHARACTER_STYLE_PROMPT_SETS: Mapping[str, Mapping[CharacterStyle, str]]
+APP_CONFIGS, CHARACTER_STYLE_PROMPT_SETS = load_app_configs()
+
+PLACEMENT_CONFIG = APP_CONFIGS["placement"]
+RELOCATION_CONFIG = APP_CONFIGS["relocation"]
+PE_NEWS_CONFIG = APP_CONFIGS["pe_news"]
+
+
+def get_app_config(app_name: str) -> AppConfig:
+    """Get configuration for an app."""
+    if app_name not in APP_CONFIGS:
+        raise ValueError(f"Unknown app: {app_name}. Available: {list(APP_CONFIGS.keys())}")
+    return APP_CONFIGS[app_name]
+
+
+def get_all_apps() -> List[str]:
+    """Get list of all configured apps."""
+    return list(APP_CONFIGS.keys())
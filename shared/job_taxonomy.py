@@ -0,0 +1,395 @@
+"""
+Job taxonomy: the enums and lookup tables used to normalize and classify jobs.
+
+job-worker's Pydantic models (src/models/normalized.py), its batch
+normalizer and the rule-based pre-classifier (shared.rule_classification)
+all read these, so both job workers classify against the same tables.
+"""
+
+from enum import Enum
+
+# =============================================================================
+# ENUMS - Standardized categories
+# =============================================================================
+
+class Country(str, Enum):
+    """ISO country codes for job locations"""
+    UK = "GB"
+    US = "US"
+    GERMANY = "DE"
+    FRANCE = "FR"
+    NETHERLANDS = "NL"
+    IRELAND = "IE"
+    SPAIN = "ES"
+    ITALY = "IT"
+    CANADA = "CA"
+    AUSTRALIA = "AU"
+    SINGAPORE = "SG"
+    UAE = "AE"
+    REMOTE = "REMOTE"
+    UNKNOWN = "UNKNOWN"
+
+
+class UKCity(str, Enum):
+    """Major UK cities for filtering"""
+    LONDON = "London"
+    MANCHESTER = "Manchester"
+    BIRMINGHAM = "Birmingham"
+    BRISTOL = "Bristol"
+    LEEDS = "Leeds"
+    LIVERPOOL = "Liverpool"
+    EDINBURGH = "Edinburgh"
+    GLASGOW = "Glasgow"
+    CARDIFF = "Cardiff"
+    BELFAST = "Belfast"
+    CAMBRIDGE = "Cambridge"
+    OXFORD = "Oxford"
+    READING = "Reading"
+    OTHER = "Other UK"
+
+
+class USCity(str, Enum):
+    """Major US cities for filtering"""
+    NEW_YORK = "New York"
+    SAN_FRANCISCO = "San Francisco"
+    LOS_ANGELES = "Los Angeles"
+    SEATTLE = "Seattle"
+    AUSTIN = "Austin"
+    BOSTON = "Boston"
+    CHICAGO = "Chicago"
+    DENVER = "Denver"
+    MIAMI = "Miami"
+    OTHER = "Other US"
+
+
+class Department(str, Enum):
+    """Standardized department categories"""
+    FINANCE = "Finance"
+    MARKETING = "Marketing"
+    ENGINEERING = "Engineering"
+    OPERATIONS = "Operations"
+    HUMAN_RESOURCES = "Human Resources"
+    SALES = "Sales"
+    PRODUCT = "Product"
+    LEGAL = "Legal"
+    STRATEGY = "Strategy"
+    DATA = "Data"
+    DESIGN = "Design"
+    CUSTOMER_SUCCESS = "Customer Success"
+    GENERAL_MANAGEMENT = "General Management"
+    OTHER = "Other"
+
+
+class ExecutiveRole(str, Enum):
+    """C-suite and executive role categories"""
+    CEO = "CEO"
+    CFO = "CFO"
+    CTO = "CTO"
+    CMO = "CMO"
+    COO = "COO"
+    CHRO = "CHRO"
+    CPO = "CPO"  # Chief Product Officer
+    CRO = "CRO"  # Chief Revenue Officer
+    CDO = "CDO"  # Chief Data Officer
+    CIO = "CIO"  # Chief Information Officer
+    VP_FINANCE = "VP Finance"
+    VP_ENGINEERING = "VP Engineering"
+    VP_MARKETING = "VP Marketing"
+    VP_SALES = "VP Sales"
+    VP_PRODUCT = "VP Product"
+    VP_OPERATIONS = "VP Operations"
+    VP_HR = "VP HR"
+    DIRECTOR = "Director"
+    HEAD_OF = "Head of"
+    NON_EXECUTIVE = "Non-Executive"
+
+
+class EmploymentType(str, Enum):
+    """Employment arrangement types"""
+    FRACTIONAL = "Fractional"
+    PART_TIME = "Part-Time"
+    CONTRACT = "Contract"
+    INTERIM = "Interim"
+    TEMPORARY = "Temporary"
+    FULL_TIME = "Full-Time"
+    FREELANCE = "Freelance"
+    UNKNOWN = "Unknown"
+
+
+class SeniorityLevel(str, Enum):
+    """Job seniority levels"""
+    C_SUITE = "C-Suite"
+    VP = "VP"
+    DIRECTOR = "Director"
+    HEAD = "Head"
+    SENIOR_MANAGER = "Senior Manager"
+    MANAGER = "Manager"
+    SENIOR = "Senior"
+    MID = "Mid"
+    JUNIOR = "Junior"
+    ENTRY = "Entry"
+    UNKNOWN = "Unknown"
+
+
+class WorkplaceType(str, Enum):
+    """Workplace arrangement"""
+    REMOTE = "Remote"
+    HYBRID = "Hybrid"
+    ONSITE = "On-site"
+    FLEXIBLE = "Flexible"
+    UNKNOWN = "Unknown"
+
+
+class Industry(str, Enum):
+    """Company industry categories"""
+    TECHNOLOGY = "Technology"
+    FINTECH = "Fintech"
+    HEALTHTECH = "Healthtech"
+    ECOMMERCE = "E-commerce"
+    SAAS = "SaaS"
+    AI_ML = "AI/ML"
+    CYBERSECURITY = "Cybersecurity"
+    CONSULTING = "Consulting"
+    FINANCIAL_SERVICES = "Financial Services"
+    HEALTHCARE = "Healthcare"
+    MANUFACTURING = "Manufacturing"
+    RETAIL = "Retail"
+    MEDIA = "Media"
+    EDUCATION = "Education"
+    REAL_ESTATE = "Real Estate"
+    ENERGY = "Energy"
+    OTHER = "Other"
+
+
+class CompanyStage(str, Enum):
+    """Company funding/growth stage"""
+    PRE_SEED = "Pre-Seed"
+    SEED = "Seed"
+    SERIES_A = "Series A"
+    SERIES_B = "Series B"
+    SERIES_C = "Series C"
+    SERIES_D_PLUS = "Series D+"
+    GROWTH = "Growth"
+    PUBLIC = "Public"
+    PRIVATE_EQUITY = "Private Equity"
+    BOOTSTRAPPED = "Bootstrapped"
+    UNKNOWN = "Unknown"
+
+
+# =============================================================================
+# LOOKUP TABLES - Built once at import, shared by validators, batch code and rules
+# =============================================================================
+
+UK_CITY_MAP = {
+    'london': 'London',
+    'greater london': 'London',
+    'city of london': 'London',
+    'manchester': 'Manchester',
+    'birmingham': 'Birmingham',
+    'bristol': 'Bristol',
+    'leeds': 'Leeds',
+    'liverpool': 'Liverpool',
+    'edinburgh': 'Edinburgh',
+    'glasgow': 'Glasgow',
+    'cardiff': 'Cardiff',
+    'belfast': 'Belfast',
+    'cambridge': 'Cambridge',
+    'oxford': 'Oxford',
+    'reading': 'Reading',
+}
+
+US_CITY_MAP = {
+    'new york': 'New York',
+    'nyc': 'New York',
+    'new york city': 'New York',
+    'san francisco': 'San Francisco',
+    'sf': 'San Francisco',
+    'bay area': 'San Francisco',
+    'los angeles': 'Los Angeles',
+    'la': 'Los Angeles',
+    'seattle': 'Seattle',
+    'austin': 'Austin',
+    'boston': 'Boston',
+    'chicago': 'Chicago',
+    'denver': 'Denver',
+    'miami': 'Miami',
+}
+
+COUNTRY_MAP = {
+    'uk': Country.UK,
+    'united kingdom': Country.UK,
+    'england': Country.UK,
+    'scotland': Country.UK,
+    'wales': Country.UK,
+    'northern ireland': Country.UK,
+    'gb': Country.UK,
+    'great britain': Country.UK,
+    'us': Country.US,
+    'usa': Country.US,
+    'united states': Country.US,
+    'america': Country.US,
+    'germany': Country.GERMANY,
+    'de': Country.GERMANY,
+    'france': Country.FRANCE,
+    'fr': Country.FRANCE,
+    'netherlands': Country.NETHERLANDS,
+    'nl': Country.NETHERLANDS,
+    'holland': Country.NETHERLANDS,
+    'ireland': Country.IRELAND,
+    'ie': Country.IRELAND,
+    'spain': Country.SPAIN,
+    'es': Country.SPAIN,
+    'italy': Country.ITALY,
+    'it': Country.ITALY,
+    'canada': Country.CANADA,
+    'ca': Country.CANADA,
+    'australia': Country.AUSTRALIA,
+    'au': Country.AUSTRALIA,
+    'singapore': Country.SINGAPORE,
+    'sg': Country.SINGAPORE,
+    'uae': Country.UAE,
+    'dubai': Country.UAE,
+    'remote': Country.REMOTE,
+}
+
+# Single-part location strings treated as a country rather than a city
+COUNTRY_ONLY_LOCATIONS = ['uk', 'us', 'usa', 'remote', 'germany', 'france']
+
+# Cities used to infer the country when a location has no country part
+UK_INFERENCE_CITIES = ['london', 'manchester', 'birmingham', 'bristol', 'leeds', 'edinburgh', 'glasgow']
+US_INFERENCE_CITIES = ['new york', 'san francisco', 'los angeles', 'seattle', 'austin', 'boston', 'chicago']
+
+REMOTE_LOCATION_KEYWORDS = ['remote', 'anywhere', 'distributed', 'work from home', 'wfh']
+
+CURRENCY_MAP = {
+    '£': 'GBP',
+    'gbp': 'GBP',
+    'pound': 'GBP',
+    'pounds': 'GBP',
+    '$': 'USD',
+    'usd': 'USD',
+    'dollar': 'USD',
+    'dollars': 'USD',
+    '€': 'EUR',
+    'eur': 'EUR',
+    'euro': 'EUR',
+    'euros': 'EUR',
+}
+
+EQUITY_KEYWORDS = ['equity', 'stock', 'options', 'shares']
+
+# Keys are lowercased with '-' and ' ' replaced by '_'
+EMPLOYMENT_TYPE_MAP = {
+    'fractional': EmploymentType.FRACTIONAL,
+    'part_time': EmploymentType.PART_TIME,
+    'part time': EmploymentType.PART_TIME,
+    'parttime': EmploymentType.PART_TIME,
+    'contract': EmploymentType.CONTRACT,
+    'contractor': EmploymentType.CONTRACT,
+    'interim': EmploymentType.INTERIM,
+    'temporary': EmploymentType.TEMPORARY,
+    'temp': EmploymentType.TEMPORARY,
+    'full_time': EmploymentType.FULL_TIME,
+    'full time': EmploymentType.FULL_TIME,
+    'fulltime': EmploymentType.FULL_TIME,
+    'permanent': EmploymentType.FULL_TIME,
+    'freelance': EmploymentType.FREELANCE,
+}
+
+# Keys are lowercased with '-' and ' ' replaced by '_'
+SENIORITY_LEVEL_MAP = {
+    'c_suite': SeniorityLevel.C_SUITE,
+    'csuite': SeniorityLevel.C_SUITE,
+    'c_level': SeniorityLevel.C_SUITE,
+    'chief': SeniorityLevel.C_SUITE,
+    'vp': SeniorityLevel.VP,
+    'vice_president': SeniorityLevel.VP,
+    'director': SeniorityLevel.DIRECTOR,
+    'head': SeniorityLevel.HEAD,
+    'head_of': SeniorityLevel.HEAD,
+    'senior_manager': SeniorityLevel.SENIOR_MANAGER,
+    'manager': SeniorityLevel.MANAGER,
+    'senior': SeniorityLevel.SENIOR,
+    'mid': SeniorityLevel.MID,
+    'mid_level': SeniorityLevel.MID,
+    'junior': SeniorityLevel.JUNIOR,
+    'entry': SeniorityLevel.ENTRY,
+    'entry_level': SeniorityLevel.ENTRY,
+}
+
+# Checked in order - first department with a matching keyword wins
+DEPARTMENT_KEYWORDS = [
+    (Department.FINANCE, ['finance', 'accounting', 'cfo', 'financial']),
+    (Department.MARKETING, ['marketing', 'cmo', 'brand', 'growth']),
+    (Department.ENGINEERING, ['engineering', 'cto', 'development', 'software', 'tech']),
+    (Department.OPERATIONS, ['operations', 'coo', 'ops']),
+    (Department.HUMAN_RESOURCES, ['hr', 'human resources', 'people', 'talent', 'chro']),
+    (Department.SALES, ['sales', 'cro', 'revenue', 'business development']),
+    (Department.PRODUCT, ['product', 'cpo']),
+    (Department.LEGAL, ['legal', 'compliance', 'general counsel']),
+    (Department.STRATEGY, ['strategy', 'corporate development']),
+    (Department.DATA, ['data', 'analytics', 'cdo']),
+    (Department.DESIGN, ['design', 'ux', 'ui', 'creative']),
+    (Department.CUSTOMER_SUCCESS, ['customer success', 'customer service', 'support']),
+    (Department.GENERAL_MANAGEMENT, ['ceo', 'general manager', 'managing director']),
+]
+
+# Checked in order - first workplace type with a matching keyword wins
+WORKPLACE_KEYWORDS = [
+    (WorkplaceType.REMOTE, ['remote', 'work from home', 'wfh', 'anywhere']),
+    (WorkplaceType.HYBRID, ['hybrid', 'mixed']),
+    (WorkplaceType.ONSITE, ['onsite', 'on-site', 'office', 'in-person']),
+    (WorkplaceType.FLEXIBLE, ['flexible']),
+]
+
+# Checked in order against the lowercased title - first match wins
+EXECUTIVE_ROLE_PATTERNS = {
+    ExecutiveRole.CEO: ['ceo', 'chief executive', 'managing director'],
+    ExecutiveRole.CFO: ['cfo', 'chief financial', 'finance director'],
+    ExecutiveRole.CTO: ['cto', 'chief technology', 'chief technical'],
+    ExecutiveRole.CMO: ['cmo', 'chief marketing'],
+    ExecutiveRole.COO: ['coo', 'chief operating', 'chief operations'],
+    ExecutiveRole.CHRO: ['chro', 'chief human resources', 'chief people'],
+    ExecutiveRole.CPO: ['cpo', 'chief product'],
+    ExecutiveRole.CRO: ['cro', 'chief revenue'],
+    ExecutiveRole.CDO: ['cdo', 'chief data'],
+    ExecutiveRole.CIO: ['cio', 'chief information'],
+    ExecutiveRole.VP_FINANCE: ['vp finance', 'vp of finance', 'vice president finance'],
+    ExecutiveRole.VP_ENGINEERING: ['vp engineering', 'vp of engineering', 'vice president engineering'],
+    ExecutiveRole.VP_MARKETING: ['vp marketing', 'vp of marketing', 'vice president marketing'],
+    ExecutiveRole.VP_SALES: ['vp sales', 'vp of sales', 'vice president sales'],
+    ExecutiveRole.VP_PRODUCT: ['vp product', 'vp of product', 'vice president product'],
+    ExecutiveRole.VP_OPERATIONS: ['vp operations', 'vp of operations', 'vice president operations'],
+    ExecutiveRole.VP_HR: ['vp hr', 'vp of hr', 'vp people', 'vice president hr'],
+    ExecutiveRole.DIRECTOR: ['director'],
+    ExecutiveRole.HEAD_OF: ['head of'],
+}
+
+C_SUITE_ROLES = [
+    ExecutiveRole.CEO, ExecutiveRole.CFO, ExecutiveRole.CTO,
+    ExecutiveRole.CMO, ExecutiveRole.COO, ExecutiveRole.CHRO,
+    ExecutiveRole.CPO, ExecutiveRole.CRO, ExecutiveRole.CDO,
+    ExecutiveRole.CIO,
+]
+
+EXECUTIVE_ROLE_DEPARTMENTS = {
+    ExecutiveRole.CFO: Department.FINANCE,
+    ExecutiveRole.VP_FINANCE: Department.FINANCE,
+    ExecutiveRole.CMO: Department.MARKETING,
+    ExecutiveRole.VP_MARKETING: Department.MARKETING,
+    ExecutiveRole.CTO: Department.ENGINEERING,
+    ExecutiveRole.VP_ENGINEERING: Department.ENGINEERING,
+    ExecutiveRole.COO: Department.OPERATIONS,
+    ExecutiveRole.VP_OPERATIONS: Department.OPERATIONS,
+    ExecutiveRole.CHRO: Department.HUMAN_RESOURCES,
+    ExecutiveRole.VP_HR: Department.HUMAN_RESOURCES,
+    ExecutiveRole.CRO: Department.SALES,
+    ExecutiveRole.VP_SALES: Department.SALES,
+    ExecutiveRole.CPO: Department.PRODUCT,
+    ExecutiveRole.VP_PRODUCT: Department.PRODUCT,
+    ExecutiveRole.CDO: Department.DATA,
+    ExecutiveRole.CEO: Department.GENERAL_MANAGEMENT,
+}
+
+# Title keywords that mark a role as fractional
+FRACTIONAL_TITLE_KEYWORDS = ['fractional', 'part-time', 'interim']
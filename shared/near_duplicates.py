@@ -0,0 +1,263 @@
+"""
+Cross-board near-duplicate job detection with MinHash + LSH.
+
+The same role is often scraped from LinkedIn (Apify) and from the company's
+own Greenhouse/Lever/Ashby board under different URLs and external IDs. Each
+saved job gets a MinHash signature over normalized title/company/location and
+description shingles. Its LSH band buckets are stored in Postgres
+(job_lsh_buckets), so candidates are found with an indexed bucket lookup
+instead of comparing against every row. Matches above SIMILARITY_THRESHOLD
+are linked to a canonical job via jobs.canonical_job_id, unless the two jobs
+are in different cities (the same JD is often posted once per office).
+
+Both job workers link jobs as they save them (link_near_duplicate). Jobs
+saved before the tables existed are indexed by backfill_near_duplicates()
+(scripts/backfill_near_duplicates.py in apify-job-worker).
+
+Tables are created by apify-job-worker/migrations/004_job_near_duplicates.sql.
+"""
+
+import hashlib
+import random
+import re
+import struct
+from collections.abc import Iterable
+from itertools import pairwise
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncpg
+
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS  # 8 rows → ~0.7 Jaccard for a 50% match chance
+
+# Estimated Jaccard similarity at which a candidate is treated as the same job
+SIMILARITY_THRESHOLD = 0.8
+
+# Only the start of long descriptions is shingled; boilerplate accumulates at the end
+MAX_DESCRIPTION_CHARS = 4000
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(20251201)
+_PERMUTATIONS = [
+    (_rng.randint(1, _MERSENNE_PRIME - 1), _rng.randint(0, _MERSENNE_PRIME - 1))
+    for _ in range(NUM_PERM)
+]
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_COMPANY_SUFFIXES = {"ltd", "limited", "inc", "llc", "plc", "gmbh", "co", "corp", "group", "uk"}
+_REMOTE_WORDS = {"remote", "hybrid", "anywhere"}
+_TITLE_NOISE = {"fractional", "interim", "part", "time", "remote", "hybrid", "contract", "m", "f", "d"}
+
+
+def _tokens(text: str | None) -> list[str]:
+    return _TOKEN.findall((text or "").lower())
+
+
+def _stable_hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+def location_key(location: str | None) -> str:
+    """Normalized city (first location part) of a location string; "" when unknown or remote."""
+    tokens = [t for t in _tokens((location or "").split(",")[0]) if t not in _REMOTE_WORDS]
+    return " ".join(tokens)
+
+
+def job_features(job: dict) -> set[str]:
+    """Normalized feature set (header tokens + description word 3-grams) for a job."""
+    title = [t for t in _tokens(job.get("title")) if t not in _TITLE_NOISE]
+    company = [t for t in _tokens(job.get("company_name")) if t not in _COMPANY_SUFFIXES]
+    # First location part is the city on both LinkedIn and ATS boards
+    location = _tokens((job.get("location") or "").split(",")[0])
+
+    features = {f"t:{t}" for t in title}
+    features.update(f"t2:{a} {b}" for a, b in pairwise(title))
+    features.add(f"c:{' '.join(company)}")
+    if location:
+        features.add(f"l:{' '.join(location)}")
+
+    description = (
+        job.get("full_description")
+        or job.get("description")
+        or job.get("job_description")
+        or ""
+    )[:MAX_DESCRIPTION_CHARS]
+    words = _tokens(description)
+    features.update(" ".join(words[i:i + 3]) for i in range(len(words) - 2))
+
+    return features
+
+
+def minhash_signature(features: Iterable[str]) -> list[int]:
+    """128 32-bit MinHash values for a feature set."""
+    hashes = [_stable_hash(f) for f in features]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERM
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def lsh_buckets(signature: list[int]) -> list[tuple[int, int]]:
+    """(band, bucket) keys for a signature; bucket is a signed 64-bit hash of the band rows."""
+    buckets = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f">{ROWS_PER_BAND}I", *rows), digest_size=8).digest()
+        buckets.append((band, int.from_bytes(digest, "big", signed=True)))
+    return buckets
+
+
+def estimate_similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def best_match(
+    signature: list[int],
+    location: str | None,
+    candidates: Iterable[dict],
+) -> tuple[Any, float] | None:
+    """
+    Best candidate at or above SIMILARITY_THRESHOLD as (canonical_id, similarity).
+
+    Candidates need "signature", "canonical_id" and "location". One whose city
+    differs from `location` never matches, however similar the description;
+    a missing or remote location on either side doesn't block.
+    """
+    city = location_key(location)
+    best = None
+    for row in candidates:
+        candidate_city = location_key(row["location"])
+        if city and candidate_city and city != candidate_city:
+            continue
+        similarity = estimate_similarity(signature, unpack_signature(row["signature"]))
+        if similarity >= SIMILARITY_THRESHOLD and (best is None or similarity > best[1]):
+            best = (row["canonical_id"], similarity)
+    return best
+
+
+def pack_signature(signature: list[int]) -> bytes:
+    return struct.pack(f">{NUM_PERM}I", *signature)
+
+
+def unpack_signature(data: bytes) -> list[int]:
+    return list(struct.unpack(f">{NUM_PERM}I", data))
+
+
+async def link_near_duplicate(
+    conn: "asyncpg.Connection",
+    job_id: Any,
+    job: dict,
+) -> dict | None:
+    """
+    Index a saved job and link it to a canonical job if it is a near duplicate.
+
+    Looks up jobs sharing at least one LSH bucket, verifies them by estimated
+    Jaccard similarity and city (best_match), and sets jobs.canonical_job_id to the best match's
+    canonical job, or clears it if nothing matches any more. The job's own
+    signature and buckets are stored either way.
+
+    Returns:
+        {"canonical_job_id": ..., "similarity": ...} if a duplicate was found, else None
+    """
+    signature = minhash_signature(job_features(job))
+    buckets = lsh_buckets(signature)
+    bands = [b for b, _ in buckets]
+    keys = [k for _, k in buckets]
+
+    candidates = await conn.fetch("""
+        SELECT m.job_id, m.signature, COALESCE(j.canonical_job_id, j.id) AS canonical_id, j.location
+        FROM (
+            SELECT DISTINCT lb.job_id
+            FROM job_lsh_buckets lb
+            JOIN unnest($1::smallint[], $2::bigint[]) AS k(band, bucket)
+              ON lb.band = k.band AND lb.bucket = k.bucket
+            WHERE lb.job_id <> $3
+        ) c
+        JOIN job_minhash m ON m.job_id = c.job_id
+        JOIN jobs j ON j.id = c.job_id
+    """, bands, keys, job_id)
+
+    best = best_match(signature, job.get("location"), candidates)
+    # A job that matches only itself (it is the canonical of its candidates) stays unlinked
+    if best and best[0] == job_id:
+        best = None
+
+    async with conn.transaction():
+        await conn.execute("""
+            INSERT INTO job_minhash (job_id, signature)
+            VALUES ($1, $2)
+            ON CONFLICT (job_id) DO UPDATE SET signature = EXCLUDED.signature
+        """, job_id, pack_signature(signature))
+
+        await conn.execute("DELETE FROM job_lsh_buckets WHERE job_id = $1", job_id)
+        await conn.execute("""
+            INSERT INTO job_lsh_buckets (band, bucket, job_id)
+            SELECT band, bucket, $3 FROM unnest($1::smallint[], $2::bigint[]) AS k(band, bucket)
+            ON CONFLICT DO NOTHING
+        """, bands, keys, job_id)
+
+        # Cleared when nothing matches, so an edited posting drops a stale link
+        await conn.execute(
+            "UPDATE jobs SET canonical_job_id = $1 WHERE id = $2 AND canonical_job_id IS DISTINCT FROM $1",
+            best[0] if best else None, job_id
+        )
+
+    if best:
+        return {"canonical_job_id": best[0], "similarity": best[1]}
+    return None
+
+
+async def backfill_near_duplicates(
+    conn: "asyncpg.Connection",
+    batch_size: int = 500,
+    limit: int | None = None,
+) -> dict[str, int]:
+    """
+    Index jobs that have no signature yet (saved before job_minhash existed).
+
+    Jobs are processed oldest first, so the earliest posting of a pair is
+    indexed before the later ones and becomes their canonical job. Safe to
+    re-run: indexed jobs are skipped, and a job whose statements fail is
+    counted in "errors" and retried next run.
+
+    Returns:
+        {"indexed": ..., "linked": ..., "errors": ...}
+    """
+    pending = await conn.fetch("""
+        SELECT j.id
+        FROM jobs j
+        WHERE NOT EXISTS (SELECT 1 FROM job_minhash m WHERE m.job_id = j.id)
+        ORDER BY j.first_seen_at NULLS FIRST, j.id
+    """ + (" LIMIT $1" if limit else ""), *([limit] if limit else []))
+    job_ids = [row["id"] for row in pending]
+
+    import asyncpg  # Only needed at runtime here, where a connection already exists
+
+    stats = {"indexed": 0, "linked": 0, "errors": 0}
+    for start in range(0, len(job_ids), batch_size):
+        rows = await conn.fetch("""
+            SELECT id, title, company_name, location, full_description
+            FROM jobs
+            WHERE id = ANY($1)
+        """, job_ids[start:start + batch_size])
+        jobs = {row["id"]: dict(row) for row in rows}
+
+        for job_id in job_ids[start:start + batch_size]:
+            job = jobs.get(job_id)
+            if job is None:
+                continue  # Deleted since the pending list was read
+            try:
+                if await link_near_duplicate(conn, job_id, job):
+                    stats["linked"] += 1
+                stats["indexed"] += 1
+            except asyncpg.PostgresError:
+                stats["errors"] += 1
+
+    return stats
@@ -0,0 +1,113 @@
+"""Keyset pagination and cheap row counts for job listing queries."""
+
+import base64
+import json
+import time
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncpg
+
+# Below this planner estimate an exact COUNT(*) is cheap enough to run.
+EXACT_COUNT_THRESHOLD = 5000
+
+# Seconds an exact count stays valid for identical filters.
+COUNT_CACHE_TTL = 60
+
+_count_cache: dict[tuple, tuple[float, int]] = {}
+
+
+def encode_cursor(posted_date: Any | None, row_id: Any) -> str:
+    """Encode the (posted_date, id) of the last row on a page as an opaque cursor."""
+    if isinstance(posted_date, datetime):
+        value = {"t": "dt", "v": posted_date.isoformat()}
+    elif isinstance(posted_date, date):
+        value = {"t": "d", "v": posted_date.isoformat()}
+    else:
+        value = None
+
+    payload = {"p": value, "id": row_id if isinstance(row_id, int) else str(row_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any | None, Any]:
+    """Decode a cursor back into (posted_date, id). Raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value = payload["p"]
+        row_id = payload["id"]
+        if value is None:
+            return None, row_id
+        if value["t"] == "dt":
+            return datetime.fromisoformat(value["v"]), row_id
+        return date.fromisoformat(value["v"]), row_id
+    except (ValueError, KeyError, TypeError) as e:
+        # binascii.Error and JSONDecodeError are ValueErrors
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def keyset_condition(cursor: str, params: list[Any], alias: str = "j") -> str:
+    """
+    Build the WHERE fragment selecting rows after the cursor.
+
+    Ordering is ``posted_date DESC NULLS LAST, id DESC``, so rows with a NULL
+    posted_date come after every dated row. Appends its values to ``params``.
+    """
+    posted_date, row_id = decode_cursor(cursor)
+
+    if posted_date is None:
+        params.append(row_id)
+        return f"({alias}.posted_date IS NULL AND {alias}.id < ${len(params)})"
+
+    params.append(posted_date)
+    date_param = len(params)
+    params.append(row_id)
+    id_param = len(params)
+    return (
+        f"(({alias}.posted_date, {alias}.id) < (${date_param}, ${id_param})"
+        f" OR {alias}.posted_date IS NULL)"
+    )
+
+
+async def estimate_count(conn: "asyncpg.Connection", from_where: str, params: list[Any]) -> int:
+    """Return the planner's row estimate for ``SELECT ... FROM <from_where>``."""
+    plan = await conn.fetchval(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {from_where}", *params)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    conn: "asyncpg.Connection",
+    from_where: str,
+    params: list[Any],
+    exact: bool = False,
+) -> tuple[int, bool]:
+    """
+    Count rows matching a filter without paying for COUNT(*) on large result sets.
+
+    Exact counts are cached for COUNT_CACHE_TTL seconds per filter. When the
+    planner estimates more than EXACT_COUNT_THRESHOLD rows (and ``exact`` is not
+    requested) the estimate is returned instead.
+
+    Returns:
+        (count, is_estimate)
+    """
+    key = (from_where, tuple(params))
+    cached = _count_cache.get(key)
+    if cached and time.monotonic() - cached[0] < COUNT_CACHE_TTL:
+        return cached[1], False
+
+    if not exact:
+        estimate = await estimate_count(conn, from_where, params)
+        if estimate > EXACT_COUNT_THRESHOLD:
+            return estimate, True
+
+    total = await conn.fetchval(f"SELECT COUNT(*) FROM {from_where}", *params)
+    if len(_count_cache) >= 1000:
+        _count_cache.clear()
+    _count_cache[key] = (time.monotonic(), total)
+    return total, False
@@ -0,0 +1,726 @@
+"""
+Provider Rate Limits
+
+Account-wide limits for the external APIs every worker shares: Serper,
+DataForSEO, Exa, Gemini, Anthropic, OpenAI, Replicate, Mux and Zep.
+Without a shared governor, parallel workflows each hit a provider at full
+speed, trip 429s, burn Temporal retries and stretch tail latency.
+
+Scope: every worker. content-worker and video-worker acquire per activity
+(ACTIVITY_PROVIDERS, via the interceptor) and in src.utils.ai_gateway;
+job-worker and apify-job-worker wrap their Gemini, OpenAI and Zep calls
+in provider_slot().
+
+Each provider has a quota (DEFAULT_QUOTAS, overridable with the
+PROVIDER_QUOTAS env var as JSON, e.g. '{"anthropic": {"requests_per_minute": 400}}'):
+- requests_per_minute / burst: token bucket refilled continuously
+- max_concurrent: calls in flight across all workers (leases)
+- interactive_reserve: share of the bucket and of the leases that only
+  interactive callers may use
+
+Priority classes:
+- interactive: dashboard-started workflows (the default)
+- batch: scheduled workflows - Temporal priority_key >= BATCH_PRIORITY_KEY
+  (children inherit it), or a workflow type listed in BATCH_WORKFLOW_TYPES
+Batch callers stop short of the reserve, so a nightly news run cannot
+starve someone waiting on the dashboard.
+
+State lives in Neon (provider_rate_buckets, provider_leases - see
+content-worker/migrations/create_provider_limits.sql) so every worker
+process shares it. Each worker passes its database URL (and, for "llm"
+activities, its model picker) to configure_provider_limits() at startup.
+An acquire is one short transaction, serialized per provider with
+pg_advisory_xact_lock. Leases expire (activity start_to_close timeout, or
+LEASE_TTL_SECONDS), so a crashed worker cannot hold slots forever.
+Without a database URL, or with PROVIDER_LIMITS_BACKEND=local, limits are
+per process. Database errors never block a call: that acquire falls back
+to the in-process limiter.
+
+Wait time per provider and priority goes to Prometheus
+(provider_limit_wait_seconds, provider_limit_throttled_total) when
+prometheus_client is installed, and to an in-memory summary.
+
+Usage:
+    # Worker startup, before the first acquire
+    configure_provider_limits(database_url=config.DATABASE_URL, ai_model=config.get_ai_model)
+
+    # Activity level - acquires for the providers in ACTIVITY_PROVIDERS
+    Worker(..., interceptors=telemetry_interceptors("content-worker") + provider_limit_interceptors())
+
+    # Client level, around a single provider call
+    async with provider_slot("anthropic"):
+        response = await client.messages.create(...)
+
+    # Current buckets and leases
+    python -m shared.provider_limits status
+
+A provider_slot() inside an activity that already holds that provider
+(via the interceptor) takes a rate token but no second lease.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import logging
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from typing import Any
+
+import psycopg
+from temporalio import activity
+from temporalio.worker import (
+    ActivityInboundInterceptor,
+    ExecuteActivityInput,
+    Interceptor,
+)
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_LIMITS_ENABLED = os.getenv("PROVIDER_LIMITS_ENABLED", "true").lower() == "true"
+PROVIDER_LIMITS_BACKEND = os.getenv("PROVIDER_LIMITS_BACKEND", "postgres")
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+# Temporal priority keys run 1 (highest) to 5; unset means 3
+BATCH_PRIORITY_KEY = 4
+BATCH_WORKFLOW_TYPES = frozenset(
+    name.strip() for name in os.getenv("BATCH_WORKFLOW_TYPES", "NewsCreationWorkflow").split(",") if name.strip()
+)
+
+# Lease lifetime when the activity has no start_to_close timeout
+LEASE_TTL_SECONDS = 1800
+
+# Give up (and let Temporal retry the activity) after waiting this long
+MAX_WAIT_SECONDS = {INTERACTIVE: 120.0, BATCH: 900.0}
+
+# Longest sleep between attempts; interactive callers re-check sooner
+MAX_POLL_SECONDS = {INTERACTIVE: 0.5, BATCH: 2.0}
+
+# Key space for pg_advisory_xact_lock(ADVISORY_LOCK_NAMESPACE, hashtext(provider))
+ADVISORY_LOCK_NAMESPACE = 7301
+
+# Database failure warnings are logged at most this often
+FALLBACK_WARNING_INTERVAL = 60.0
+
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900)
+
+
+@dataclass(frozen=True)
+class ProviderQuota:
+    """Account-wide limit for one provider."""
+    requests_per_minute: float
+    burst: int
+    max_concurrent: int
+    interactive_reserve: float = 0.25
+
+    def min_tokens(self, priority: str) -> float:
+        """Tokens that must be in the bucket before this priority may take one."""
+        if priority == INTERACTIVE:
+            return 1.0
+        return 1.0 + self.burst * self.interactive_reserve
+
+    def max_leases(self, priority: str) -> int:
+        """Leases (all priorities) below which this priority may take another."""
+        if priority == INTERACTIVE:
+            return self.max_concurrent
+        return max(1, self.max_concurrent - math.ceil(self.max_concurrent * self.interactive_reserve))
+
+
+# Starting points - set PROVIDER_QUOTAS to match each account's plan
+DEFAULT_QUOTAS: dict[str, ProviderQuota] = {
+    "serper": ProviderQuota(requests_per_minute=300, burst=20, max_concurrent=10),
+    "dataforseo": ProviderQuota(requests_per_minute=240, burst=20, max_concurrent=10),
+    "exa": ProviderQuota(requests_per_minute=300, burst=10, max_concurrent=5),
+    "gemini": ProviderQuota(requests_per_minute=150, burst=10, max_concurrent=8),
+    "anthropic": ProviderQuota(requests_per_minute=50, burst=5, max_concurrent=5),
+    "openai": ProviderQuota(requests_per_minute=500, burst=20, max_concurrent=10),
+    "replicate": ProviderQuota(requests_per_minute=600, burst=10, max_concurrent=4),
+    "mux": ProviderQuota(requests_per_minute=300, burst=10, max_concurrent=5),
+    "zep": ProviderQuota(requests_per_minute=300, burst=20, max_concurrent=10),
+}
+
+# Activity type -> providers it calls. "llm" is whichever provider the
+# worker's get_ai_model() picks. Activities that only call models through
+# src.utils.ai_gateway are not listed: the gateway acquires per call.
+ACTIVITY_PROVIDERS: dict[str, tuple[str, ...]] = {
+    # Serper
+    "serper_company_search": ("serper",),
+    "serper_news_search": ("serper",),
+    "serper_article_search": ("serper",),
+    "serper_targeted_search": ("serper",),
+    "serper_crawl4ai_deep_articles": ("serper",),
+    "serper_scrape": ("serper",),
+
+    # DataForSEO
+    "dataforseo_news_search": ("dataforseo",),
+    "dataforseo_serp_search": ("dataforseo",),
+    "dataforseo_keyword_research": ("dataforseo",),
+    "dataforseo_keyword_difficulty": ("dataforseo",),
+    "dataforseo_related_keywords": ("dataforseo",),
+    "research_country_seo_keywords": ("dataforseo",),
+
+    # Exa
+    "exa_research_company": ("exa",),
+    "exa_research_topic": ("exa",),
+    "exa_find_similar_companies": ("exa",),
+
+    # Replicate (images and video)
+    "generate_company_featured_image": ("replicate",),
+    "generate_flux_image": ("replicate",),
+    "generate_sequential_article_images": ("replicate",),
+    "generate_company_contextual_images": ("replicate",),
+    "generate_article_images_from_prompts": ("replicate",),
+    "generate_four_act_video": ("replicate",),
+    "generate_company_video": ("replicate",),
+    "generate_video_simple": ("replicate",),
+
+    # Mux
+    "upload_video_to_mux": ("mux",),
+    "upload_video_file_to_mux": ("mux",),
+    "delete_mux_asset": ("mux",),
+    "get_mux_asset_info": ("mux",),
+
+    # Zep
+    "query_zep_for_context": ("zep",),
+    "sync_company_to_zep": ("zep",),
+    "create_zep_summary": ("zep",),
+    "sync_v2_profile_to_zep_graph": ("zep",),
+    "sync_article_to_zep": ("zep",),
+    "fetch_company_graph_data": ("zep",),
+
+    # LLM generation with direct SDK clients
+    "generate_company_profile_v2": ("llm",),
+    "generate_four_act_article": ("llm",),
+    "generate_narrative_article": ("llm",),
+    "build_3_act_narrative": ("anthropic",),
+    "generate_country_guide_content": ("llm",),
+    "generate_topic_cluster_content": ("llm",),
+    "refine_broken_links": ("gemini",),
+    "generate_four_act_video_prompt_brief": ("gemini",),
+    "extract_entities_from_v2_profile": ("gemini",),
+    "extract_entities_from_article": ("gemini",),
+}
+
+# The worker's config, set by configure_provider_limits()
+_database_url: str | None = None
+_ai_model: Callable[[], tuple[str, str]] | None = None
+
+# Providers whose lease the current task already holds
+_held: contextvars.ContextVar[frozenset[str]] = contextvars.ContextVar("provider_limits_held", default=frozenset())
+
+
+class ProviderLimitTimeout(RuntimeError):
+    """Waited longer than MAX_WAIT_SECONDS for a provider; the activity fails and Temporal retries it."""
+
+
+def load_quotas(overrides: str | None = None) -> dict[str, ProviderQuota]:
+    """DEFAULT_QUOTAS with PROVIDER_QUOTAS (JSON: provider -> partial quota) applied."""
+    quotas = dict(DEFAULT_QUOTAS)
+    raw = os.getenv("PROVIDER_QUOTAS", "") if overrides is None else overrides
+    if not raw:
+        return quotas
+    for provider, fields in json.loads(raw).items():
+        quotas[provider] = replace(quotas[provider], **fields) if provider in quotas else ProviderQuota(**fields)
+    return quotas
+
+
+def llm_provider() -> str:
+    """Provider behind the worker's get_ai_model() (gateway/anthropic -> anthropic, google-gla -> gemini)."""
+    if _ai_model is None:
+        return "llm"
+    try:
+        provider, _ = _ai_model()
+    except ValueError:
+        return "llm"
+    provider = provider.split("/")[-1]
+    return "gemini" if provider.startswith("google") else provider
+
+
+def provider_for_model(model: str) -> str:
+    """Provider serving a model name (claude-* -> anthropic, gemini-* -> gemini, else openai)."""
+    model = model.lower()
+    if "claude" in model:
+        return "anthropic"
+    if "gemini" in model:
+        return "gemini"
+    return "openai"
+
+
+def priority_for(info: activity.Info | None) -> str:
+    """Priority class of an activity: batch for scheduled work, otherwise interactive."""
+    if info is None:
+        return INTERACTIVE
+    priority = getattr(info, "priority", None)  # temporalio >= 1.11
+    if priority is not None and priority.priority_key and priority.priority_key >= BATCH_PRIORITY_KEY:
+        return BATCH
+    if info.workflow_type in BATCH_WORKFLOW_TYPES:
+        return BATCH
+    return INTERACTIVE
+
+
+def _current_activity() -> activity.Info | None:
+    try:
+        return activity.info()
+    except RuntimeError:
+        return None
+
+
+def _lease_ttl(info: activity.Info | None) -> float:
+    timeout = info and (info.start_to_close_timeout or info.schedule_to_close_timeout)
+    return timeout.total_seconds() if timeout else LEASE_TTL_SECONDS
+
+
+def decide(
+    quota: ProviderQuota,
+    priority: str,
+    tokens: float,
+    elapsed: float,
+    leases: int,
+    lease: bool,
+) -> tuple[bool, float, float]:
+    """
+    Token bucket + concurrency decision shared by both backends.
+
+    Args:
+        tokens: bucket level at the last refill
+        elapsed: seconds since the last refill
+        leases: unexpired leases for the provider (all priorities)
+        lease: whether the caller also needs a concurrency lease
+
+    Returns:
+        (granted, new bucket level, seconds until worth retrying)
+    """
+    rate = quota.requests_per_minute / 60.0
+    tokens = min(float(quota.burst), tokens + max(0.0, elapsed) * rate)
+    needed = quota.min_tokens(priority)
+
+    if lease and leases >= quota.max_leases(priority):
+        return False, tokens, MAX_POLL_SECONDS[priority]
+    if tokens < needed:
+        return False, tokens, (needed - tokens) / rate if rate > 0 else MAX_POLL_SECONDS[priority]
+    return True, tokens - 1.0, 0.0
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class LocalBackend:
+    """Per-process buckets and leases (no DATABASE_URL, tests, database outages)."""
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}  # provider -> (tokens, refilled_at)
+        self._leases: dict[str, dict[str, float]] = defaultdict(dict)  # provider -> lease id -> expires_at
+
+    async def try_acquire(
+        self, provider: str, quota: ProviderQuota, priority: str, lease: bool, ttl: float
+    ) -> tuple[str | None, float]:
+        now = time.monotonic()
+        leases = self._leases[provider]
+        for lease_id in [i for i, expires_at in leases.items() if expires_at < now]:
+            del leases[lease_id]
+
+        tokens, refilled_at = self._buckets.get(provider, (float(quota.burst), now))
+        granted, tokens, retry_after = decide(quota, priority, tokens, now - refilled_at, len(leases), lease)
+        self._buckets[provider] = (tokens, now)
+        if not granted:
+            return None, retry_after
+
+        lease_id = f"local:{uuid.uuid4().hex}" if lease else ""
+        if lease:
+            leases[lease_id] = now + ttl
+        return lease_id, 0.0
+
+    async def release(self, provider: str, lease_id: str) -> None:
+        self._leases[provider].pop(lease_id, None)
+
+
+class PostgresBackend:
+    """Buckets and leases in Neon, shared by every worker process."""
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._conn: psycopg.AsyncConnection | None = None
+        self._lock = asyncio.Lock()
+        self.holder = f"{os.getenv('RAILWAY_SERVICE_NAME', 'worker')}:{os.getpid()}"
+
+    async def _connection(self) -> psycopg.AsyncConnection:
+        if self._conn is None or self._conn.closed:
+            self._conn = await psycopg.AsyncConnection.connect(self.dsn, autocommit=True)
+        return self._conn
+
+    async def _reset(self) -> None:
+        if self._conn is not None:
+            # Already broken; the next acquire opens a fresh connection
+            with suppress(psycopg.Error, OSError):
+                await self._conn.close()
+        self._conn = None
+
+    async def try_acquire(
+        self, provider: str, quota: ProviderQuota, priority: str, lease: bool, ttl: float
+    ) -> tuple[str | None, float]:
+        async with self._lock:
+            try:
+                conn = await self._connection()
+                async with conn.transaction():
+                    await conn.execute(
+                        "SELECT pg_advisory_xact_lock(%s::int, hashtext(%s))", (ADVISORY_LOCK_NAMESPACE, provider)
+                    )
+                    await conn.execute(
+                        "DELETE FROM provider_leases WHERE provider = %s AND expires_at < NOW()", (provider,)
+                    )
+                    cur = await conn.execute(
+                        """
+                        SELECT
+                            (SELECT COUNT(*) FROM provider_leases WHERE provider = %s),
+                            b.tokens,
+                            EXTRACT(EPOCH FROM (NOW() - b.refilled_at))
+                        FROM (SELECT 1) AS one
+                        LEFT JOIN provider_rate_buckets b ON b.provider = %s
+                        """,
+                        (provider, provider)
+                    )
+                    leases, tokens, elapsed = await cur.fetchone()
+                    if tokens is None:
+                        tokens, elapsed = float(quota.burst), 0.0
+
+                    granted, tokens, retry_after = decide(
+                        quota, priority, float(tokens), float(elapsed), leases, lease
+                    )
+                    await conn.execute(
+                        """
+                        INSERT INTO provider_rate_buckets (provider, tokens, refilled_at)
+                        VALUES (%s, %s, NOW())
+                        ON CONFLICT (provider) DO UPDATE
+                        SET tokens = EXCLUDED.tokens, refilled_at = EXCLUDED.refilled_at
+                        """,
+                        (provider, tokens)
+                    )
+                    if not granted:
+                        return None, retry_after
+                    if not lease:
+                        return "", 0.0
+
+                    cur = await conn.execute(
+                        """
+                        INSERT INTO provider_leases (provider, priority, holder, expires_at)
+                        VALUES (%s, %s, %s, NOW() + %s)
+                        RETURNING id
+                        """,
+                        (provider, priority, self.holder, timedelta(seconds=ttl))
+                    )
+                    (lease_id,) = await cur.fetchone()
+                    return str(lease_id), 0.0
+            except Exception:
+                await self._reset()
+                raise
+
+    async def release(self, provider: str, lease_id: str) -> None:
+        async with self._lock:
+            try:
+                conn = await self._connection()
+                await conn.execute("DELETE FROM provider_leases WHERE id = %s", (int(lease_id),))
+            except Exception:
+                await self._reset()
+                raise
+
+    async def status(self) -> list[dict[str, Any]]:
+        async with self._lock:
+            conn = await self._connection()
+            cur = await conn.execute(
+                """
+                SELECT b.provider, b.tokens, b.refilled_at,
+                       COUNT(l.id) FILTER (WHERE l.priority = 'interactive'),
+                       COUNT(l.id) FILTER (WHERE l.priority = 'batch')
+                FROM provider_rate_buckets b
+                LEFT JOIN provider_leases l ON l.provider = b.provider AND l.expires_at > NOW()
+                GROUP BY b.provider, b.tokens, b.refilled_at
+                ORDER BY b.provider
+                """
+            )
+            return [
+                {"provider": p, "tokens": t, "refilled_at": r.isoformat(), "interactive_leases": i, "batch_leases": b}
+                for p, t, r, i, b in await cur.fetchall()
+            ]
+
+
+# ============================================================================
+# LIMITER
+# ============================================================================
+
+class _PrometheusMetrics:
+    """Wait-time histogram and throttle counter in the default prometheus registry."""
+
+    _metrics: dict[str, Any] | None = None
+
+    def __init__(self):
+        from prometheus_client import Counter, Gauge, Histogram
+
+        # Metrics register once per process
+        if _PrometheusMetrics._metrics is None:
+            labels = ["provider", "priority"]
+            _PrometheusMetrics._metrics = {
+                "wait": Histogram(
+                    "provider_limit_wait_seconds",
+                    "Time spent waiting for a provider rate/concurrency slot", labels, buckets=WAIT_BUCKETS
+                ),
+                "throttled": Counter(
+                    "provider_limit_throttled_total",
+                    "Acquires that had to wait at least once", labels
+                ),
+                "in_flight": Gauge(
+                    "provider_limit_in_flight",
+                    "Provider leases held by this process", labels
+                ),
+            }
+        self.metrics = _PrometheusMetrics._metrics
+
+
+class ProviderLimiter:
+    """Acquires provider slots from a backend; see module docstring."""
+
+    def __init__(self, backend: Any = None, quotas: dict[str, ProviderQuota] | None = None):
+        self.quotas = load_quotas() if quotas is None else quotas
+        self.local = LocalBackend()
+        self.backend = self.local if backend is None else backend
+        self._last_fallback_warning = 0.0
+        # (provider, priority) -> recent wait seconds, and throttled acquire counts
+        self.waits: dict[tuple[str, str], deque] = defaultdict(lambda: deque(maxlen=1000))
+        self.throttled: dict[tuple[str, str], int] = defaultdict(int)
+        try:
+            self.prometheus = _PrometheusMetrics().metrics
+        except ImportError:
+            self.prometheus = None
+
+    def providers_for(self, activity_type: str) -> tuple[str, ...]:
+        providers = ACTIVITY_PROVIDERS.get(activity_type, ())
+        return tuple(sorted({llm_provider() if p == "llm" else p for p in providers}))
+
+    async def _try_acquire(
+        self, provider: str, quota: ProviderQuota, priority: str, lease: bool, ttl: float
+    ) -> tuple[str | None, float, Any]:
+        try:
+            lease_id, retry_after = await self.backend.try_acquire(provider, quota, priority, lease, ttl)
+            return lease_id, retry_after, self.backend
+        except Exception as e:
+            if self.backend is self.local:
+                raise
+            now = time.monotonic()
+            if now - self._last_fallback_warning > FALLBACK_WARNING_INTERVAL:
+                self._last_fallback_warning = now
+                logger.warning(f"Provider limits: {type(self.backend).__name__} failed, limiting per process: {e}")
+            lease_id, retry_after = await self.local.try_acquire(provider, quota, priority, lease, ttl)
+            return lease_id, retry_after, self.local
+
+    @asynccontextmanager
+    async def slot(self, provider: str, priority: str | None = None, ttl: float | None = None) -> AsyncIterator[None]:
+        """
+        Hold a rate token (and, unless this task already holds one, a concurrency lease) for provider.
+
+        Raises:
+            ProviderLimitTimeout: if no slot frees up within MAX_WAIT_SECONDS[priority]
+        """
+        quota = self.quotas.get(provider)
+        if quota is None:
+            yield
+            return
+
+        info = _current_activity()
+        priority = priority or priority_for(info)
+        ttl = ttl or _lease_ttl(info)
+        held = _held.get()
+        lease = provider not in held
+
+        start = time.monotonic()
+        waited = False
+        while True:
+            lease_id, retry_after, backend = await self._try_acquire(provider, quota, priority, lease, ttl)
+            if lease_id is not None:
+                break
+            elapsed = time.monotonic() - start
+            if elapsed >= MAX_WAIT_SECONDS[priority]:
+                raise ProviderLimitTimeout(f"No {provider} slot for {priority} call after {elapsed:.0f}s")
+            waited = True
+            if info is not None:
+                activity.heartbeat()
+            pause = min(retry_after, MAX_POLL_SECONDS[priority])
+            await asyncio.sleep(max(0.05, pause) * random.uniform(1.0, 1.2))
+
+        self._record_wait(provider, priority, time.monotonic() - start, waited)
+        if not lease:
+            yield
+            return
+
+        token = _held.set(held | {provider})
+        if self.prometheus:
+            self.prometheus["in_flight"].labels(provider, priority).inc()
+        try:
+            yield
+        finally:
+            _held.reset(token)
+            if self.prometheus:
+                self.prometheus["in_flight"].labels(provider, priority).dec()
+            try:
+                await backend.release(provider, lease_id)
+            except (psycopg.Error, OSError) as e:
+                # The lease expires on its own
+                logger.warning(f"Provider limits: releasing {provider} lease failed: {e}")
+
+    def _record_wait(self, provider: str, priority: str, seconds: float, waited: bool) -> None:
+        self.waits[(provider, priority)].append(seconds)
+        if waited:
+            self.throttled[(provider, priority)] += 1
+            if seconds > 1.0:
+                logger.info(f"Provider limits: waited {seconds:.1f}s for {provider} ({priority})")
+        if self.prometheus:
+            self.prometheus["wait"].labels(provider, priority).observe(seconds)
+            if waited:
+                self.prometheus["throttled"].labels(provider, priority).inc()
+
+    def wait_summary(self) -> list[dict[str, Any]]:
+        """Per provider/priority: acquires, throttled acquires, p50/p95/max wait (recent)."""
+        rows = []
+        for (provider, priority), waits in sorted(self.waits.items()):
+            ordered = sorted(waits)
+            rows.append({
+                "provider": provider,
+                "priority": priority,
+                "acquires": len(ordered),
+                "throttled": self.throttled[(provider, priority)],
+                "p50_wait_seconds": statistics.median(ordered),
+                "p95_wait_seconds": ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)],
+                "max_wait_seconds": ordered[-1],
+            })
+        return rows
+
+
+_limiter: ProviderLimiter | None = None
+
+
+def configure_provider_limits(
+    database_url: str | None = None,
+    ai_model: Callable[[], tuple[str, str]] | None = None,
+) -> None:
+    """
+    Hand the limiter the worker's config. Call once at startup, before the first acquire.
+
+    Args:
+        database_url: Neon DSN holding the shared buckets and leases; without it limits are per process
+        ai_model: the worker's get_ai_model(), returning (provider, model); resolves "llm" activities
+    """
+    global _database_url, _ai_model, _limiter
+    _database_url = database_url
+    _ai_model = ai_model
+    _limiter = None
+
+
+def get_limiter() -> ProviderLimiter:
+    """Process-wide limiter (Postgres-backed when a database URL was configured)."""
+    global _limiter
+    if _limiter is None:
+        use_postgres = PROVIDER_LIMITS_BACKEND == "postgres" and _database_url
+        _limiter = ProviderLimiter(PostgresBackend(_database_url) if use_postgres else None)
+    return _limiter
+
+
+@asynccontextmanager
+async def provider_slot(provider: str, priority: str | None = None) -> AsyncIterator[None]:
+    """Client-level acquire around a single provider call; no-op when PROVIDER_LIMITS_ENABLED is false."""
+    if not PROVIDER_LIMITS_ENABLED:
+        yield
+        return
+    async with get_limiter().slot(provider, priority):
+        yield
+
+
+# ============================================================================
+# INTERCEPTOR
+# ============================================================================
+
+class _ProviderLimitedActivity(ActivityInboundInterceptor):
+
+    def __init__(self, next: ActivityInboundInterceptor, limiter: ProviderLimiter):
+        super().__init__(next)
+        self.limiter = limiter
+
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        info = activity.info()
+        providers = self.limiter.providers_for(info.activity_type)
+        if not providers:
+            return await self.next.execute_activity(input)
+
+        # Sorted order, so two activities needing the same pair cannot deadlock
+        async with AsyncExitStack() as stack:
+            for provider in providers:
+                await stack.enter_async_context(self.limiter.slot(provider, priority_for(info)))
+            return await self.next.execute_activity(input)
+
+
+class ProviderLimitInterceptor(Interceptor):
+    """Worker interceptor acquiring provider slots for the activities in ACTIVITY_PROVIDERS."""
+
+    def __init__(self, limiter: ProviderLimiter | None = None):
+        self.limiter = limiter or get_limiter()
+
+    def intercept_activity(self, next: ActivityInboundInterceptor) -> ActivityInboundInterceptor:
+        return _ProviderLimitedActivity(next, self.limiter)
+
+
+def provider_limit_interceptors() -> list[Interceptor]:
+    """Interceptors for Worker(interceptors=...); empty if PROVIDER_LIMITS_ENABLED is false."""
+    if not PROVIDER_LIMITS_ENABLED:
+        return []
+    return [ProviderLimitInterceptor()]
+
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Provider rate limit tools")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", ""), help="Default: $DATABASE_URL")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="Shared buckets and active leases (needs DATABASE_URL)")
+    commands.add_parser("quotas", help="Effective quotas after PROVIDER_QUOTAS overrides")
+    args = parser.parse_args(argv)
+
+    quotas = load_quotas()
+    if args.command == "quotas":
+        print(f"{'provider':<12} {'rpm':>7} {'burst':>6} {'concurrent':>10} {'batch max':>9} {'reserve':>8}")
+        for provider, q in sorted(quotas.items()):
+            print(
+                f"{provider:<12} {q.requests_per_minute:>7g} {q.burst:>6} {q.max_concurrent:>10} "
+                f"{q.max_leases(BATCH):>9} {q.interactive_reserve:>8.0%}"
+            )
+        return 0
+
+    if not args.database_url:
+        print("DATABASE_URL not set - limits are per process, nothing shared to show")
+        return 1
+    rows = asyncio.run(PostgresBackend(args.database_url).status())
+    print(f"{'provider':<12} {'tokens':>7} {'burst':>6} {'interactive':>11} {'batch':>6} {'max':>4}  refilled")
+    for row in rows:
+        quota = quotas.get(row["provider"])
+        print(
+            f"{row['provider']:<12} {row['tokens']:>7.1f} {quota.burst if quota else '-':>6} "
+            f"{row['interactive_leases']:>11} {row['batch_leases']:>6} "
+            f"{quota.max_concurrent if quota else '-':>4}  {row['refilled_at']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
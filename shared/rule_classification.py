@@ -0,0 +1,307 @@
+"""
+Deterministic pre-classifier for job postings.
+
+Most postings are obviously full-time or obviously fractional ("Fractional CFO",
+LinkedIn "Part-time" with an executive title). Part-time or contract postings
+for other roles are ordinary reduced-hours jobs, not fractional ones, and are
+left to the LLM. These are classified from the
+title, listed employment type/seniority and description using the lookup
+tables in shared.job_taxonomy, and only low-confidence jobs are sent to an LLM.
+Used by job-worker's fractional classifier and apify-job-worker's Gemini
+classifier.
+"""
+
+import re
+
+from pydantic import BaseModel
+
+from shared.job_taxonomy import (
+    C_SUITE_ROLES,
+    COUNTRY_MAP,
+    DEPARTMENT_KEYWORDS,
+    EMPLOYMENT_TYPE_MAP,
+    EXECUTIVE_ROLE_DEPARTMENTS,
+    EXECUTIVE_ROLE_PATTERNS,
+    REMOTE_LOCATION_KEYWORDS,
+    SENIORITY_LEVEL_MAP,
+    UK_INFERENCE_CITIES,
+    US_INFERENCE_CITIES,
+    WORKPLACE_KEYWORDS,
+    Country,
+    Department,
+    EmploymentType,
+    ExecutiveRole,
+    SeniorityLevel,
+    WorkplaceType,
+)
+
+# Jobs at or above this confidence skip the LLM
+RULE_CONFIDENCE_THRESHOLD = 0.85
+
+# Employment types that are fractional whatever the role
+FRACTIONAL_EMPLOYMENT_TYPES = {EmploymentType.FRACTIONAL, EmploymentType.INTERIM}
+
+# Employment types that are fractional only for an executive role
+EXECUTIVE_FRACTIONAL_EMPLOYMENT_TYPES = {EmploymentType.PART_TIME, EmploymentType.CONTRACT}
+
+EXECUTIVE_SENIORITY_LEVELS = {
+    SeniorityLevel.C_SUITE,
+    SeniorityLevel.VP,
+    SeniorityLevel.DIRECTOR,
+    SeniorityLevel.HEAD,
+}
+
+# Confidence cap for part-time/contract jobs without an executive role, so they go to the LLM
+NON_EXECUTIVE_CONFIDENCE = 0.5
+
+
+def _word_matcher(keywords: list[str], prefix_only: bool = False) -> "re.Pattern":
+    # Word boundaries stop 'cto' matching "director" and 'hr' matching "three"
+    tail = "" if prefix_only else r"\b"
+    return re.compile(r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")" + tail)
+
+
+_EXECUTIVE_ROLE_MATCHERS = [(role, _word_matcher(p)) for role, p in EXECUTIVE_ROLE_PATTERNS.items()]
+_DEPARTMENT_MATCHERS = [(dept, _word_matcher(k, prefix_only=True)) for dept, k in DEPARTMENT_KEYWORDS]
+_REMOTE_MATCHER = _word_matcher(REMOTE_LOCATION_KEYWORDS)
+_WORKPLACE_MATCHERS = [(wt, _word_matcher(k)) for wt, k in WORKPLACE_KEYWORDS]
+
+# Description phrases that state the arrangement ("office" alone is too common)
+_DESCRIPTION_WORKPLACE = [
+    (WorkplaceType.HYBRID, re.compile(r"\bhybrid\b")),
+    (WorkplaceType.REMOTE, re.compile(
+        r"\b(?:fully|100%)\s+remote\b|\bremote[\s-]first\b"
+        r"|\bwork(?:ing)?\s+(?:from|at)\s+home\b"
+    )),
+    (WorkplaceType.ONSITE, re.compile(r"\bon[\s-]?site\b|\bin[\s-]person\b|\boffice[\s-]based\b")),
+]
+
+# Title keywords, in priority order, that settle the employment type on their own
+_TITLE_EMPLOYMENT = [
+    (EmploymentType.FRACTIONAL, re.compile(r"\bfractional\b")),
+    (EmploymentType.INTERIM, re.compile(r"\binterim\b")),
+    (EmploymentType.PART_TIME, re.compile(r"\bpart[\s-]?time\b")),
+    (EmploymentType.CONTRACT, re.compile(
+        # Only employment-type phrasing: "Contract Manager" is a permanent job title
+        r"\((?:contract|contractor|freelance)\)|\bfreelancer?\b|\bon\s+a\s+contract\b"
+        r"|\bcontract\s+(?:role|position|basis|assignment|engagement|opportunity)\b"
+        r"|\b(?:fixed|short)[\s-]term\s+contract\b|\b\d+[\s-]months?\s+contract\b"
+        r"|[-\u2013|:]\s*(?:contract|contractor)\s*$"
+    )),
+]
+
+# Arrangements an explicit Full-time listing overrides (unlike "Fractional CFO")
+_LISTING_OVERRIDES = {EmploymentType.CONTRACT}
+
+# Description phrases that suggest a reduced-hours arrangement
+_REDUCED_HOURS = re.compile(
+    r"\bfractional\b|\binterim\b|\bpart[\s-]?time\b|\b0?\.\d+\s*fte\b"
+    r"|\b[1-4](?:\s*-\s*[1-4])?\s*days?\s*(?:a|per|/)\s*week\b"
+)
+
+_HOURS_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+class RuleClassification(BaseModel):
+    """Output of the deterministic pre-classifier"""
+
+    employment_type: EmploymentType = EmploymentType.UNKNOWN
+    is_fractional: bool = False
+    is_executive: bool = False
+    seniority_level: SeniorityLevel = SeniorityLevel.UNKNOWN
+    executive_role: ExecutiveRole | None = None
+    department: Department = Department.OTHER
+    country: Country = Country.UNKNOWN
+    city: str | None = None
+    is_remote: bool = False
+    workplace_type: WorkplaceType = WorkplaceType.UNKNOWN
+
+    employment_confidence: float = 0.0
+    role_confidence: float = 0.0
+    confidence: float = 0.0
+    reasoning: str = ""
+
+
+def _listed_employment_type(value: str | None) -> EmploymentType:
+    if not value:
+        return EmploymentType.UNKNOWN
+    key = str(value).lower().strip().replace('-', '_').replace(' ', '_')
+    return EMPLOYMENT_TYPE_MAP.get(key, EmploymentType.UNKNOWN)
+
+
+def _listed_seniority(value: str | None) -> SeniorityLevel:
+    if not value:
+        return SeniorityLevel.UNKNOWN
+    key = str(value).lower().strip().replace('-', '_').replace(' ', '_')
+    return SENIORITY_LEVEL_MAP.get(key, SeniorityLevel.UNKNOWN)
+
+
+def _hours_are_reduced(hours: str | None) -> bool:
+    """True if an hours string ("10-20 hrs/week", "2 days") describes under 30h/week."""
+    if not hours:
+        return False
+    numbers = [float(n) for n in _HOURS_NUMBER.findall(str(hours))]
+    if not numbers:
+        return False
+    if "day" in str(hours).lower():
+        return max(numbers) <= 4
+    return max(numbers) < 30
+
+
+def _classify_employment(
+    title_lower: str,
+    description_lower: str,
+    listed_type: str | None,
+    hours: str | None,
+) -> tuple[EmploymentType, float, str]:
+    title_type = next((t for t, rx in _TITLE_EMPLOYMENT if rx.search(title_lower)), None)
+    listed = _listed_employment_type(listed_type)
+    reduced_hours = bool(_REDUCED_HOURS.search(description_lower)) or _hours_are_reduced(hours)
+
+    if title_type:
+        if listed == EmploymentType.FULL_TIME and title_type in _LISTING_OVERRIDES:
+            return listed, 0.85, f"listed as Full-Time, title says {title_type.value}"
+        if listed == EmploymentType.FULL_TIME:
+            # "Fractional CFO" listed as Full-time happens on LinkedIn; still trust the title
+            return title_type, 0.85, f"title says {title_type.value}, listing says Full-Time"
+        return title_type, 0.95, f"title says {title_type.value}"
+
+    if listed != EmploymentType.UNKNOWN:
+        if listed == EmploymentType.FULL_TIME and reduced_hours:
+            return listed, 0.4, "listed Full-Time but description mentions reduced hours"
+        return listed, 0.9, f"listed as {listed.value}"
+
+    if reduced_hours:
+        return EmploymentType.PART_TIME, 0.6, "reduced hours mentioned"
+
+    return EmploymentType.UNKNOWN, 0.0, "no employment signal"
+
+
+def _classify_role(
+    title_lower: str,
+    listed_seniority: str | None,
+) -> tuple[SeniorityLevel, ExecutiveRole | None, Department, float]:
+    role = next((r for r, rx in _EXECUTIVE_ROLE_MATCHERS if rx.search(title_lower)), None)
+    department = next((d for d, rx in _DEPARTMENT_MATCHERS if rx.search(title_lower)), Department.OTHER)
+
+    if role:
+        if role in C_SUITE_ROLES:
+            seniority = SeniorityLevel.C_SUITE
+        elif 'VP' in role.value:
+            seniority = SeniorityLevel.VP
+        elif role == ExecutiveRole.DIRECTOR:
+            seniority = SeniorityLevel.DIRECTOR
+        else:
+            seniority = SeniorityLevel.HEAD
+        department = EXECUTIVE_ROLE_DEPARTMENTS.get(role, department)
+        confidence = 0.95 if department != Department.OTHER else 0.8
+        return seniority, role, department, confidence
+
+    seniority = _listed_seniority(listed_seniority)
+    if seniority != SeniorityLevel.UNKNOWN:
+        confidence = 0.85 if department != Department.OTHER else 0.7
+    else:
+        confidence = 0.75 if department != Department.OTHER else 0.5
+    return seniority, None, department, confidence
+
+
+def _classify_location(location: str | None) -> tuple[str | None, Country, bool]:
+    if not location:
+        return None, Country.UNKNOWN, False
+    parts = [p.strip() for p in re.split(r'[,\-/]', location) if p.strip()]
+    is_remote = bool(_REMOTE_MATCHER.search(location.lower()))
+    if not parts:
+        return None, Country.UNKNOWN, is_remote
+    country = COUNTRY_MAP.get(parts[-1].lower(), Country.UNKNOWN)
+    city = parts[0] if len(parts) >= 2 or country == Country.UNKNOWN else None
+    if city and city.lower() in ("remote", "hybrid"):
+        city = None
+    if city and country == Country.UNKNOWN:
+        if city.lower() in UK_INFERENCE_CITIES:
+            country = Country.UK
+        elif city.lower() in US_INFERENCE_CITIES:
+            country = Country.US
+    return city, country, is_remote
+
+
+def _classify_workplace(
+    location: str | None,
+    description_lower: str,
+    country: Country,
+    is_remote: bool,
+) -> WorkplaceType:
+    """Remote/hybrid/on-site from the location, then the description.
+
+    A posting with a concrete location and no remote or hybrid wording is
+    on-site: that is how LinkedIn lists office jobs.
+    """
+    location_lower = (location or "").lower()
+    for workplace_type, matcher in _WORKPLACE_MATCHERS:
+        if workplace_type != WorkplaceType.FLEXIBLE and matcher.search(location_lower):
+            return workplace_type
+    if is_remote:
+        return WorkplaceType.REMOTE
+    for workplace_type, pattern in _DESCRIPTION_WORKPLACE:
+        if pattern.search(description_lower):
+            return workplace_type
+    if country not in (Country.UNKNOWN, Country.REMOTE):
+        return WorkplaceType.ONSITE
+    return WorkplaceType.UNKNOWN
+
+
+def pre_classify_job(
+    title: str,
+    description: str = "",
+    employment_type: str | None = None,
+    seniority_level: str | None = None,
+    location: str | None = None,
+    hours_per_week: str | None = None,
+) -> RuleClassification:
+    """
+    Classify a job without an LLM.
+
+    `confidence` is the lower of the employment and role confidences. A
+    part-time or contract job is only fractional for an executive role; for
+    any other role `confidence` is capped below the LLM threshold.
+    """
+    title_lower = (title or "").lower()
+    description_lower = (description or "").lower()
+
+    employment, employment_conf, employment_reason = _classify_employment(
+        title_lower, description_lower, employment_type, hours_per_week
+    )
+    seniority, role, department, role_conf = _classify_role(title_lower, seniority_level)
+    city, country, is_remote = _classify_location(location)
+    workplace = _classify_workplace(location, description_lower, country, is_remote)
+
+    is_executive = role is not None or seniority in EXECUTIVE_SENIORITY_LEVELS
+    is_fractional = employment in FRACTIONAL_EMPLOYMENT_TYPES or (
+        employment in EXECUTIVE_FRACTIONAL_EMPLOYMENT_TYPES and is_executive
+    )
+    confidence = min(employment_conf, role_conf)
+
+    reasoning = f"Rule-based: {employment_reason}"
+    if role:
+        reasoning += f"; executive role {role.value}"
+    elif seniority != SeniorityLevel.UNKNOWN:
+        reasoning += f"; listed seniority {seniority.value}"
+    if employment in EXECUTIVE_FRACTIONAL_EMPLOYMENT_TYPES and not is_executive:
+        confidence = min(confidence, NON_EXECUTIVE_CONFIDENCE)
+        reasoning += "; not an executive role, fractional unclear"
+
+    return RuleClassification(
+        employment_type=employment,
+        is_fractional=is_fractional,
+        is_executive=is_executive,
+        seniority_level=seniority,
+        executive_role=role,
+        department=department,
+        country=country,
+        city=city,
+        is_remote=is_remote,
+        workplace_type=workplace,
+        employment_confidence=employment_conf,
+        role_confidence=role_conf,
+        confidence=confidence,
+        reasoning=reasoning,
+    )
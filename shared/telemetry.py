@@ -0,0 +1,533 @@
+"""
+Worker Telemetry
+
+Temporal worker interceptor recording, for every activity attempt (used by
+content-worker, video-worker, job-worker and apify-job-worker):
+- queue latency (scheduled -> started, i.e. time waiting for a worker slot)
+- execution time and outcome (completed / failed / cancelled)
+- attempt number (retries)
+- input and result payload sizes (estimated JSON bytes)
+- provider cost reported by the activity (result "cost" / "total_cost")
+
+Records go to every configured exporter:
+- LocalExporter: always on; keeps the last LOCAL_MAX_RECORDS in memory and
+  appends JSON lines to TELEMETRY_JSONL if set (tests, the report CLI)
+- OpenTelemetry: one span per attempt, if opentelemetry is installed (sent
+  wherever the process's tracer provider sends spans - e.g. Logfire)
+- Prometheus: histograms/counters, if prometheus_client is installed;
+  served on TELEMETRY_PROMETHEUS_PORT when set
+
+Payload sizes are estimated in the interceptor without encoding the payload:
+a walk of at most PAYLOAD_SAMPLE_ITEMS items per container and
+PAYLOAD_MAX_DEPTH levels, extrapolated to the rest, so a multi-MB crawl
+result costs the event loop about as much as a small one. Only the small
+attempt record (never the activity's inputs or result) is queued to a
+telemetry thread, which runs the exporters; file/network I/O stays off the
+event loop.
+The queue is bounded by QUEUE_MAX_BYTES of records; beyond that records are
+dropped and counted. Exporter errors are logged and never affect the activity.
+
+Usage:
+    worker = Worker(client, ..., interceptors=telemetry_interceptors("content-worker"))
+
+    # Per-workflow critical path from a JSONL file
+    python -m shared.telemetry report telemetry.jsonl [--workflow-id ID]
+"""
+
+import argparse
+import atexit
+import json
+import logging
+import math
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from temporalio import activity
+from temporalio.worker import (
+    ActivityInboundInterceptor,
+    ExecuteActivityInput,
+    Interceptor,
+)
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_ENABLED = os.getenv("TELEMETRY_ENABLED", "true").lower() == "true"
+TELEMETRY_JSONL = os.getenv("TELEMETRY_JSONL")
+TELEMETRY_PROMETHEUS_PORT = os.getenv("TELEMETRY_PROMETHEUS_PORT")
+
+LOCAL_MAX_RECORDS = 5000
+
+# Queued record bytes (estimated) waiting for the telemetry thread; beyond this they are dropped
+QUEUE_MAX_BYTES = 4 * 1024 * 1024
+# Per-record overhead in that estimate: dict, keys, numbers
+RECORD_OVERHEAD_BYTES = 1024
+# Records handed to the exporters at a time
+EXPORT_BATCH = 500
+
+# Result keys holding the provider cost an activity reports (USD)
+COST_KEYS = ("cost", "total_cost")
+
+# Activities starting within this long of a predecessor's end still follow it
+CRITICAL_PATH_SLACK_SECONDS = 0.05
+
+# Items walked per list/dict when estimating a payload size; the rest are
+# extrapolated from these. Containers nested deeper count PAYLOAD_DEEP_ITEM_BYTES per item
+PAYLOAD_SAMPLE_ITEMS = 8
+PAYLOAD_MAX_DEPTH = 4
+PAYLOAD_DEEP_ITEM_BYTES = 16
+
+SECONDS_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+BYTES_BUCKETS = (1e2, 1e3, 1e4, 1e5, 5e5, 1e6, 2e6, 4e6)
+
+
+def payload_size(value: Any, depth: int = 0) -> int:
+    """
+    Approximate payload size: length of the value as compact JSON.
+
+    Exact for small payloads of strings and numbers (escapes aside); large
+    containers are sampled (see PAYLOAD_SAMPLE_ITEMS), so the cost is bounded
+    whatever the payload size.
+    """
+    if isinstance(value, str):
+        return len(value) + 2
+    if value is None or isinstance(value, bool):
+        return 5 if value is False else 4
+    if isinstance(value, (int, float)):
+        return len(repr(value))
+    if isinstance(value, (bytes, bytearray)):
+        return (len(value) + 2) // 3 * 4 + 2  # base64
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    elif hasattr(value, "__dict__"):
+        return payload_size(vars(value), depth)
+    else:
+        return len(str(value)) + 2
+    count = len(items)
+    if not count:
+        return 2
+    if depth >= PAYLOAD_MAX_DEPTH:
+        return 2 + count * PAYLOAD_DEEP_ITEM_BYTES
+    sampled = 0
+    for n, item in enumerate(items, 1):
+        if isinstance(value, dict):
+            key, item = item
+            sampled += len(str(key)) + 3
+        sampled += payload_size(item, depth + 1)
+        if n == PAYLOAD_SAMPLE_ITEMS:
+            break
+    # Brackets, commas, and the unsampled items at the sampled average
+    return 2 + (count - 1) + sampled * count // n
+
+
+def reported_cost(result: Any) -> Optional[float]:
+    """Provider cost from an activity result dict, if it reports one."""
+    if not isinstance(result, dict):
+        return None
+    for key in COST_KEYS:
+        value = result.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+def record_bytes(record: Dict[str, Any]) -> int:
+    """Estimated memory held by a queued attempt record."""
+    return RECORD_OVERHEAD_BYTES + sum(len(value) for value in record.values() if isinstance(value, str))
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+# ============================================================================
+# EXPORTERS
+# ============================================================================
+
+class LocalExporter:
+    """In-memory (and optional JSONL file) record sink."""
+
+    def __init__(self, path: Optional[str] = None, max_records: int = LOCAL_MAX_RECORDS):
+        self.path = path
+        self.records = deque(maxlen=max_records)
+
+    def export(self, record: Dict[str, Any]) -> None:
+        self.export_many([record])
+
+    def export_many(self, records: List[Dict[str, Any]]) -> None:
+        self.records.extend(records)
+        if self.path:
+            with open(self.path, "a") as f:
+                f.write("".join(json.dumps(record, default=str) + "\n" for record in records))
+
+
+class OpenTelemetryExporter:
+    """One span per activity attempt, from scheduled time to end."""
+
+    def __init__(self):
+        from opentelemetry import trace
+        self._trace = trace
+        self._tracer = trace.get_tracer("quest.temporal.activity")
+
+    def export(self, record: Dict[str, Any]) -> None:
+        attributes = {
+            key: value for key, value in record.items()
+            if value is not None and isinstance(value, (str, int, float, bool))
+        }
+        span = self._tracer.start_span(
+            f"activity:{record['activity_type']}",
+            start_time=int((record["scheduled_at"] or record["started_at"]) * 1e9),
+            attributes={f"temporal.{key}": value for key, value in attributes.items()},
+        )
+        if record["status"] != "completed":
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, record.get("error") or ""))
+        span.end(end_time=int(record["ended_at"] * 1e9))
+
+
+class PrometheusExporter:
+    """Activity histograms and counters in the default prometheus registry."""
+
+    _metrics: Optional[Dict[str, Any]] = None
+
+    def __init__(self, port: Optional[int] = None):
+        from prometheus_client import Counter, Histogram, start_http_server
+
+        # Metrics register once per process
+        if PrometheusExporter._metrics is None:
+            labels = ["worker", "workflow_type", "activity_type"]
+            PrometheusExporter._metrics = {
+                "queue": Histogram(
+                    "temporal_activity_queue_seconds",
+                    "Activity scheduled-to-started latency", labels, buckets=SECONDS_BUCKETS
+                ),
+                "execution": Histogram(
+                    "temporal_activity_execution_seconds",
+                    "Activity execution time", labels + ["status"], buckets=SECONDS_BUCKETS
+                ),
+                "retries": Counter(
+                    "temporal_activity_retries_total",
+                    "Activity attempts after the first", labels
+                ),
+                "payload": Histogram(
+                    "temporal_activity_payload_bytes",
+                    "Activity input/result JSON size", labels + ["direction"], buckets=BYTES_BUCKETS
+                ),
+                "cost": Counter(
+                    "temporal_activity_cost_usd_total",
+                    "Provider cost reported by activities", labels
+                ),
+            }
+            if port:
+                start_http_server(port)
+                logger.info(f"Prometheus metrics on :{port}")
+        self.metrics = PrometheusExporter._metrics
+
+    def export(self, record: Dict[str, Any]) -> None:
+        labels = (record["worker"], record["workflow_type"], record["activity_type"])
+        if record["queue_seconds"] is not None:
+            self.metrics["queue"].labels(*labels).observe(record["queue_seconds"])
+        self.metrics["execution"].labels(*labels, record["status"]).observe(record["execution_seconds"])
+        if record["attempt"] > 1:
+            self.metrics["retries"].labels(*labels).inc()
+        self.metrics["payload"].labels(*labels, "input").observe(record["input_bytes"])
+        if record["output_bytes"] is not None:
+            self.metrics["payload"].labels(*labels, "output").observe(record["output_bytes"])
+        if record["cost"]:
+            self.metrics["cost"].labels(*labels).inc(record["cost"])
+
+
+def default_exporters() -> List[Any]:
+    """LocalExporter plus OpenTelemetry/Prometheus when their packages are installed."""
+    exporters: List[Any] = [LocalExporter(TELEMETRY_JSONL)]
+    try:
+        exporters.append(OpenTelemetryExporter())
+    except ImportError:
+        pass
+    try:
+        exporters.append(PrometheusExporter(int(TELEMETRY_PROMETHEUS_PORT) if TELEMETRY_PROMETHEUS_PORT else None))
+    except ImportError:
+        if TELEMETRY_PROMETHEUS_PORT:
+            logger.warning("TELEMETRY_PROMETHEUS_PORT set but prometheus_client is not installed")
+    return exporters
+
+
+# ============================================================================
+# INTERCEPTOR
+# ============================================================================
+
+class _ActivityTelemetry(ActivityInboundInterceptor):
+
+    def __init__(self, next: ActivityInboundInterceptor, telemetry: "ActivityTelemetryInterceptor"):
+        super().__init__(next)
+        self.telemetry = telemetry
+
+    async def execute_activity(self, input: ExecuteActivityInput) -> Any:
+        info = activity.info()
+        start = time.perf_counter()
+        status, error, result = "completed", None, None
+        try:
+            result = await self.next.execute_activity(input)
+            return result
+        except BaseException as e:
+            status = "cancelled" if activity.is_cancelled() else "failed"
+            error = f"{type(e).__name__}: {e}"[:500]
+            raise
+        finally:
+            execution_seconds = time.perf_counter() - start
+            scheduled_at = _timestamp(info.current_attempt_scheduled_time)
+            started_at = _timestamp(info.started_time)
+            self.telemetry.record({
+                "worker": self.telemetry.worker,
+                "workflow_id": info.workflow_id,
+                "workflow_run_id": info.workflow_run_id,
+                "workflow_type": info.workflow_type,
+                "activity_id": info.activity_id,
+                "activity_type": info.activity_type,
+                "task_queue": info.task_queue,
+                "attempt": info.attempt,
+                "status": status,
+                "error": error,
+                "scheduled_at": scheduled_at,
+                "started_at": started_at,
+                "ended_at": started_at + execution_seconds if started_at else time.time(),
+                "queue_seconds": max(0.0, started_at - scheduled_at) if scheduled_at and started_at else None,
+                "execution_seconds": round(execution_seconds, 6),
+                "input_bytes": payload_size(list(input.args)),
+                "output_bytes": payload_size(result) if status == "completed" else None,
+                "cost": reported_cost(result),
+            })
+
+
+class ActivityTelemetryInterceptor(Interceptor):
+    """Worker interceptor timing every activity attempt; see module docstring."""
+
+    def __init__(self, worker: str, exporters: Optional[List[Any]] = None):
+        self.worker = worker
+        self.exporters = default_exporters() if exporters is None else exporters
+        self.dropped = 0
+        self.queued_bytes = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._bytes_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def intercept_activity(self, next: ActivityInboundInterceptor) -> ActivityInboundInterceptor:
+        return _ActivityTelemetry(next, self)
+
+    def record(self, record: Dict[str, Any]) -> None:
+        """Queue an attempt record for the telemetry thread (never blocks)."""
+        self._ensure_thread()
+        size = record_bytes(record)
+        with self._bytes_lock:
+            full = self.queued_bytes + size > QUEUE_MAX_BYTES
+            if full:
+                self.dropped += 1
+            else:
+                self.queued_bytes += size
+        if full:
+            if self.dropped % 1000 == 1:
+                logger.warning(f"Telemetry queue full - {self.dropped} records dropped")
+            return
+        self._queue.put_nowait((record, size))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until queued records are exported; False on timeout."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="activity-telemetry", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush, 2.0)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < EXPORT_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._export([record for record, _ in batch])
+            except Exception as e:
+                logger.warning(f"Telemetry batch dropped: {type(e).__name__}: {e}")
+            finally:
+                with self._bytes_lock:
+                    self.queued_bytes -= sum(size for _, size in batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _export(self, records: List[Dict[str, Any]]) -> None:
+        for exporter in self.exporters:
+            try:
+                if hasattr(exporter, "export_many"):
+                    exporter.export_many(records)
+                else:
+                    for record in records:
+                        exporter.export(record)
+            except Exception as e:
+                logger.warning(f"Telemetry export failed ({type(exporter).__name__}): {e}")
+
+
+def telemetry_interceptors(worker: str) -> List[Interceptor]:
+    """Interceptors for Worker(interceptors=...); empty if TELEMETRY_ENABLED is false."""
+    if not TELEMETRY_ENABLED:
+        return []
+    return [ActivityTelemetryInterceptor(worker)]
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def critical_path(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Chain of activity attempts that bounds a workflow's wall time.
+
+    Walks back from the attempt that ended last, each time to the attempt
+    that ended latest before the current one was scheduled (and before it
+    ended, so concurrent attempts can't point at each other). Each returned
+    record gets "gap_seconds": time before it was scheduled that no activity
+    on the path accounts for (workflow tasks, timers, child workflows).
+    """
+    timed = [r for r in records if r.get("ended_at")]
+    if not timed:
+        return []
+
+    def begin(r):
+        return r.get("scheduled_at") or r.get("started_at") or r["ended_at"]
+
+    path = [max(timed, key=lambda r: r["ended_at"])]
+    while True:
+        current = path[-1]
+        predecessors = [
+            r for r in timed
+            if r["ended_at"] < current["ended_at"]
+            and r["ended_at"] <= begin(current) + CRITICAL_PATH_SLACK_SECONDS
+        ]
+        if not predecessors:
+            break
+        path.append(max(predecessors, key=lambda r: r["ended_at"]))
+
+    path.reverse()
+    for previous, r in zip([None] + path[:-1], path):
+        gap = begin(r) - previous["ended_at"] if previous else 0.0
+        r["gap_seconds"] = max(0.0, gap)
+    return path
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    records = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def _ms(seconds: Optional[float]) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:,.0f}"
+
+
+def report(records: List[Dict[str, Any]], workflow_id: Optional[str] = None, limit: int = 20) -> str:
+    """Text per-workflow critical-path breakdown plus a per-activity summary."""
+    workflows: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for r in records:
+        if workflow_id is None or r.get("workflow_id") == workflow_id:
+            workflows[r.get("workflow_id") or "?"].append(r)
+
+    lines = []
+    ordered = sorted(workflows.items(), key=lambda item: -max(r["ended_at"] for r in item[1]))
+    for wf_id, wf_records in ordered[:limit]:
+        begin = min(r.get("scheduled_at") or r["started_at"] for r in wf_records)
+        wall = max(r["ended_at"] for r in wf_records) - begin
+        path = critical_path(wf_records)
+        cost = sum(r.get("cost") or 0 for r in wf_records)
+        retries = sum(1 for r in wf_records if r.get("attempt", 1) > 1)
+
+        lines.append(f"\n{wf_records[0].get('workflow_type')} {wf_id}")
+        lines.append(
+            f"  wall {_ms(wall)} ms  activities {len(wf_records)}  retries {retries}  cost ${cost:.4f}"
+        )
+        lines.append(f"  {'critical path':<44} {'gap ms':>9} {'queue ms':>9} {'exec ms':>10} {'attempt':>7}")
+        for r in path:
+            name = r["activity_type"] + ("" if r["status"] == "completed" else f" [{r['status']}]")
+            lines.append(
+                f"  {name[:44]:<44} {_ms(r['gap_seconds']):>9} {_ms(r.get('queue_seconds')):>9} "
+                f"{_ms(r['execution_seconds']):>10} {r.get('attempt', 1):>7}"
+            )
+        path_gap = sum(r["gap_seconds"] for r in path)
+        path_queue = sum(r.get("queue_seconds") or 0 for r in path)
+        path_exec = sum(r["execution_seconds"] for r in path)
+        lines.append(
+            f"  {'total':<44} {_ms(path_gap):>9} {_ms(path_queue):>9} {_ms(path_exec):>10}"
+        )
+
+    by_activity: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for wf_records in workflows.values():
+        for r in wf_records:
+            by_activity[r["activity_type"]].append(r)
+
+    lines.append(
+        f"\n{'activity':<44} {'calls':>6} {'p50 ms':>9} {'p95 ms':>9} {'queue ms':>9} "
+        f"{'retries':>7} {'in KB':>8} {'out KB':>8} {'cost $':>9}"
+    )
+    for name, rs in sorted(by_activity.items(), key=lambda item: -sum(r["execution_seconds"] for r in item[1])):
+        durations = sorted(r["execution_seconds"] for r in rs)
+        queues = [r["queue_seconds"] for r in rs if r.get("queue_seconds") is not None]
+        outputs = [r["output_bytes"] for r in rs if r.get("output_bytes") is not None]
+        lines.append(
+            f"{name[:44]:<44} {len(rs):>6} {_ms(statistics.median(durations)):>9} "
+            f"{_ms(durations[max(0, math.ceil(0.95 * len(durations)) - 1)]):>9} "
+            f"{_ms(statistics.mean(queues) if queues else None):>9} "
+            f"{sum(1 for r in rs if r.get('attempt', 1) > 1):>7} "
+            f"{statistics.mean(r['input_bytes'] for r in rs) / 1024:>8.1f} "
+            f"{(statistics.mean(outputs) / 1024 if outputs else 0):>8.1f} "
+            f"{sum(r.get('cost') or 0 for r in rs):>9.4f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Activity telemetry tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    report_parser = commands.add_parser("report", help="Per-workflow critical-path breakdown of a JSONL file")
+    report_parser.add_argument("path", nargs="?", default=TELEMETRY_JSONL)
+    report_parser.add_argument("--workflow-id")
+    report_parser.add_argument("--limit", type=int, default=20, help="Most recent workflows to show")
+    args = parser.parse_args(argv)
+
+    if not args.path:
+        parser.error("path required (or set TELEMETRY_JSONL)")
+    records = load_records(args.path)
+    if not records:
+        print("No telemetry records")
+        return 1
+    print(report(records, workflow_id=args.workflow_id, limit=args.limit))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
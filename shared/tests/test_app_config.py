@@ -0,0 +1,67 @@
+import json
+import os
+from dataclasses import fields, is_dataclass
+from enum import Enum
+
+import pytest
+
+from shared.app_config import (
+    APP_CONFIGS,
+    CHARACTER_STYLE_PROMPT_SETS,
+    get_all_apps,
+    get_app_config,
+    load_app_configs,
+)
+
+# model_dump(mode="json") of every app under the Pydantic models these
+# dataclasses replaced, plus each worker's CHARACTER_STYLE_PROMPTS
+MODEL_DUMP_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "app_configs_model_dump.json")
+
+
+def dump(value):
+    """The Pydantic model_dump(mode="json") shape of a loaded config value."""
+    if is_dataclass(value):
+        return {f.name: dump(getattr(value, f.name)) for f in fields(value) if f.init}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, tuple):
+        return [dump(item) for item in value]
+    return value
+
+
+@pytest.fixture(scope="module")
+def model_dump():
+    with open(MODEL_DUMP_FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_configs_load_frozen():
+    assert set(get_all_apps()) == set(APP_CONFIGS)
+    config = get_app_config("relocation")
+    with pytest.raises(Exception):
+        config.name = "other"
+
+
+def test_apps_match_previous_model_dump(model_dump):
+    assert list(APP_CONFIGS) == list(model_dump["apps"])
+    for name, config in APP_CONFIGS.items():
+        assert dump(config) == model_dump["apps"][name], name
+
+
+def test_each_worker_keeps_its_character_prompts(model_dump):
+    expected = model_dump["character_style_prompts"]
+
+    assert set(CHARACTER_STYLE_PROMPT_SETS) == set(expected)
+    for worker, prompts in CHARACTER_STYLE_PROMPT_SETS.items():
+        assert {style.value: text for style, text in prompts.items()} == expected[worker], worker
+
+
+def test_missing_character_style_names_the_path(tmp_path):
+    with open(MODEL_DUMP_FIXTURE, encoding="utf-8") as f:
+        data = json.load(f)
+    del data["character_style_prompts"]["video-worker"]["diverse"]
+    path = tmp_path / "app_configs.json"
+    path.write_text(json.dumps(data))
+
+    with pytest.raises(ValueError, match=r"character_style_prompts\.video-worker: missing \['diverse'\]"):
+        load_app_configs(str(path))
@@ -0,0 +1,40 @@
+import json
+import os
+import re
+import tomllib
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Services that import shared, and their Railway config file
+SERVICES = {
+    "content-worker": "railway.toml",
+    "video-worker": "railway.toml",
+    "job-worker": "railway.json",
+    "apify-job-worker": "railway.json",
+}
+
+
+def load_railway_config(service):
+    path = os.path.join(REPO_ROOT, service, SERVICES[service])
+    with open(path, "rb") as f:
+        return tomllib.load(f) if path.endswith(".toml") else json.load(f)
+
+
+@pytest.mark.parametrize("service", sorted(SERVICES))
+def test_requirements_have_no_relative_paths(service):
+    # pip resolves these from the current directory, not the requirements file
+    with open(os.path.join(REPO_ROOT, service, "requirements.txt")) as f:
+        lines = [line.split("#")[0].strip() for line in f]
+
+    assert not [line for line in lines if re.match(r"(-e\s+)?\.{1,2}/", line)]
+
+
+@pytest.mark.parametrize("service", sorted(SERVICES))
+def test_build_installs_shared_from_repo_root(service):
+    config = load_railway_config(service)
+
+    assert config["build"]["buildCommand"] == f"pip install ./shared -r {service}/requirements.txt"
+    assert set(config["build"]["watchPatterns"]) == {f"{service}/**", "shared/**"}
+    assert config["deploy"]["startCommand"].startswith(f"cd {service} && ")
@@ -0,0 +1,142 @@
+import asyncio
+import contextlib
+
+from shared.near_duplicates import (
+    SIMILARITY_THRESHOLD,
+    best_match,
+    estimate_similarity,
+    job_features,
+    link_near_duplicate,
+    location_key,
+    lsh_buckets,
+    minhash_signature,
+    pack_signature,
+    unpack_signature,
+)
+
+DESCRIPTION = (
+    "We are looking for a fractional CFO to lead our finance function two days a week. "
+    "You will own the monthly close, board reporting, cash flow forecasting and fundraising "
+    "preparation, working closely with the founders and the wider leadership team. "
+    "Experience scaling venture-backed SaaS businesses from Series A to Series C is essential."
+)
+
+
+def _job(**overrides):
+    job = {
+        "title": "Fractional CFO",
+        "company_name": "Acme Analytics Ltd",
+        "location": "London, England, United Kingdom",
+        "full_description": DESCRIPTION,
+    }
+    job.update(overrides)
+    return job
+
+
+def _candidate(job, canonical_id):
+    return {
+        "signature": pack_signature(minhash_signature(job_features(job))),
+        "canonical_id": canonical_id,
+        "location": job["location"],
+    }
+
+
+def test_same_posting_from_two_boards_matches():
+    linkedin = _job()
+    ats = _job(title="CFO (Fractional)", company_name="Acme Analytics", location="London, UK")
+
+    signature = minhash_signature(job_features(ats))
+
+    assert estimate_similarity(signature, minhash_signature(job_features(linkedin))) >= SIMILARITY_THRESHOLD
+    assert best_match(signature, ats["location"], [_candidate(linkedin, 1)])[0] == 1
+
+
+def test_same_description_in_another_city_is_not_linked():
+    london = _job()
+    manchester = _job(location="Manchester, United Kingdom")
+
+    signature = minhash_signature(job_features(manchester))
+
+    assert estimate_similarity(signature, minhash_signature(job_features(london))) >= SIMILARITY_THRESHOLD
+    assert best_match(signature, manchester["location"], [_candidate(london, 1)]) is None
+
+
+def test_remote_or_missing_location_does_not_block():
+    london = _job()
+    remote = _job(location="Remote")
+
+    assert best_match(minhash_signature(job_features(remote)), "Remote", [_candidate(london, 1)])
+    assert best_match(minhash_signature(job_features(london)), None, [_candidate(london, 2)])
+
+
+def test_different_role_does_not_match():
+    other = _job(title="Fractional CMO", full_description="Own brand, demand generation and pipeline targets.")
+
+    signature = minhash_signature(job_features(other))
+
+    assert best_match(signature, other["location"], [_candidate(_job(), 1)]) is None
+
+
+def test_best_match_prefers_most_similar_candidate():
+    job = _job()
+    near = _candidate(_job(full_description=DESCRIPTION + " Hybrid working available."), "near")
+    exact = _candidate(_job(), "exact")
+
+    assert best_match(minhash_signature(job_features(job)), job["location"], [near, exact])[0] == "exact"
+
+
+def test_location_key():
+    assert location_key("London, England, United Kingdom") == "london"
+    assert location_key("New York, NY") == "new york"
+    assert location_key("Remote") == ""
+    assert location_key(None) == ""
+
+
+def test_signature_round_trip_and_buckets():
+    signature = minhash_signature(job_features(_job()))
+
+    assert unpack_signature(pack_signature(signature)) == signature
+    assert len(lsh_buckets(signature)) == 16
+    assert lsh_buckets(signature) == lsh_buckets(list(signature))
+
+
+class FakeConnection:
+    def __init__(self, candidates):
+        self.candidates = candidates
+        self.executed = []
+
+    async def fetch(self, query, *params):
+        return self.candidates
+
+    async def execute(self, query, *params):
+        self.executed.append((" ".join(query.split()), params))
+
+    def transaction(self):
+        return contextlib.nullcontext()
+
+
+def _canonical_updates(conn):
+    return [params for query, params in conn.executed if query.startswith("UPDATE jobs SET canonical_job_id")]
+
+
+def test_link_sets_canonical_job():
+    conn = FakeConnection([_candidate(_job(), 1)])
+
+    result = asyncio.run(link_near_duplicate(conn, 2, _job()))
+
+    assert result["canonical_job_id"] == 1
+    assert _canonical_updates(conn) == [(1, 2)]
+
+
+def test_link_clears_stale_canonical_when_nothing_matches():
+    conn = FakeConnection([_candidate(_job(title="Fractional CMO", full_description="Own the brand."), 1)])
+
+    assert asyncio.run(link_near_duplicate(conn, 2, _job())) is None
+    assert _canonical_updates(conn) == [(None, 2)]
+
+
+def test_job_matching_only_itself_is_not_linked():
+    conn = FakeConnection([_candidate(_job(), 2)])
+
+    assert asyncio.run(link_near_duplicate(conn, 2, _job())) is None
+    assert _canonical_updates(conn) == [(None, 2)]
@@ -0,0 +1,105 @@
+import asyncio
+import json
+from datetime import date, datetime
+
+import pytest
+from shared import pagination
+from shared.pagination import count_rows, decode_cursor, encode_cursor, keyset_condition
+
+
+class FakeConnection:
+    def __init__(self, estimate, total):
+        self.estimate = estimate
+        self.total = total
+        self.queries = []
+
+    async def fetchval(self, query, *params):
+        self.queries.append(query)
+        if query.startswith("EXPLAIN"):
+            return json.dumps([{"Plan": {"Plan Rows": self.estimate}}])
+        return self.total
+
+
+@pytest.fixture(autouse=True)
+def empty_count_cache(monkeypatch):
+    monkeypatch.setattr(pagination, "_count_cache", {})
+
+
+@pytest.mark.parametrize("posted_date, row_id", [
+    (date(2025, 3, 1), 42),
+    (datetime(2025, 3, 1, 9, 30), 7),
+    (None, 3),
+    (date(2025, 3, 1), "a1b2c3"),
+])
+def test_cursor_round_trip(posted_date, row_id):
+    cursor = encode_cursor(posted_date, row_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (posted_date, row_id)
+
+
+def test_malformed_cursor_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_condition_numbers_params_after_existing_filters():
+    params = ["remote"]
+
+    condition = keyset_condition(encode_cursor(date(2025, 3, 1), 42), params)
+
+    assert params == ["remote", date(2025, 3, 1), 42]
+    assert condition == "((j.posted_date, j.id) < ($2, $3) OR j.posted_date IS NULL)"
+
+
+def test_keyset_condition_after_undated_row():
+    params = []
+
+    condition = keyset_condition(encode_cursor(None, 9), params, alias="jobs")
+
+    assert params == [9]
+    assert condition == "(jobs.posted_date IS NULL AND jobs.id < $1)"
+
+
+def after_cursor(row, cursor_row):
+    """Python reading of keyset_condition for posted_date DESC NULLS LAST, id DESC."""
+    (posted, row_id), (cursor_posted, cursor_id) = row, cursor_row
+    if cursor_posted is None:
+        return posted is None and row_id < cursor_id
+    return posted is None or (posted, row_id) < (cursor_posted, cursor_id)
+
+
+def test_pages_cover_every_row_once():
+    rows = [(date(2025, 1, day % 5 + 1) if day % 4 else None, day) for day in range(1, 40)]
+    ordered = sorted(rows, key=lambda r: (r[0] is None, -(r[0].toordinal() if r[0] else 0), -r[1]))
+
+    seen, cursor = [], None
+    while True:
+        remaining = [r for r in ordered if cursor is None or after_cursor(r, decode_cursor(cursor))]
+        page = remaining[:7]
+        if not page:
+            break
+        seen.extend(page)
+        cursor = encode_cursor(*page[-1])
+
+    assert seen == ordered
+
+
+def test_large_results_use_planner_estimate():
+    conn = FakeConnection(estimate=250000, total=249000)
+
+    assert asyncio.run(count_rows(conn, "jobs j WHERE j.is_active", [])) == (250000, True)
+    assert not any(q.startswith("SELECT COUNT") for q in conn.queries)
+
+
+def test_small_or_exact_counts_are_cached():
+    small = FakeConnection(estimate=120, total=118)
+    assert asyncio.run(count_rows(small, "jobs j WHERE j.country = $1", ["CY"])) == (118, False)
+
+    again = FakeConnection(estimate=120, total=999)
+    assert asyncio.run(count_rows(again, "jobs j WHERE j.country = $1", ["CY"])) == (118, False)
+    assert again.queries == []
+
+    large = FakeConnection(estimate=250000, total=249000)
+    assert asyncio.run(count_rows(large, "jobs j", [], exact=True)) == (249000, False)
+    assert not any(q.startswith("EXPLAIN") for q in large.queries)
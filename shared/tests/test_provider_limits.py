@@ -0,0 +1,240 @@
+import asyncio
+import dataclasses
+import time
+from types import SimpleNamespace
+
+import pytest
+from temporalio.common import Priority
+from temporalio.testing import ActivityEnvironment
+
+from shared import provider_limits
+from shared.provider_limits import (
+    BATCH,
+    INTERACTIVE,
+    LocalBackend,
+    ProviderLimiter,
+    ProviderLimitInterceptor,
+    ProviderLimitTimeout,
+    ProviderQuota,
+    configure_provider_limits,
+    decide,
+    load_quotas,
+    priority_for,
+)
+
+# 60 rpm = one token per second
+QUOTA = ProviderQuota(requests_per_minute=60, burst=8, max_concurrent=4, interactive_reserve=0.25)
+
+
+def test_decide_refills_up_to_burst_and_takes_a_token():
+    assert decide(QUOTA, INTERACTIVE, tokens=2.0, elapsed=3.0, leases=0, lease=True) == (True, 4.0, 0.0)
+    assert decide(QUOTA, INTERACTIVE, tokens=7.0, elapsed=60.0, leases=0, lease=True) == (True, 7.0, 0.0)
+
+
+def test_decide_reports_time_until_next_token():
+    granted, tokens, retry_after = decide(QUOTA, INTERACTIVE, tokens=0.25, elapsed=0.0, leases=0, lease=False)
+
+    assert not granted
+    assert tokens == 0.25
+    assert retry_after == pytest.approx(0.75)
+
+
+def test_decide_keeps_a_reserve_from_batch_callers():
+    # Batch needs 1 + 8 * 0.25 = 3 tokens in the bucket and leaves 1 of the 4 leases
+    assert QUOTA.min_tokens(BATCH) == 3.0
+    assert QUOTA.max_leases(BATCH) == 3
+
+    assert not decide(QUOTA, BATCH, tokens=2.5, elapsed=0.0, leases=0, lease=True)[0]
+    assert decide(QUOTA, INTERACTIVE, tokens=2.5, elapsed=0.0, leases=0, lease=True)[0]
+
+    assert not decide(QUOTA, BATCH, tokens=8.0, elapsed=0.0, leases=3, lease=True)[0]
+    assert decide(QUOTA, INTERACTIVE, tokens=8.0, elapsed=0.0, leases=3, lease=True)[0]
+    assert not decide(QUOTA, INTERACTIVE, tokens=8.0, elapsed=0.0, leases=4, lease=True)[0]
+    # Token-only (nested) acquires ignore the lease count
+    assert decide(QUOTA, INTERACTIVE, tokens=8.0, elapsed=0.0, leases=4, lease=False)[0]
+
+
+def test_load_quotas_applies_partial_overrides():
+    quotas = load_quotas('{"anthropic": {"requests_per_minute": 400}, "acme": {"requests_per_minute": 10, "burst": 2, "max_concurrent": 1}}')
+
+    assert quotas["anthropic"].requests_per_minute == 400
+    assert quotas["anthropic"].burst == provider_limits.DEFAULT_QUOTAS["anthropic"].burst
+    assert quotas["acme"] == ProviderQuota(requests_per_minute=10, burst=2, max_concurrent=1)
+
+
+def test_local_backend_burst_then_throttle():
+    backend = LocalBackend()
+    quota = ProviderQuota(requests_per_minute=60, burst=3, max_concurrent=10)
+
+    async def run():
+        return [await backend.try_acquire("serper", quota, INTERACTIVE, False, 60) for _ in range(4)]
+
+    results = asyncio.run(run())
+
+    assert [lease_id for lease_id, _ in results] == ["", "", "", None]
+    assert 0 < results[-1][1] <= 1.0
+
+
+def test_local_backend_leases_release_and_expire():
+    backend = LocalBackend()
+    quota = ProviderQuota(requests_per_minute=6000, burst=100, max_concurrent=1, interactive_reserve=0)
+
+    async def run():
+        first, _ = await backend.try_acquire("exa", quota, INTERACTIVE, True, 60)
+        blocked, _ = await backend.try_acquire("exa", quota, INTERACTIVE, True, 60)
+        await backend.release("exa", first)
+        second, _ = await backend.try_acquire("exa", quota, INTERACTIVE, True, 0.05)
+        await asyncio.sleep(0.1)
+        # The second lease expired without a release (crashed holder)
+        third, _ = await backend.try_acquire("exa", quota, INTERACTIVE, True, 60)
+        return first, blocked, second, third
+
+    first, blocked, second, third = asyncio.run(run())
+
+    assert first.startswith("local:")
+    assert blocked is None
+    assert second and third and third != second
+
+
+def test_slot_nesting_takes_no_second_lease():
+    limiter = ProviderLimiter(quotas={"zep": ProviderQuota(requests_per_minute=6000, burst=10, max_concurrent=1)})
+
+    async def run():
+        async with limiter.slot("zep", INTERACTIVE), limiter.slot("zep", INTERACTIVE):
+            return len(limiter.local._leases["zep"])
+
+    assert asyncio.run(run()) == 1
+    assert limiter.local._leases["zep"] == {}
+
+
+def test_slot_times_out(monkeypatch):
+    monkeypatch.setitem(provider_limits.MAX_WAIT_SECONDS, INTERACTIVE, 0.2)
+    limiter = ProviderLimiter(quotas={"mux": ProviderQuota(requests_per_minute=6000, burst=10, max_concurrent=1)})
+
+    async def hold(seconds):
+        async with limiter.slot("mux", INTERACTIVE):
+            await asyncio.sleep(seconds)
+
+    async def run():
+        await asyncio.gather(hold(1.0), hold(0))
+
+    with pytest.raises(ProviderLimitTimeout):
+        asyncio.run(run())
+    assert limiter.throttled == {}  # timeouts aren't recorded as completed waits
+
+
+def test_backend_failure_falls_back_to_local():
+    class Down:
+        async def try_acquire(self, *args):
+            raise OSError("connection refused")
+
+    limiter = ProviderLimiter(backend=Down(), quotas={"serper": QUOTA})
+
+    async def run():
+        async with limiter.slot("serper", INTERACTIVE):
+            return len(limiter.local._leases["serper"])
+
+    assert asyncio.run(run()) == 1
+    assert limiter.local._leases["serper"] == {}
+
+
+def test_unknown_provider_is_not_limited():
+    limiter = ProviderLimiter(quotas={})
+
+    async def run():
+        async with limiter.slot("nobody"):
+            return True
+
+    assert asyncio.run(run())
+
+
+@pytest.fixture
+def unconfigured(monkeypatch):
+    # Restored after the test, whatever configure_provider_limits() sets
+    for name in ("_database_url", "_ai_model", "_limiter"):
+        monkeypatch.setattr(provider_limits, name, None)
+    monkeypatch.setattr(provider_limits, "PROVIDER_LIMITS_BACKEND", "postgres")
+
+
+def test_unconfigured_limiter_is_per_process(unconfigured):
+    assert isinstance(provider_limits.get_limiter().backend, LocalBackend)
+    assert provider_limits.llm_provider() == "llm"
+
+
+def test_configure_injects_database_and_model(unconfigured):
+    configure_provider_limits(database_url="postgresql://neon/db", ai_model=lambda: ("google-gla", "gemini-2.0-flash"))
+
+    assert provider_limits.get_limiter().backend.dsn == "postgresql://neon/db"
+    assert provider_limits.llm_provider() == "gemini"
+    assert provider_limits.get_limiter().providers_for("generate_four_act_article") == ("gemini",)
+
+
+def activity_env(activity_type, workflow_type="ArticleCreationWorkflow", priority_key=None):
+    env = ActivityEnvironment()
+    env.info = dataclasses.replace(
+        env.info,
+        activity_type=activity_type,
+        workflow_type=workflow_type,
+        priority=Priority(priority_key=priority_key),
+    )
+    return env
+
+
+def test_priority_for_batch_key_and_workflow_type():
+    env = activity_env("serper_news_search", priority_key=4)
+    assert priority_for(env.info) == BATCH
+    assert priority_for(activity_env("serper_news_search", priority_key=3).info) == INTERACTIVE
+    assert priority_for(activity_env("serper_news_search", "NewsCreationWorkflow").info) == BATCH
+    assert priority_for(None) == INTERACTIVE
+
+
+def test_interceptor_serializes_activities_over_max_concurrent():
+    limiter = ProviderLimiter(quotas={"serper": ProviderQuota(requests_per_minute=6000, burst=10, max_concurrent=1)})
+    interceptor = ProviderLimitInterceptor(limiter)
+    running, peak = 0, 0
+
+    class Next:
+        async def execute_activity(self, input):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.1)
+            running -= 1
+            return "done"
+
+    def run_activity():
+        env = activity_env("serper_news_search")
+        intercepted = interceptor.intercept_activity(Next())
+
+        async def execute():
+            return await intercepted.execute_activity(SimpleNamespace(args=[]))
+
+        return env.run(execute)
+
+    async def run():
+        return await asyncio.gather(run_activity(), run_activity(), run_activity())
+
+    start = time.perf_counter()
+    assert asyncio.run(run()) == ["done"] * 3
+    assert peak == 1
+    assert time.perf_counter() - start >= 0.3
+    assert limiter.local._leases["serper"] == {}
+    assert limiter.throttled[("serper", INTERACTIVE)] == 2
+
+
+def test_interceptor_passes_through_unmapped_activities():
+    limiter = ProviderLimiter(quotas={})
+    interceptor = ProviderLimitInterceptor(limiter)
+
+    class Next:
+        async def execute_activity(self, input):
+            return "ok"
+
+    env = activity_env("calculate_completeness_score")
+    intercepted = interceptor.intercept_activity(Next())
+
+    async def execute():
+        return await intercepted.execute_activity(SimpleNamespace(args=[]))
+
+    assert asyncio.run(env.run(execute)) == "ok"
+    assert limiter.waits == {}
@@ -0,0 +1,102 @@
+import pytest
+
+from shared.job_taxonomy import EmploymentType, WorkplaceType
+from shared.rule_classification import (
+    RULE_CONFIDENCE_THRESHOLD,
+    pre_classify_job,
+)
+
+
+@pytest.mark.parametrize("title", [
+    "Contract Manager",
+    "Contracts Lead",
+    "Commercial Contract Specialist",
+    "Head of Contractor Relations",
+    "Contract Negotiation Director",
+])
+def test_contract_in_job_title_is_not_an_arrangement(title):
+    result = pre_classify_job(title, employment_type="Full-time")
+
+    assert result.employment_type == EmploymentType.FULL_TIME
+    assert not result.is_fractional
+
+
+@pytest.mark.parametrize("title", ["Contract Manager", "Head of Contractor Relations"])
+def test_contract_in_job_title_without_listing_goes_to_llm(title):
+    result = pre_classify_job(title)
+
+    assert result.employment_type == EmploymentType.UNKNOWN
+    assert result.employment_confidence < RULE_CONFIDENCE_THRESHOLD
+
+
+@pytest.mark.parametrize("title", [
+    "Finance Director (Contract)",
+    "CFO - Contract",
+    "Freelance Marketing Director",
+    "Head of Data, 6 month contract",
+    "Operations Director on a contract basis",
+    "CTO contract role",
+])
+def test_contract_arrangement_in_title(title):
+    result = pre_classify_job(title)
+
+    assert result.employment_type == EmploymentType.CONTRACT
+    assert result.is_fractional
+    assert result.employment_confidence >= RULE_CONFIDENCE_THRESHOLD
+
+
+def test_full_time_listing_overrides_contract_title():
+    result = pre_classify_job("Finance Director (Contract)", employment_type="Full-time")
+
+    assert result.employment_type == EmploymentType.FULL_TIME
+    assert not result.is_fractional
+
+
+def test_full_time_listing_does_not_override_fractional_title():
+    result = pre_classify_job("Fractional CFO", employment_type="Full-time")
+
+    assert result.employment_type == EmploymentType.FRACTIONAL
+    assert result.is_fractional
+
+
+def test_listed_contract_without_title_signal():
+    result = pre_classify_job("Contract Manager", employment_type="Contract")
+
+    assert result.employment_type == EmploymentType.CONTRACT
+    assert result.employment_confidence >= RULE_CONFIDENCE_THRESHOLD
+
+
+@pytest.mark.parametrize(("location", "description", "expected"), [
+    ("London, United Kingdom (Hybrid)", "", WorkplaceType.HYBRID),
+    ("Remote - UK", "", WorkplaceType.REMOTE),
+    ("Manchester, United Kingdom", "Hybrid working, 2 days in the office.", WorkplaceType.HYBRID),
+    ("Manchester, United Kingdom", "This is a fully remote role.", WorkplaceType.REMOTE),
+    ("Manchester, United Kingdom", "Flexible hours.", WorkplaceType.ONSITE),
+    (None, "The role is on-site in our Leeds office.", WorkplaceType.ONSITE),
+    (None, "", WorkplaceType.UNKNOWN),
+])
+def test_workplace_type(location, description, expected):
+    result = pre_classify_job("Finance Director", description, location=location)
+
+    assert result.workplace_type == expected
+
+
+@pytest.mark.parametrize(("title", "employment_type", "seniority_level"), [
+    ("Part-time Sales Assistant", None, "Entry level"),
+    ("Contract Software Engineer", "Contract", None),
+    ("Warehouse Operative (Temporary Contract)", "Contract", None),
+])
+def test_non_executive_part_time_or_contract_is_not_fractional(title, employment_type, seniority_level):
+    result = pre_classify_job(title, employment_type=employment_type, seniority_level=seniority_level)
+
+    assert result.employment_type in (EmploymentType.PART_TIME, EmploymentType.CONTRACT)
+    assert not result.is_executive
+    assert not result.is_fractional
+    assert result.confidence < RULE_CONFIDENCE_THRESHOLD
+
+
+def test_part_time_with_listed_executive_seniority_is_fractional():
+    result = pre_classify_job("Part-time Operations Lead", seniority_level="Director")
+
+    assert result.is_executive
+    assert result.is_fractional
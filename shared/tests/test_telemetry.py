@@ -0,0 +1,219 @@
+import asyncio
+import dataclasses
+import gc
+import json
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from temporalio.testing import ActivityEnvironment
+
+from shared import telemetry as telemetry_module
+from shared.telemetry import (
+    ActivityTelemetryInterceptor,
+    LocalExporter,
+    critical_path,
+    load_records,
+    payload_size,
+    report,
+)
+
+
+class FakeNext:
+    def __init__(self, result=None, error=None, delay=0.0):
+        self.result, self.error, self.delay = result, error, delay
+
+    async def execute_activity(self, input):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.result
+
+
+def run_attempt(telemetry, next, args=("query",), attempt=1, queued_seconds=2.0):
+    env = ActivityEnvironment()
+    now = datetime.now(timezone.utc)
+    env.info = dataclasses.replace(
+        env.info,
+        activity_type="serper_news_search",
+        workflow_id="wf-1",
+        workflow_type="NewsCreationWorkflow",
+        attempt=attempt,
+        current_attempt_scheduled_time=now - timedelta(seconds=queued_seconds),
+        started_time=now,
+    )
+    intercepted = telemetry.intercept_activity(next)
+
+    async def execute():
+        return await intercepted.execute_activity(SimpleNamespace(args=list(args)))
+
+    return env.run(execute)
+
+
+def test_records_timing_sizes_and_cost(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    local = LocalExporter(str(path))
+    telemetry = ActivityTelemetryInterceptor("content-worker", exporters=[local])
+
+    result = asyncio.run(run_attempt(telemetry, FakeNext({"articles": [1, 2], "cost": 0.012}), attempt=2))
+
+    assert result["cost"] == 0.012
+    assert telemetry.flush()
+    (record,) = local.records
+    assert record["status"] == "completed"
+    assert record["activity_type"] == "serper_news_search"
+    assert record["attempt"] == 2
+    assert record["queue_seconds"] == pytest.approx(2.0, abs=0.01)
+    assert record["input_bytes"] == len('["query"]')
+    assert record["output_bytes"] == len('{"articles":[1,2],"cost":0.012}')
+    assert record["cost"] == 0.012
+    assert load_records(str(path)) == [json.loads(json.dumps(record, default=str))]
+
+
+def test_failed_attempt_is_recorded_and_reraised():
+    local = LocalExporter()
+    telemetry = ActivityTelemetryInterceptor("content-worker", exporters=[local])
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run_attempt(telemetry, FakeNext(error=RuntimeError("provider down"))))
+
+    assert telemetry.flush()
+    (record,) = local.records
+    assert record["status"] == "failed"
+    assert record["error"] == "RuntimeError: provider down"
+    assert record["output_bytes"] is None
+
+
+def test_exporters_run_off_the_event_loop():
+    class SlowExporter:
+        def __init__(self):
+            self.threads = []
+
+        def export(self, record):
+            time.sleep(0.3)
+            self.threads.append(threading.current_thread().name)
+
+    slow = SlowExporter()
+    telemetry = ActivityTelemetryInterceptor("content-worker", exporters=[slow, LocalExporter()])
+
+    start = time.perf_counter()
+    for _ in range(3):
+        asyncio.run(run_attempt(telemetry, FakeNext({"ok": True})))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.3
+    assert telemetry.flush()
+    assert slow.threads == ["activity-telemetry"] * 3
+
+
+class Payload(dict):
+    """Result dict that can be weakly referenced."""
+
+
+class BlockedExporter:
+    def __init__(self):
+        self.release = threading.Event()
+        self.records = []
+
+    def export(self, record):
+        self.release.wait(5)
+        self.records.append(record)
+
+
+def test_queued_records_do_not_hold_payloads():
+    blocked = BlockedExporter()
+    telemetry = ActivityTelemetryInterceptor("content-worker", exporters=[blocked])
+    result = Payload(content="x" * 1_000_000)
+    ref = weakref.ref(result)
+
+    asyncio.run(run_attempt(telemetry, FakeNext(result), args=("y" * 1_000_000,)))
+    del result
+    gc.collect()
+
+    assert ref() is None
+    blocked.release.set()
+    assert telemetry.flush()
+    assert blocked.records[0]["output_bytes"] > 1_000_000
+    assert telemetry.queued_bytes == 0
+
+
+def test_queue_is_bounded_by_bytes(monkeypatch):
+    monkeypatch.setattr(telemetry_module, "QUEUE_MAX_BYTES", 3 * telemetry_module.RECORD_OVERHEAD_BYTES + 2000)
+    blocked = BlockedExporter()
+    telemetry = ActivityTelemetryInterceptor("content-worker", exporters=[blocked])
+
+    for _ in range(10):
+        asyncio.run(run_attempt(telemetry, FakeNext({"ok": True})))
+
+    assert telemetry.dropped > 0
+    assert telemetry.queued_bytes <= telemetry_module.QUEUE_MAX_BYTES
+    blocked.release.set()
+    assert telemetry.flush()
+    assert len(blocked.records) == 10 - telemetry.dropped
+
+
+def test_payload_size_estimates_large_payloads_from_a_sample(monkeypatch):
+    pages = [{"url": f"https://example.com/{i:06d}", "content": "x" * 5000, "links": list(range(20))} for i in range(2000)]
+    exact = len(json.dumps({"pages": pages, "total": 2000}, separators=(",", ":")))
+    visited = []
+
+    def counting(value, depth=0):
+        visited.append(value)
+        return payload_size(value, depth)
+
+    monkeypatch.setattr(telemetry_module, "payload_size", counting)
+    estimate = payload_size({"pages": pages, "total": 2000})
+
+    assert estimate == pytest.approx(exact, rel=0.01)
+    assert len(visited) < 500
+
+
+def test_failing_exporter_does_not_stop_others():
+    class Broken:
+        def export(self, record):
+            raise ValueError("collector unreachable")
+
+    local = LocalExporter()
+    telemetry = ActivityTelemetryInterceptor("content-worker", exporters=[Broken(), local])
+
+    asyncio.run(run_attempt(telemetry, FakeNext({"ok": True})))
+
+    assert telemetry.flush()
+    assert len(local.records) == 1
+
+
+def record(activity, scheduled, started, ended, attempt=1, cost=None):
+    return {
+        "workflow_id": "wf-1", "workflow_type": "NewsCreationWorkflow", "activity_type": activity,
+        "status": "completed", "attempt": attempt, "scheduled_at": scheduled, "started_at": started,
+        "ended_at": ended, "queue_seconds": started - scheduled, "execution_seconds": ended - started,
+        "input_bytes": 100, "output_bytes": 1000, "cost": cost,
+    }
+
+
+def test_critical_path_follows_the_latest_predecessor():
+    records = [
+        record("search_a", 0.0, 0.0, 1.0),
+        record("search_b", 0.0, 0.5, 3.0, cost=0.01),  # slower of the two concurrent searches
+        record("assess", 3.5, 4.0, 6.0, attempt=2),
+    ]
+
+    path = critical_path(records)
+
+    assert [r["activity_type"] for r in path] == ["search_b", "assess"]
+    assert path[1]["gap_seconds"] == pytest.approx(0.5)
+
+    text = report(records)
+    assert "search_b" in text and "retries 1" in text and "cost $0.0100" in text
+
+
+def test_critical_path_ends_on_concurrent_instant_attempts():
+    # Zero-latency stubs: every attempt starts and ends within the slack of the others
+    records = [record(f"stub_{i}", 10.0, 10.0, 10.0 + i * 0.001) for i in range(5)]
+
+    path = critical_path(records)
+
+    assert [r["activity_type"] for r in path] == ["stub_0", "stub_1", "stub_2", "stub_3", "stub_4"]
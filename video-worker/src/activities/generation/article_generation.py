@@ -25,7 +25,13 @@ import anthropic
 from pydantic import BaseModel, Field, field_validator
 
 from src.utils.config import config
-from src.config.app_config import get_app_config, APP_CONFIGS, CharacterStyle, CHARACTER_STYLE_PROMPTS
+from shared.app_config import (
+    get_app_config, APP_CONFIGS, CharacterStyle, CHARACTER_STYLE_PROMPT_SETS,
+    VideoActTemplate, VideoConfig, format_act_structure,
+)
+
+# Cast wording injected into this worker's video prompts
+CHARACTER_STYLE_PROMPTS = CHARACTER_STYLE_PROMPT_SETS["video-worker"]
 
 
 # ===== PYDANTIC MODELS FOR 4-ACT VALIDATION =====
@@ -2000,6 +2006,16 @@ ARTICLE_TYPE_TO_TEMPLATE = {
     "analysis": "market_analysis",
 }
 
+# Used when the app has no video templates (act block formatted once, like app templates)
+GENERIC_VIDEO_ACT_TEMPLATE = VideoActTemplate(
+    name="generic",
+    act_1_role="THE SETUP - Problem/challenge", act_1_mood="Tension, stakes",
+    act_2_role="THE OPPORTUNITY - Discovery/hope", act_2_mood="Hope, revelation",
+    act_3_role="THE JOURNEY - Process/action", act_3_mood="Progress, momentum",
+    act_4_role="THE RESOLUTION - Outcome/future", act_4_mood="Achievement, possibility",
+)
+GENERIC_ACT_STRUCTURE = format_act_structure(GENERIC_VIDEO_ACT_TEMPLATE, VideoConfig())
+
 
 @activity.defn
 async def generate_four_act_video_prompt_brief(
@@ -2108,23 +2124,15 @@ async def generate_four_act_video_prompt_brief(
             selected_template = video_prompt_template.get_template()
 
     if selected_template:
-        act_1_role = selected_template.act_1_role
-        act_1_mood = selected_template.act_1_mood
-        act_2_role = selected_template.act_2_role
-        act_2_mood = selected_template.act_2_mood
-        act_3_role = selected_template.act_3_role
-        act_3_mood = selected_template.act_3_mood
-        act_4_role = selected_template.act_4_role
-        act_4_mood = selected_template.act_4_mood
-        template_used = selected_template.name
-        activity.logger.info(f"Using template '{template_used}' for article_type '{article_type}'")
+        # Precomputed at config load with the app's act timestamps
+        act_structure = app_config.article_theme.act_structure_prompts[selected_template.name]
+        activity.logger.info(f"Using template '{selected_template.name}' for article_type '{article_type}'")
     else:
-        act_1_role, act_1_mood = "THE SETUP - Problem/challenge", "Tension, stakes"
-        act_2_role, act_2_mood = "THE OPPORTUNITY - Discovery/hope", "Hope, revelation"
-        act_3_role, act_3_mood = "THE JOURNEY - Process/action", "Progress, momentum"
-        act_4_role, act_4_mood = "THE RESOLUTION - Outcome/future", "Achievement, possibility"
-        template_used = "generic"
+        selected_template = GENERIC_VIDEO_ACT_TEMPLATE
+        act_structure = GENERIC_ACT_STRUCTURE
         activity.logger.warning(f"No template found for article_type '{article_type}', using generic")
+    template_used = selected_template.name
+    act_1_mood, act_2_mood, act_3_mood, act_4_mood = (mood for _, mood in selected_template.acts)
 
     # Build AI prompt - request JSON for Pydantic validation
     ai_prompt = f"""Generate 4-act video content briefs for this article. Return ONLY valid JSON.
@@ -2135,17 +2143,7 @@ ARTICLE CONTENT:
 {content}
 
 ===== 4-ACT STRUCTURE (from app template: {template_used}) =====
-ACT 1 (0-3s): {act_1_role}
-  Mood: {act_1_mood}
-
-ACT 2 (3-6s): {act_2_role}
-  Mood: {act_2_mood}
-
-ACT 3 (6-9s): {act_3_role}
-  Mood: {act_3_mood}
-
-ACT 4 (9-12s): {act_4_role}
-  Mood: {act_4_mood}
+{act_structure}
 
 ===== VISUAL STYLE =====
 {technical_notes}
@@ -42,6 +42,8 @@ from src.activities.media.mux_client import (
 )
 
 from src.utils.config import config
+from shared.telemetry import telemetry_interceptors
+from shared.provider_limits import configure_provider_limits, provider_limit_interceptors
 
 
 async def main():
@@ -96,6 +98,9 @@ async def main():
         print(f"❌ Failed to connect to Temporal: {e}")
         sys.exit(1)
 
+    # Shared provider buckets/leases live in Neon; "llm" activities use the configured model
+    configure_provider_limits(database_url=config.DATABASE_URL, ai_model=config.get_ai_model)
+
     # Create worker with video enrichment workflows
     worker = Worker(
         client,
@@ -124,6 +129,7 @@ async def main():
             # MUX upload
             upload_video_to_mux,
         ],
+        interceptors=telemetry_interceptors("video-worker") + provider_limit_interceptors(),
     )
 
     print("\n" + "=" * 70)